@@ -0,0 +1,73 @@
+"""Admin endpoints for tuning the running application."""
+import ipaddress
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from pydantic import BaseModel, Field
+
+from app import config
+from app.thread_limiter import (
+    get_thread_limiter_stats, is_adaptive_limiter_running, set_thread_limiter_tokens,
+    start_adaptive_limiter, stop_adaptive_limiter,
+)
+
+
+def _is_loopback(host):
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return host == "localhost"
+
+
+async def require_admin_token(request: Request, x_admin_token: Optional[str] = Header(default=None)):
+    """
+    Reject the request unless it carries ADMIN_TOKEN, or without one configured, unless it comes from loopback.
+
+    Async so the check runs on the event loop: a sync dependency would wait for
+    a thread, and admin requests must not queue behind a saturated pool.
+    """
+    if config.ADMIN_TOKEN:
+        if not secrets.compare_digest(x_admin_token or "", config.ADMIN_TOKEN):
+            raise HTTPException(status_code=403, detail="Invalid admin token")
+    elif request.client is None or not _is_loopback(request.client.host):
+        raise HTTPException(status_code=403, detail="Set ADMIN_TOKEN to use this endpoint from other hosts")
+
+
+router = APIRouter(prefix="/admin", dependencies=[Depends(require_admin_token)])
+
+
+class ThreadLimiterUpdate(BaseModel):
+    """New thread limiter settings; omitted fields are left unchanged."""
+    total_tokens: Optional[int] = Field(default=None, ge=1)
+    adaptive: Optional[bool] = None
+
+
+@router.get("/thread-limiter")
+async def get_thread_limiter():
+    """Return the AnyIO default thread limiter size, usage and adaptive controller state."""
+    return get_thread_limiter_stats()
+
+
+@router.put("/thread-limiter")
+async def update_thread_limiter(update: ThreadLimiterUpdate):
+    """
+    Resize the AnyIO default thread limiter of this worker and/or toggle adaptive sizing.
+
+    A manual size stops the adaptive controller unless `adaptive` is true in the
+    same request, in which case the controller continues from the new size.
+    """
+    if update.total_tokens is not None:
+        if update.adaptive is not True:
+            await stop_adaptive_limiter()
+        set_thread_limiter_tokens(update.total_tokens)
+
+    if update.adaptive is True and not is_adaptive_limiter_running():
+        start_adaptive_limiter(
+            config.THREAD_LIMITER_MIN, config.THREAD_LIMITER_MAX,
+            config.THREAD_LIMITER_ADJUST_INTERVAL, config.THREAD_LIMITER_CPU_HIGH,
+        )
+    elif update.adaptive is False:
+        await stop_adaptive_limiter()
+
+    return get_thread_limiter_stats()
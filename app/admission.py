@@ -0,0 +1,150 @@
+"""Admission control for background work.
+
+Each background task type has a high-water mark on its pending queue depth.
+Once the mark is reached, new work is handled by the task type's overflow
+policy:
+
+  - reject:   the request fails fast with 503 (or 429) and a Retry-After header
+  - drop:     the request is served but its background work is discarded
+  - coalesce: the work is absorbed by an identical call that is already
+              pending; if there is none, the request is rejected
+"""
+import math
+import threading
+from collections import Counter
+from dataclasses import dataclass
+
+from fastapi import HTTPException
+
+from app import config
+from app.bg_pools import find_pool
+
+ADMIT = "admit"
+REJECT = "reject"
+DROP = "drop"
+COALESCE = "coalesce"
+# Not a policy: the request was abandoned (app.deadlines) before its work was scheduled
+ABANDONED = "abandoned"
+
+OVERFLOW_POLICIES = (REJECT, DROP, COALESCE)
+
+
+@dataclass(frozen=True)
+class AdmissionPolicy:
+    """High-water mark and overflow behavior for one background task type."""
+    high_water: int
+    overflow: str = REJECT
+
+    def __post_init__(self):
+        if self.overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy {self.overflow!r}, expected one of {OVERFLOW_POLICIES}")
+
+
+def get_policy(task_type):
+    """Return the configured admission policy for a task type."""
+    return AdmissionPolicy(
+        high_water=config.BG_HIGH_WATER_MARKS.get(task_type, config.BG_HIGH_WATER_DEFAULT),
+        overflow=config.BG_OVERFLOW_POLICIES.get(task_type, config.BG_OVERFLOW_DEFAULT),
+    )
+
+
+def validate_policies():
+    """
+    Check the configured overflow policies. Called from the lifespan.
+
+    An unknown policy would otherwise raise ValueError, a 500, on every request of its task type.
+    """
+    settings = {"BG_OVERFLOW_DEFAULT": config.BG_OVERFLOW_DEFAULT}
+    settings.update({f"BG_OVERFLOW_POLICIES[{task_type}]": overflow
+                     for task_type, overflow in config.BG_OVERFLOW_POLICIES.items()})
+    for setting, overflow in settings.items():
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"{setting}: unknown overflow policy {overflow!r}, expected one of {OVERFLOW_POLICIES}")
+
+
+_lock = threading.Lock()
+_pending_calls = Counter()
+_decisions = {}
+
+
+def call_key(task, args=(), kwargs=None):
+    """Return the key identifying equivalent calls of a background task."""
+    return (task.__name__, args, tuple(sorted((kwargs or {}).items())))
+
+
+def track_pending_call(key):
+    """Record that a call is queued or running."""
+    with _lock:
+        _pending_calls[key] += 1
+
+
+def release_pending_call(key):
+    """Record that a call has finished."""
+    with _lock:
+        _pending_calls[key] -= 1
+        if _pending_calls[key] <= 0:
+            del _pending_calls[key]
+
+
+def decide(task, args, kwargs, pending):
+    """
+    Decide what to do with new background work given the task type's queue depth.
+
+    Args:
+        task: The background task callable
+        args: Positional arguments of the call
+        kwargs: Keyword arguments of the call
+        pending: Current pending count for the task type
+
+    Returns:
+        str: One of ADMIT, REJECT, DROP or COALESCE
+    """
+    task_type = task.__name__
+    policy = get_policy(task_type)
+
+    decision = ADMIT
+    if policy.high_water and pending >= policy.high_water:
+        decision = policy.overflow
+        if decision == COALESCE:
+            with _lock:
+                if not _pending_calls.get(call_key(task, args, kwargs)):
+                    decision = REJECT
+    return decision
+
+
+def record_decision(task_type, decision):
+    """Count an admission decision for a task type."""
+    with _lock:
+        counts = _decisions.setdefault(task_type, Counter())
+        counts[decision] += 1
+
+
+def retry_after(task_type, pending):
+    """Estimate the seconds until the task type's queue drops below its high-water mark."""
+    policy = get_policy(task_type)
+    pool = find_pool(task_type)
+    if pool is None:
+        return 1
+    stats = pool.statistics()
+    excess = max(pending - policy.high_water + 1, 1)
+    seconds = excess * stats["avg_duration_s"] / stats["size"]
+    return min(max(math.ceil(seconds), 1), config.BG_RETRY_AFTER_MAX)
+
+
+def rejection(task_type, pending):
+    """Build the HTTPException used to shed a request."""
+    return HTTPException(
+        status_code=config.BG_REJECT_STATUS,
+        detail=f"Background queue for {task_type} is full ({pending} pending)",
+        headers={"Retry-After": str(retry_after(task_type, pending))},
+    )
+
+
+def get_admission_stats():
+    """Return admission decision counts and policies keyed by task type."""
+    with _lock:
+        decisions = {task_type: dict(counts) for task_type, counts in _decisions.items()}
+    return {
+        task_type: {"policy": vars(get_policy(task_type)), "decisions": counts}
+        for task_type, counts in decisions.items()
+    }
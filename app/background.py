@@ -1,42 +1,275 @@
 """Background task functions for FastAPI."""
 import time
 import asyncio
+import inspect
 import logging
 import threading
-from app.metrics import decrement_pending_bg_tasks
+from fastapi import BackgroundTasks
+
+from app import admission, bg_runner, config
+from app.bg_pools import get_pool
+from app.coalescing import BatchedCall, coalescer, get_batcher, release_on_start
+from app.deadlines import request_abandoned
+from app.job_queue import get_job_queue, new_job_id, run_queue_io, submit_queue_io
+from app.metrics import increment_pending_bg_tasks, decrement_pending_bg_tasks, get_pending_bg_tasks
 
 logger = logging.getLogger(__name__)
 
 
 def sync_background_task():
     """Synchronous background task - pure blocking sync."""
-    try:
-        thread_id = threading.get_ident()
-        logger.info(f"[sync_background_task] Started in thread {thread_id}")
-        time.sleep(10)  # Simulate blocking work
-        logger.info(f"[sync_background_task] Completed in thread {thread_id}")
-    finally:
-        decrement_pending_bg_tasks()
+    thread_id = threading.get_ident()
+    logger.info("[sync_background_task] Started in thread %s", thread_id)
+    time.sleep(10)  # Simulate blocking work
+    logger.info("[sync_background_task] Completed in thread %s", thread_id)
 
 
 async def async_background_task_wrapping_sync():
     """Async background task that wraps a blocking sync operation."""
-    try:
-        thread_id = threading.get_ident()
-        logger.info(f"[async_background_task_wrapping_sync] Started in thread {thread_id}")
-        # This will block the event loop - BAD practice but demonstrates the issue
-        time.sleep(10)  # Blocking call inside async function
-        logger.info(f"[async_background_task_wrapping_sync] Completed in thread {thread_id}")
-    finally:
-        decrement_pending_bg_tasks()
+    thread_id = threading.get_ident()
+    logger.info("[async_background_task_wrapping_sync] Started in thread %s", thread_id)
+    # This will block the event loop - BAD practice but demonstrates the issue
+    time.sleep(10)  # Blocking call inside async function
+    logger.info("[async_background_task_wrapping_sync] Completed in thread %s", thread_id)
 
 
 async def async_background_task_wrapping_async():
     """Async background task with pure async operations."""
+    thread_id = threading.get_ident()
+    logger.info("[async_background_task_wrapping_async] Started in thread %s", thread_id)
+    await asyncio.sleep(10)  # Pure async work
+    logger.info("[async_background_task_wrapping_async] Completed in thread %s", thread_id)
+
+
+def sync_background_batch(calls):
+    """Batch form of sync_background_task: one blocking execution for many calls."""
+    thread_id = threading.get_ident()
+    logger.info("[sync_background_batch] Started %d calls in thread %s", len(calls), thread_id)
+    time.sleep(10)  # Simulate blocking work done once for the whole batch (e.g. a bulk write)
+    logger.info("[sync_background_batch] Completed %d calls in thread %s", len(calls), thread_id)
+
+
+async def async_background_batch_wrapping_async(calls):
+    """Batch form of async_background_task_wrapping_async: one async execution for many calls."""
+    thread_id = threading.get_ident()
+    logger.info("[async_background_batch_wrapping_async] Started %d calls in thread %s", len(calls), thread_id)
+    await asyncio.sleep(10)
+    logger.info("[async_background_batch_wrapping_async] Completed %d calls in thread %s", len(calls), thread_id)
+
+
+# Batch handlers keyed by the task they replace; called with a list of (args, kwargs)
+BATCH_HANDLERS = {
+    sync_background_task.__name__: sync_background_batch,
+    async_background_task_wrapping_async.__name__: async_background_batch_wrapping_async,
+}
+
+# Tasks that job queue workers can execute, keyed by name
+JOB_TASKS = {
+    task.__name__: task
+    for task in (sync_background_task, async_background_task_wrapping_sync, async_background_task_wrapping_async)
+}
+
+
+# Last pending count read from the job queue per task type. On the event loop, admission
+# decides on it instead of running a COUNT query; the route's admission dependency refreshes it
+_queue_pending = {}
+
+
+def _on_event_loop():
     try:
-        thread_id = threading.get_ident()
-        logger.info(f"[async_background_task_wrapping_async] Started in thread {thread_id}")
-        await asyncio.sleep(10)  # Pure async work
-        logger.info(f"[async_background_task_wrapping_async] Completed in thread {thread_id}")
-    finally:
-        decrement_pending_bg_tasks()
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def pending_background_tasks(task_type):
+    """Return the pending count for a task type from the active backend."""
+    if config.BG_BACKEND != "queue":
+        return get_pending_bg_tasks(task_type)
+    if _on_event_loop():
+        return _queue_pending.get(task_type, 0)
+    count = _queue_pending[task_type] = get_job_queue().pending_count(task_type)
+    return count
+
+
+async def pending_background_tasks_async(task_type):
+    """Return the pending count for a task type, reading the job queue off the event loop."""
+    if config.BG_BACKEND != "queue":
+        return get_pending_bg_tasks(task_type)
+    count = _queue_pending[task_type] = await run_queue_io(get_job_queue().pending_count, task_type)
+    return count
+
+
+def background_admission(task, *args, **kwargs):
+    """
+    Build a route dependency that sheds requests before the handler runs.
+
+    The dependency rejects with 503/429 and Retry-After as soon as the task
+    type's queue depth reaches its high-water mark, so overloaded routes fail
+    fast instead of doing their inner work first. Without a high-water mark
+    it does nothing, not even read the queue depth.
+    """
+    task_type = task.__name__
+
+    async def check_background_admission():
+        if not admission.get_policy(task_type).high_water:
+            return
+        pending = await pending_background_tasks_async(task_type)
+        if admission.decide(task, args, kwargs, pending) == admission.REJECT:
+            admission.record_decision(task_type, admission.REJECT)
+            raise admission.rejection(task_type, pending)
+
+    return check_background_admission
+
+
+def schedule_background_task(background_tasks: BackgroundTasks, task, *args, coalesce_key=None, **kwargs):
+    """
+    Schedule a background task on the configured backend.
+
+    With the "pool" backend the task runs on its dedicated worker pool once
+    the response is sent. The callable handed to Starlette only submits the
+    task to the pool, so the request cycle never waits on the task itself and
+    never holds an AnyIO thread-limiter token for it. With the "queue" backend
+    the task is enqueued as a durable job for `app.worker` processes.
+
+    Admission control is applied first: work over the task type's high-water
+    mark is rejected, dropped or coalesced. Nothing is scheduled for a request
+    whose deadline has passed or whose client has disconnected.
+
+    With BG_SCHEDULING=detached, the call is handed to the lifespan-owned
+    background runner right away and `background_tasks` is not used, so
+    nothing runs after the response inside the request's ASGI call.
+
+    With the "pool" backend, a call with a `coalesce_key` (by default the call
+    itself for task types in BG_COALESCE_TASKS) is absorbed while another call
+    with that key is queued, and task types with a batch size in BG_BATCH_SIZES
+    run their calls in batches through their entry in BATCH_HANDLERS.
+
+    Returns:
+        str | None: The job id when enqueued on the job queue, otherwise None
+    """
+    task_type = task.__name__
+    if request_abandoned():
+        admission.record_decision(task_type, admission.ABANDONED)
+        return None
+    pending = pending_background_tasks(task_type) if admission.get_policy(task_type).high_water else 0
+    decision = admission.decide(task, args, kwargs, pending)
+
+    key = admission.call_key(task, args, kwargs)
+    if decision != admission.ADMIT:
+        admission.record_decision(task_type, decision)
+        if decision == admission.REJECT:
+            raise admission.rejection(task_type, pending)
+        return None
+
+    if config.BG_BACKEND == "queue":
+        admission.record_decision(task_type, decision)
+        # Job arguments must be JSON-serializable
+        if not _on_event_loop():
+            return get_job_queue().enqueue(task_type, args, kwargs)
+        # On the loop the insert runs on the queue's I/O threads; the job id is known up front,
+        # though GET /jobs/{id} only finds the job once the insert has run
+        job_id = new_job_id()
+        submit_queue_io(get_job_queue().enqueue, task_type, args, kwargs, job_id).add_done_callback(
+            lambda future: _log_enqueue_error(future, task_type, job_id)
+        )
+        _queue_pending[task_type] = _queue_pending.get(task_type, 0) + 1
+        return job_id
+
+    if coalesce_key is None and task_type in config.BG_COALESCE_TASKS:
+        coalesce_key = key
+    call = BatchedCall(args, kwargs, key, coalesce_key)
+    if config.BG_SCHEDULING == "detached":
+        _schedule(task, call, on_loop=False)
+    else:
+        # The coalescing key is claimed and the call counted as pending only once this runs.
+        # If the response is never sent (client gone, request cancelled), nothing is left claimed
+        background_tasks.add_task(_schedule_after_response, task, call)
+    return None
+
+
+def _schedule(task, call, on_loop):
+    """Claim the call's coalescing key, count it as pending and hand it to its batch or pool."""
+    task_type = task.__name__
+    if call.coalesce_key is not None and not coalescer.claim(call.coalesce_key):
+        admission.record_decision(task_type, admission.COALESCE)
+        return
+    admission.record_decision(task_type, admission.ADMIT)
+    admission.track_pending_call(call.key)
+    increment_pending_bg_tasks(task_type)
+    batcher = _get_batcher(task_type)
+    if batcher is None:
+        _dispatch(task, call)
+    elif on_loop:
+        batcher.add(call)
+    else:
+        # Batchers live on the event loop; detached scheduling may run in a worker thread
+        bg_runner.call_soon(batcher.add, call)
+
+
+async def _schedule_after_response(task, call):
+    """BackgroundTasks entry point: runs on the event loop after the response."""
+    _schedule(task, call, on_loop=True)
+
+
+def _log_enqueue_error(future, task_type, job_id):
+    if future.exception() is not None:
+        logger.error("Could not enqueue %s job %s", task_type, job_id, exc_info=future.exception())
+
+
+def _dispatch(task, call):
+    """Submit a task to its pool through the background runner (returns immediately)."""
+    task_type = task.__name__
+    pool = get_pool(task_type, inspect.iscoroutinefunction(task))
+    future = bg_runner.submit(pool, release_on_start(task, [call.coalesce_key]), *call.args, **call.kwargs)
+    if future is None:
+        _on_refused(task_type, [call])
+        return
+    future.add_done_callback(lambda _: _on_task_done(task_type, call.key))
+
+
+def _on_task_done(task_type, key):
+    """Release the pending bookkeeping of a finished task."""
+    admission.release_pending_call(key)
+    decrement_pending_bg_tasks(task_type)
+
+
+def _on_refused(task_type, calls):
+    """Undo the bookkeeping of calls the runner refused because the app is shutting down."""
+    logger.warning("Discarding %d %s calls scheduled during shutdown", len(calls), task_type)
+    for call in calls:
+        if call.coalesce_key is not None:
+            coalescer.release(call.coalesce_key)
+        _on_task_done(task_type, call.key)
+
+
+def _get_batcher(task_type):
+    """Return the batcher of a task type, or None if its calls are not batched."""
+    max_size = config.BG_BATCH_SIZES.get(task_type, 0)
+    if max_size <= 1 or task_type not in BATCH_HANDLERS:
+        return None
+    return get_batcher(
+        task_type, max_size, config.BG_BATCH_DELAY, submit=lambda calls: _submit_batch(task_type, calls)
+    )
+
+
+def _submit_batch(task_type, calls):
+    """Run a batch of calls as one execution of the batch handler, on the task type's pool."""
+    handler = BATCH_HANDLERS[task_type]
+    pool = get_pool(task_type, inspect.iscoroutinefunction(handler))
+    future = bg_runner.submit(
+        pool,
+        release_on_start(handler, [call.coalesce_key for call in calls]),
+        [(call.args, call.kwargs) for call in calls],
+    )
+    if future is None:
+        _on_refused(task_type, calls)
+        return
+
+    def on_batch_done(_):
+        for call in calls:
+            _on_task_done(task_type, call.key)
+
+    future.add_done_callback(on_batch_done)
+
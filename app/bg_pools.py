@@ -0,0 +1,183 @@
+"""Dedicated worker pools for background tasks.
+
+Each background task type gets its own named pool, separate from the AnyIO
+thread limiter that runs `def` routes. Sync tasks run on a fixed-size thread
+pool; async tasks run on a private event loop with bounded concurrency, so a
+task that blocks only stalls its own loop and never the request loop.
+"""
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app import config
+from app.metrics_registry import BG_TASK_DURATION, BG_TASKS_FINISHED
+
+logger = logging.getLogger(__name__)
+
+
+class _PoolCounters:
+    """Thread-safe submitted/active/completed/failed counters for one pool."""
+
+    # Weight of the newest sample in the moving average of task durations
+    DURATION_EWMA_ALPHA = 0.2
+
+    def __init__(self, name):
+        self._name = name
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.active = 0
+        self.completed = 0
+        self.failed = 0
+        self.avg_duration = 0.0
+
+    def on_submit(self):
+        with self._lock:
+            self.submitted += 1
+
+    def on_start(self):
+        with self._lock:
+            self.active += 1
+
+    def on_finish(self, failed, duration):
+        BG_TASK_DURATION.observe(duration, task_type=self._name)
+        BG_TASKS_FINISHED.inc(task_type=self._name, outcome="failed" if failed else "ok")
+        with self._lock:
+            self.active -= 1
+            self.completed += 1
+            if failed:
+                self.failed += 1
+            if self.completed == 1:
+                self.avg_duration = duration
+            else:
+                alpha = self.DURATION_EWMA_ALPHA
+                self.avg_duration = alpha * duration + (1 - alpha) * self.avg_duration
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "submitted": self.submitted,
+                "active": self.active,
+                "queued": self.submitted - self.active - self.completed,
+                "completed": self.completed,
+                "failed": self.failed,
+                "avg_duration_s": self.avg_duration,
+            }
+
+
+class ThreadWorkerPool:
+    """Runs sync callables on a dedicated fixed-size thread pool."""
+
+    kind = "thread"
+
+    def __init__(self, name, size):
+        self.name = name
+        self.size = size
+        self._counters = _PoolCounters(name)
+        self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix=f"bg-{name}")
+
+    def submit(self, func, *args, **kwargs):
+        """Submit a callable and return a concurrent.futures.Future."""
+        self._counters.on_submit()
+        return self._executor.submit(self._run, func, args, kwargs)
+
+    def _run(self, func, args, kwargs):
+        self._counters.on_start()
+        started = time.perf_counter()
+        failed = False
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            failed = True
+            logger.exception("Background task %s failed in pool %s", func.__name__, self.name)
+            raise
+        finally:
+            self._counters.on_finish(failed, time.perf_counter() - started)
+
+    def statistics(self):
+        """Return pool size and task counters."""
+        return {"kind": self.kind, "size": self.size, **self._counters.snapshot()}
+
+    def shutdown(self):
+        """Stop accepting work and drop queued tasks; running tasks finish."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class LoopWorkerPool:
+    """Runs coroutine functions on a private event loop with bounded concurrency."""
+
+    kind = "loop"
+
+    def __init__(self, name, size):
+        self.name = name
+        self.size = size
+        self._counters = _PoolCounters(name)
+        self._loop = asyncio.new_event_loop()
+        self._semaphore = asyncio.Semaphore(size)
+        self._thread = threading.Thread(target=self._loop.run_forever, name=f"bg-{name}", daemon=True)
+        self._thread.start()
+
+    def submit(self, func, *args, **kwargs):
+        """Submit a coroutine function and return a concurrent.futures.Future."""
+        self._counters.on_submit()
+        return asyncio.run_coroutine_threadsafe(self._run(func, args, kwargs), self._loop)
+
+    async def _run(self, func, args, kwargs):
+        async with self._semaphore:
+            self._counters.on_start()
+            started = time.perf_counter()
+            failed = False
+            try:
+                return await func(*args, **kwargs)
+            except Exception:
+                failed = True
+                logger.exception("Background task %s failed in pool %s", func.__name__, self.name)
+                raise
+            finally:
+                self._counters.on_finish(failed, time.perf_counter() - started)
+
+    def statistics(self):
+        """Return pool size and task counters."""
+        return {"kind": self.kind, "size": self.size, **self._counters.snapshot()}
+
+    def shutdown(self):
+        """Stop the private loop; unfinished tasks are abandoned."""
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(name, is_async):
+    """Return the pool for a task type, creating it on first use."""
+    with _pools_lock:
+        pool = _pools.get(name)
+        if pool is None:
+            size = config.BG_POOL_SIZES.get(name, config.BG_POOL_DEFAULT_SIZE)
+            pool_class = LoopWorkerPool if is_async else ThreadWorkerPool
+            pool = _pools[name] = pool_class(name, size)
+        return pool
+
+
+def find_pool(name):
+    """Return the pool for a task type, or None if it has not been created."""
+    with _pools_lock:
+        return _pools.get(name)
+
+
+def get_pool_stats():
+    """Return statistics for every pool, keyed by pool name."""
+    with _pools_lock:
+        pools = list(_pools.values())
+    return {pool.name: pool.statistics() for pool in pools}
+
+
+def shutdown_pools():
+    """Shut down all pools."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown()
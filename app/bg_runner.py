@@ -0,0 +1,114 @@
+"""Lifespan-owned runner for background work.
+
+Every background call submitted to a worker pool goes through the runner,
+which keeps track of the calls in flight. At shutdown the lifespan drains the
+runner: it stops accepting work, then waits up to BG_DRAIN_TIMEOUT seconds
+for the calls in flight to finish before the pools are shut down and the rest
+is abandoned.
+
+With BG_SCHEDULING=detached, routes hand their calls to the runner when they
+register them instead of to Starlette's BackgroundTasks. Starlette runs
+BackgroundTasks after the response, but inside the request's ASGI call, so
+the connection cannot serve its next request until they return. Detached
+calls leave nothing to run after the response.
+"""
+import asyncio
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundRunner:
+    """Submits background calls to pools and tracks them until they finish."""
+
+    def __init__(self, loop):
+        self._loop = loop
+        self._lock = threading.Lock()
+        self._in_flight = set()
+        self._closed = False
+        self.submitted = 0
+        self.refused = 0
+        self.abandoned = 0
+
+    def submit(self, pool, func, *args, **kwargs):
+        """Submit a call to a pool. Returns its future, or None once the runner is draining."""
+        with self._lock:
+            if self._closed:
+                self.refused += 1
+                return None
+            future = pool.submit(func, *args, **kwargs)
+            self._in_flight.add(future)
+            self.submitted += 1
+        future.add_done_callback(self._discard)
+        return future
+
+    def _discard(self, future):
+        with self._lock:
+            self._in_flight.discard(future)
+
+    def call_soon(self, callback, *args):
+        """Run a callback on the application's event loop (safe from any thread)."""
+        self._loop.call_soon_threadsafe(callback, *args)
+
+    async def drain(self, timeout):
+        """Stop accepting work and wait up to `timeout` seconds for the calls in flight."""
+        with self._lock:
+            self._closed = True
+            pending = list(self._in_flight)
+        if not pending:
+            return
+        logger.info("Draining %d background calls (up to %.0fs)", len(pending), timeout)
+        if timeout > 0:
+            _, not_done = await asyncio.wait([asyncio.wrap_future(f) for f in pending], timeout=timeout)
+        else:
+            not_done = pending
+        if not_done:
+            self.abandoned += len(not_done)
+            logger.warning("Abandoning %d background calls still running after the drain deadline", len(not_done))
+
+    def statistics(self):
+        with self._lock:
+            return {
+                "draining": self._closed,
+                "in_flight": len(self._in_flight),
+                "submitted": self.submitted,
+                "refused": self.refused,
+                "abandoned": self.abandoned,
+            }
+
+
+_runner = None
+
+
+def start_background_runner(loop):
+    """Create the runner for this worker. Called from the lifespan, on the event loop."""
+    global _runner
+    _runner = BackgroundRunner(loop)
+    return _runner
+
+
+async def drain_background_runner(timeout):
+    """Drain the runner at shutdown; it keeps refusing work afterwards."""
+    if _runner is not None:
+        await _runner.drain(timeout)
+
+
+def submit(pool, func, *args, **kwargs):
+    """Submit a call through the runner, or straight to the pool when no lifespan runs."""
+    if _runner is None:
+        return pool.submit(func, *args, **kwargs)
+    return _runner.submit(pool, func, *args, **kwargs)
+
+
+def call_soon(callback, *args):
+    """Run a callback on the application's event loop."""
+    if _runner is None:
+        raise RuntimeError("The background runner is not running (BG_SCHEDULING=detached needs the lifespan)")
+    _runner.call_soon(callback, *args)
+
+
+def get_runner_stats():
+    """Return the runner's counters, or None if it is not running."""
+    runner = _runner
+    return runner.statistics() if runner is not None else None
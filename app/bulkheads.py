@@ -0,0 +1,271 @@
+"""Per-route bulkheads and priority lanes for request admission.
+
+Requests to the demo routes (app.routes) pass through two limiters before
+their handler runs:
+
+  - bulkhead: each route with a limit (BULKHEAD_LIMITS, BULKHEAD_DEFAULT_LIMIT)
+    caps its own requests in flight. Up to BULKHEAD_QUEUE more wait behind the
+    cap, and the rest are shed with 503 and Retry-After. A route family that
+    stalls fills its own bulkhead instead of the whole thread pool
+  - priority lanes: routes in CRITICAL_ROUTES run their `def` handlers in
+    a thread limiter of their own, THREAD_RESERVED_TOKENS tokens that nothing
+    else borrows. The other `def` handlers use the AnyIO default thread
+    limiter, which they share with every other thread offload of the app
+    (@blocking calls, CPU work in mode=thread, sync dependencies, sync
+    background tasks). Once BULK_QUEUE tasks wait for one of its tokens,
+    whoever they are, new bulk requests are shed
+
+Operational routes (/metrics, /, /admin, /debug) are not in app.routes and
+never wait here. Their handlers are async, so they keep answering while the
+demo routes hold every thread, as long as the event loop itself is not blocked.
+
+Waiting happens on the event loop, before a thread is taken. Everything
+here runs on the loop, so none of it needs locks.
+"""
+import asyncio
+import functools
+from collections import deque
+
+import anyio
+from fastapi import HTTPException, Request
+from fastapi.routing import APIRoute
+
+from app import config
+from app.metrics_registry import REQUESTS_SHED
+
+CRITICAL = "critical"
+BULK = "bulk"
+
+
+def _shed(limiter, detail):
+    REQUESTS_SHED.inc(limiter=limiter)
+    return HTTPException(status_code=503, detail=detail, headers={"Retry-After": "1"})
+
+
+class _Waiters:
+    """FIFO of futures a limiter resolves to hand a slot to the next waiter."""
+
+    def __init__(self):
+        self._futures = deque()
+
+    def __len__(self):
+        return len(self._futures)
+
+    async def wait(self, on_handed_over):
+        """Wait to be handed a slot. Calls `on_handed_over` if the slot arrives as the wait is cancelled."""
+        future = asyncio.get_running_loop().create_future()
+        self._futures.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                on_handed_over()
+            else:
+                self._futures.remove(future)
+            raise
+
+    def hand_over(self):
+        """Resolve the oldest live waiter. Returns False if nobody is waiting."""
+        while self._futures:
+            future = self._futures.popleft()
+            if not future.done():
+                future.set_result(None)
+                return True
+        return False
+
+
+class Bulkhead:
+    """Caps the requests of one route in flight, with a bounded queue behind the cap."""
+
+    def __init__(self, route, limit, queue_size):
+        self.route = route
+        self.limit = limit
+        self.queue_size = queue_size
+        self._waiters = _Waiters()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.admitted = 0
+        self.queued = 0
+        self.shed = 0
+
+    async def acquire(self):
+        if self.in_flight < self.limit and not len(self._waiters):
+            self._admit()
+            return
+        if len(self._waiters) >= self.queue_size:
+            self.shed += 1
+            raise _shed(self.route, f"Too many requests in flight for {self.route} ({self.in_flight})")
+        self.queued += 1
+        # release() hands its slot to us, so in_flight already counts this request
+        await self._waiters.wait(self.release)
+        self.admitted += 1
+
+    def _admit(self):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.admitted += 1
+
+    def release(self):
+        if not self._waiters.hand_over():
+            self.in_flight -= 1
+
+    def statistics(self):
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "waiting": len(self._waiters),
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "shed": self.shed,
+        }
+
+
+class PriorityLanes:
+    """
+    Admits `def` handlers to threads by lane.
+
+    The critical lane runs its handlers in a CapacityLimiter of `reserved`
+    tokens, so bulk handlers and other offloads can never take its threads.
+    The bulk lane runs in the AnyIO default thread limiter and sheds once
+    `bulk_queue` tasks wait for it. Reading that limiter's own queue counts
+    every user of it, resized or not.
+    """
+
+    def __init__(self, reserved, bulk_queue):
+        self.reserved = reserved
+        self.bulk_queue = bulk_queue
+        self._critical_limiter = None
+        self.admitted = {CRITICAL: 0, BULK: 0}
+        self.shed = 0
+
+    @property
+    def critical_limiter(self):
+        """The critical lane's limiter, or None without reserved tokens (created on the event loop)."""
+        if self._critical_limiter is None and self.reserved:
+            self._critical_limiter = anyio.CapacityLimiter(self.reserved)
+        return self._critical_limiter
+
+    def limiter(self, lane):
+        """The thread limiter a lane's handlers run in."""
+        if lane == CRITICAL and self.critical_limiter is not None:
+            return self.critical_limiter
+        return anyio.to_thread.current_default_thread_limiter()
+
+    def admit(self, lane):
+        if lane == BULK and self.bulk_queue:
+            if self.limiter(BULK).statistics().tasks_waiting >= self.bulk_queue:
+                self.shed += 1
+                raise _shed(BULK, "Thread pool is saturated, bulk requests are being shed")
+        self.admitted[lane] += 1
+
+    def statistics(self):
+        lanes = {}
+        for lane in (CRITICAL, BULK):
+            limiter = self.limiter(lane).statistics()
+            lanes[lane] = {
+                "dedicated": lane == CRITICAL and self.critical_limiter is not None,
+                "capacity": limiter.total_tokens,
+                "in_flight": limiter.borrowed_tokens,
+                "waiting": limiter.tasks_waiting,
+                "admitted": self.admitted[lane],
+            }
+        return {"reserved_tokens": self.reserved, "bulk_queue": self.bulk_queue, "shed": self.shed, "lanes": lanes}
+
+
+def _run_in_critical_lane(endpoint):
+    """Wrap a `def` endpoint to run in the critical lane's threads instead of FastAPI's threadpool."""
+
+    @functools.wraps(endpoint)
+    async def run_endpoint(**kwargs):
+        limiter = get_lanes().limiter(CRITICAL)
+        return await anyio.to_thread.run_sync(functools.partial(endpoint, **kwargs), limiter=limiter)
+
+    run_endpoint.lane = CRITICAL
+    return run_endpoint
+
+
+class LaneRoute(APIRoute):
+    """
+    APIRoute that knows its priority lane.
+
+    `lane` is None for async handlers, which don't take a thread. The `def`
+    handlers of critical routes are wrapped to run in the critical lane.
+    """
+
+    def __init__(self, path, endpoint, **kwargs):
+        # include_router() builds the route again from the endpoint, already wrapped
+        self.lane = getattr(endpoint, "lane", None)
+        if self.lane is None and not asyncio.iscoroutinefunction(endpoint):
+            self.lane = CRITICAL if path in config.CRITICAL_ROUTES else BULK
+            if self.lane == CRITICAL and config.THREAD_RESERVED_TOKENS:
+                endpoint = _run_in_critical_lane(endpoint)
+        super().__init__(path, endpoint, **kwargs)
+
+
+_bulkheads = {}
+_lanes = None
+
+
+def get_bulkhead(route):
+    """Return the bulkhead of a route path, or None if the route is not limited."""
+    if route not in _bulkheads:
+        limit = config.BULKHEAD_LIMITS.get(route, config.BULKHEAD_DEFAULT_LIMIT)
+        _bulkheads[route] = Bulkhead(route, limit, config.BULKHEAD_QUEUE) if limit > 0 else None
+    return _bulkheads[route]
+
+
+def get_lanes():
+    """Return the priority lanes, or None unless THREAD_RESERVED_TOKENS, CRITICAL_ROUTES or BULK_QUEUE is set."""
+    global _lanes
+    if _lanes is None and (config.THREAD_RESERVED_TOKENS or config.CRITICAL_ROUTES or config.BULK_QUEUE):
+        _lanes = PriorityLanes(config.THREAD_RESERVED_TOKENS, config.BULK_QUEUE)
+    return _lanes
+
+
+async def admit_request(request: Request):
+    """
+    Route dependency holding the request's bulkhead slot while the handler runs.
+
+    `def` handlers of a LaneRoute are also admitted to their lane: bulk ones
+    may be shed here, and then wait for a thread of their lane's limiter.
+    """
+    route = request.scope["route"]
+    bulkhead = get_bulkhead(route.path)
+    lane = getattr(route, "lane", None)
+    lanes = get_lanes() if lane is not None else None
+
+    if bulkhead is not None:
+        await bulkhead.acquire()
+    try:
+        if lanes is not None:
+            lanes.admit(lane)
+        yield
+    finally:
+        if bulkhead is not None:
+            bulkhead.release()
+
+
+def get_request_limiter_stats():
+    """Return occupancy of the bulkheads and priority lanes in use."""
+    return {
+        "bulkheads": {route: bulkhead.statistics() for route, bulkhead in _bulkheads.items() if bulkhead},
+        "priority_lanes": _lanes.statistics() if _lanes is not None else None,
+    }
+
+
+def request_limiter_slots():
+    """Slots per limiter and state, for the app_request_limiter_slots gauge."""
+    slots = {}
+    for route, bulkhead in _bulkheads.items():
+        if bulkhead is not None:
+            slots[(route, "in_flight")] = bulkhead.in_flight
+            slots[(route, "waiting")] = len(bulkhead._waiters)
+            slots[(route, "limit")] = bulkhead.limit
+    if _lanes is not None:
+        for lane in (CRITICAL, BULK):
+            limiter = _lanes.limiter(lane).statistics()
+            slots[(lane, "in_flight")] = limiter.borrowed_tokens
+            slots[(lane, "waiting")] = limiter.tasks_waiting
+            slots[(lane, "limit")] = limiter.total_tokens
+    return slots
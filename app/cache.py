@@ -0,0 +1,233 @@
+"""Result cache for inner functions, with single-flight request collapsing.
+
+`@cached` memoizes a function's results per arguments in a pluggable backend
+(by default an in-memory LRU whose entries also expire after a TTL). Misses
+are collapsed: while one caller computes a key, concurrent callers of the
+same key wait for that computation instead of starting their own, so a burst
+of misses costs one thread or one sleep instead of one per request.
+
+It works for async functions, plain sync functions and @blocking functions.
+The cached wrapper of a @blocking function keeps its `offload()` for
+coroutines: a hit is answered on the loop without the thread hop, and only a
+miss goes to a thread.
+"""
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from app.metrics_registry import CACHE_REQUESTS
+
+MISSING = object()  # returned by backends on a miss
+_RETRY = object()   # a flight's result when its leader was cancelled: waiters look the key up again
+
+
+class LRUTTLCache:
+    """Thread-safe in-memory LRU cache whose entries expire `ttl` seconds after being stored."""
+
+    def __init__(self, maxsize=1024, ttl=60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key):
+        """Return the cached value, or MISSING if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def statistics(self):
+        with self._lock:
+            return {
+                "backend": "lru_ttl",
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_s": self.ttl,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+def _default_key(args, kwargs):
+    return args, tuple(sorted(kwargs.items()))
+
+
+class _CachedCall:
+    """The cache, in-flight computations and counters behind one cached function."""
+
+    def __init__(self, name, backend, make_key):
+        self.name = name
+        self.backend = backend
+        self.make_key = make_key
+        self._lock = threading.Lock()
+        self._flights = {}  # key -> concurrent.futures.Future of the computation in progress
+
+    def _record(self, result):
+        CACHE_REQUESTS.inc(cache=self.name, result=result)
+
+    def _lookup(self, key):
+        """Return (value, flight, leader): flight is None on a hit; leader is True for the caller that computes."""
+        value = self.backend.get(key)
+        if value is not MISSING:
+            self._record("hit")
+            return value, None, False
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                self._record("collapsed")
+                return None, flight, False
+            flight = self._flights[key] = Future()
+        self._record("miss")
+        return None, flight, True
+
+    def _finish(self, key, flight, value=MISSING, error=None):
+        # Store before dropping the flight, so no caller can miss in between
+        if value is not MISSING:
+            self.backend.set(key, value)
+        with self._lock:
+            self._flights.pop(key, None)
+        if value is not MISSING:
+            flight.set_result(value)
+        elif isinstance(error, Exception):
+            self._record("error")
+            flight.set_exception(error)
+        else:
+            # The leader was cancelled (its client left or missed its deadline). That says
+            # nothing about the waiters' requests: they retry, and one of them leads
+            flight.set_result(_RETRY)
+
+    def call_sync(self, compute, args, kwargs):
+        key = self.make_key(args, kwargs)
+        while True:
+            value, flight, leader = self._lookup(key)
+            if flight is None:
+                return value
+            if leader:
+                break
+            value = flight.result()
+            if value is not _RETRY:
+                return value
+        try:
+            value = compute(*args, **kwargs)
+        except BaseException as error:
+            self._finish(key, flight, error=error)
+            raise
+        self._finish(key, flight, value)
+        return value
+
+    async def call_async(self, compute, args, kwargs):
+        key = self.make_key(args, kwargs)
+        while True:
+            value, flight, leader = self._lookup(key)
+            if flight is None:
+                return value
+            if leader:
+                break
+            # Shielded: cancelling a waiter would otherwise cancel the shared flight
+            value = await asyncio.shield(asyncio.wrap_future(flight))
+            if value is not _RETRY:
+                return value
+        try:
+            value = await compute(*args, **kwargs)
+        except BaseException as error:
+            self._finish(key, flight, error=error)
+            raise
+        self._finish(key, flight, value)
+        return value
+
+    def statistics(self):
+        counts = {result: CACHE_REQUESTS.value(cache=self.name, result=result)
+                  for result in ("hit", "miss", "collapsed", "error")}
+        lookups = counts["hit"] + counts["miss"] + counts["collapsed"]
+        with self._lock:
+            in_flight = len(self._flights)
+        return {
+            **counts,
+            "hit_ratio": counts["hit"] / lookups if lookups else 0.0,
+            "in_flight": in_flight,
+            **self.backend.statistics(),
+        }
+
+
+_caches = {}
+
+
+def cached(ttl=60.0, maxsize=1024, key=None, backend=None, name=None):
+    """
+    Cache a function's results per arguments, collapsing concurrent misses.
+
+    Args:
+        ttl: Seconds an entry stays valid in the default backend; 0 disables
+            caching (the function is returned unchanged) unless a backend is given
+        maxsize: Entries kept by the default backend before evicting the least recently used
+        key: Function (args, kwargs) -> hashable key; defaults to the arguments themselves
+        backend: Object with get(key) (returning cache.MISSING on a miss), set(key, value),
+            clear() and statistics(), replacing the in-memory LRU
+        name: Cache name in /metrics; defaults to the function's qualified name
+    """
+    def decorate(func):
+        if backend is None and ttl <= 0:
+            return func
+        cache_name = name or f"{func.__module__}.{func.__qualname__}"
+        call = _CachedCall(cache_name, backend or LRUTTLCache(maxsize, ttl), key or _default_key)
+        _caches[cache_name] = call
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                return await call.call_async(func, args, kwargs)
+        elif getattr(func, "is_blocking", False):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                try:
+                    asyncio.get_running_loop()
+                except RuntimeError:
+                    return call.call_sync(func, args, kwargs)
+                # A plain call on the loop is the misuse @blocking reports. It must not join a
+                # flight either: waiting for one would block the loop that has to finish it
+                return func(*args, **kwargs)
+
+            async def offload(*args, **kwargs):
+                return await call.call_async(func.offload, args, kwargs)
+
+            wrapper.offload = offload
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                return call.call_sync(func, args, kwargs)
+
+        wrapper.cache_clear = call.backend.clear
+        wrapper.cache_statistics = call.statistics
+        return wrapper
+
+    return decorate
+
+
+def get_cache_stats():
+    """Return hit/miss/collapsed counts and backend statistics keyed by cache name."""
+    return {cache_name: call.statistics() for cache_name, call in list(_caches.items())}
@@ -0,0 +1,160 @@
+"""Coalescing and batching of background task executions.
+
+Coalescing: a call scheduled with a coalescing key is absorbed when a call
+with the same key is still queued, i.e. scheduled but not yet started. Once
+the queued call starts, the next one with that key is scheduled again, so the
+work always runs at least once after the latest request asked for it.
+
+Batching: calls of a task type that has a batch handler are collected on the
+event loop and run as one execution of the handler, with up to `max_size`
+calls, at most `max_delay` seconds after the first call arrived.
+"""
+import asyncio
+import functools
+import inspect
+import threading
+from dataclasses import dataclass
+
+
+class Coalescer:
+    """Tracks which coalescing keys have a queued call."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._queued = {}  # key -> number of calls absorbed by the queued call
+
+    def claim(self, key):
+        """Return True if the caller should schedule a call for `key`, False if it was absorbed."""
+        with self._lock:
+            if key in self._queued:
+                self._queued[key] += 1
+                return False
+            self._queued[key] = 0
+            return True
+
+    def release(self, key):
+        """Mark the queued call for `key` as started. Returns how many calls it absorbed."""
+        with self._lock:
+            return self._queued.pop(key, 0)
+
+    def queued(self):
+        with self._lock:
+            return len(self._queued)
+
+
+coalescer = Coalescer()
+
+
+def release_on_start(func, keys):
+    """Wrap a task so its coalescing keys are released when it starts running."""
+    keys = [key for key in keys if key is not None]
+    if not keys:
+        return func
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            for key in keys:
+                coalescer.release(key)
+            return await func(*args, **kwargs)
+    else:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for key in keys:
+                coalescer.release(key)
+            return func(*args, **kwargs)
+    return wrapper
+
+
+@dataclass
+class BatchedCall:
+    """One scheduled call waiting in a batch."""
+    args: tuple
+    kwargs: dict
+    key: tuple
+    coalesce_key: object = None
+
+
+@dataclass
+class _BatchCounters:
+    batches: int = 0
+    calls: int = 0
+    max_batch: int = 0
+    flushed_full: int = 0
+    flushed_by_delay: int = 0
+
+
+class Batcher:
+    """Collects calls of one task type and hands them to `submit` as batches. Used on the event loop."""
+
+    def __init__(self, task_type, max_size, max_delay, submit):
+        self.task_type = task_type
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self._submit = submit
+        self._calls = []
+        self._timer = None
+        self._counters = _BatchCounters()
+
+    def add(self, call):
+        self._calls.append(call)
+        if len(self._calls) >= self.max_size:
+            self._counters.flushed_full += 1
+            self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_delay, self._flush_by_delay)
+
+    def _flush_by_delay(self):
+        self._timer = None
+        self._counters.flushed_by_delay += 1
+        self.flush()
+
+    def flush(self):
+        """Submit the collected calls now, if any."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        calls, self._calls = self._calls, []
+        if not calls:
+            return
+        counters = self._counters
+        counters.batches += 1
+        counters.calls += len(calls)
+        counters.max_batch = max(counters.max_batch, len(calls))
+        self._submit(calls)
+
+    def statistics(self):
+        counters = self._counters
+        return {
+            "max_size": self.max_size,
+            "max_delay_s": self.max_delay,
+            "buffered": len(self._calls),
+            "batches": counters.batches,
+            "calls": counters.calls,
+            "avg_batch": counters.calls / counters.batches if counters.batches else 0.0,
+            "max_batch": counters.max_batch,
+            "flushed_full": counters.flushed_full,
+            "flushed_by_delay": counters.flushed_by_delay,
+        }
+
+
+_batchers = {}
+
+
+def get_batcher(task_type, max_size, max_delay, submit):
+    """Return the batcher of a task type, creating it on first use."""
+    batcher = _batchers.get(task_type)
+    if batcher is None:
+        batcher = _batchers.setdefault(task_type, Batcher(task_type, max_size, max_delay, submit))
+    return batcher
+
+
+def flush_batches():
+    """Submit every partially filled batch now (e.g. at shutdown). Must run on the event loop."""
+    for batcher in list(_batchers.values()):
+        batcher.flush()
+
+
+def get_batch_stats():
+    """Return batching statistics keyed by task type."""
+    return {task_type: batcher.statistics() for task_type, batcher in list(_batchers.items())}
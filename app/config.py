@@ -0,0 +1,163 @@
+"""Runtime configuration read from environment variables."""
+import os
+
+
+def _bool_env(name, default):
+    """Read a boolean flag from the environment."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _float_env(name, default):
+    """Read a float from the environment."""
+    value = os.environ.get(name)
+    return float(value) if value else default
+
+
+def _int_env(name, default):
+    """Read an integer from the environment."""
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+def _mapping_env(name, convert=str):
+    """Read a 'key=value,key=value' mapping from the environment."""
+    mapping = {}
+    for item in os.environ.get(name, "").split(","):
+        if "=" in item:
+            key, value = item.split("=", 1)
+            mapping[key.strip()] = convert(value.strip())
+    return mapping
+
+
+def _set_env(name):
+    """Read a comma-separated set of names from the environment."""
+    return {item.strip() for item in os.environ.get(name, "").split(",") if item.strip()}
+
+
+# Event-loop lag monitor
+LOOP_MONITOR_ENABLED = _bool_env("LOOP_MONITOR_ENABLED", True)
+LOOP_MONITOR_INTERVAL = _float_env("LOOP_MONITOR_INTERVAL", 0.05)   # seconds between probes
+LOOP_MONITOR_THRESHOLD = _float_env("LOOP_MONITOR_THRESHOLD", 0.1)  # lag that counts as a stall
+LOOP_MONITOR_MAX_OFFENDERS = _int_env("LOOP_MONITOR_MAX_OFFENDERS", 10)
+
+# Background task worker pools (one pool per task type)
+BG_POOL_DEFAULT_SIZE = _int_env("BG_POOL_DEFAULT_SIZE", 16)
+BG_POOL_SIZES = _mapping_env("BG_POOL_SIZES", int)
+
+# Background task admission control (per task type; a high-water mark of 0 disables it)
+BG_HIGH_WATER_DEFAULT = _int_env("BG_HIGH_WATER_DEFAULT", 0)
+BG_HIGH_WATER_MARKS = _mapping_env("BG_HIGH_WATER_MARKS", int)
+BG_OVERFLOW_DEFAULT = os.environ.get("BG_OVERFLOW_DEFAULT", "reject")  # reject | drop | coalesce
+BG_OVERFLOW_POLICIES = _mapping_env("BG_OVERFLOW_POLICIES")
+BG_REJECT_STATUS = _int_env("BG_REJECT_STATUS", 503)                   # 503 or 429
+BG_RETRY_AFTER_MAX = _int_env("BG_RETRY_AFTER_MAX", 60)                # seconds
+
+# Coalescing: calls of these task types are absorbed by an identical call that is still queued
+BG_COALESCE_TASKS = _set_env("BG_COALESCE_TASKS")
+# Batching: run up to N calls of a task type as one execution of its batch handler ("task=N,...")
+BG_BATCH_SIZES = _mapping_env("BG_BATCH_SIZES", int)
+BG_BATCH_DELAY = _float_env("BG_BATCH_DELAY", 0.05)  # seconds a partial batch waits for more calls
+
+# When pool work is submitted: "response" (Starlette BackgroundTasks, after the response) or
+# "detached" (handed to the lifespan-owned runner at registration, nothing runs after the response)
+BG_SCHEDULING = os.environ.get("BG_SCHEDULING", "response")
+# Seconds the shutdown waits for background calls in flight before abandoning them
+BG_DRAIN_TIMEOUT = _float_env("BG_DRAIN_TIMEOUT", 10.0)
+
+# Where background work runs: "pool" (in-process worker pools) or "queue" (job queue + app.worker)
+BG_BACKEND = os.environ.get("BG_BACKEND", "pool")
+
+# Job queue
+JOB_QUEUE_BACKEND = os.environ.get("JOB_QUEUE_BACKEND", "sqlite")                 # memory | sqlite
+JOB_QUEUE_PATH = os.environ.get("JOB_QUEUE_PATH", "jobs.sqlite3")
+JOB_QUEUE_LOCAL_WORKERS = _int_env("JOB_QUEUE_LOCAL_WORKERS", 0)                # worker threads inside the app
+JOB_QUEUE_POLL_INTERVAL = _float_env("JOB_QUEUE_POLL_INTERVAL", 0.5)            # seconds
+JOB_QUEUE_VISIBILITY_TIMEOUT = _float_env("JOB_QUEUE_VISIBILITY_TIMEOUT", 300)  # requeue jobs running longer
+JOB_QUEUE_RETENTION = _float_env("JOB_QUEUE_RETENTION", 3600)                   # keep finished jobs this long
+JOB_QUEUE_IO_THREADS = _int_env("JOB_QUEUE_IO_THREADS", 4)                       # threads for queue calls from the loop
+
+# Debug mode enables extra runtime checks
+DEBUG = _bool_env("APP_DEBUG", False)
+
+# What `await f.offload()` does for @blocking functions: "offload" (run in a thread) or "inline" (on the loop)
+BLOCKING_CALLS = os.environ.get("BLOCKING_CALLS", "offload")
+BLOCKING_EXECUTOR_THREADS = _int_env("BLOCKING_EXECUTOR_THREADS", 0)  # 0 = AnyIO default thread limiter
+
+# Per-request phase timing: Server-Timing header and per-phase histograms
+REQUEST_TIMING = _bool_env("REQUEST_TIMING", True)
+
+# Sampling profiler served at /debug/profile (off by default; protected by ADMIN_TOKEN like /admin)
+PROFILER_ENABLED = _bool_env("PROFILER_ENABLED", False)
+PROFILER_INTERVAL = _float_env("PROFILER_INTERVAL", 0.01)  # seconds between stack samples
+
+# Simulated I/O time of the inner functions in seconds; 0 leaves only the framework overhead
+INNER_FUNCTION_DELAY = _float_env("INNER_FUNCTION_DELAY", 0.2)
+
+# CPU-bound inner functions: work per call (~0.17ms per iteration) and process pool size
+CPU_INNER_ITERATIONS = _int_env("CPU_INNER_ITERATIONS", 300)
+CPU_POOL_PROCESSES = _int_env("CPU_POOL_PROCESSES", os.cpu_count() or 1)
+CPU_POOL_PRESTART = _bool_env("CPU_POOL_PRESTART", False)  # start and warm up the pool at startup
+
+# I/O-backed inner functions: the upstream stub (python -m bench.upstream) and a local SQLite
+# file. Pools default to the AnyIO thread limiter's 40 tokens; timeouts include waiting for a connection
+UPSTREAM_URL = os.environ.get("UPSTREAM_URL", "http://127.0.0.1:8100/")
+UPSTREAM_POOL_SIZE = _int_env("UPSTREAM_POOL_SIZE", 40)
+UPSTREAM_TIMEOUT = _float_env("UPSTREAM_TIMEOUT", 30.0)  # seconds
+DB_PATH = os.environ.get("DB_PATH", "inner.sqlite3")
+DB_POOL_SIZE = _int_env("DB_POOL_SIZE", 40)
+DB_QUERY_DELAY = _float_env("DB_QUERY_DELAY", 0.2)  # simulated query time in seconds
+DB_TIMEOUT = _float_env("DB_TIMEOUT", 30.0)  # seconds
+
+# Routes return pre-encoded JSON responses, skipping jsonable_encoder (orjson when installed)
+FAST_RESPONSES = _bool_env("FAST_RESPONSES", False)
+
+# Inner function result cache (seconds an entry stays valid; 0 = no caching) and entries kept
+INNER_CACHE_TTL = _float_env("INNER_CACHE_TTL", 0)
+INNER_CACHE_SIZE = _int_env("INNER_CACHE_SIZE", 1024)
+
+# Multi-worker mode: workers publish counters to this shared file (empty = single-worker mode)
+METRICS_SHARED_PATH = os.environ.get("METRICS_SHARED_PATH", "")
+METRICS_SHARED_SLOTS = _int_env("METRICS_SHARED_SLOTS", 64)
+METRICS_PUBLISH_INTERVAL = _float_env("METRICS_PUBLISH_INTERVAL", 0.25)  # seconds
+
+# AnyIO default thread limiter size applied at startup (0 = keep AnyIO's default of 40)
+THREAD_LIMITER_TOKENS = _int_env("THREAD_LIMITER_TOKENS", 0)
+
+# Adaptive thread limiter: resize the pool from its queue length, usage and process CPU
+THREAD_LIMITER_ADAPTIVE = _bool_env("THREAD_LIMITER_ADAPTIVE", False)
+THREAD_LIMITER_MIN = _int_env("THREAD_LIMITER_MIN", 8)
+THREAD_LIMITER_MAX = _int_env("THREAD_LIMITER_MAX", 400)
+THREAD_LIMITER_ADJUST_INTERVAL = _float_env("THREAD_LIMITER_ADJUST_INTERVAL", 1.0)  # seconds
+THREAD_LIMITER_CPU_HIGH = _float_env("THREAD_LIMITER_CPU_HIGH", 85.0)  # % of the cores usable (one with the GIL); stop growing above
+
+# Request deadlines: cancel requests whose deadline passes or whose client disconnects before
+# the response starts. The deadline is the header's value in seconds, else REQUEST_TIMEOUT (0 = none)
+REQUEST_CANCELLATION = _bool_env("REQUEST_CANCELLATION", False)
+REQUEST_TIMEOUT = _float_env("REQUEST_TIMEOUT", 0)
+REQUEST_TIMEOUT_HEADER = os.environ.get("REQUEST_TIMEOUT_HEADER", "x-request-timeout").lower()
+
+# Per-route bulkheads: requests in flight per route path ("/path=limit,..."; 0 = unlimited)
+# and requests that may wait behind a full bulkhead before the rest are shed with 503
+BULKHEAD_LIMITS = _mapping_env("BULKHEAD_LIMITS", int)
+BULKHEAD_DEFAULT_LIMIT = _int_env("BULKHEAD_DEFAULT_LIMIT", 0)
+BULKHEAD_QUEUE = _int_env("BULKHEAD_QUEUE", 100)
+
+# Priority lanes for `def` handlers: critical routes ("/path,..."), threads reserved for them in a
+# limiter of their own, and default limiter waiters beyond which bulk requests are shed (0 = no limit)
+CRITICAL_ROUTES = _set_env("CRITICAL_ROUTES")
+THREAD_RESERVED_TOKENS = _int_env("THREAD_RESERVED_TOKENS", 0)
+BULK_QUEUE = _int_env("BULK_QUEUE", 0)
+
+# Admin endpoints require this value in the X-Admin-Token header (empty = loopback clients only)
+ADMIN_TOKEN = os.environ.get("ADMIN_TOKEN", "")
+
+# Logging: "sync" (write to stdout in the logging thread) or "queue" (bounded queue + batching writer thread)
+LOG_MODE = os.environ.get("LOG_MODE", "sync")
+LOG_QUEUE_SIZE = _int_env("LOG_QUEUE_SIZE", 10000)   # records buffered before new ones are dropped
+LOG_BATCH_SIZE = _int_env("LOG_BATCH_SIZE", 256)     # records per stdout write
+# Fraction of requests whose INFO records are logged, per path ("/path=0.1,...") and by default
+LOG_SAMPLE_RATES = _mapping_env("LOG_SAMPLE_RATES", float)
+LOG_SAMPLE_DEFAULT = _float_env("LOG_SAMPLE_DEFAULT", 1.0)
@@ -0,0 +1,138 @@
+"""CPU-bound work and the process pool that can run it.
+
+cpu_work() stands in for the CPU part of real handlers: serializing, parsing,
+hashing and compressing a small document. Most of it holds the GIL, so in one
+process it runs on one core at a time whatever the route style. The process
+pool runs the work in separate interpreters, one core each. It is started by
+the first request that uses it, so apps that never do don't pay for its
+processes, or by the lifespan at startup with CPU_POOL_PRESTART, and shut down
+by the lifespan. Both starting and stopping block while processes spawn or
+exit, so they run off the event loop.
+
+This module only imports the standard library and app.config, so pool
+processes start quickly with the "spawn" method. Spawn is used instead of fork because the
+app process already runs threads when the pool starts.
+"""
+import hashlib
+import json
+import logging
+import multiprocessing
+import threading
+import zlib
+from concurrent.futures import ProcessPoolExecutor, wait
+
+from app import config
+
+logger = logging.getLogger(__name__)
+
+
+def cpu_work(iterations):
+    """Serialize, parse, hash and compress a small document `iterations` times (~0.17ms each)."""
+    document = {
+        "id": 0, "name": "order", "tags": ["a", "b", "c"],
+        "items": [{"sku": i, "qty": i % 3, "price": i * 1.5} for i in range(20)],
+    }
+    digest = b""
+    for i in range(iterations):
+        document["id"] = i
+        payload = json.dumps(document).encode()
+        json.loads(payload)
+        digest = hashlib.sha256(payload + digest).digest()
+        zlib.compress(payload, 6)
+    return digest.hex()
+
+
+def _warm_up():
+    return None
+
+
+class ProcessPool:
+    """A ProcessPoolExecutor with submitted/completed/failed counters."""
+
+    def __init__(self, processes):
+        self.processes = processes
+        self._executor = ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn"))
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+
+    def warm_up(self):
+        """Start the worker processes now, so the first requests do not pay for spawning them."""
+        return [self._executor.submit(_warm_up) for _ in range(self.processes)]
+
+    def submit(self, func, *args):
+        """Submit a picklable callable and return a concurrent.futures.Future."""
+        with self._lock:
+            self.submitted += 1
+        future = self._executor.submit(func, *args)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future):
+        with self._lock:
+            self.completed += 1
+            if future.cancelled() or future.exception() is not None:
+                self.failed += 1
+
+    def statistics(self):
+        with self._lock:
+            return {
+                "processes": self.processes,
+                "submitted": self.submitted,
+                "in_flight": self.submitted - self.completed,
+                "completed": self.completed,
+                "failed": self.failed,
+            }
+
+    def shutdown(self):
+        """Stop the worker processes; queued work is cancelled."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_process_pool():
+    """Return the process pool, starting it with CPU_POOL_PROCESSES processes on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPool(config.CPU_POOL_PROCESSES)
+            _pool.warm_up()
+            logger.info("Started process pool with %d processes", config.CPU_POOL_PROCESSES)
+        return _pool
+
+
+def start_process_pool():
+    """Start the process pool and wait until its processes are up. Called from the lifespan."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            return _pool
+        _pool = ProcessPool(config.CPU_POOL_PROCESSES)
+        warm_up = _pool.warm_up()
+    wait(warm_up)
+    logger.info("Started process pool with %d processes", config.CPU_POOL_PROCESSES)
+    return _pool
+
+
+def running_process_pool():
+    """Return the process pool, or None if it has not been started."""
+    return _pool
+
+
+def shutdown_process_pool():
+    """Stop the process pool, if it was started. Called from the lifespan."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+def get_process_pool_stats():
+    """Return the process pool counters, or None if no pool is running."""
+    pool = _pool
+    return pool.statistics() if pool is not None else None
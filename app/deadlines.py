@@ -0,0 +1,166 @@
+"""Request deadlines and cancellation of abandoned requests.
+
+DeadlineMiddleware gives every HTTP request a deadline: the X-Request-Timeout
+header (seconds) when the client sends one, otherwise REQUEST_TIMEOUT. It also
+watches the connection for the client going away. When either happens before
+the response has started, the request is abandoned:
+
+  - the app call is cancelled. A `def` handler still waiting for a thread
+    limiter token never runs, and awaits in async handlers (async inner calls,
+    offloads still waiting for a thread) raise CancelledError
+  - a `def` handler already running in a thread cannot be interrupted. It
+    runs to completion, but schedule_background_task() sees the request is
+    abandoned and schedules nothing
+  - the client gets 504 on a missed deadline. A disconnect is recorded as 499
+    (client closed request); nothing reaches the client, which is gone
+
+Outgoing calls (app.io_backends) take the time left as their timeout and pass
+it on in the same header.
+
+The deadline is kept in a context variable, which handlers see whether they
+run on the event loop or in a worker thread.
+"""
+import contextvars
+import time
+
+import anyio
+
+from app import config
+from app.metrics_registry import REQUESTS_ABANDONED
+from app.middleware import route_label
+
+DEADLINE = "deadline"
+DISCONNECT = "disconnect"
+
+_current = contextvars.ContextVar("request_deadline", default=None)
+
+
+class RequestDeadline:
+    """Deadline (perf_counter seconds, or None) and abandonment of one request."""
+
+    __slots__ = ("expires", "abandoned")
+
+    def __init__(self, timeout):
+        self.expires = time.perf_counter() + timeout if timeout else None
+        self.abandoned = None  # DEADLINE or DISCONNECT once abandoned
+
+    def remaining(self):
+        """Seconds left before the deadline, or None without one."""
+        if self.expires is None:
+            return None
+        return max(self.expires - time.perf_counter(), 0.0)
+
+
+def _request_timeout(scope):
+    header = config.REQUEST_TIMEOUT_HEADER.encode("latin-1")
+    for name, value in scope["headers"]:
+        if name == header:
+            try:
+                return max(float(value), 0.0)
+            except ValueError:
+                break
+    return config.REQUEST_TIMEOUT
+
+
+def request_abandoned():
+    """True if the current request's deadline has passed or its client is gone."""
+    deadline = _current.get()
+    if deadline is None:
+        return False
+    if deadline.abandoned is None and deadline.remaining() == 0.0:
+        deadline.abandoned = DEADLINE
+    return deadline.abandoned is not None
+
+
+def deadline_timeout(timeout):
+    """Cap a timeout for an outgoing call at the time left for the current request."""
+    deadline = _current.get()
+    remaining = deadline.remaining() if deadline is not None else None
+    return timeout if remaining is None else max(min(timeout, remaining), 0.001)
+
+
+def deadline_headers():
+    """Headers that pass the current request's time left on to an outgoing call."""
+    deadline = _current.get()
+    remaining = deadline.remaining() if deadline is not None else None
+    return {} if remaining is None else {config.REQUEST_TIMEOUT_HEADER: f"{remaining:.3f}"}
+
+
+class DeadlineMiddleware:
+    """Cancels requests whose deadline passes or whose client disconnects before the response starts."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        deadline = RequestDeadline(_request_timeout(scope))
+        _current.set(deadline)
+        response_started = False
+        disconnected = anyio.Event()
+
+        # Read the request body up front, so that afterwards receive() only
+        # returns once the client disconnects. A request that streams its
+        # body is passed through, with only its deadline watched.
+        first = await receive()
+        watch_connection = first["type"] == "http.request" and not first.get("more_body", False)
+        replayed = False
+
+        async def replay_receive():
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return first
+            if not watch_connection:
+                return await receive()
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        async def send_wrapper(message):
+            nonlocal response_started
+            if not response_started and deadline.abandoned is not None:
+                # Abandoned while a `def` handler ran on: the cancellation only lands at the
+                # next checkpoint, which may come after the response. The 504/499 replaces it
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        async def watch(cancel_scope):
+            reason = DEADLINE
+            with anyio.move_on_after(deadline.remaining() if deadline.expires is not None else float("inf")):
+                if watch_connection:
+                    await receive()  # with the body read, this only returns on disconnect
+                    disconnected.set()
+                    reason = DISCONNECT
+                else:
+                    await anyio.sleep_forever()
+            # Once the response has started, a disconnect or a late deadline changes nothing
+            if not response_started:
+                deadline.abandoned = reason
+                cancel_scope.cancel()
+
+        async with anyio.create_task_group() as task_group:
+            task_group.start_soon(watch, task_group.cancel_scope)
+            await self.app(scope, replay_receive, send_wrapper)
+            task_group.cancel_scope.cancel()
+
+        if deadline.abandoned is not None and not response_started:
+            REQUESTS_ABANDONED.inc(route=route_label(scope), reason=deadline.abandoned)
+            if deadline.abandoned == DEADLINE:
+                await _send_plain(send, 504, b"Request deadline exceeded")
+            else:
+                # The server drops messages for a closed connection; the outer middleware still records the 499
+                await _send_plain(send, 499, b"")
+
+
+async def _send_plain(send, status, body):
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", b"text/plain; charset=utf-8"), (b"content-length", str(len(body)).encode())],
+    })
+    await send({"type": "http.response.body", "body": body})
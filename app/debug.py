@@ -0,0 +1,48 @@
+"""Debug endpoints for inspecting the running application (enabled with PROFILER_ENABLED)."""
+import asyncio
+
+import anyio
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from app import config
+from app.admin import require_admin_token
+from app.profiler import SamplingProfiler, release_profiler, try_acquire_profiler
+
+router = APIRouter(prefix="/debug", dependencies=[Depends(require_admin_token)])
+
+
+@router.get("/profile")
+async def profile(
+    seconds: float = Query(default=10.0, gt=0, le=300),
+    interval_ms: float = Query(default=None, gt=0, le=1000),
+    format: str = Query(default="collapsed", pattern="^(collapsed|json)$"),
+):
+    """
+    Sample the stacks of every thread in this worker for `seconds` and return them.
+
+    The default `collapsed` format is one "thread;frame;...;frame count" line per
+    stack, for flamegraph.pl or speedscope. `json` returns the sample counts, the
+    sampler's own CPU overhead and the functions with the most self samples.
+    Only one profile runs at a time per worker; a second request gets 409.
+    """
+    if not try_acquire_profiler():
+        raise HTTPException(status_code=409, detail="A profile is already running")
+    interval = interval_ms / 1000 if interval_ms else config.PROFILER_INTERVAL
+    profiler = SamplingProfiler(interval)
+    try:
+        profiler.start()
+        # Sleeping keeps the loop free and uses no thread-pool token, so profiling a
+        # saturated pool does not have to queue behind it
+        await asyncio.sleep(seconds)
+    finally:
+        # Joining the sampler waits for its last sample and the final stack counts, so it
+        # runs off the loop. A limiter of its own keeps it from queueing behind a saturated
+        # default pool, and the shield lets it finish when the request is cancelled
+        with anyio.CancelScope(shield=True):
+            await anyio.to_thread.run_sync(profiler.stop, limiter=anyio.CapacityLimiter(1))
+        release_profiler()
+
+    if format == "json":
+        return profiler.statistics()
+    return PlainTextResponse(profiler.collapsed())
@@ -1,25 +1,218 @@
 """Inner functions called by route handlers."""
 import time
 import asyncio
+import contextvars
+import functools
 import logging
+import random
 import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import anyio
+
+from app import config
+from app.cache import cached
+from app.cpu import cpu_work, get_process_pool, running_process_pool
+from app.io_backends import DB_CATEGORIES, db_query, db_query_async, get_async_upstream, get_sync_upstream
 
 logger = logging.getLogger(__name__)
 
 
+class BlockingCallError(RuntimeError):
+    """Raised in debug mode when a blocking function would run on the event loop."""
+
+
+# Registry of functions marked @blocking, keyed by qualified name
+_blocking_functions = {}
+_blocking_calls = Counter()
+_blocking_lock = threading.Lock()
+_blocking_executor = None
+
+
+def _count_blocking_call(name, how):
+    with _blocking_lock:
+        _blocking_calls[(name, how)] += 1
+
+
+def _get_blocking_executor():
+    """Return the dedicated executor for blocking calls, or None to use AnyIO's limiter."""
+    global _blocking_executor
+    if config.BLOCKING_EXECUTOR_THREADS <= 0:
+        return None
+    with _blocking_lock:
+        if _blocking_executor is None:
+            _blocking_executor = ThreadPoolExecutor(
+                max_workers=config.BLOCKING_EXECUTOR_THREADS, thread_name_prefix="blocking"
+            )
+        return _blocking_executor
+
+
+def blocking(func):
+    """
+    Mark a sync function as blocking.
+
+    Calling the function always runs it in the calling thread and returns its
+    result. From a worker thread that is the intended use. On the event loop
+    it blocks the loop: the call is counted as inline, and in debug mode
+    (APP_DEBUG=1) it raises BlockingCallError instead.
+
+    Coroutines call `await func.offload(*args, **kwargs)` instead:
+
+      - BLOCKING_CALLS=offload (default): the call runs in a thread, via the
+        AnyIO thread limiter or a dedicated executor of
+        BLOCKING_EXECUTOR_THREADS threads
+      - BLOCKING_CALLS=inline: the call runs on the loop, blocking it. In
+        debug mode this raises BlockingCallError instead
+    """
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    def run_inline(args, kwargs):
+        if config.DEBUG:
+            raise BlockingCallError(f"{name} is blocking and was called on the event loop without offload")
+        _count_blocking_call(name, "inline")
+        return func(*args, **kwargs)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            _count_blocking_call(name, "direct")
+            return func(*args, **kwargs)
+        return run_inline(args, kwargs)
+
+    async def offload(*args, **kwargs):
+        if config.BLOCKING_CALLS == "inline":
+            return run_inline(args, kwargs)
+        _count_blocking_call(name, "offload")
+        return await _run_offloaded(func, args, kwargs)
+
+    wrapper.is_blocking = True
+    wrapper.offload = offload
+    _blocking_functions[name] = wrapper
+    return wrapper
+
+
+async def _run_offloaded(func, args, kwargs):
+    call = functools.partial(func, *args, **kwargs)
+    executor = _get_blocking_executor()
+    if executor is None:
+        return await anyio.to_thread.run_sync(call)
+    # run_in_executor does not propagate context variables on its own
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(executor, context.run, call)
+
+
+def get_blocking_call_stats():
+    """Return call counts of @blocking functions by how they ran (direct/offload/inline)."""
+    with _blocking_lock:
+        calls = dict(_blocking_calls)
+    stats = {name: {"direct": 0, "offload": 0, "inline": 0} for name in _blocking_functions}
+    for (name, how), count in calls.items():
+        stats[name][how] = count
+    return stats
+
+
+@cached(ttl=config.INNER_CACHE_TTL, maxsize=config.INNER_CACHE_SIZE)
+@blocking
 def sync_inner_function():
     """Synchronous inner function that simulates I/O work."""
     thread_id = threading.get_ident()
-    logger.info(f"[sync_inner_function] Executing in thread {thread_id}")
-    time.sleep(0.2)  # Simulate I/O work
-    logger.info(f"[sync_inner_function] Completed in thread {thread_id}")
+    logger.info("[sync_inner_function] Executing in thread %s", thread_id)
+    if config.INNER_FUNCTION_DELAY:
+        time.sleep(config.INNER_FUNCTION_DELAY)  # Simulate I/O work
+    logger.info("[sync_inner_function] Completed in thread %s", thread_id)
     return {"type": "sync", "thread_id": thread_id}
 
 
+@cached(ttl=config.INNER_CACHE_TTL, maxsize=config.INNER_CACHE_SIZE)
 async def async_inner_function():
     """Asynchronous inner function that simulates I/O work."""
     thread_id = threading.get_ident()
-    logger.info(f"[async_inner_function] Executing in thread {thread_id}")
-    await asyncio.sleep(0.2)  # Simulate async I/O work
-    logger.info(f"[async_inner_function] Completed in thread {thread_id}")
+    logger.info("[async_inner_function] Executing in thread %s", thread_id)
+    if config.INNER_FUNCTION_DELAY:
+        await asyncio.sleep(config.INNER_FUNCTION_DELAY)  # Simulate async I/O work
+    logger.info("[async_inner_function] Completed in thread %s", thread_id)
     return {"type": "async", "thread_id": thread_id}
+
+
+# Where CPU-bound inner functions run
+CPU_MODES = ("inline", "thread", "process")
+
+
+def sync_cpu_inner_function(mode):
+    """
+    CPU-bound inner function for `def` routes, which already run in an AnyIO worker thread.
+
+    "inline" and "thread" both run the work in the calling thread; "process"
+    runs it in the process pool and blocks the thread until it is done.
+    """
+    thread_id = threading.get_ident()
+    logger.info("[sync_cpu_inner_function] Executing in thread %s (%s)", thread_id, mode)
+    if mode == "process":
+        digest = get_process_pool().submit(cpu_work, config.CPU_INNER_ITERATIONS).result()
+    else:
+        digest = cpu_work(config.CPU_INNER_ITERATIONS)
+    logger.info("[sync_cpu_inner_function] Completed in thread %s", thread_id)
+    return {"type": "cpu", "mode": mode, "thread_id": thread_id, "digest": digest}
+
+
+async def async_cpu_inner_function(mode):
+    """
+    CPU-bound inner function for `async` routes.
+
+    "inline" runs the work on the event loop, blocking it; "thread" offloads it
+    to the AnyIO thread pool; "process" awaits it from the process pool.
+    """
+    thread_id = threading.get_ident()
+    logger.info("[async_cpu_inner_function] Executing in thread %s (%s)", thread_id, mode)
+    if mode == "process":
+        # Starting the pool spawns processes, so the first request does it off the loop
+        pool = running_process_pool() or await anyio.to_thread.run_sync(get_process_pool)
+        future = pool.submit(cpu_work, config.CPU_INNER_ITERATIONS)
+        digest = await asyncio.wrap_future(future)
+    elif mode == "thread":
+        digest = await anyio.to_thread.run_sync(cpu_work, config.CPU_INNER_ITERATIONS)
+    else:
+        digest = cpu_work(config.CPU_INNER_ITERATIONS)
+    logger.info("[async_cpu_inner_function] Completed in thread %s", thread_id)
+    return {"type": "cpu", "mode": mode, "thread_id": thread_id, "digest": digest}
+
+
+@blocking
+def sync_http_inner_function():
+    """Synchronous inner function that calls the upstream stub through the pooled requests.Session."""
+    thread_id = threading.get_ident()
+    logger.info("[sync_http_inner_function] Executing in thread %s", thread_id)
+    payload = get_sync_upstream().get()
+    logger.info("[sync_http_inner_function] Completed in thread %s", thread_id)
+    return {"type": "http", "thread_id": thread_id, "upstream_request": payload["request"]}
+
+
+async def async_http_inner_function():
+    """Asynchronous inner function that calls the upstream stub through the pooled httpx.AsyncClient."""
+    thread_id = threading.get_ident()
+    logger.info("[async_http_inner_function] Executing in thread %s", thread_id)
+    payload = await get_async_upstream().get()
+    logger.info("[async_http_inner_function] Completed in thread %s", thread_id)
+    return {"type": "http", "thread_id": thread_id, "upstream_request": payload["request"]}
+
+
+@blocking
+def sync_db_inner_function():
+    """Synchronous inner function that queries SQLite through the connection pool."""
+    thread_id = threading.get_ident()
+    logger.info("[sync_db_inner_function] Executing in thread %s", thread_id)
+    row = db_query(random.randrange(DB_CATEGORIES))
+    logger.info("[sync_db_inner_function] Completed in thread %s", thread_id)
+    return {"type": "db", "thread_id": thread_id, **row}
+
+
+async def async_db_inner_function():
+    """Asynchronous inner function that queries SQLite in the pool's dedicated threads."""
+    thread_id = threading.get_ident()
+    logger.info("[async_db_inner_function] Executing in thread %s", thread_id)
+    row = await db_query_async(random.randrange(DB_CATEGORIES))
+    logger.info("[async_db_inner_function] Completed in thread %s", thread_id)
+    return {"type": "db", "thread_id": thread_id, **row}
@@ -0,0 +1,331 @@
+"""Pooled clients behind the I/O-backed inner functions.
+
+The http inner functions call the upstream stub (python -m bench.upstream)
+at UPSTREAM_URL: def routes through a requests.Session, async routes through
+an httpx.AsyncClient. The db inner functions query a local SQLite file
+through a pool of connections; async routes run the query in threads of
+their own CapacityLimiter, as an async SQLite driver would, so they do not
+take tokens from the default thread limiter.
+
+Pool sizes default to 40, the size of AnyIO's default thread limiter, so a
+def route that holds a thread never also waits for a connection. Below that,
+requests queue twice, first for a thread and then for a connection. Each pool
+records how long callers waited for a connection, which shows where that
+second queue forms.
+
+Waits and calls are bounded by the request's deadline (app.deadlines) when it
+is sooner than the pool's timeout.
+"""
+import asyncio
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+
+import anyio
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from app import config
+from app.deadlines import deadline_headers, deadline_timeout
+from app.metrics_registry import POOL_WAIT_DURATION
+
+logger = logging.getLogger(__name__)
+
+# Rows and distinct categories in the seeded table
+DB_ROWS = 10_000
+DB_CATEGORIES = 100
+
+
+class PoolTimeoutError(RuntimeError):
+    """Raised when no connection of a pool became free within the timeout."""
+
+
+class PoolUsage:
+    """Connection checkouts of one pool: how many are in use and how long callers waited."""
+
+    def __init__(self, name, size):
+        self.name = name
+        self.size = size
+        self._lock = threading.Lock()
+        self.in_use = 0
+        self.max_in_use = 0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.waited = 0.0
+        self.max_wait = 0.0
+
+    def checked_out(self, waited):
+        POOL_WAIT_DURATION.observe(waited, pool=self.name)
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.max_in_use = max(self.max_in_use, self.in_use)
+            self.waited += waited
+            self.max_wait = max(self.max_wait, waited)
+
+    def checked_in(self):
+        with self._lock:
+            self.in_use -= 1
+
+    def timed_out(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def statistics(self):
+        with self._lock:
+            return {
+                "size": self.size,
+                "in_use": self.in_use,
+                "max_in_use": self.max_in_use,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.waited / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+            }
+
+
+class ThreadSlots:
+    """
+    Bounds blocking callers to `size` connections at a time.
+
+    The clients' own pools are sized the same and never block; callers wait
+    here instead, where the wait is measured.
+    """
+
+    def __init__(self, name, size):
+        self.usage = PoolUsage(name, size)
+        self._semaphore = threading.BoundedSemaphore(size)
+
+    @contextmanager
+    def hold(self, timeout):
+        started = time.perf_counter()
+        if not self._semaphore.acquire(timeout=timeout):
+            self.usage.timed_out()
+            raise PoolTimeoutError(f"No {self.usage.name} connection free after {timeout:g}s")
+        self.usage.checked_out(time.perf_counter() - started)
+        try:
+            yield
+        finally:
+            self.usage.checked_in()
+            self._semaphore.release()
+
+
+class LoopSlots:
+    """Bounds coroutines to `size` connections at a time."""
+
+    def __init__(self, name, size):
+        self.usage = PoolUsage(name, size)
+        self._semaphore = asyncio.BoundedSemaphore(size)
+
+    @asynccontextmanager
+    async def hold(self, timeout):
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout)
+        except TimeoutError:
+            self.usage.timed_out()
+            raise PoolTimeoutError(f"No {self.usage.name} connection free after {timeout:g}s") from None
+        self.usage.checked_out(time.perf_counter() - started)
+        try:
+            yield
+        finally:
+            self.usage.checked_in()
+            self._semaphore.release()
+
+
+class SyncUpstreamClient:
+    """requests.Session keeping up to `size` connections to the upstream alive."""
+
+    def __init__(self, url, size, timeout):
+        self.url = url
+        self.timeout = timeout
+        self.slots = ThreadSlots("upstream_sync", size)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=size, pool_block=True)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get(self):
+        with self.slots.hold(deadline_timeout(self.timeout)):
+            response = self.session.get(self.url, headers=deadline_headers(), timeout=deadline_timeout(self.timeout))
+            response.raise_for_status()
+            return response.json()
+
+    def close(self):
+        self.session.close()
+
+
+class AsyncUpstreamClient:
+    """httpx.AsyncClient keeping up to `size` connections to the upstream alive."""
+
+    def __init__(self, url, size, timeout):
+        self.url = url
+        self.timeout = timeout
+        self.slots = LoopSlots("upstream_async", size)
+        self.client = httpx.AsyncClient(
+            timeout=timeout, limits=httpx.Limits(max_connections=size, max_keepalive_connections=size)
+        )
+
+    async def get(self):
+        async with self.slots.hold(deadline_timeout(self.timeout)):
+            response = await self.client.get(
+                self.url, headers=deadline_headers(), timeout=deadline_timeout(self.timeout)
+            )
+            response.raise_for_status()
+            return response.json()
+
+    async def close(self):
+        await self.client.aclose()
+
+
+def _sleep_ms(milliseconds):
+    """SQL function sleep_ms(n): stands in for the server-side time of a remote database query."""
+    time.sleep(milliseconds / 1000)
+    return milliseconds
+
+
+class SQLitePool:
+    """Up to `size` SQLite connections, opened on demand and reused, shared by all threads."""
+
+    def __init__(self, path, size, timeout):
+        self.path = path
+        self.timeout = timeout
+        self.slots = ThreadSlots("db", size)
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self.opened = 0
+        self._setup()
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False)
+        connection.create_function("sleep_ms", 1, _sleep_ms)
+        with self._lock:
+            self.opened += 1
+        return connection
+
+    def _setup(self):
+        """Switch the file to WAL so readers never block each other, and seed the table once."""
+        connection = self._connect()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS items (id INTEGER PRIMARY KEY, category INTEGER, price REAL, name TEXT)"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS items_category ON items (category)")
+        if connection.execute("SELECT count(*) FROM items").fetchone()[0] == 0:
+            connection.executemany(
+                "INSERT INTO items (category, price, name) VALUES (?, ?, ?)",
+                ((i % DB_CATEGORIES, (i * 7919 % 10_000) / 100, f"item-{i}") for i in range(DB_ROWS)),
+            )
+            logger.info("Seeded %s with %d rows", self.path, DB_ROWS)
+        connection.commit()
+        self._idle.put(connection)
+
+    @contextmanager
+    def connection(self):
+        with self.slots.hold(deadline_timeout(self.timeout)):
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                connection = self._connect()
+            try:
+                yield connection
+            finally:
+                self._idle.put(connection)
+
+    def query(self, category, delay):
+        """Aggregate one category's rows, after `delay` seconds of simulated query time."""
+        with self.connection() as connection:
+            if delay:
+                connection.execute("SELECT sleep_ms(?)", (delay * 1000,)).fetchone()
+            count, avg_price = connection.execute(
+                "SELECT count(*), avg(price) FROM items WHERE category = ?", (category,)
+            ).fetchone()
+        return {"category": category, "count": count, "avg_price": round(avg_price, 2)}
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+_lock = threading.Lock()
+_sync_upstream = None
+_async_upstream = None
+_db_pool = None
+_db_limiter = None
+
+
+def get_sync_upstream():
+    """Return the requests-based upstream client, creating it on first use."""
+    global _sync_upstream
+    with _lock:
+        if _sync_upstream is None:
+            _sync_upstream = SyncUpstreamClient(config.UPSTREAM_URL, config.UPSTREAM_POOL_SIZE, config.UPSTREAM_TIMEOUT)
+        return _sync_upstream
+
+
+def get_async_upstream():
+    """Return the httpx-based upstream client, creating it on first use (on the event loop)."""
+    global _async_upstream
+    if _async_upstream is None:
+        _async_upstream = AsyncUpstreamClient(config.UPSTREAM_URL, config.UPSTREAM_POOL_SIZE, config.UPSTREAM_TIMEOUT)
+    return _async_upstream
+
+
+def get_db_pool():
+    """Return the SQLite pool, creating and seeding the database on first use."""
+    global _db_pool
+    with _lock:
+        if _db_pool is None:
+            _db_pool = SQLitePool(config.DB_PATH, config.DB_POOL_SIZE, config.DB_TIMEOUT)
+        return _db_pool
+
+
+def db_query(category):
+    """Run the inner query from a worker thread."""
+    return get_db_pool().query(category, config.DB_QUERY_DELAY)
+
+
+async def db_query_async(category):
+    """Run the inner query from the event loop, in one of DB_POOL_SIZE dedicated threads."""
+    global _db_limiter
+    if _db_limiter is None:
+        _db_limiter = anyio.CapacityLimiter(config.DB_POOL_SIZE)
+    return await anyio.to_thread.run_sync(db_query, category, limiter=_db_limiter)
+
+
+async def close_io_backends():
+    """Close the clients and connections that were opened. Called from the lifespan."""
+    global _sync_upstream, _async_upstream, _db_pool
+    with _lock:
+        sync_upstream, _sync_upstream = _sync_upstream, None
+        db_pool, _db_pool = _db_pool, None
+    async_upstream, _async_upstream = _async_upstream, None
+    if sync_upstream is not None:
+        sync_upstream.close()
+    if async_upstream is not None:
+        await async_upstream.close()
+    if db_pool is not None:
+        db_pool.close()
+
+
+def get_io_pool_stats():
+    """Return connection usage of the pools that were opened, keyed by pool."""
+    stats = {}
+    if _sync_upstream is not None:
+        stats["upstream_sync"] = _sync_upstream.slots.usage.statistics()
+    if _async_upstream is not None:
+        stats["upstream_async"] = _async_upstream.slots.usage.statistics()
+    if _db_pool is not None:
+        stats["db"] = {**_db_pool.slots.usage.statistics(), "opened": _db_pool.opened}
+    if _db_limiter is not None:
+        limiter = _db_limiter.statistics()
+        stats["db_threads"] = {"total_tokens": limiter.total_tokens, "borrowed_tokens": limiter.borrowed_tokens,
+                               "tasks_waiting": limiter.tasks_waiting}
+    return stats
@@ -0,0 +1,377 @@
+"""Durable background job queue.
+
+Background work can be enqueued as named jobs instead of running on the
+in-process pools. Jobs are consumed by worker processes started with
+`python -m app.worker`, so the work runs on other cores and a queued backlog
+survives an app restart.
+
+Two backends are available:
+
+  - InMemoryJobQueue: jobs live in process memory; consumed by worker threads
+    started inside the app (useful for development)
+  - SQLiteJobQueue:   jobs live in a SQLite database in WAL mode, shared by the
+    app and any number of worker processes
+
+Queue calls made from the event loop go through run_queue_io() or
+submit_queue_io(), which run them on a few dedicated threads: a SQLite
+statement can wait up to 30s for the database lock, and the loop must not.
+"""
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+
+from fastapi import APIRouter, HTTPException
+
+from app import config
+
+router = APIRouter()
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+@dataclass
+class Job:
+    """A unit of background work identified by task name."""
+    id: str
+    task_name: str
+    args: list = field(default_factory=list)
+    kwargs: dict = field(default_factory=dict)
+    status: str = QUEUED
+    attempts: int = 0
+    worker: str | None = None
+    error: str | None = None
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    def to_dict(self):
+        return asdict(self)
+
+
+def new_job_id():
+    """Return a new, unique job id."""
+    return uuid.uuid4().hex
+
+
+class JobQueue(ABC):
+    """Interface shared by job queue backends."""
+
+    @abstractmethod
+    def enqueue(self, task_name, args=(), kwargs=None, job_id=None):
+        """Queue a job and return its id (`job_id`, or a new one)."""
+
+    @abstractmethod
+    def claim(self, worker_id, timeout):
+        """Claim the oldest queued job, waiting up to timeout seconds. Returns a Job or None."""
+
+    @abstractmethod
+    def complete(self, job_id):
+        """Mark a running job as done."""
+
+    @abstractmethod
+    def fail(self, job_id, error):
+        """Mark a running job as failed."""
+
+    @abstractmethod
+    def get(self, job_id):
+        """Return a job by id, or None."""
+
+    @abstractmethod
+    def pending_count(self, task_name=None):
+        """Return the number of queued or running jobs, optionally for one task name."""
+
+    @abstractmethod
+    def counts(self):
+        """Return job counts keyed by status."""
+
+    @abstractmethod
+    def requeue_stale(self, older_than):
+        """Requeue running jobs claimed more than older_than seconds ago. Returns the count."""
+
+    @abstractmethod
+    def purge_finished(self, older_than):
+        """Delete finished jobs older than older_than seconds. Returns the count."""
+
+    def close(self):
+        """Release backend resources."""
+
+
+class InMemoryJobQueue(JobQueue):
+    """Job queue held in process memory."""
+
+    def __init__(self):
+        self._jobs = OrderedDict()
+        self._queued = deque()
+        self._cond = threading.Condition()
+
+    def enqueue(self, task_name, args=(), kwargs=None, job_id=None):
+        job = Job(id=job_id or new_job_id(), task_name=task_name, args=list(args), kwargs=dict(kwargs or {}))
+        with self._cond:
+            self._jobs[job.id] = job
+            self._queued.append(job.id)
+            self._cond.notify()
+        return job.id
+
+    def claim(self, worker_id, timeout):
+        with self._cond:
+            if not self._queued:
+                self._cond.wait(timeout)
+            if not self._queued:
+                return None
+            job = self._jobs[self._queued.popleft()]
+            job.status = RUNNING
+            job.worker = worker_id
+            job.attempts += 1
+            job.started_at = time.time()
+            return Job(**job.to_dict())
+
+    def _finish(self, job_id, status, error=None):
+        with self._cond:
+            job = self._jobs[job_id]
+            job.status = status
+            job.error = error
+            job.finished_at = time.time()
+
+    def complete(self, job_id):
+        self._finish(job_id, DONE)
+
+    def fail(self, job_id, error):
+        self._finish(job_id, FAILED, error)
+
+    def get(self, job_id):
+        with self._cond:
+            job = self._jobs.get(job_id)
+            return Job(**job.to_dict()) if job else None
+
+    def pending_count(self, task_name=None):
+        with self._cond:
+            return sum(
+                1 for job in self._jobs.values()
+                if job.status in (QUEUED, RUNNING) and task_name in (None, job.task_name)
+            )
+
+    def counts(self):
+        with self._cond:
+            return dict(Counter(job.status for job in self._jobs.values()))
+
+    def requeue_stale(self, older_than):
+        cutoff = time.time() - older_than
+        with self._cond:
+            stale = [job for job in self._jobs.values() if job.status == RUNNING and job.started_at < cutoff]
+            for job in stale:
+                job.status = QUEUED
+                job.worker = None
+                self._queued.append(job.id)
+            self._cond.notify(len(stale))
+        return len(stale)
+
+    def purge_finished(self, older_than):
+        cutoff = time.time() - older_than
+        with self._cond:
+            finished = [
+                job_id for job_id, job in self._jobs.items()
+                if job.status in (DONE, FAILED) and job.finished_at < cutoff
+            ]
+            for job_id in finished:
+                del self._jobs[job_id]
+        return len(finished)
+
+
+class SQLiteJobQueue(JobQueue):
+    """Job queue stored in a SQLite database shared across processes."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            id TEXT NOT NULL UNIQUE,
+            task_name TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            status TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            worker TEXT,
+            error TEXT,
+            created_at REAL NOT NULL,
+            started_at REAL,
+            finished_at REAL
+        );
+        CREATE INDEX IF NOT EXISTS jobs_status_seq ON jobs (status, seq);
+        CREATE INDEX IF NOT EXISTS jobs_task_status ON jobs (task_name, status);
+    """
+
+    def __init__(self, path, poll_interval=0.5):
+        self.path = path
+        self.poll_interval = poll_interval
+        self._local = threading.local()
+        self._conn().executescript(self.SCHEMA)
+
+    def _conn(self):
+        """Return this thread's connection (sqlite3 connections are not shared across threads)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _to_job(row):
+        payload = json.loads(row["payload"])
+        return Job(
+            id=row["id"], task_name=row["task_name"], args=payload["args"], kwargs=payload["kwargs"],
+            status=row["status"], attempts=row["attempts"], worker=row["worker"], error=row["error"],
+            created_at=row["created_at"], started_at=row["started_at"], finished_at=row["finished_at"],
+        )
+
+    def enqueue(self, task_name, args=(), kwargs=None, job_id=None):
+        job_id = job_id or new_job_id()
+        payload = json.dumps({"args": list(args), "kwargs": dict(kwargs or {})})
+        self._conn().execute(
+            "INSERT INTO jobs (id, task_name, payload, status, created_at) VALUES (?, ?, ?, ?, ?)",
+            (job_id, task_name, payload, QUEUED, time.time()),
+        )
+        return job_id
+
+    def _try_claim(self, worker_id):
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")  # Take the write lock so two workers never claim the same job
+        try:
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE status = ? ORDER BY seq LIMIT 1", (QUEUED,)
+            ).fetchone()
+            if row is not None:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, worker = ?, started_at = ?, attempts = attempts + 1 "
+                    "WHERE seq = ?",
+                    (RUNNING, worker_id, time.time(), row["seq"]),
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return self.get(row["id"]) if row is not None else None
+
+    def claim(self, worker_id, timeout):
+        deadline = time.monotonic() + timeout
+        while True:
+            job = self._try_claim(worker_id)
+            remaining = deadline - time.monotonic()
+            if job is not None or remaining <= 0:
+                return job
+            time.sleep(min(self.poll_interval, remaining))
+
+    def _finish(self, job_id, status, error=None):
+        self._conn().execute(
+            "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+            (status, error, time.time(), job_id),
+        )
+
+    def complete(self, job_id):
+        self._finish(job_id, DONE)
+
+    def fail(self, job_id, error):
+        self._finish(job_id, FAILED, error)
+
+    def get(self, job_id):
+        row = self._conn().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_job(row) if row is not None else None
+
+    def pending_count(self, task_name=None):
+        query = "SELECT COUNT(*) FROM jobs WHERE status IN (?, ?)"
+        params = [QUEUED, RUNNING]
+        if task_name is not None:
+            query += " AND task_name = ?"
+            params.append(task_name)
+        return self._conn().execute(query, params).fetchone()[0]
+
+    def counts(self):
+        rows = self._conn().execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    def requeue_stale(self, older_than):
+        cursor = self._conn().execute(
+            "UPDATE jobs SET status = ?, worker = NULL WHERE status = ? AND started_at < ?",
+            (QUEUED, RUNNING, time.time() - older_than),
+        )
+        return cursor.rowcount
+
+    def purge_finished(self, older_than):
+        cursor = self._conn().execute(
+            "DELETE FROM jobs WHERE status IN (?, ?) AND finished_at < ?",
+            (DONE, FAILED, time.time() - older_than),
+        )
+        return cursor.rowcount
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def create_job_queue(backend, path=None):
+    """Create a job queue for the named backend ('memory' or 'sqlite')."""
+    if backend == "memory":
+        return InMemoryJobQueue()
+    if backend == "sqlite":
+        return SQLiteJobQueue(path or config.JOB_QUEUE_PATH, poll_interval=config.JOB_QUEUE_POLL_INTERVAL)
+    raise ValueError(f"Unknown job queue backend {backend!r}, expected 'memory' or 'sqlite'")
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_job_queue():
+    """Return the application's job queue, creating it from config on first use."""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = create_job_queue(config.JOB_QUEUE_BACKEND)
+        return _queue
+
+
+_io_executor = None
+
+
+def submit_queue_io(func, *args):
+    """Run a job queue call on the queue's I/O threads; returns a concurrent.futures.Future."""
+    global _io_executor
+    with _queue_lock:
+        if _io_executor is None:
+            _io_executor = ThreadPoolExecutor(max_workers=config.JOB_QUEUE_IO_THREADS, thread_name_prefix="job-queue")
+    return _io_executor.submit(func, *args)
+
+
+async def run_queue_io(func, *args):
+    """Await a job queue call run on the queue's I/O threads, off the event loop."""
+    return await asyncio.wrap_future(submit_queue_io(func, *args))
+
+
+def get_job_queue_stats():
+    """Return job counts by status, or None when background work does not use the queue."""
+    if config.BG_BACKEND != "queue":
+        return None
+    return {"backend": config.JOB_QUEUE_BACKEND, "counts": get_job_queue().counts()}
+
+
+@router.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Return the status of a queued background job."""
+    if config.BG_BACKEND != "queue":
+        raise HTTPException(status_code=404, detail="Background job queue is not enabled")
+    job = await run_queue_io(get_job_queue().get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job.to_dict()
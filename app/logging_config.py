@@ -1,18 +1,215 @@
-"""Logging configuration for the application."""
+"""Logging configuration for the application.
+
+LOG_MODE=sync writes every record to stdout inline, in the thread that logged
+it, which on an `async` route is the event loop. LOG_MODE=queue only puts the
+unformatted record on a bounded in-memory queue; a writer thread formats
+records and writes them to stdout in batches. When the queue is full (stdout
+cannot keep up), records are dropped and counted instead of blocking the caller.
+"""
+import atexit
+import contextvars
 import logging
+import queue
+import random
 import sys
+import threading
+import time
+from logging.handlers import QueueHandler
+
+from app import config
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Whether INFO/DEBUG records of the current request are kept (per-route sampling)
+_request_sampled = contextvars.ContextVar("log_request_sampled", default=True)
+
+_stats_lock = threading.Lock()
+_dropped = 0
+_sampled_out = 0
+_writer = None
+
+
+def sample_request(path):
+    """Decide once per request whether its INFO/DEBUG records are logged."""
+    rate = config.LOG_SAMPLE_RATES.get(path, config.LOG_SAMPLE_DEFAULT)
+    _request_sampled.set(rate >= 1.0 or random.random() < rate)
+
+
+class SamplingFilter(logging.Filter):
+    """Drops INFO and lower records of requests that were not sampled. Warnings always pass."""
+
+    def filter(self, record):
+        global _sampled_out
+        if record.levelno >= logging.WARNING or _request_sampled.get():
+            return True
+        with _stats_lock:
+            _sampled_out += 1
+        return False
+
+
+class LazyQueueHandler(QueueHandler):
+    """
+    Enqueues records without formatting them and never blocks.
+
+    The stock QueueHandler formats the message in the logging thread so the
+    record can be pickled; the writer here lives in the same process, so the
+    message and arguments are merged in the writer thread instead.
+    """
+
+    def prepare(self, record):
+        return record
+
+    def enqueue(self, record):
+        global _dropped
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with _stats_lock:
+                _dropped += 1
+
+
+class BatchingLogWriter:
+    """Drains the log queue in a side thread and writes records in batches."""
+
+    _STOP = object()
+    # Seconds the writer waits for a record before checking whether it should stop
+    _POLL_INTERVAL = 0.5
+
+    def __init__(self, log_queue, stream, formatter, batch_size):
+        self.queue = log_queue
+        self.stream = stream
+        self.formatter = formatter
+        self.batch_size = batch_size
+        self.written = 0
+        self.batches = 0
+        self._reported_drops = 0
+        self._thread = None
+        self._stopping = threading.Event()
+
+    def _format(self, record):
+        try:
+            return self.formatter.format(record)
+        except Exception:
+            return f"Failed to format log record {record.msg!r} with args {record.args!r}"
+
+    def _drop_notice(self):
+        """Return a log line reporting drops since the last notice, if any."""
+        dropped = _dropped
+        if dropped == self._reported_drops:
+            return None
+        notice = logging.makeLogRecord({
+            "name": __name__, "levelno": logging.WARNING, "levelname": "WARNING",
+            "msg": "Log queue full: dropped %d records (%d in total)",
+            "args": (dropped - self._reported_drops, dropped),
+        })
+        self._reported_drops = dropped
+        return self._format(notice)
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            try:
+                batch = [self.queue.get(timeout=self._POLL_INTERVAL)]
+            except queue.Empty:
+                # stop() could not queue the marker: stop once everything queued is written
+                if self._stopping.is_set():
+                    break
+                continue
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if self._STOP in batch:
+                stopping = True
+                batch = [record for record in batch if record is not self._STOP]
+
+            lines = [self._format(record) for record in batch]
+            notice = self._drop_notice()
+            if notice:
+                lines.append(notice)
+            if lines:
+                try:
+                    self.stream.write("\n".join(lines) + "\n")
+                    self.stream.flush()
+                except (OSError, ValueError):
+                    pass  # Closed or broken stdout: nothing left to report to
+                self.written += len(batch)
+                self.batches += 1
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=5.0):
+        """Write out everything queued so far and stop the thread, giving up after `timeout` seconds."""
+        global _dropped
+        if self._thread is None:
+            return
+        deadline = time.monotonic() + timeout
+        self._stopping.set()
+        try:
+            self.queue.put(self._STOP, timeout=timeout)
+        except queue.Full:
+            pass  # The writer stops on the flag once it has drained the queue
+        self._thread.join(timeout=max(deadline - time.monotonic(), 0.0))
+        if self._thread.is_alive():
+            # The writer is stuck, e.g. on a blocked stdout: drop what is left rather than hang the exit
+            discarded = 0
+            while True:
+                try:
+                    record = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                discarded += record is not self._STOP
+            with _stats_lock:
+                _dropped += discarded
+        self._thread = None
 
 
 def setup_logging():
     """Configure application logging."""
+    global _writer
+    if _writer is not None:
+        return
+    if config.LOG_MODE == "queue":
+        log_queue = queue.Queue(maxsize=config.LOG_QUEUE_SIZE)
+        handler = LazyQueueHandler(log_queue)
+        _writer = BatchingLogWriter(log_queue, sys.stdout, logging.Formatter(LOG_FORMAT), config.LOG_BATCH_SIZE)
+        _writer.start()
+        atexit.register(shutdown_logging)
+    else:
+        handler = logging.StreamHandler(sys.stdout)
+    handler.addFilter(SamplingFilter())
+
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(sys.stdout)
-        ]
+        format=LOG_FORMAT,
+        handlers=[handler]
     )
 
     # Set specific log levels
     logging.getLogger("uvicorn").setLevel(logging.WARNING)
     logging.getLogger("fastapi").setLevel(logging.INFO)
+
+
+def shutdown_logging():
+    """Write out queued records and stop the writer (registered to run at exit)."""
+    global _writer
+    if _writer is not None:
+        _writer.stop()
+        _writer = None
+
+
+def get_logging_stats():
+    """Return the logging mode and, in queue mode, buffer usage and drop counts."""
+    writer = _writer
+    stats = {"mode": config.LOG_MODE, "dropped": _dropped, "sampled_out": _sampled_out}
+    if writer is not None:
+        stats.update({
+            "queued": writer.queue.qsize(),
+            "capacity": writer.queue.maxsize,
+            "written": writer.written,
+            "batches": writer.batches,
+        })
+    return stats
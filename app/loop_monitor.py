@@ -0,0 +1,215 @@
+"""Event-loop lag monitor.
+
+A sentinel thread periodically schedules a callback on the event loop and
+measures how long the loop takes to run it. When the loop does not respond
+within the threshold, the sentinel captures the Python stack of the loop
+thread so the function holding the loop can be identified.
+"""
+import logging
+import os
+import sys
+import sysconfig
+import threading
+import time
+import traceback
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds in milliseconds
+LAG_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+_LIBRARY_PATHS = tuple(
+    os.path.normcase(path)
+    for path in {sysconfig.get_paths()["stdlib"], sysconfig.get_paths()["purelib"],
+                 sysconfig.get_paths()["platlib"]}
+)
+
+
+def is_library_frame(frame):
+    """Return True if the frame belongs to the stdlib or an installed package."""
+    return os.path.normcase(frame.f_code.co_filename).startswith(_LIBRARY_PATHS)
+
+
+def frame_label(frame):
+    """Return a 'module:qualname' label for a frame."""
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}:{frame.f_code.co_qualname}"
+
+
+def blocking_frame(frame):
+    """Return the innermost application frame of a stack, or the innermost frame."""
+    current = frame
+    while current is not None:
+        if not is_library_frame(current):
+            return current
+        current = current.f_back
+    return frame
+
+
+class LoopLagMonitor:
+    """Measures scheduling delay on an event loop from a side thread."""
+
+    def __init__(self, loop, interval, threshold, max_offenders=10):
+        self._loop = loop
+        self._loop_thread_id = threading.get_ident()
+        self._interval = interval
+        self._threshold = threshold
+        self._max_offenders = max_offenders
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._buckets = [0] * (len(LAG_BUCKETS_MS) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._stalls = 0
+        self._offenders = {}
+        self._probe = None
+        self._last_lag = 0.0
+
+    def start(self):
+        """Start the sentinel thread. Must be called from the loop thread."""
+        self._loop_thread_id = threading.get_ident()
+        self._thread = threading.Thread(target=self._run, name="loop-lag-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the sentinel thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+
+    def _run(self):
+        while not self._stop.wait(self._interval):
+            probe = {"sent": time.perf_counter(), "lag": None, "done": threading.Event()}
+            self._probe = probe
+            try:
+                self._loop.call_soon_threadsafe(self._on_loop, probe)
+            except RuntimeError:
+                return  # Loop closed
+
+            if probe["done"].wait(self._threshold):
+                self._record(probe["lag"], None)
+                continue
+
+            # The loop is stalled: capture what is running on it right now
+            offender = self._capture_offender()
+            while not probe["done"].wait(self._interval):
+                if self._stop.is_set():
+                    return
+            self._record(probe["lag"], offender)
+
+    @staticmethod
+    def _on_loop(probe):
+        probe["lag"] = time.perf_counter() - probe["sent"]
+        probe["done"].set()
+
+    def _capture_offender(self):
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return None
+        stack = traceback.format_stack(frame)
+        name = frame_label(blocking_frame(frame))
+        logger.warning(
+            "Event loop blocked for more than %.0fms by %s\n%s",
+            self._threshold * 1000, name, "".join(stack),
+        )
+        return name, stack
+
+    def _record(self, lag, offender):
+        lag_ms = lag * 1000
+        bucket = len(LAG_BUCKETS_MS)
+        for i, bound in enumerate(LAG_BUCKETS_MS):
+            if lag_ms <= bound:
+                bucket = i
+                break
+
+        self._last_lag = lag
+        with self._lock:
+            self._buckets[bucket] += 1
+            self._count += 1
+            self._sum += lag
+            self._max = max(self._max, lag)
+            if offender is None:
+                return
+
+            self._stalls += 1
+            name, stack = offender
+            entry = self._offenders.setdefault(
+                name, {"stalls": 0, "total_blocked_s": 0.0, "max_blocked_s": 0.0, "last_stack": []}
+            )
+            entry["stalls"] += 1
+            entry["total_blocked_s"] += lag
+            entry["max_blocked_s"] = max(entry["max_blocked_s"], lag)
+            entry["last_stack"] = stack
+
+    def current_lag(self):
+        """
+        Return the loop's lag right now, in seconds.
+
+        While a probe is outstanding this is its age, so a stall shows up as it
+        happens instead of only after the loop resumes.
+        """
+        probe = self._probe
+        if probe is not None and not probe["done"].is_set():
+            return time.perf_counter() - probe["sent"]
+        return self._last_lag
+
+    def statistics(self):
+        """Return the lag histogram and the worst offenders by total blocked time."""
+        with self._lock:
+            histogram = {f"le_{bound}ms": count for bound, count in zip(LAG_BUCKETS_MS, self._buckets)}
+            histogram["le_inf"] = self._buckets[-1]
+            offenders = sorted(
+                self._offenders.items(), key=lambda item: item[1]["total_blocked_s"], reverse=True
+            )[:self._max_offenders]
+
+            return {
+                "threshold_ms": self._threshold * 1000,
+                "probes": self._count,
+                "stalls": self._stalls,
+                "mean_lag_ms": (self._sum / self._count * 1000) if self._count else 0.0,
+                "max_lag_ms": self._max * 1000,
+                "lag_histogram": histogram,
+                "worst_offenders": [
+                    {
+                        "function": name,
+                        "stalls": entry["stalls"],
+                        "total_blocked_ms": entry["total_blocked_s"] * 1000,
+                        "max_blocked_ms": entry["max_blocked_s"] * 1000,
+                        "last_stack": entry["last_stack"],
+                    }
+                    for name, entry in offenders
+                ],
+            }
+
+
+_monitor = None
+
+
+def start_loop_monitor(loop, interval, threshold, max_offenders=10):
+    """Start monitoring the given loop. Must be called from the loop thread."""
+    global _monitor
+    _monitor = LoopLagMonitor(loop, interval, threshold, max_offenders)
+    _monitor.start()
+    return _monitor
+
+
+def stop_loop_monitor():
+    """Stop the running monitor, if any."""
+    global _monitor
+    if _monitor is not None:
+        _monitor.stop()
+        _monitor = None
+
+
+def get_loop_lag_stats():
+    """Return lag statistics, or None if the monitor is not running."""
+    monitor = _monitor
+    return monitor.statistics() if monitor is not None else None
+
+
+def get_current_loop_lag():
+    """Return the current loop lag in seconds, or None if the monitor is not running."""
+    monitor = _monitor
+    return monitor.current_lag() if monitor is not None else None
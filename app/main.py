@@ -1,22 +1,125 @@
 """Main FastAPI application."""
+import asyncio
+import os
+import threading
+from contextlib import asynccontextmanager
+
+import anyio
 from fastapi import FastAPI
+from app import config
+from app.admission import validate_policies
 from app.routes import router
-from app.metrics import router as metrics_router
+from app.metrics import router as metrics_router, collect_worker_counters
+from app.job_queue import router as jobs_router, get_job_queue
 from app.logging_config import setup_logging
+from app.bg_pools import shutdown_pools
+from app.bg_runner import drain_background_runner, start_background_runner
+from app.coalescing import flush_batches
+from app.cpu import shutdown_process_pool, start_process_pool
+from app.deadlines import DeadlineMiddleware
+from app.io_backends import close_io_backends
+from app.loop_monitor import start_loop_monitor, stop_loop_monitor
+from app.shared_metrics import start_shared_metrics, stop_shared_metrics
+from app.worker import start_worker_threads
+from app.middleware import LogSamplingMiddleware, RequestMetricsMiddleware, RequestTimingMiddleware
+from app.admin import router as admin_router
+from app.debug import router as debug_router
+from app.thread_limiter import set_thread_limiter_tokens, start_adaptive_limiter, stop_adaptive_limiter
 
 # Setup logging
 setup_logging()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start and stop the runtime monitors and workers owned by the application."""
+    # Fail at startup, not with a 500 on every request
+    validate_policies()
+    if config.THREAD_LIMITER_TOKENS:
+        set_thread_limiter_tokens(config.THREAD_LIMITER_TOKENS)
+    if config.THREAD_LIMITER_ADAPTIVE:
+        start_adaptive_limiter(
+            config.THREAD_LIMITER_MIN, config.THREAD_LIMITER_MAX,
+            config.THREAD_LIMITER_ADJUST_INTERVAL, config.THREAD_LIMITER_CPU_HIGH,
+        )
+
+    if config.LOOP_MONITOR_ENABLED:
+        start_loop_monitor(
+            asyncio.get_running_loop(),
+            interval=config.LOOP_MONITOR_INTERVAL,
+            threshold=config.LOOP_MONITOR_THRESHOLD,
+            max_offenders=config.LOOP_MONITOR_MAX_OFFENDERS,
+        )
+
+    if config.METRICS_SHARED_PATH:
+        limiter = anyio.to_thread.current_default_thread_limiter()
+        start_shared_metrics(
+            config.METRICS_SHARED_PATH,
+            slots=config.METRICS_SHARED_SLOTS,
+            collect=lambda: collect_worker_counters(limiter),
+            interval=config.METRICS_PUBLISH_INTERVAL,
+        )
+
+    start_background_runner(asyncio.get_running_loop())
+
+    if config.CPU_POOL_PRESTART:
+        # Spawning the processes blocks, and the first CPU requests should not wait for it
+        await anyio.to_thread.run_sync(start_process_pool)
+
+    job_workers_stop = threading.Event()
+    if config.BG_BACKEND == "queue":
+        local_workers = config.JOB_QUEUE_LOCAL_WORKERS
+        if config.JOB_QUEUE_BACKEND == "memory":
+            # Nothing outside this process can consume an in-memory queue
+            local_workers = local_workers or config.BG_POOL_DEFAULT_SIZE
+        start_worker_threads(
+            get_job_queue(), local_workers, f"app-{os.getpid()}", job_workers_stop,
+            config.JOB_QUEUE_POLL_INTERVAL,
+        )
+
+    try:
+        yield
+    finally:
+        await stop_adaptive_limiter()
+        job_workers_stop.set()
+        # Submit partial batches, then give the calls in flight until the deadline to finish
+        flush_batches()
+        await drain_background_runner(config.BG_DRAIN_TIMEOUT)
+        shutdown_pools()
+        # Waits for the pool processes to exit
+        await anyio.to_thread.run_sync(shutdown_process_pool)
+        await close_io_backends()
+        stop_shared_metrics()
+        stop_loop_monitor()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="FastAPI Sync/Async Demo",
     description="Demonstration of sync/async interaction patterns",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
+# Cancel requests on a missed deadline or a client disconnect (innermost, so the metrics and
+# timing middleware see its 504/499 responses)
+if config.REQUEST_CANCELLATION:
+    app.add_middleware(DeadlineMiddleware)
+# Record per-route request counts and latency
+app.add_middleware(RequestMetricsMiddleware)
+if config.LOG_SAMPLE_RATES or config.LOG_SAMPLE_DEFAULT < 1.0:
+    app.add_middleware(LogSamplingMiddleware)
+# Break request latency into phases (added last, so it is outermost and times the other middleware too)
+if config.REQUEST_TIMING:
+    app.add_middleware(RequestTimingMiddleware)
+
 # Include routes
 app.include_router(router)
 app.include_router(metrics_router)
+app.include_router(jobs_router)
+app.include_router(admin_router)
+if config.PROFILER_ENABLED:
+    app.include_router(debug_router)
 
 
 @app.get("/")
@@ -32,5 +135,11 @@ async def root():
             {"path": "/async-route-async-inner-async-bg-async-task", "pattern": "async/async/async-bg-reg/async-bg-task"},
             {"path": "/async-route-async-inner-async-bg-sync-task", "pattern": "async/async/async-bg-reg/sync-bg-task"},
             {"path": "/async-route-async-inner-sync-bg-sync-task", "pattern": "async/async/sync-bg-reg/sync-bg-task"},
+            {"path": "/sync-route-cpu-inner?mode=inline|thread|process", "pattern": "def/cpu-{mode}"},
+            {"path": "/async-route-cpu-inner?mode=inline|thread|process", "pattern": "async/cpu-{mode}"},
+            {"path": "/sync-route-http-inner", "pattern": "def/http-pool"},
+            {"path": "/async-route-http-inner", "pattern": "async/http-pool"},
+            {"path": "/sync-route-db-inner", "pattern": "def/db-pool"},
+            {"path": "/async-route-db-inner", "pattern": "async/db-pool"},
         ]
     }
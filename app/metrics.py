@@ -1,33 +1,86 @@
 """Internal metrics endpoint for monitoring thread pool and background task state."""
+import os
 import threading
 import anyio
 from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app import config
+from app.admission import get_admission_stats
+from app.bg_pools import get_pool_stats
+from app.bg_runner import get_runner_stats
+from app.bulkheads import get_request_limiter_stats, request_limiter_slots
+from app.cache import get_cache_stats
+from app.coalescing import get_batch_stats
+from app.cpu import get_process_pool_stats
+from app.functions import get_blocking_call_stats
+from app.io_backends import get_io_pool_stats
+from app.job_queue import get_job_queue, get_job_queue_stats, run_queue_io
+from app.logging_config import get_logging_stats
+from app.loop_monitor import get_current_loop_lag, get_loop_lag_stats
+from app.metrics_registry import (
+    registry, BG_TASKS_PENDING, BG_TASK_DURATION, HTTP_REQUEST_DURATION, HTTP_REQUESTS,
+    REQUEST_PHASE_DURATION, REQUESTS_ABANDONED
+)
+from app.shared_metrics import get_cluster_metrics
+from app.thread_limiter import get_thread_limiter_stats
 
 router = APIRouter()
 
-# Global counter for tracking pending background tasks
-_pending_bg_tasks = 0
-_bg_tasks_lock = threading.Lock()
+# Pending background tasks are a sharded gauge: increments and decrements from the
+# event loop and from worker threads never contend on a shared lock
+_UNTYPED = "other"
+
+
+def increment_pending_bg_tasks(task_type=None):
+    """Increment the pending background task counter (thread-safe, lock-free)."""
+    BG_TASKS_PENDING.inc(task_type=task_type or _UNTYPED)
+
+
+def decrement_pending_bg_tasks(task_type=None):
+    """Decrement the pending background task counter (thread-safe, lock-free)."""
+    BG_TASKS_PENDING.dec(task_type=task_type or _UNTYPED)
+
 
+def get_pending_bg_tasks(task_type=None):
+    """Get the current count of pending background tasks, optionally for one task type."""
+    if task_type is not None:
+        return BG_TASKS_PENDING.value(task_type=task_type)
+    return BG_TASKS_PENDING.total()
 
-def increment_pending_bg_tasks():
-    """Increment the pending background task counter (thread-safe)."""
-    global _pending_bg_tasks
-    with _bg_tasks_lock:
-        _pending_bg_tasks += 1
 
+def get_pending_bg_tasks_by_type():
+    """Get pending background task counts keyed by task type."""
+    return {label_values[0]: count for label_values, count in BG_TASKS_PENDING.values().items()}
 
-def decrement_pending_bg_tasks():
-    """Decrement the pending background task counter (thread-safe)."""
-    global _pending_bg_tasks
-    with _bg_tasks_lock:
-        _pending_bg_tasks -= 1
 
+def get_pending_count():
+    """Get the pending background task count from the active backend."""
+    # With the job queue backend, pending work lives in the queue rather than in this process
+    if config.BG_BACKEND == "queue":
+        return get_job_queue().pending_count()
+    return get_pending_bg_tasks()
 
-def get_pending_bg_tasks():
-    """Get the current count of pending background tasks."""
-    with _bg_tasks_lock:
-        return _pending_bg_tasks
+
+def collect_worker_counters(limiter):
+    """
+    Snapshot this worker's counters for the shared metrics file.
+
+    Safe to call from any thread: the limiter is captured on the event loop at
+    startup and only its statistics are read here.
+    """
+    stats = limiter.statistics()
+    loop_stats = get_loop_lag_stats()
+    loop_lag = get_current_loop_lag()
+    return {
+        "thread_pool_total": stats.total_tokens,
+        "thread_pool_borrowed": stats.borrowed_tokens,
+        "thread_pool_waiting": stats.tasks_waiting,
+        "pending_bg_tasks": get_pending_count(),
+        "active_threads": threading.active_count(),
+        "loop_stalls": loop_stats["stalls"] if loop_stats else 0,
+        "loop_lag_us": loop_lag * 1_000_000 if loop_lag is not None else 0,
+    }
 
 
 @router.get("/metrics")
@@ -36,24 +89,93 @@ async def get_metrics():
     Return internal runtime metrics for monitoring.
 
     Returns:
-        dict: Metrics including thread pool stats and background task count
+        dict: Metrics for the worker that served the request (thread pool stats, background
+            task count, event-loop lag) plus, in multi-worker mode, counters of every worker
     """
     # Get AnyIO thread pool limiter stats
     # This is the limiter used by Starlette/FastAPI for running sync functions in async contexts
     limiter = anyio.to_thread.current_default_thread_limiter()
     stats = limiter.statistics()
+    adaptive = get_thread_limiter_stats()["adaptive"]
+    if config.BG_BACKEND == "queue":
+        # Job queue reads are SQLite queries; keep them off the event loop
+        pending_count, job_queue_stats = await run_queue_io(lambda: (get_pending_count(), get_job_queue_stats()))
+    else:
+        pending_count, job_queue_stats = get_pending_count(), None
 
     return {
+        "worker_pid": os.getpid(),
         "thread_pool": {
             "total_tokens": stats.total_tokens,           # Total thread pool capacity (default: 40)
             "borrowed_tokens": stats.borrowed_tokens,     # Currently active threads
             "available_tokens": stats.total_tokens - stats.borrowed_tokens,
             "tasks_waiting": stats.tasks_waiting,         # Tasks queued for thread pool
+            "adaptive": adaptive,                         # Adaptive sizing controller state (if enabled)
         },
         "background_tasks": {
-            "pending_count": get_pending_bg_tasks(),      # Background tasks not yet completed
+            "pending_count": pending_count,               # Background tasks not yet completed
+            "pending_by_type": get_pending_bg_tasks_by_type(),
+            "pools": get_pool_stats(),                    # Per task type worker pool stats
+            "runner": get_runner_stats(),                 # Calls in flight, and drain state at shutdown
+            "admission": get_admission_stats(),           # Admitted/rejected/dropped/coalesced per task type
+            "batching": get_batch_stats(),                # Batches, calls per batch and flush reasons per task type
+            "job_queue": job_queue_stats,                 # Job counts by status (queue backend only)
         },
+        "request_limiters": get_request_limiter_stats(),  # Bulkhead and priority lane occupancy (app.bulkheads)
         "threading": {
             "active_thread_count": threading.active_count(),  # Total active threads in process
-        }
+            "metrics_shards": registry.shard_count(),         # Live per-thread metric shards (app.metrics_registry)
+        },
+        "event_loop": get_loop_lag_stats(),               # Lag histogram and worst blocking functions
+        "process_pool": get_process_pool_stats(),         # CPU-bound work submitted to the process pool
+        "io_pools": get_io_pool_stats(),                  # Connections in use and checkout waits per I/O pool
+        "blocking_calls": get_blocking_call_stats(),      # @blocking calls by how they ran
+        "cache": get_cache_stats(),                       # Hits, misses and collapsed misses per cached function
+        "logging": get_logging_stats(),                   # Log queue usage, drops and sampled-out records
+        "cluster": get_cluster_metrics(),                 # Per-worker and summed counters (multi-worker mode)
+        "requests": {
+            "latency": HTTP_REQUEST_DURATION.summary(),   # Per route and method
+            "by_status": {" ".join(key): count for key, count in HTTP_REQUESTS.values().items()},
+            "phases": REQUEST_PHASE_DURATION.summary(),  # accept/wait/handler/inner/bg per route (app.timing)
+            # Cancelled on a missed deadline or a client disconnect, per route and reason (app.deadlines)
+            "abandoned": {" ".join(key): count for key, count in REQUESTS_ABANDONED.values().items()},
+        },
+        "background_task_durations": BG_TASK_DURATION.summary(),
     }
+
+
+def _thread_pool_tokens():
+    stats = anyio.to_thread.current_default_thread_limiter().statistics()
+    return {("total",): stats.total_tokens, ("borrowed",): stats.borrowed_tokens}
+
+
+def _loop_stalls():
+    loop_stats = get_loop_lag_stats()
+    return loop_stats["stalls"] if loop_stats else 0
+
+
+# Gauges read at scrape time (the endpoint runs on the event loop, where the limiter lives)
+registry.gauge(
+    "app_thread_pool_tokens", "AnyIO default thread limiter tokens", labels=("state",)
+).set_function(_thread_pool_tokens)
+registry.gauge(
+    "app_thread_pool_tasks_waiting", "Tasks waiting for an AnyIO thread limiter token"
+).set_function(lambda: anyio.to_thread.current_default_thread_limiter().statistics().tasks_waiting)
+registry.gauge(
+    "app_request_limiter_slots", "Bulkhead and priority lane slots by state (in_flight, waiting, limit)",
+    labels=("limiter", "state"),
+).set_function(request_limiter_slots)
+registry.gauge(
+    "app_active_threads", "Active threads in the process"
+).set_function(threading.active_count)
+registry.gauge(
+    "app_event_loop_stalls", "Event-loop probes that exceeded the lag threshold"
+).set_function(_loop_stalls)
+
+
+@router.get("/metrics/prometheus", response_class=PlainTextResponse)
+async def get_prometheus_metrics():
+    """Return the metrics registry in the Prometheus text exposition format."""
+    return PlainTextResponse(
+        registry.render_prometheus(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -0,0 +1,320 @@
+"""Metrics registry with per-thread sharded counters and Prometheus exposition.
+
+Every thread writes to its own shard (plain dicts only that thread mutates),
+so recording a metric never takes a lock, whether it runs on the event loop
+or in a worker thread. Reads merge all shards. The only lock guards the list
+of shards and is taken once per thread, when its shard is created.
+
+Threads come and go (AnyIO retires idle worker threads, pools are resized),
+so when a shard is created or the shards are read, the shards of threads
+that have exited are folded into one retired shard and dropped. Their
+values still count, and the list of shards stays as long as the number of
+live threads.
+"""
+import math
+import threading
+
+# Default latency buckets in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class Registry:
+    """Holds metrics and the per-thread shards their values are recorded in."""
+
+    def __init__(self):
+        self._metrics = {}
+        self._local = threading.local()
+        self._shards = []  # (owner thread, shard) pairs
+        self._retired = {}  # merged values of threads that have exited
+        self._shards_lock = threading.Lock()
+
+    def shard(self, name):
+        """Return the calling thread's values for a metric, keyed by label values."""
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = {}
+            with self._shards_lock:
+                self._retire_dead_shards()
+                self._shards.append((threading.current_thread(), shard))
+        values = shard.get(name)
+        if values is None:
+            values = shard[name] = {}
+        return values
+
+    def _retire_dead_shards(self):
+        """Fold the shards of exited threads into the retired shard. Called with the lock held."""
+        live = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                live.append((thread, shard))
+                continue
+            # Nothing writes to a dead thread's shard any more
+            for name, values in shard.items():
+                retired = self._retired.setdefault(name, {})
+                for key, value in values.items():
+                    total = retired.get(key)
+                    if total is None:
+                        retired[key] = list(value) if isinstance(value, list) else value
+                    elif isinstance(value, list):
+                        retired[key] = [a + b for a, b in zip(total, value)]
+                    else:
+                        retired[key] = total + value
+        self._shards = live
+
+    def shard_count(self):
+        """Number of live thread shards (the retired shard not included)."""
+        with self._shards_lock:
+            self._retire_dead_shards()
+            return len(self._shards)
+
+    def shard_items(self, name):
+        """Yield (label values, value) pairs for a metric from every thread's shard."""
+        with self._shards_lock:
+            self._retire_dead_shards()
+            shards = [shard for _, shard in self._shards]
+            retired = list(self._retired.get(name, {}).items())
+        yield from retired
+        for shard in shards:
+            values = shard.get(name)
+            if values:
+                # list() of a dict view runs without releasing the GIL, so it is a consistent copy
+                yield from list(values.items())
+
+    def register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, help, labels=()):
+        return self.register(Counter(self, name, help, labels))
+
+    def gauge(self, name, help, labels=()):
+        return self.register(Gauge(self, name, help, labels))
+
+    def histogram(self, name, help, labels=(), buckets=DEFAULT_BUCKETS):
+        return self.register(Histogram(self, name, help, labels, buckets))
+
+    def render_prometheus(self):
+        """Render every metric in the Prometheus text exposition format."""
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for suffix, labels, value in metric.samples():
+                lines.append(f"{metric.name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _format_value(value):
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    type = "untyped"
+
+    def __init__(self, registry, name, help, labels):
+        self._registry = registry
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+
+    def _label_values(self, labels):
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"{self.name} expects labels {self.label_names}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def _labels_dict(self, values):
+        return dict(zip(self.label_names, values))
+
+
+class Counter(_Metric):
+    """A monotonically increasing sum, sharded per thread."""
+
+    type = "counter"
+
+    def inc(self, amount=1, **labels):
+        values = self._registry.shard(self.name)
+        key = self._label_values(labels)
+        values[key] = values.get(key, 0) + amount
+
+    def values(self):
+        """Return the merged value for each label combination."""
+        merged = {}
+        for label_values, value in self._registry.shard_items(self.name):
+            merged[label_values] = merged.get(label_values, 0) + value
+        return merged
+
+    def value(self, **labels):
+        """Return the merged value for one label combination."""
+        return self.values().get(self._label_values(labels), 0)
+
+    def total(self):
+        """Return the merged value across all label combinations."""
+        return sum(self.values().values())
+
+    def samples(self):
+        for label_values, value in self.values().items():
+            yield "", self._labels_dict(label_values), value
+
+
+class Gauge(Counter):
+    """
+    A value that goes up and down.
+
+    Sharded gauges are changed with inc()/dec(). A gauge can instead read its
+    value at collection time from a callback set with set_function(); the
+    callback returns a number, or a dict mapping label-value tuples to numbers.
+    """
+
+    type = "gauge"
+
+    def __init__(self, registry, name, help, labels):
+        super().__init__(registry, name, help, labels)
+        self._function = None
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+    def set_function(self, function):
+        self._function = function
+
+    def values(self):
+        if self._function is None:
+            return super().values()
+        value = self._function()
+        if isinstance(value, dict):
+            return {tuple(str(v) for v in key): val for key, val in value.items()}
+        return {(): value}
+
+
+class Histogram(_Metric):
+    """A bucketed distribution of observations, sharded per thread."""
+
+    type = "histogram"
+
+    def __init__(self, registry, name, help, labels, buckets):
+        super().__init__(registry, name, help, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        values = self._registry.shard(self.name)
+        key = self._label_values(labels)
+        state = values.get(key)
+        if state is None:
+            # Per-bucket counts (last slot is +Inf), then sum and count
+            state = values[key] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        state[index] += 1
+        state[-2] += value
+        state[-1] += 1
+
+    def values(self):
+        """Return merged [bucket counts..., sum, count] for each label combination."""
+        merged = {}
+        for label_values, state in self._registry.shard_items(self.name):
+            state = list(state)
+            total = merged.get(label_values)
+            merged[label_values] = state if total is None else [a + b for a, b in zip(total, state)]
+        return merged
+
+    def quantile(self, q, state):
+        """Estimate a quantile from merged state by linear interpolation within buckets."""
+        count = state[-1]
+        if not count:
+            return 0.0
+        rank = q * count
+        cumulative = 0
+        lower = 0.0
+        for bound, bucket_count in zip(self.buckets + (math.inf,), state):
+            if cumulative + bucket_count >= rank:
+                if bound == math.inf:
+                    return lower
+                fraction = (rank - cumulative) / bucket_count if bucket_count else 0
+                return lower + (bound - lower) * fraction
+            cumulative += bucket_count
+            lower = bound
+        return lower
+
+    def summary(self):
+        """Return count, mean and estimated percentiles for each label combination."""
+        result = {}
+        for label_values, state in self.values().items():
+            count, total = state[-1], state[-2]
+            key = " ".join(label_values) or self.name
+            result[key] = {
+                "count": count,
+                "mean_s": total / count if count else 0.0,
+                "p50_s": self.quantile(0.5, state),
+                "p95_s": self.quantile(0.95, state),
+                "p99_s": self.quantile(0.99, state),
+            }
+        return result
+
+    def samples(self):
+        for label_values, state in self.values().items():
+            labels = self._labels_dict(label_values)
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), state):
+                cumulative += bucket_count
+                yield "_bucket", {**labels, "le": _format_value(bound)}, cumulative
+            yield "_sum", labels, state[-2]
+            yield "_count", labels, state[-1]
+
+
+# Application-wide registry and the instruments recorded on hot paths
+registry = Registry()
+
+HTTP_REQUESTS = registry.counter(
+    "app_http_requests_total", "HTTP requests handled", labels=("route", "method", "status")
+)
+HTTP_REQUEST_DURATION = registry.histogram(
+    "app_http_request_duration_seconds", "HTTP request latency", labels=("route", "method")
+)
+REQUEST_PHASE_DURATION = registry.histogram(
+    "app_request_phase_duration_seconds", "Time spent in each phase of a request (see app.timing)",
+    labels=("route", "phase"),
+    buckets=(0.0001, 0.0005, 0.001, 0.0025) + DEFAULT_BUCKETS,
+)
+CACHE_REQUESTS = registry.counter(
+    "app_cache_requests_total", "Cached function calls by result (hit, miss, collapsed, error)",
+    labels=("cache", "result"),
+)
+POOL_WAIT_DURATION = registry.histogram(
+    "app_pool_wait_seconds", "Time spent waiting for a connection of an I/O pool (see app.io_backends)",
+    labels=("pool",),
+    buckets=(0.0001, 0.0005, 0.001, 0.0025) + DEFAULT_BUCKETS,
+)
+REQUESTS_SHED = registry.counter(
+    "app_requests_shed_total", "Requests shed by a bulkhead or the bulk lane (see app.bulkheads)",
+    labels=("limiter",),
+)
+REQUESTS_ABANDONED = registry.counter(
+    "app_requests_abandoned_total", "Requests cancelled on a deadline or client disconnect (see app.deadlines)",
+    labels=("route", "reason"),
+)
+BG_TASKS_PENDING = registry.gauge(
+    "app_bg_tasks_pending", "Background tasks scheduled but not yet finished", labels=("task_type",)
+)
+BG_TASKS_FINISHED = registry.counter(
+    "app_bg_tasks_finished_total", "Background tasks finished", labels=("task_type", "outcome")
+)
+BG_TASK_DURATION = registry.histogram(
+    "app_bg_task_duration_seconds", "Background task run time", labels=("task_type",)
+)
@@ -0,0 +1,82 @@
+"""ASGI middleware for per-route request metrics, phase timing and log sampling."""
+import time
+
+from app.logging_config import sample_request
+from app.metrics_registry import HTTP_REQUEST_DURATION, HTTP_REQUESTS, REQUEST_PHASE_DURATION
+from app.timing import server_timing_header, start_request_timing
+
+
+def route_label(scope):
+    """Return the matched route's path template, so labels stay low-cardinality."""
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class RequestMetricsMiddleware:
+    """Records request counts and latency per route into the metrics registry."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # The router stores the matched route in the (shared) scope while dispatching
+            route = route_label(scope)
+            HTTP_REQUEST_DURATION.observe(time.perf_counter() - started, route=route, method=scope["method"])
+            HTTP_REQUESTS.inc(route=route, method=scope["method"], status=status)
+
+
+class RequestTimingMiddleware:
+    """Breaks each request's latency into phases, returned in a Server-Timing header and recorded per route."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Set in this request's context, so handlers in worker threads record into it too
+        timing = start_request_timing()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                phases = timing.phases(time.perf_counter())
+                route = route_label(scope)
+                for phase, seconds in phases.items():
+                    REQUEST_PHASE_DURATION.observe(seconds, route=route, phase=phase)
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", server_timing_header(phases).encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class LogSamplingMiddleware:
+    """Makes the per-route log sampling decision at the start of each request."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            # Set in this request's context, so the handler and its background tasks inherit it
+            sample_request(scope["path"])
+        await self.app(scope, receive, send)
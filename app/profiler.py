@@ -0,0 +1,152 @@
+"""Statistical sampling profiler for all threads of the process.
+
+A side thread takes the Python stack of every thread with
+sys._current_frames() at a fixed interval and counts identical stacks. The
+result is in the collapsed-stack format ("thread;frame;frame count" per line)
+read by flamegraph.pl, speedscope and inferno.
+
+A side thread is used instead of a signal-based sampler because CPython runs
+signal handlers in the main thread only, which would miss the thread pool.
+Sampling holds the GIL for a moment, so the sampler measures its own CPU time
+and reports it as overhead. Stacks are cached per thread while the innermost
+frame stays the same, and only threads whose frame changed are visited, so
+idle threads (the common case in a large pool) cost almost nothing.
+"""
+import re
+import sys
+import threading
+import time
+from collections import Counter
+
+from app.loop_monitor import frame_label
+
+# Pool threads are numbered ("bg-pool-report_3"); group them into one flame graph root
+_THREAD_NUMBER = re.compile(r"[-_ ]?\d+$")
+
+
+class SamplingProfiler:
+    """Samples the stacks of all threads from a side thread until stopped."""
+
+    def __init__(self, interval=0.01):
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+        self._stacks = Counter()
+        self._samples = 0
+        self._labels = {}          # code object -> "module:qualname"
+        self._thread_names = {}    # thread ident -> grouped thread name
+        self._last_frames = {}     # thread ident -> innermost frame at the previous sample
+        self._current = {}         # thread ident -> (collapsed stack, sample it was first seen at)
+        self._started = None
+        self._elapsed = 0.0
+        self._cpu = 0.0
+
+    def start(self):
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling and wait for the sampler thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._elapsed = time.perf_counter() - self._started
+
+    def _run(self):
+        own = threading.get_ident()
+        cpu_started = time.thread_time()
+        next_sample = time.perf_counter()
+        while not self._stop.is_set():
+            self._sample(own)
+            next_sample += self._interval
+            delay = next_sample - time.perf_counter()
+            if delay < 0:
+                # Fell behind (e.g. a long GIL hold); skip the missed samples instead of bursting
+                next_sample = time.perf_counter()
+                delay = 0
+            self._stop.wait(delay)
+        self._cpu = time.thread_time() - cpu_started
+        for ident in list(self._current):
+            self._credit(ident, self._samples)
+        self._last_frames = {}
+
+    def _sample(self, own):
+        frames = sys._current_frames()
+        frames.pop(own, None)
+        sample = self._samples
+        previous = self._last_frames
+        # Set operations on the dict views run in C and find the threads whose
+        # innermost frame changed; the others keep accumulating their current stack
+        for ident in previous.keys() - frames.keys():
+            self._credit(ident, sample)
+        for ident, frame in frames.items() - previous.items():
+            if ident in self._current:
+                self._credit(ident, sample)
+            self._current[ident] = (self._walk(ident, frame), sample)
+        # Keeping the frames referenced also keeps their ids from being reused
+        self._last_frames = frames
+        self._samples = sample + 1
+
+    def _credit(self, ident, sample):
+        """Count the samples a thread spent in its current stack up to `sample`."""
+        stack, since = self._current.pop(ident)
+        self._stacks[stack] += sample - since
+
+    def _walk(self, ident, frame):
+        labels = self._labels
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            label = labels.get(code)
+            if label is None:
+                label = labels[code] = frame_label(frame)
+            names.append(label)
+            frame = frame.f_back
+        names.append(self._thread_name(ident))
+        names.reverse()
+        return ";".join(names)
+
+    def _thread_name(self, ident):
+        name = self._thread_names.get(ident)
+        if name is None:
+            for thread in threading.enumerate():
+                self._thread_names.setdefault(thread.ident, _THREAD_NUMBER.sub("", thread.name) or thread.name)
+            name = self._thread_names.setdefault(ident, f"thread-{ident}")
+        return name
+
+    def collapsed(self):
+        """Return the stacks in collapsed format, most frequent first."""
+        return "".join(f"{stack} {count}\n" for stack, count in self._stacks.most_common())
+
+    def statistics(self, top=20):
+        """Return sampling totals, overhead and the functions with the most self samples."""
+        own = Counter()
+        for stack, count in self._stacks.items():
+            own[stack.rsplit(";", 1)[-1]] += count
+        total = sum(self._stacks.values())
+        return {
+            "interval_ms": self._interval * 1000,
+            "duration_s": self._elapsed,
+            "samples": self._samples,
+            "thread_samples": total,
+            "sampler_cpu_s": self._cpu,
+            # Sampler CPU as a share of one core over the profiling window
+            "overhead_percent": self._cpu / self._elapsed * 100 if self._elapsed else 0.0,
+            "top_self": [
+                {"function": name, "samples": count, "percent": count / total * 100}
+                for name, count in own.most_common(top)
+            ],
+        }
+
+
+_lock = threading.Lock()
+
+
+def try_acquire_profiler():
+    """Reserve the profiler for one run. Returns False if a profile is already running."""
+    return _lock.acquire(blocking=False)
+
+
+def release_profiler():
+    _lock.release()
@@ -0,0 +1,42 @@
+"""Fast JSON responses for the demo routes.
+
+A route that returns a dict goes through FastAPI's serialize_response:
+jsonable_encoder walks the dict and builds a copy, then JSONResponse encodes
+it with the stdlib json module. With FAST_RESPONSES=1 the routes return a
+FastJSONResponse instead, which FastAPI sends as is: the dict is encoded
+straight to bytes, by orjson when it is installed and by a compact stdlib
+json.dumps otherwise.
+"""
+import json
+
+from fastapi.responses import Response
+
+from app import config
+
+try:
+    import orjson
+except ImportError:  # optional: poetry install --extras fast-json
+    orjson = None
+
+
+class FastJSONResponse(Response):
+    """JSON response that skips jsonable_encoder; content must be JSON-native (dict/list/str/int/...)."""
+
+    media_type = "application/json"
+
+    def render(self, content):
+        if orjson is not None:
+            return orjson.dumps(content)
+        return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def respond(content):
+    """Return route content as a FastJSONResponse in fast mode, or unchanged for FastAPI to serialize."""
+    if config.FAST_RESPONSES:
+        return FastJSONResponse(content)
+    return content
+
+
+def json_backend():
+    """Name of the encoder FastJSONResponse uses."""
+    return "orjson" if orjson is not None else "json"
@@ -1,142 +1,319 @@
 """Route definitions demonstrating sync/async combinations."""
 import logging
 import threading
-from fastapi import APIRouter, BackgroundTasks
+from typing import Literal
 
-from app.functions import sync_inner_function, async_inner_function
+from fastapi import APIRouter, BackgroundTasks, Depends
+
+from app.functions import (
+    sync_inner_function,
+    async_inner_function,
+    sync_cpu_inner_function,
+    async_cpu_inner_function,
+    sync_http_inner_function,
+    async_http_inner_function,
+    sync_db_inner_function,
+    async_db_inner_function
+)
 from app.background import (
     sync_background_task,
     async_background_task_wrapping_sync,
-    async_background_task_wrapping_async
+    async_background_task_wrapping_async,
+    background_admission,
+    schedule_background_task
 )
-from app.metrics import increment_pending_bg_tasks
+from app.bulkheads import LaneRoute, admit_request
+from app.responses import respond
+from app.timing import mark_handler_start, mark_routed, timed_phase
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+# mark_routed runs before the route's own dependencies, right after routing; admit_request
+# then holds the request's bulkhead slot until the handler returns and admits it to its lane
+router = APIRouter(route_class=LaneRoute, dependencies=[Depends(mark_routed), Depends(admit_request)])
 
 
-@router.get("/sync-route-sync-inner-async-bg-sync-task")
+@router.get(
+    "/sync-route-sync-inner-async-bg-sync-task",
+    dependencies=[Depends(background_admission(sync_background_task))]
+)
 def sync_route_sync_inner_async_bg_sync_task(background_tasks: BackgroundTasks):
     """def route -> sync inner -> async background registration -> sync bg task"""
+    mark_handler_start()
     thread_id = threading.get_ident()
-    logger.info(f"[sync-route-sync-inner-async-bg-sync-task] Handler executing in thread {thread_id}")
+    logger.info("[sync-route-sync-inner-async-bg-sync-task] Handler executing in thread %s", thread_id)
 
-    result = sync_inner_function()
-    increment_pending_bg_tasks()
-    background_tasks.add_task(sync_background_task)  # async registration of sync task
+    with timed_phase("inner"):
+        result = sync_inner_function()
+    with timed_phase("bg"):
+        bg_job_id = schedule_background_task(background_tasks, sync_background_task)  # async registration of sync task
 
-    return {
+    return respond({
         "route": "sync-route-sync-inner-async-bg-sync-task",
         "pattern": "def/sync/async-bg-reg/sync-bg-task",
         "handler_thread": thread_id,
-        "inner_result": result
-    }
+        "inner_result": result,
+        "bg_job_id": bg_job_id
+    })
 
 
-@router.get("/sync-route-sync-inner-async-bg-async-task")
+@router.get(
+    "/sync-route-sync-inner-async-bg-async-task",
+    dependencies=[Depends(background_admission(async_background_task_wrapping_async))]
+)
 def sync_route_sync_inner_async_bg_async_task(background_tasks: BackgroundTasks):
     """def route -> sync inner -> async background registration -> async bg task wrapping async"""
+    mark_handler_start()
     thread_id = threading.get_ident()
-    logger.info(f"[sync-route-sync-inner-async-bg-async-task] Handler executing in thread {thread_id}")
+    logger.info("[sync-route-sync-inner-async-bg-async-task] Handler executing in thread %s", thread_id)
 
-    result = sync_inner_function()
-    increment_pending_bg_tasks()
-    background_tasks.add_task(async_background_task_wrapping_async)  # async wrapping async
+    with timed_phase("inner"):
+        result = sync_inner_function()
+    with timed_phase("bg"):
+        bg_job_id = schedule_background_task(background_tasks, async_background_task_wrapping_async)  # async wrapping async
 
-    return {
+    return respond({
         "route": "sync-route-sync-inner-async-bg-async-task",
         "pattern": "def/sync/async-bg-reg/async-bg-task-wrapping-async",
         "handler_thread": thread_id,
-        "inner_result": result
-    }
+        "inner_result": result,
+        "bg_job_id": bg_job_id
+    })
 
 
-@router.get("/sync-route-sync-inner-sync-bg-sync-task")
+@router.get(
+    "/sync-route-sync-inner-sync-bg-sync-task",
+    dependencies=[Depends(background_admission(sync_background_task))]
+)
 def sync_route_sync_inner_sync_bg_sync_task(background_tasks: BackgroundTasks):
     """def route -> sync inner -> sync background registration -> sync bg task"""
+    mark_handler_start()
     thread_id = threading.get_ident()
-    logger.info(f"[sync-route-sync-inner-sync-bg-sync-task] Handler executing in thread {thread_id}")
+    logger.info("[sync-route-sync-inner-sync-bg-sync-task] Handler executing in thread %s", thread_id)
 
-    result = sync_inner_function()
-    increment_pending_bg_tasks()
-    background_tasks.add_task(sync_background_task)  # sync registration of sync task
+    with timed_phase("inner"):
+        result = sync_inner_function()
+    with timed_phase("bg"):
+        bg_job_id = schedule_background_task(background_tasks, sync_background_task)  # sync registration of sync task
 
-    return {
+    return respond({
         "route": "sync-route-sync-inner-sync-bg-sync-task",
         "pattern": "def/sync/sync-bg-reg/sync-bg-task",
         "handler_thread": thread_id,
-        "inner_result": result
-    }
+        "inner_result": result,
+        "bg_job_id": bg_job_id
+    })
 
 
-@router.get("/async-route-sync-inner-async-bg-async-task")
+@router.get(
+    "/async-route-sync-inner-async-bg-async-task",
+    dependencies=[Depends(background_admission(async_background_task_wrapping_async))]
+)
 async def async_route_sync_inner_async_bg_async_task(background_tasks: BackgroundTasks):
     """async route -> sync inner -> async background registration -> async bg task wrapping async"""
+    mark_handler_start()
     thread_id = threading.get_ident()
-    logger.info(f"[async-route-sync-inner-async-bg-async-task] Handler executing in thread {thread_id}")
+    logger.info("[async-route-sync-inner-async-bg-async-task] Handler executing in thread %s", thread_id)
 
-    # Calling sync function from async context - will use thread pool
-    result = sync_inner_function()
-    increment_pending_bg_tasks()
-    background_tasks.add_task(async_background_task_wrapping_async)
+    # Calling a @blocking sync function from async context - offloaded to the thread pool
+    # (BLOCKING_CALLS=inline runs it on the event loop instead, reproducing the blocking behavior)
+    with timed_phase("inner"):
+        result = await sync_inner_function.offload()
+    with timed_phase("bg"):
+        bg_job_id = schedule_background_task(background_tasks, async_background_task_wrapping_async)
 
-    return {
+    return respond({
         "route": "async-route-sync-inner-async-bg-async-task",
         "pattern": "async/sync/async-bg-reg/async-bg-task-wrapping-async",
         "handler_thread": thread_id,
-        "inner_result": result
-    }
+        "inner_result": result,
+        "bg_job_id": bg_job_id
+    })
 
 
-@router.get("/async-route-async-inner-async-bg-async-task")
+@router.get(
+    "/async-route-async-inner-async-bg-async-task",
+    dependencies=[Depends(background_admission(async_background_task_wrapping_async))]
+)
 async def async_route_async_inner_async_bg_async_task(background_tasks: BackgroundTasks):
     """async route -> async inner -> async background registration -> async bg task wrapping async"""
+    mark_handler_start()
     thread_id = threading.get_ident()
-    logger.info(f"[async-route-async-inner-async-bg-async-task] Handler executing in thread {thread_id}")
+    logger.info("[async-route-async-inner-async-bg-async-task] Handler executing in thread %s", thread_id)
 
-    result = await async_inner_function()
-    increment_pending_bg_tasks()
-    background_tasks.add_task(async_background_task_wrapping_async)
+    with timed_phase("inner"):
+        result = await async_inner_function()
+    with timed_phase("bg"):
+        bg_job_id = schedule_background_task(background_tasks, async_background_task_wrapping_async)
 
-    return {
+    return respond({
         "route": "async-route-async-inner-async-bg-async-task",
         "pattern": "async/async/async-bg-reg/async-bg-task-wrapping-async",
         "handler_thread": thread_id,
-        "inner_result": result
-    }
+        "inner_result": result,
+        "bg_job_id": bg_job_id
+    })
 
 
-@router.get("/async-route-async-inner-async-bg-sync-task")
+@router.get(
+    "/async-route-async-inner-async-bg-sync-task",
+    dependencies=[Depends(background_admission(async_background_task_wrapping_sync))]
+)
 async def async_route_async_inner_async_bg_sync_task(background_tasks: BackgroundTasks):
     """async route -> async inner -> async background registration -> async bg task wrapping sync"""
+    mark_handler_start()
     thread_id = threading.get_ident()
-    logger.info(f"[async-route-async-inner-async-bg-sync-task] Handler executing in thread {thread_id}")
+    logger.info("[async-route-async-inner-async-bg-sync-task] Handler executing in thread %s", thread_id)
 
-    result = await async_inner_function()
-    increment_pending_bg_tasks()
-    background_tasks.add_task(async_background_task_wrapping_sync)  # async wrapping blocking sync
+    with timed_phase("inner"):
+        result = await async_inner_function()
+    with timed_phase("bg"):
+        bg_job_id = schedule_background_task(background_tasks, async_background_task_wrapping_sync)  # async wrapping blocking sync
 
-    return {
+    return respond({
         "route": "async-route-async-inner-async-bg-sync-task",
         "pattern": "async/async/async-bg-reg/async-bg-task-wrapping-sync",
         "handler_thread": thread_id,
-        "inner_result": result
-    }
+        "inner_result": result,
+        "bg_job_id": bg_job_id
+    })
 
 
-@router.get("/async-route-async-inner-sync-bg-sync-task")
+@router.get(
+    "/async-route-async-inner-sync-bg-sync-task",
+    dependencies=[Depends(background_admission(sync_background_task))]
+)
 async def async_route_async_inner_sync_bg_sync_task(background_tasks: BackgroundTasks):
     """async route -> async inner -> sync background registration -> sync bg task"""
+    mark_handler_start()
     thread_id = threading.get_ident()
-    logger.info(f"[async-route-async-inner-sync-bg-sync-task] Handler executing in thread {thread_id}")
+    logger.info("[async-route-async-inner-sync-bg-sync-task] Handler executing in thread %s", thread_id)
 
-    result = await async_inner_function()
-    increment_pending_bg_tasks()
-    background_tasks.add_task(sync_background_task)
+    with timed_phase("inner"):
+        result = await async_inner_function()
+    with timed_phase("bg"):
+        bg_job_id = schedule_background_task(background_tasks, sync_background_task)
 
-    return {
+    return respond({
         "route": "async-route-async-inner-sync-bg-sync-task",
         "pattern": "async/async/sync-bg-reg/sync-bg-task",
         "handler_thread": thread_id,
+        "inner_result": result,
+        "bg_job_id": bg_job_id
+    })
+
+
+# CPU-bound variants: no background task, the inner function does ~50ms of CPU work
+# either inline, in the thread pool or in the process pool (?mode=)
+CpuMode = Literal["inline", "thread", "process"]
+
+
+@router.get("/sync-route-cpu-inner")
+def sync_route_cpu_inner(mode: CpuMode = "inline"):
+    """def route -> CPU-bound inner (inline/thread run in the route's worker thread, process in the process pool)"""
+    mark_handler_start()
+    thread_id = threading.get_ident()
+    logger.info("[sync-route-cpu-inner] Handler executing in thread %s", thread_id)
+
+    with timed_phase("inner"):
+        result = sync_cpu_inner_function(mode)
+
+    return respond({
+        "route": "sync-route-cpu-inner",
+        "pattern": f"def/cpu-{mode}",
+        "handler_thread": thread_id,
+        "inner_result": result
+    })
+
+
+@router.get("/async-route-cpu-inner")
+async def async_route_cpu_inner(mode: CpuMode = "inline"):
+    """async route -> CPU-bound inner (inline blocks the event loop, thread uses the thread pool, process the process pool)"""
+    mark_handler_start()
+    thread_id = threading.get_ident()
+    logger.info("[async-route-cpu-inner] Handler executing in thread %s", thread_id)
+
+    with timed_phase("inner"):
+        result = await async_cpu_inner_function(mode)
+
+    return respond({
+        "route": "async-route-cpu-inner",
+        "pattern": f"async/cpu-{mode}",
+        "handler_thread": thread_id,
+        "inner_result": result
+    })
+
+
+# I/O-backed variants: no background task, the inner function calls the upstream
+# stub or queries SQLite through a connection pool (app.io_backends)
+
+
+@router.get("/sync-route-http-inner")
+def sync_route_http_inner():
+    """def route -> sync inner calling the upstream stub through a pooled requests.Session"""
+    mark_handler_start()
+    thread_id = threading.get_ident()
+    logger.info("[sync-route-http-inner] Handler executing in thread %s", thread_id)
+
+    with timed_phase("inner"):
+        result = sync_http_inner_function()
+
+    return respond({
+        "route": "sync-route-http-inner",
+        "pattern": "def/http-pool",
+        "handler_thread": thread_id,
+        "inner_result": result
+    })
+
+
+@router.get("/async-route-http-inner")
+async def async_route_http_inner():
+    """async route -> async inner calling the upstream stub through a pooled httpx.AsyncClient"""
+    mark_handler_start()
+    thread_id = threading.get_ident()
+    logger.info("[async-route-http-inner] Handler executing in thread %s", thread_id)
+
+    with timed_phase("inner"):
+        result = await async_http_inner_function()
+
+    return respond({
+        "route": "async-route-http-inner",
+        "pattern": "async/http-pool",
+        "handler_thread": thread_id,
+        "inner_result": result
+    })
+
+
+@router.get("/sync-route-db-inner")
+def sync_route_db_inner():
+    """def route -> sync inner querying SQLite through the connection pool"""
+    mark_handler_start()
+    thread_id = threading.get_ident()
+    logger.info("[sync-route-db-inner] Handler executing in thread %s", thread_id)
+
+    with timed_phase("inner"):
+        result = sync_db_inner_function()
+
+    return respond({
+        "route": "sync-route-db-inner",
+        "pattern": "def/db-pool",
+        "handler_thread": thread_id,
+        "inner_result": result
+    })
+
+
+@router.get("/async-route-db-inner")
+async def async_route_db_inner():
+    """async route -> async inner querying SQLite in the pool's dedicated threads"""
+    mark_handler_start()
+    thread_id = threading.get_ident()
+    logger.info("[async-route-db-inner] Handler executing in thread %s", thread_id)
+
+    with timed_phase("inner"):
+        result = await async_db_inner_function()
+
+    return respond({
+        "route": "async-route-db-inner",
+        "pattern": "async/db-pool",
+        "handler_thread": thread_id,
         "inner_result": result
-    }
+    })
@@ -0,0 +1,248 @@
+"""Cross-process metrics for multi-worker deployments.
+
+With `uvicorn --workers N`, each worker is a separate process with its own
+thread limiter, threads and background queue, so a single `/metrics` response
+only describes the worker that served it. In multi-worker mode every worker
+claims a slot in a shared mmap'd file and a side thread publishes its counters
+there. Any worker can then read all slots and report per-worker and summed
+views.
+
+Each slot is guarded by a sequence number (odd while a write is in progress),
+so readers never see a half-written slot and writers never take a lock. A
+worker killed between its two sequence writes leaves its slot odd for good;
+readers give up on such a slot after a few attempts and report it as torn,
+and the slot is reclaimed once its process is gone.
+"""
+import fcntl
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Counters published by every worker, in slot order
+FIELDS = (
+    "thread_pool_total",
+    "thread_pool_borrowed",
+    "thread_pool_waiting",
+    "pending_bg_tasks",
+    "active_threads",
+    "loop_stalls",
+    "loop_lag_us",
+)
+
+# Slot layout: sequence, pid, updated_at, then one signed 64-bit integer per field
+_SLOT = struct.Struct("<Qqd" + "q" * len(FIELDS))
+_MAGIC = b"FSVAMET2"
+_HEADER = struct.Struct("<8sI")
+
+# Slots not updated for this long are reported as stale
+STALE_AFTER = 5.0
+
+# Reads of a slot before it is reported as torn. A write takes microseconds,
+# so a slot still odd after this many attempts belongs to a writer that died mid-write
+READ_ATTEMPTS = 100
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class SharedMetricsFile:
+    """A fixed number of per-worker counter slots in an mmap'd file."""
+
+    def __init__(self, path, slots):
+        self.path = path
+        self.slots = slots
+        size = _HEADER.size + slots * _SLOT.size
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        with self._locked():
+            if os.fstat(self._fd).st_size < size:
+                os.ftruncate(self._fd, size)
+            self._mm = mmap.mmap(self._fd, size)
+            magic, existing_slots = _HEADER.unpack_from(self._mm, 0)
+            if magic != _MAGIC or existing_slots != slots:
+                self._mm[:] = b"\0" * size
+                _HEADER.pack_into(self._mm, 0, _MAGIC, slots)
+
+    @classmethod
+    def attach(cls, path):
+        """Open an existing metrics file read-only, e.g. from a monitoring process."""
+        shared = cls.__new__(cls)
+        shared.path = path
+        shared._fd = os.open(path, os.O_RDONLY)
+        try:
+            shared._mm = mmap.mmap(shared._fd, os.fstat(shared._fd).st_size, access=mmap.ACCESS_READ)
+            magic, shared.slots = _HEADER.unpack_from(shared._mm, 0)
+        except (ValueError, struct.error) as exc:
+            os.close(shared._fd)
+            raise ValueError(f"{path} is not an initialized metrics file") from exc
+        if magic != _MAGIC:
+            shared.close()
+            raise ValueError(f"{path} is not a metrics file of this version")
+        return shared
+
+    def _locked(self):
+        return _FileLock(self._fd)
+
+    def _offset(self, slot):
+        return _HEADER.size + slot * _SLOT.size
+
+    def _read_slot(self, slot):
+        """
+        Read a consistent copy of a slot, retrying while a write is in progress.
+
+        Returns (values, torn). After READ_ATTEMPTS reads without a consistent
+        copy, torn is True and the values are the last, possibly mixed, read;
+        only the pid is reliable, since a slot's owner never changes it.
+        """
+        offset = self._offset(slot)
+        for _ in range(READ_ATTEMPTS):
+            values = _SLOT.unpack_from(self._mm, offset)
+            if values[0] % 2 == 0 and _SLOT.unpack_from(self._mm, offset)[0] == values[0]:
+                return values, False
+            time.sleep(0)
+        return values, True
+
+    def claim_slot(self, pid):
+        """Claim a free slot (or one left by a dead process, torn or not) for pid."""
+        with self._locked():
+            for slot in range(self.slots):
+                (_, slot_pid, *_), _torn = self._read_slot(slot)
+                if slot_pid in (0, pid) or not _pid_alive(slot_pid):
+                    _SLOT.pack_into(self._mm, self._offset(slot), 0, pid, time.time(), *([0] * len(FIELDS)))
+                    return slot
+        raise RuntimeError(f"No free metrics slot in {self.path} ({self.slots} slots)")
+
+    def release_slot(self, slot):
+        """Free a slot so another worker can claim it."""
+        with self._locked():
+            _SLOT.pack_into(self._mm, self._offset(slot), 0, 0, 0.0, *([0] * len(FIELDS)))
+
+    def write(self, slot, counters):
+        """Publish counters to a slot owned by this process."""
+        offset = self._offset(slot)
+        seq, pid, *_ = _SLOT.unpack_from(self._mm, offset)
+        struct.pack_into("<Q", self._mm, offset, seq + 1)  # odd: write in progress
+        _SLOT.pack_into(
+            self._mm, offset, seq + 1, pid, time.time(), *(int(counters.get(name, 0)) for name in FIELDS)
+        )
+        struct.pack_into("<Q", self._mm, offset, seq + 2)
+
+    def read_all(self):
+        """Return the counters of every live worker. A torn slot's counters are zeroed and reported stale."""
+        now = time.time()
+        workers = []
+        for slot in range(self.slots):
+            (_, pid, updated_at, *values), torn = self._read_slot(slot)
+            if pid == 0 or not _pid_alive(pid):
+                continue
+            if torn:
+                updated_at, values = 0.0, [0] * len(FIELDS)
+            workers.append({
+                "pid": pid,
+                "slot": slot,
+                "age_s": now - updated_at,
+                "stale": torn or now - updated_at > STALE_AFTER,
+                "torn": torn,
+                **dict(zip(FIELDS, values)),
+            })
+        return workers
+
+    def close(self):
+        self._mm.close()
+        os.close(self._fd)
+
+
+class _FileLock:
+    """Exclusive flock on a file descriptor, used only for slot claims."""
+
+    def __init__(self, fd):
+        self._fd = fd
+
+    def __enter__(self):
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+
+    def __exit__(self, *exc):
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+
+class MetricsPublisher:
+    """Side thread that publishes this worker's counters to its slot."""
+
+    def __init__(self, shared, collect, interval):
+        self._shared = shared
+        self._collect = collect
+        self._interval = interval
+        self._slot = shared.claim_slot(os.getpid())
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-publisher", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join(timeout=1)
+        self._shared.release_slot(self._slot)
+
+    def _run(self):
+        while True:
+            try:
+                self._shared.write(self._slot, self._collect())
+            except Exception:
+                logger.exception("Failed to publish shared metrics")
+            if self._stop.wait(self._interval):
+                return
+
+
+_shared = None
+_publisher = None
+
+
+def start_shared_metrics(path, slots, collect, interval):
+    """Open the shared metrics file and start publishing this worker's counters."""
+    global _shared, _publisher
+    _shared = SharedMetricsFile(path, slots)
+    _publisher = MetricsPublisher(_shared, collect, interval)
+    _publisher.start()
+
+
+def stop_shared_metrics():
+    """Stop publishing and release this worker's slot."""
+    global _shared, _publisher
+    if _publisher is not None:
+        _publisher.stop()
+        _publisher = None
+    if _shared is not None:
+        _shared.close()
+        _shared = None
+
+
+def sum_counters(workers):
+    """Sum the counters of several workers (lag is a per-loop figure, so the worst one is kept)."""
+    totals = {name: sum(worker[name] for worker in workers) for name in FIELDS}
+    totals["loop_lag_us"] = max((worker["loop_lag_us"] for worker in workers), default=0)
+    return totals
+
+
+def get_cluster_metrics():
+    """Return per-worker counters and their sums, or None outside multi-worker mode."""
+    shared = _shared
+    if shared is None:
+        return None
+    workers = shared.read_all()
+    return {
+        "worker_count": len(workers),
+        "workers": workers,
+        "totals": sum_counters(workers),
+    }
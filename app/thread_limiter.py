@@ -0,0 +1,196 @@
+"""Runtime sizing of the AnyIO default thread limiter.
+
+`def` routes, sync dependencies and sync background tasks all borrow a token
+from AnyIO's default thread limiter (40 tokens unless configured). The size
+can be changed at runtime, by hand through the admin endpoint or by the
+adaptive controller, which grows the pool while requests wait for a token and
+the process has CPU to spare, and shrinks it again once most tokens sit idle.
+
+The limiter belongs to the event loop: everything here must run on it.
+"""
+import asyncio
+import logging
+import math
+import os
+import sys
+import time
+
+import anyio
+
+logger = logging.getLogger(__name__)
+
+
+def cpu_capacity():
+    """
+    Cores the process can keep busy, the 100% mark of the controller's CPU reading.
+
+    That is the cores in the process's CPU affinity mask, but with the GIL
+    one core: Python code in every thread then runs on one core at a time.
+    """
+    if getattr(sys, "_is_gil_enabled", lambda: True)():
+        return 1
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+def get_limiter():
+    """Return the AnyIO default thread limiter of the running event loop."""
+    return anyio.to_thread.current_default_thread_limiter()
+
+
+def set_thread_limiter_tokens(total_tokens):
+    """Resize the default thread limiter. Waiting tasks are woken if tokens were added."""
+    limiter = get_limiter()
+    previous = limiter.total_tokens
+    limiter.total_tokens = total_tokens
+    if total_tokens != previous:
+        logger.info("Thread limiter resized from %d to %d tokens", previous, total_tokens)
+    return previous
+
+
+class AdaptiveLimiterController:
+    """
+    Periodically resizes the default thread limiter from its own statistics.
+
+    Each tick:
+      - tasks waiting and CPU below `cpu_high`: grow by `grow_factor` (at least one token)
+      - tasks waiting but CPU saturated: hold, more threads would only add contention
+      - nothing waiting and fewer than half the tokens borrowed for `shrink_after`
+        consecutive ticks: shrink by `shrink_factor`, never below the borrowed count
+    """
+
+    def __init__(self, min_tokens, max_tokens, interval, cpu_high,
+                 grow_factor=0.25, shrink_factor=0.1, shrink_after=5):
+        self.min_tokens = min_tokens
+        self.max_tokens = max_tokens
+        self.interval = interval
+        self.cpu_high = cpu_high
+        self.grow_factor = grow_factor
+        self.shrink_factor = shrink_factor
+        self.shrink_after = shrink_after
+        self._task = None
+        self._idle_ticks = 0
+        self._last_cpu = None
+        self._cpu_capacity = cpu_capacity()
+        self._cpu_percent = 0.0
+        self._grown = 0
+        self._shrunk = 0
+        self._held_for_cpu = 0
+        self._last_decision = None
+
+    def _sample_cpu(self):
+        """Process CPU use since the previous sample, as a percentage of cpu_capacity() cores."""
+        now = (time.perf_counter(), time.process_time())
+        if self._last_cpu is not None:
+            wall = now[0] - self._last_cpu[0]
+            if wall > 0:
+                self._cpu_percent = (now[1] - self._last_cpu[1]) / wall / self._cpu_capacity * 100
+        self._last_cpu = now
+        return self._cpu_percent
+
+    def tick(self):
+        """Take one sizing decision and apply it. Returns the decision name."""
+        stats = get_limiter().statistics()
+        total, borrowed, waiting = stats.total_tokens, stats.borrowed_tokens, stats.tasks_waiting
+        cpu = self._sample_cpu()
+        target = total
+
+        if waiting:
+            self._idle_ticks = 0
+            if cpu >= self.cpu_high:
+                decision = "hold_cpu"
+                self._held_for_cpu += 1
+            else:
+                target = min(self.max_tokens, total + max(1, math.ceil(total * self.grow_factor)))
+                decision = "grow" if target > total else "hold_max"
+        elif borrowed < total / 2:
+            self._idle_ticks += 1
+            decision = "idle"
+            if self._idle_ticks >= self.shrink_after:
+                self._idle_ticks = 0
+                floor = max(self.min_tokens, borrowed + 1)
+                target = max(floor, total - max(1, math.ceil(total * self.shrink_factor)))
+                decision = "shrink" if target < total else "hold_min"
+        else:
+            self._idle_ticks = 0
+            decision = "steady"
+
+        if target != total:
+            set_thread_limiter_tokens(target)
+            if target > total:
+                self._grown += 1
+            else:
+                self._shrunk += 1
+        self._last_decision = decision
+        return decision
+
+    async def _run(self):
+        self._sample_cpu()
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                self.tick()
+            except Exception:
+                logger.exception("Adaptive thread limiter tick failed")
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._run(), name="adaptive-thread-limiter")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def statistics(self):
+        return {
+            "min_tokens": self.min_tokens,
+            "max_tokens": self.max_tokens,
+            "interval_s": self.interval,
+            "cpu_high_percent": self.cpu_high,
+            "cpu_percent": round(self._cpu_percent, 1),
+            "cpu_capacity_cores": self._cpu_capacity,
+            "grown": self._grown,
+            "shrunk": self._shrunk,
+            "held_for_cpu": self._held_for_cpu,
+            "last_decision": self._last_decision,
+        }
+
+
+_controller = None
+
+
+def start_adaptive_limiter(min_tokens, max_tokens, interval, cpu_high):
+    """Start the adaptive controller on the running loop."""
+    global _controller
+    _controller = AdaptiveLimiterController(min_tokens, max_tokens, interval, cpu_high)
+    _controller.start()
+    return _controller
+
+
+async def stop_adaptive_limiter():
+    """Stop the adaptive controller, if running."""
+    global _controller
+    if _controller is not None:
+        await _controller.stop()
+        _controller = None
+
+
+def is_adaptive_limiter_running():
+    return _controller is not None
+
+
+def get_thread_limiter_stats():
+    """Return the limiter's current size and usage plus the controller's state, if running."""
+    stats = get_limiter().statistics()
+    controller = _controller
+    return {
+        "total_tokens": stats.total_tokens,
+        "borrowed_tokens": stats.borrowed_tokens,
+        "tasks_waiting": stats.tasks_waiting,
+        "adaptive": controller.statistics() if controller is not None else None,
+    }
@@ -0,0 +1,91 @@
+"""Per-request latency breakdown.
+
+RequestTimingMiddleware starts a RequestTiming for every HTTP request and keeps
+it in a context variable, which the handler sees whether it runs on the event
+loop or in a worker thread. Hooks record marks and phase durations along the
+way:
+
+    accept   middleware entry -> routing done (router dependency, on the loop)
+    wait     routing done -> handler starts: for `def` routes the wait for a
+             thread-limiter token, for `async` routes the wait for the loop
+    handler  handler start -> response start
+    inner    inner function call, including any offload to a thread
+    bg       background task admission and scheduling
+    total    middleware entry -> response start
+
+The phases are sent back in a Server-Timing header and recorded in the
+REQUEST_PHASE_DURATION histogram.
+"""
+import contextvars
+import time
+from contextlib import contextmanager
+
+_current = contextvars.ContextVar("request_timing", default=None)
+
+
+class RequestTiming:
+    """Marks and phase durations of one request (perf_counter seconds)."""
+
+    __slots__ = ("started", "routed", "handler_started", "durations")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.routed = None
+        self.handler_started = None
+        self.durations = {}
+
+    def add(self, phase, seconds):
+        self.durations[phase] = self.durations.get(phase, 0.0) + seconds
+
+    def phases(self, finished):
+        """Return phase -> seconds, in request order, for a response that started at `finished`."""
+        phases = {}
+        if self.routed is not None:
+            phases["accept"] = self.routed - self.started
+            if self.handler_started is not None:
+                phases["wait"] = self.handler_started - self.routed
+        if self.handler_started is not None:
+            phases["handler"] = finished - self.handler_started
+        phases.update(self.durations)
+        phases["total"] = finished - self.started
+        return phases
+
+
+def start_request_timing():
+    """Start timing the current request. Called by the middleware for each request."""
+    timing = RequestTiming()
+    _current.set(timing)
+    return timing
+
+
+async def mark_routed():
+    """Router dependency: routing is done and dependencies are being solved (runs on the loop)."""
+    timing = _current.get()
+    if timing is not None and timing.routed is None:
+        timing.routed = time.perf_counter()
+
+
+def mark_handler_start():
+    """Called first thing in a handler, in whatever thread it runs."""
+    timing = _current.get()
+    if timing is not None:
+        timing.handler_started = time.perf_counter()
+
+
+@contextmanager
+def timed_phase(phase):
+    """Add the duration of the enclosed block to a phase of the current request."""
+    timing = _current.get()
+    if timing is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timing.add(phase, time.perf_counter() - started)
+
+
+def server_timing_header(phases):
+    """Format phases as a Server-Timing header value (durations in milliseconds)."""
+    return ", ".join(f"{phase};dur={seconds * 1000:.2f}" for phase, seconds in phases.items())
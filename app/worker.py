@@ -0,0 +1,163 @@
+"""Job queue worker.
+
+Runs background jobs from the SQLite job queue in separate processes:
+
+    python -m app.worker --processes 4 --concurrency 2
+
+Each process runs `--concurrency` worker threads. Sync tasks are called
+directly; async tasks run on a fresh event loop per job.
+"""
+import argparse
+import asyncio
+import inspect
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import sqlite3
+import threading
+import time
+
+from app import config
+from app.background import JOB_TASKS
+from app.job_queue import create_job_queue
+from app.logging_config import setup_logging
+
+logger = logging.getLogger(__name__)
+
+# Seconds between stale-job requeue and finished-job purge passes
+HOUSEKEEPING_INTERVAL = 60
+
+
+class JobWorker:
+    """Claims jobs from a queue and executes them until stopped."""
+
+    def __init__(self, queue, worker_id, stop_event, poll_interval):
+        self.queue = queue
+        self.worker_id = worker_id
+        self.stop_event = stop_event
+        self.poll_interval = poll_interval
+
+    def run(self):
+        """Process jobs until the stop event is set."""
+        logger.info("[%s] Worker started", self.worker_id)
+        while not self.stop_event.is_set():
+            try:
+                job = self.queue.claim(self.worker_id, timeout=self.poll_interval)
+            except sqlite3.Error:
+                # A locked or briefly unavailable database must not end the worker thread
+                logger.exception("[%s] Could not claim a job, retrying", self.worker_id)
+                self.stop_event.wait(self.poll_interval)
+                continue
+            if job is not None:
+                self.execute(job)
+        logger.info("[%s] Worker stopped", self.worker_id)
+
+    def execute(self, job):
+        """Run one job and record its outcome."""
+        task = JOB_TASKS.get(job.task_name)
+        if task is None:
+            self._record(self.queue.fail, job, f"Unknown task {job.task_name!r}")
+            return
+        try:
+            if inspect.iscoroutinefunction(task):
+                asyncio.run(task(*job.args, **job.kwargs))
+            else:
+                task(*job.args, **job.kwargs)
+        except Exception as exc:
+            logger.exception("[%s] Job %s (%s) failed", self.worker_id, job.id, job.task_name)
+            self._record(self.queue.fail, job, repr(exc))
+        else:
+            self._record(self.queue.complete, job)
+
+    def _record(self, outcome, job, *args):
+        """Record a job's outcome. If the write fails, the job stays running and is requeued once stale."""
+        try:
+            outcome(job.id, *args)
+        except sqlite3.Error:
+            logger.exception("[%s] Could not record the outcome of job %s (%s)", self.worker_id, job.id, job.task_name)
+            self.stop_event.wait(self.poll_interval)
+
+
+def start_worker_threads(queue, count, name, stop_event, poll_interval):
+    """Start count worker threads on a queue and return them."""
+    threads = []
+    for i in range(count):
+        worker = JobWorker(queue, f"{name}-{i}", stop_event, poll_interval)
+        thread = threading.Thread(target=worker.run, name=f"job-worker-{i}", daemon=True)
+        thread.start()
+        threads.append(thread)
+    return threads
+
+
+def run_process(db_path, concurrency, poll_interval, stop_event):
+    """Entry point of one worker process."""
+    # The parent handles Ctrl+C and SIGTERM and signals shutdown through stop_event, so a signal
+    # sent to the whole process group lets running jobs finish instead of killing them
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    setup_logging()
+
+    queue = create_job_queue("sqlite", db_path)
+    name = f"{socket.gethostname()}-{os.getpid()}"
+    threads = start_worker_threads(queue, concurrency, name, stop_event, poll_interval)
+
+    while not stop_event.wait(HOUSEKEEPING_INTERVAL):
+        try:
+            requeued = queue.requeue_stale(config.JOB_QUEUE_VISIBILITY_TIMEOUT)
+            purged = queue.purge_finished(config.JOB_QUEUE_RETENTION)
+        except sqlite3.Error:
+            logger.exception("[%s] Housekeeping pass failed, retrying in %ds", name, HOUSEKEEPING_INTERVAL)
+            continue
+        if requeued or purged:
+            logger.info("[%s] Requeued %d stale jobs, purged %d finished jobs", name, requeued, purged)
+
+    for thread in threads:
+        thread.join()
+    queue.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run background job queue workers")
+    parser.add_argument("--processes", "-n", type=int, default=os.cpu_count() or 1,
+                        help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--concurrency", "-c", type=int, default=1,
+                        help="Worker threads per process (default: 1)")
+    parser.add_argument("--db", default=config.JOB_QUEUE_PATH,
+                        help=f"SQLite job queue path (default: {config.JOB_QUEUE_PATH})")
+    parser.add_argument("--poll-interval", type=float, default=config.JOB_QUEUE_POLL_INTERVAL,
+                        help=f"Seconds between polls of an empty queue (default: {config.JOB_QUEUE_POLL_INTERVAL})")
+    args = parser.parse_args()
+
+    setup_logging()
+    # Requeue work that was running when the previous workers died
+    queue = create_job_queue("sqlite", args.db)
+    requeued = queue.requeue_stale(config.JOB_QUEUE_VISIBILITY_TIMEOUT)
+    queue.close()
+    logger.info("Starting %d worker processes x %d threads on %s (requeued %d stale jobs)",
+                args.processes, args.concurrency, args.db, requeued)
+
+    ctx = multiprocessing.get_context("spawn")
+    stop_event = ctx.Event()
+    processes = [
+        ctx.Process(target=run_process, args=(args.db, args.concurrency, args.poll_interval, stop_event),
+                    name=f"app-worker-{i}")
+        for i in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+
+    def request_stop(signum, frame):
+        logger.info("Received signal %d, finishing running jobs", signum)
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+
+    while any(process.is_alive() for process in processes):
+        time.sleep(0.5)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""In-process benchmark harness for the FastAPI sync/async demo."""
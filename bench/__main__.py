@@ -0,0 +1,154 @@
+"""
+Benchmark runner.
+
+    python -m bench                          # full matrix from bench/matrix.toml
+    python -m bench --routes async-route-async-inner --duration 5
+    python -m bench --save-baseline          # also store this run as the baseline
+
+Runs every cell of the matrix against a freshly started uvicorn, drives load
+with an asyncio HTTP client, samples resources in the same process, writes one
+consolidated JSON result file per run to `results_dir` and compares it with
+the baseline.
+"""
+import argparse
+import asyncio
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from app.responses import json_backend
+from bench.load import closed_loop, make_client, open_loop
+from bench.matrix import DEFAULT_MATRIX, load_matrix
+from bench.report import compare, load_results, print_comparison, print_summary, summarize, write_results
+from bench.sampler import ResourceSampler
+from bench.server import AppServer, UpstreamServer
+
+
+def git_commit():
+    """Return the current git commit, or None outside a git checkout."""
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# Routes whose inner functions call the upstream stub
+UPSTREAM_ROUTES = ("-http-inner",)
+
+
+async def run_cell(matrix, cell):
+    """Start a server for the cell, drive load while sampling, and summarize."""
+    env = {"UPSTREAM_URL": f"http://{matrix.host}:{matrix.upstream_port}/", **cell.env}
+    server = AppServer(matrix.host, matrix.port, workers=cell.workers,
+                       thread_pool_size=cell.thread_pool_size, env=env)
+    await server.start()
+    try:
+        sampler = ResourceSampler(server.process.pid, server.base_url, matrix.sample_interval)
+        stop_sampling = asyncio.Event()
+        sampler_task = asyncio.create_task(sampler.run(stop_sampling))
+
+        if cell.mode == "closed":
+            async with make_client(server.base_url, max_connections=int(cell.load)) as client:
+                result = await closed_loop(client, cell.route, cell.load, matrix.duration, matrix.warmup,
+                                           matrix.think_time, matrix.seed)
+        else:
+            # Open loop needs enough connections that the client never throttles arrivals
+            async with make_client(server.base_url, max_connections=1000) as client:
+                result = await open_loop(client, cell.route, cell.load, matrix.duration, matrix.warmup)
+
+        stop_sampling.set()
+        await sampler_task
+    finally:
+        await server.stop()
+
+    return {
+        "key": cell.key,
+        "route": cell.route,
+        "mode": cell.mode,
+        "load": cell.load,
+        "workers": cell.workers,
+        "thread_pool_size": cell.thread_pool_size,
+        "variant": cell.variant,
+        "env": cell.env,
+        "summary": summarize(result, sampler.samples, matrix.duration),
+        "samples": sampler.samples,
+    }
+
+
+async def run(matrix):
+    started = datetime.now(timezone.utc)
+    upstream = None
+    if any(marker in cell.route for cell in matrix.cells for marker in UPSTREAM_ROUTES):
+        upstream = UpstreamServer(matrix.host, matrix.upstream_port, matrix.upstream_latency)
+        await upstream.start()
+    cells = []
+    try:
+        for i, cell in enumerate(matrix.cells, 1):
+            print(f"[{i}/{len(matrix.cells)}] {cell.key}", flush=True)
+            cell_started = time.perf_counter()
+            cells.append(await run_cell(matrix, cell))
+            summary = cells[-1]["summary"]
+            print(f"    {summary['throughput_rps']:.1f} req/s, p95 {summary['p95_ms'] or 0:.0f}ms, "
+                  f"{summary['failures']} failures ({time.perf_counter() - cell_started:.0f}s)", flush=True)
+    finally:
+        if upstream is not None:
+            await upstream.stop()
+    return {
+        "run_id": started.strftime("%Y%m%dT%H%M%SZ"),
+        "started_at": started.isoformat(),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        # The server runs on this interpreter, so it encodes FAST_RESPONSES with the same backend
+        "json_backend": json_backend(),
+        "matrix": matrix.raw,
+        "cells": cells,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m bench", description="Run the benchmark matrix")
+    parser.add_argument("--config", "-c", default=DEFAULT_MATRIX, help="Matrix TOML file (default: bench/matrix.toml)")
+    parser.add_argument("--routes", nargs="*", help="Only run routes containing one of these substrings")
+    parser.add_argument("--duration", type=float, help="Override the measured seconds per cell")
+    parser.add_argument("--output", "-o", help="Result file (default: <results_dir>/<run_id>.json)")
+    parser.add_argument("--baseline", help="Baseline result file to compare against (default: from the matrix)")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit 1 if any metric regressed")
+    args = parser.parse_args()
+
+    overrides = {"duration": args.duration} if args.duration else {}
+    matrix = load_matrix(args.config, routes=args.routes, overrides=overrides)
+    if not matrix.cells:
+        print("No cells selected", file=sys.stderr)
+        sys.exit(2)
+
+    print(f"Running {len(matrix.cells)} cells, ~{len(matrix.cells) * (matrix.duration + matrix.warmup + 3):.0f}s")
+    result = asyncio.run(run(matrix))
+
+    output = Path(args.output) if args.output else matrix.results_dir / f"{result['run_id']}.json"
+    write_results(output, result)
+    print()
+    print_summary(result)
+    print(f"\nResults written to {output}")
+
+    baseline_path = Path(args.baseline) if args.baseline else matrix.baseline
+    regressions = []
+    if baseline_path.exists():
+        regressions = print_comparison(compare(result, load_results(baseline_path), matrix.regression_threshold))
+    else:
+        print(f"\nNo baseline at {baseline_path}")
+
+    if args.save_baseline:
+        write_results(baseline_path, result)
+        print(f"Baseline saved to {baseline_path}")
+
+    if args.fail_on_regression and regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Reading the Locust/resource-monitor artifacts that run_load_tests.sh writes to docs/."""
+import csv
+import re
+import statistics
+from dataclasses import dataclass
+from pathlib import Path
+
+# {route}-{users}users[-{N}workers][-open], as named by run_load_tests.sh
+RUN_NAME = re.compile(r"^(?P<route>.+?)-(?P<users>\d+)users(?:-(?P<workers>\d+)workers)?(?P<open>-open)?$")
+
+
+@dataclass
+class LocustRun:
+    """One run_load_tests.sh run: the files sharing a `{name}_*` prefix in the results directory."""
+    name: str
+    route: str
+    users: int
+    workers: int
+    load_mode: str               # "closed" or "open"
+    stats: Path
+    resources: Path
+    history: Path = None         # Locust stats_history CSV, if present
+    hdr: Path = None             # HDR percentiles CSV from the locustfile, if present
+    meta: Path = None            # run metadata (git commit, ...) from run_load_tests.sh, if present
+
+
+def route_name(path):
+    """Return the route name used in run names for a request path ("/r?mode=process" -> "r-process")."""
+    route, _, query = path.strip("/").partition("?")
+    values = [value for _, _, value in (item.partition("=") for item in query.split("&")) if value]
+    return "-".join([route] + values)
+
+
+def parse_run_name(name):
+    """Split a run name into route, users, workers and load mode, or return None."""
+    match = RUN_NAME.match(name)
+    if match is None:
+        return None
+    return {
+        "route": match["route"],
+        "users": int(match["users"]),
+        "workers": int(match["workers"] or 1),
+        "load_mode": "open" if match["open"] else "closed",
+    }
+
+
+def discover_runs(results_dir):
+    """Return every complete run (stats + resources CSV) in results_dir, sorted by name."""
+    results_dir = Path(results_dir)
+    runs = []
+    for stats in sorted(results_dir.glob("*_stats.csv")):
+        name = stats.name[:-len("_stats.csv")]
+        parsed = parse_run_name(name)
+        resources = results_dir / f"{name}_resources.csv"
+        if parsed is None or not resources.exists():
+            continue
+        history = results_dir / f"{name}_stats_history.csv"
+        hdr = results_dir / f"{name}_hdr.csv"
+        meta = results_dir / f"{name}_meta.json"
+        runs.append(LocustRun(
+            name=name, stats=stats, resources=resources,
+            history=history if history.exists() else None,
+            hdr=hdr if hdr.exists() else None,
+            meta=meta if meta.exists() else None,
+            **parsed,
+        ))
+    return runs
+
+
+def _convert(value):
+    if value in ("", "N/A"):
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def read_rows(path):
+    """Read a CSV into dicts, converting numeric cells (empty and N/A become None)."""
+    with open(path, encoding="utf-8", newline="") as f:
+        return [{key: _convert(value) for key, value in row.items()} for row in csv.DictReader(f)]
+
+
+def aggregated_row(stats_rows):
+    """Return Locust's 'Aggregated' stats row."""
+    for row in stats_rows:
+        if row["Name"] == "Aggregated":
+            return row
+    raise ValueError("No Aggregated row in Locust stats")
+
+
+def test_phase(resource_rows):
+    """Resource samples taken while load was running (not while background tasks drained)."""
+    return [row for row in resource_rows if row.get("phase") == "test"] or resource_rows
+
+
+def summarize_run(stats_rows, resource_rows):
+    """Reduce a run's stats and resource samples to the headline metrics used across tools."""
+    aggregated = aggregated_row(stats_rows)
+    samples = test_phase(resource_rows)
+    cpu = [row["cpu_percent"] for row in samples if row.get("cpu_percent") is not None]
+    rss = [row["memory_rss_mb"] for row in samples if row.get("memory_rss_mb") is not None]
+    return {
+        "requests": aggregated["Request Count"],
+        "failures": aggregated["Failure Count"],
+        "throughput_rps": aggregated["Requests/s"],
+        "mean_ms": aggregated["Average Response Time"],
+        "p50_ms": aggregated["50%"],
+        "p95_ms": aggregated["95%"],
+        "p99_ms": aggregated["99%"],
+        "p999_ms": aggregated["99.9%"],
+        "max_ms": aggregated["100%"],
+        "mean_cpu_percent": statistics.fmean(cpu) if cpu else None,
+        "max_rss_mb": max(rss) if rss else None,
+    }
@@ -0,0 +1,314 @@
+"""
+Performance regression gate over run_load_tests.sh artifacts.
+
+    python -m bench.gate --baseline docs/baseline                  # check docs/ against a baseline
+    python -m bench.gate --baseline docs/baseline --report gate.md # also write a Markdown report
+    python -m bench.gate --save-baseline docs/baseline             # store the current runs as baseline
+
+Every run in the current directory that also exists in the baseline is
+compared on the metrics in bench/gate.toml. For each metric, the baseline and
+current values are bootstrapped independently and the relative change is
+taken per resample, giving a confidence interval of the change:
+
+  - throughput_rps: mean of per-second request counts from Locust's stats history
+  - rss_mb: mean RSS over the test phase of the resource samples
+  - latency percentiles: the point estimate comes from Locust's aggregated
+    percentile table, and its spread from the per-second percentiles of the
+    stats history, resampled like the other series. Runs without a history fall
+    back to drawing the percentile's rank from its binomial distribution, which
+    treats requests as independent and gives too narrow an interval
+
+Per-second series are resampled in blocks, so autocorrelated samples do not
+shrink the intervals. A metric is a regression when the whole interval lies
+beyond its threshold, and "inconclusive" when only the point estimate does.
+The gate fails (exit 1) if any metric regressed.
+"""
+import argparse
+import math
+import random
+import shutil
+import statistics
+import sys
+import tomllib
+from pathlib import Path
+
+from bench.artifacts import aggregated_row, discover_runs, read_rows, test_phase
+
+DEFAULT_GATE = Path(__file__).with_name("gate.toml")
+
+# Locust percentile columns as quantiles
+PERCENTILE_COLUMNS = {
+    "50%": 0.50, "66%": 0.66, "75%": 0.75, "80%": 0.80, "90%": 0.90, "95%": 0.95,
+    "98%": 0.98, "99%": 0.99, "99.9%": 0.999, "99.99%": 0.9999, "100%": 1.0,
+}
+
+LATENCY_METRICS = {"p50_ms": 0.50, "p90_ms": 0.90, "p95_ms": 0.95, "p99_ms": 0.99, "p999_ms": 0.999}
+QUANTILE_COLUMNS = {q: column for column, q in PERCENTILE_COLUMNS.items()}
+
+# Locust computes the stats-history percentiles over a sliding window of this many
+# seconds, so neighbouring rows share most of their requests
+HISTORY_PERCENTILE_WINDOW = 10
+
+PASS = "pass"
+REGRESSION = "regression"
+INCONCLUSIVE = "inconclusive"
+IMPROVED = "improved"
+
+
+class LatencyDistribution:
+    """Latency quantile function interpolated from Locust's aggregated percentile table."""
+
+    def __init__(self, aggregated):
+        self.count = aggregated["Request Count"] or 0
+        points = [(0.0, aggregated["Min Response Time"])]
+        points += [(q, aggregated[column]) for column, q in PERCENTILE_COLUMNS.items()]
+        self.points = [(q, value) for q, value in points if value is not None]
+
+    def quantile(self, q):
+        for (q0, v0), (q1, v1) in zip(self.points, self.points[1:]):
+            if q <= q1:
+                return v0 if q1 == q0 else v0 + (v1 - v0) * (q - q0) / (q1 - q0)
+        return self.points[-1][1]
+
+    def bootstrap(self, q, resamples, rng):
+        """
+        Resampled q-quantiles of a sample of `count` requests.
+
+        In a bootstrap resample, the rank of the q-quantile is approximately
+        normal, with mean q and variance q(1-q)/n in quantile terms, so the
+        resampled quantile can be drawn without materializing the requests.
+        Only used for runs without a stats history: requests are not
+        independent under load, so the spread is too narrow.
+        """
+        spread = math.sqrt(q * (1 - q) / self.count)
+        return [self.quantile(min(max(rng.gauss(q, spread), 0.0), 1.0)) for _ in range(resamples)]
+
+
+def block_bootstrap_means(series, resamples, block, rng):
+    """Moving-block bootstrap of the mean of a time series."""
+    n = len(series)
+    block = max(1, min(block, n))
+    starts = n - block + 1
+    blocks_needed = math.ceil(n / block)
+    means = []
+    for _ in range(resamples):
+        sample = []
+        for _ in range(blocks_needed):
+            start = rng.randrange(starts)
+            sample.extend(series[start:start + block])
+        means.append(statistics.fmean(sample[:n]))
+    return means
+
+
+class RunData:
+    """The series and distributions of one run needed to bootstrap its metrics."""
+
+    def __init__(self, run):
+        stats = read_rows(run.stats)
+        self.latency = LatencyDistribution(aggregated_row(stats))
+        history = self._history(run)
+        self.requests_per_second = self._requests_per_second(history)
+        self.latency_per_second = {
+            q: [row[column] for row in history if row.get(column) is not None]
+            for q, column in QUANTILE_COLUMNS.items()
+        }
+        samples = test_phase(read_rows(run.resources))
+        self.rss = [row["memory_rss_mb"] for row in samples if row.get("memory_rss_mb") is not None]
+        self.throughput = aggregated_row(stats)["Requests/s"]
+
+    @staticmethod
+    def _history(run):
+        """Locust's per-second Aggregated stats-history rows while users were running."""
+        if run.history is None:
+            return []
+        return [row for row in read_rows(run.history) if row["Name"] == "Aggregated" and row["User Count"]]
+
+    @staticmethod
+    def _requests_per_second(rows):
+        """Requests completed in each second of the run, from Locust's cumulative counts."""
+        per_second = []
+        for previous, current in zip(rows, rows[1:]):
+            elapsed = current["Timestamp"] - previous["Timestamp"]
+            if elapsed > 0:
+                per_second.append((current["Total Request Count"] - previous["Total Request Count"]) / elapsed)
+        return per_second
+
+    def point(self, metric):
+        if metric == "throughput_rps":
+            return self.throughput
+        if metric == "rss_mb":
+            return statistics.fmean(self.rss) if self.rss else None
+        if metric in LATENCY_METRICS:
+            return self.latency.quantile(LATENCY_METRICS[metric]) if self.latency.count else None
+        raise ValueError(f"Unknown metric {metric!r}")
+
+    def bootstrap(self, metric, resamples, block, rng):
+        """Bootstrap replicates of a metric, or None when the run has no data to resample."""
+        if metric == "throughput_rps":
+            series = self.requests_per_second
+            return block_bootstrap_means(series, resamples, block, rng) if len(series) > 1 else None
+        if metric == "rss_mb":
+            return block_bootstrap_means(self.rss, resamples, block, rng) if len(self.rss) > 1 else None
+        if metric in LATENCY_METRICS:
+            return self._bootstrap_latency(LATENCY_METRICS[metric], resamples, block, rng)
+        raise ValueError(f"Unknown metric {metric!r}")
+
+    def _bootstrap_latency(self, q, resamples, block, rng):
+        """
+        Bootstrap replicates of the q-quantile of the run's latency.
+
+        The per-second percentiles are block-bootstrapped, and each resampled
+        mean scales the point estimate by its ratio to the series mean. Blocks
+        span at least Locust's percentile window, since rows within a window
+        overlap.
+        """
+        if not self.latency.count:
+            return None
+        series = self.latency_per_second[q]
+        mean = statistics.fmean(series) if len(series) > 1 else 0
+        if not mean:
+            return self.latency.bootstrap(q, resamples, rng)
+        point = self.latency.quantile(q)
+        block = max(block, HISTORY_PERCENTILE_WINDOW)
+        return [point * resampled / mean for resampled in block_bootstrap_means(series, resamples, block, rng)]
+
+
+def compare_metric(baseline, current, metric, rule, settings, rng):
+    """Compare one metric of two runs. Returns a result row."""
+    old, new = baseline.point(metric), current.point(metric)
+    row = {"metric": metric, "baseline": old, "current": new, "change": None, "ci": None, "verdict": PASS}
+    if not old or new is None:
+        return row
+    row["change"] = (new - old) / old
+
+    old_samples = baseline.bootstrap(metric, settings["resamples"], settings["block_seconds"], rng)
+    new_samples = current.bootstrap(metric, settings["resamples"], settings["block_seconds"], rng)
+    if old_samples and new_samples:
+        changes = sorted((n - o) / o for o, n in zip(old_samples, new_samples) if o)
+        alpha = (1 - settings["confidence"]) / 2
+        row["ci"] = (changes[int(alpha * (len(changes) - 1))], changes[int((1 - alpha) * (len(changes) - 1))])
+    low, high = row["ci"] or (row["change"], row["change"])
+
+    # Express changes so that positive always means "worse"
+    sign = -1 if rule["higher_is_better"] else 1
+    worse_low, worse_high = sorted((sign * low, sign * high))
+    if worse_low > rule["threshold"]:
+        row["verdict"] = REGRESSION
+    elif sign * row["change"] > rule["threshold"]:
+        row["verdict"] = INCONCLUSIVE
+    elif worse_high < -rule["threshold"]:
+        row["verdict"] = IMPROVED
+    return row
+
+
+def run_gate(baseline_dir, current_dir, gate):
+    """Compare every run present in both directories. Returns {run name: [result rows]}."""
+    settings = {
+        "confidence": gate.get("confidence", 0.95),
+        "resamples": gate.get("resamples", 2000),
+        "block_seconds": gate.get("block_seconds", 5),
+    }
+    rng = random.Random(gate.get("seed", 0))
+    baseline_runs = {run.name: run for run in discover_runs(baseline_dir)}
+    results = {}
+    for run in discover_runs(current_dir):
+        if run.name not in baseline_runs:
+            continue
+        baseline, current = RunData(baseline_runs[run.name]), RunData(run)
+        results[run.name] = [
+            compare_metric(baseline, current, metric, rule, settings, rng)
+            for metric, rule in gate["metrics"].items()
+        ]
+    return results
+
+
+def _fmt(value, spec=".1f"):
+    return "-" if value is None else format(value, spec)
+
+
+def _fmt_change(row):
+    if row["change"] is None:
+        return "-"
+    if row["ci"] is None:
+        return f"{row['change']:+.1%}"
+    return f"{row['change']:+.1%} [{row['ci'][0]:+.1%}, {row['ci'][1]:+.1%}]"
+
+
+def format_report(results, gate, markdown=False):
+    """Render the gate results as plain text or Markdown."""
+    confidence = gate.get("confidence", 0.95)
+    lines = []
+    counts = {}
+    for rows in results.values():
+        for row in rows:
+            counts[row["verdict"]] = counts.get(row["verdict"], 0) + 1
+    failed = counts.get(REGRESSION, 0) > 0
+    summary = (f"{'FAIL' if failed else 'PASS'}: {len(results)} runs, "
+               + ", ".join(f"{count} {verdict}" for verdict, count in sorted(counts.items())))
+
+    if markdown:
+        lines += ["# Performance regression gate", "", f"**{summary}**", "",
+                  f"Changes with {confidence:.0%} bootstrap confidence intervals.", "",
+                  "| run | metric | baseline | current | change | threshold | verdict |",
+                  "|---|---|---|---|---|---|---|"]
+        for name, rows in results.items():
+            for row in rows:
+                rule = gate["metrics"][row["metric"]]
+                lines.append(f"| {name} | {row['metric']} | {_fmt(row['baseline'])} | {_fmt(row['current'])} | "
+                             f"{_fmt_change(row)} | {rule['threshold']:.0%} | {row['verdict']} |")
+    else:
+        lines.append(summary)
+        for name, rows in results.items():
+            flagged = [row for row in rows if row["verdict"] != PASS]
+            for row in flagged:
+                lines.append(f"  {row['verdict'].upper():<12} {name} {row['metric']}: "
+                             f"{_fmt(row['baseline'])} -> {_fmt(row['current'])} {_fmt_change(row)}")
+    return "\n".join(lines) + "\n", failed
+
+
+def save_baseline(current_dir, baseline_dir):
+    """Copy every run's stats, history and resource CSVs and its metadata to the baseline directory."""
+    baseline_dir = Path(baseline_dir)
+    baseline_dir.mkdir(parents=True, exist_ok=True)
+    runs = discover_runs(current_dir)
+    for run in runs:
+        for path in (run.stats, run.resources, run.history, run.meta):
+            if path is not None:
+                shutil.copy2(path, baseline_dir / path.name)
+    return len(runs)
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m bench.gate", description="Performance regression gate")
+    parser.add_argument("--current", default="docs", help="Directory with the runs to check (default: docs)")
+    parser.add_argument("--baseline", help="Directory with the baseline runs")
+    parser.add_argument("--config", default=DEFAULT_GATE, help="Gate TOML file (default: bench/gate.toml)")
+    parser.add_argument("--report", help="Write a Markdown report to this file")
+    parser.add_argument("--save-baseline", metavar="DIR", help="Copy the current runs to DIR and exit")
+    args = parser.parse_args()
+
+    if args.save_baseline:
+        count = save_baseline(args.current, args.save_baseline)
+        print(f"Saved {count} runs to {args.save_baseline}")
+        return
+    if not args.baseline:
+        parser.error("--baseline is required unless --save-baseline is given")
+
+    with open(args.config, "rb") as f:
+        gate = tomllib.load(f)
+    results = run_gate(args.baseline, args.current, gate)
+    if not results:
+        print(f"No runs in {args.current} match runs in {args.baseline}", file=sys.stderr)
+        sys.exit(2)
+
+    text, failed = format_report(results, gate)
+    print(text, end="")
+    if args.report:
+        markdown, _ = format_report(results, gate, markdown=True)
+        Path(args.report).write_text(markdown, encoding="utf-8")
+        print(f"Report written to {args.report}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+HDR (high dynamic range) latency histogram.
+
+A pure-Python port of the HdrHistogram bucketing scheme: values are recorded
+as integers (microseconds here) into log-linear buckets that keep a fixed
+number of significant digits across the whole range, so p99.9 of a run that
+mixes 200ms and 30s latencies is as accurate as its median.
+"""
+import math
+
+
+class HdrHistogram:
+    """Records integer values with `significant_figures` precision up to `highest`."""
+
+    def __init__(self, highest=3_600_000_000, significant_figures=3):
+        if not 1 <= significant_figures <= 5:
+            raise ValueError("significant_figures must be between 1 and 5")
+        self.highest = highest
+        self.significant_figures = significant_figures
+
+        largest_single_unit = 2 * 10 ** significant_figures
+        sub_bucket_count_magnitude = math.ceil(math.log2(largest_single_unit))
+        self._half_magnitude = max(sub_bucket_count_magnitude, 1) - 1
+        self._sub_bucket_count = 2 ** (self._half_magnitude + 1)
+        self._half_count = self._sub_bucket_count // 2
+        self._mask = self._sub_bucket_count - 1
+
+        buckets_needed = 1
+        smallest_untrackable = self._sub_bucket_count
+        while smallest_untrackable <= highest:
+            smallest_untrackable <<= 1
+            buckets_needed += 1
+        self.counts = [0] * ((buckets_needed + 1) * self._half_count)
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def _index(self, value):
+        bucket = (value | self._mask).bit_length() - (self._half_magnitude + 1)
+        sub_bucket = value >> bucket
+        return ((bucket + 1) << self._half_magnitude) + (sub_bucket - self._half_count)
+
+    def _value_at(self, index):
+        bucket = (index >> self._half_magnitude) - 1
+        sub_bucket = (index & (self._half_count - 1)) + self._half_count
+        if bucket < 0:
+            sub_bucket -= self._half_count
+            bucket = 0
+        return sub_bucket << bucket
+
+    def _highest_equivalent(self, index):
+        bucket = max((index >> self._half_magnitude) - 1, 0)
+        return self._value_at(index) + (1 << bucket) - 1
+
+    def record(self, value, count=1):
+        """Record a non-negative integer value (clamped to the trackable range)."""
+        value = min(max(int(value), 0), self.highest)
+        self.counts[self._index(value)] += count
+        self.total += count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = max(self.max, value)
+
+    def percentile(self, percent):
+        """Return the value at a percentile (0-100)."""
+        if not self.total:
+            return None
+        target = max(math.ceil(percent / 100 * self.total), 1)
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return min(self._highest_equivalent(index), self.max)
+        return self.max
+
+    def mean(self):
+        if not self.total:
+            return None
+        return sum(
+            count * (self._value_at(index) + self._highest_equivalent(index)) / 2
+            for index, count in enumerate(self.counts) if count
+        ) / self.total
+
+    def merge(self, other):
+        """Add another histogram with the same settings into this one."""
+        if (other.highest, other.significant_figures) != (self.highest, self.significant_figures):
+            raise ValueError("Cannot merge histograms with different settings")
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.total += other.total
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def to_dict(self):
+        """Serialize to a compact JSON-friendly dict (non-zero buckets only)."""
+        return {
+            "highest": self.highest,
+            "significant_figures": self.significant_figures,
+            "counts": {str(index): count for index, count in enumerate(self.counts) if count},
+        }
+
+    def summary(self, scale=1.0):
+        """Return headline percentiles divided by `scale` (e.g. 1000 for us -> ms)."""
+        value = lambda v: v / scale if v is not None else None
+        return {
+            "count": self.total,
+            "min": value(self.min),
+            "mean": value(self.mean()),
+            "p50": value(self.percentile(50)),
+            "p90": value(self.percentile(90)),
+            "p95": value(self.percentile(95)),
+            "p99": value(self.percentile(99)),
+            "p99.9": value(self.percentile(99.9)),
+            "p99.99": value(self.percentile(99.99)),
+            "max": value(self.max),
+        }
@@ -0,0 +1,124 @@
+"""Asyncio HTTP load generation: closed-loop users and open-loop arrivals."""
+import asyncio
+import random
+import time
+
+import httpx
+
+from bench.hdr import HdrHistogram
+
+
+class LoadResult:
+    """Latencies and outcome counts collected during the measured window."""
+
+    def __init__(self):
+        # Microseconds. Failed requests (timeouts, 5xx, 504/499 from a cancelling server) are
+        # the slow tail of a saturated server, so they are kept and reported too
+        self.ok_latencies = HdrHistogram()
+        self.error_latencies = HdrHistogram()
+        self.ok = 0
+        self.failed = 0
+        self.status_counts = {}
+        self.started = None
+        self.finished = None
+
+    def record(self, latency, status):
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        if isinstance(status, int) and status < 400:
+            self.ok += 1
+            self.ok_latencies.record(latency * 1_000_000)
+        else:
+            self.failed += 1
+            self.error_latencies.record(latency * 1_000_000)
+
+    @property
+    def latencies(self):
+        """Every completed request, failed or not."""
+        merged = HdrHistogram()
+        merged.merge(self.ok_latencies)
+        merged.merge(self.error_latencies)
+        return merged
+
+    @property
+    def elapsed(self):
+        return (self.finished or time.perf_counter()) - self.started
+
+
+async def _request(client, path):
+    """Send one GET and return its status (or the exception class name)."""
+    try:
+        response = await client.get(path)
+        return response.status_code
+    except httpx.HTTPError as exc:
+        return type(exc).__name__
+
+
+async def closed_loop(client, path, users, duration, warmup, think_time, seed):
+    """
+    Run `users` concurrent users that each send a request, wait for it and think.
+
+    Only requests sent after the warmup are recorded. When the server stalls the
+    users stop sending, so this mode under-reports tail latency; see open_loop.
+    """
+    result = LoadResult()
+    loop = asyncio.get_running_loop()
+    measure_from = loop.time() + warmup
+    stop_at = measure_from + duration
+
+    async def user(index):
+        rng = random.Random(seed + index)
+        while loop.time() < stop_at:
+            sent = time.perf_counter()
+            measured = loop.time() >= measure_from
+            status = await _request(client, path)
+            if measured:
+                result.record(time.perf_counter() - sent, status)
+            await asyncio.sleep(rng.uniform(*think_time))
+
+    await asyncio.sleep(0)
+    result.started = time.perf_counter() + warmup
+    await asyncio.gather(*(user(i) for i in range(int(users))))
+    result.finished = time.perf_counter()
+    return result
+
+
+async def open_loop(client, path, rate, duration, warmup):
+    """
+    Fire requests at a constant arrival rate, regardless of how fast responses come back.
+
+    Latency is measured from each request's intended send time, so time spent
+    queued behind a stalled server is included rather than omitted.
+    """
+    result = LoadResult()
+    interval = 1.0 / rate
+    total = int((warmup + duration) * rate)
+    warmup_requests = int(warmup * rate)
+    in_flight = set()
+
+    async def fire(intended, measured):
+        status = await _request(client, path)
+        if measured:
+            result.record(time.perf_counter() - intended, status)
+
+    start = time.perf_counter()
+    result.started = start + warmup
+    for i in range(total):
+        intended = start + i * interval
+        delay = intended - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        task = asyncio.create_task(fire(intended, i >= warmup_requests))
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
+
+    # Outstanding requests still count: a stalled server must not shorten the tail
+    if in_flight:
+        await asyncio.gather(*in_flight)
+    result.finished = time.perf_counter()
+    return result
+
+
+def make_client(base_url, max_connections, timeout=30):
+    """Create a pooled keep-alive client sized for the load."""
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    return httpx.AsyncClient(base_url=base_url, limits=limits, timeout=timeout)
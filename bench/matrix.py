@@ -0,0 +1,102 @@
+"""Benchmark matrix configuration."""
+import itertools
+import tomllib
+from dataclasses import dataclass, field
+from pathlib import Path
+
+DEFAULT_MATRIX = Path(__file__).with_name("matrix.toml")
+
+
+@dataclass(frozen=True)
+class Cell:
+    """One benchmark configuration: a route under one load shape on one server setup."""
+    route: str
+    mode: str                    # "closed" or "open"
+    load: float                  # users (closed) or requests per second (open)
+    workers: int
+    thread_pool_size: int
+    variant: str
+    env: dict = field(default_factory=dict, compare=False, hash=False)
+
+    @property
+    def key(self):
+        """Stable identifier used to match cells across runs."""
+        load = f"{int(self.load)}users" if self.mode == "closed" else f"{self.load:g}rps"
+        return (f"{self.route.strip('/')}|{self.mode}|{load}|{self.workers}w|"
+                f"{self.thread_pool_size}t|{self.variant}")
+
+
+@dataclass
+class Matrix:
+    """Global benchmark settings plus the list of cells to run."""
+    duration: float
+    warmup: float
+    sample_interval: float
+    seed: int
+    host: str
+    port: int
+    upstream_port: int
+    upstream_latency: float
+    results_dir: Path
+    baseline: Path
+    regression_threshold: float
+    think_time: tuple
+    cells: list
+    raw: dict
+
+
+def load_matrix(path=DEFAULT_MATRIX, routes=None, overrides=None):
+    """
+    Load a matrix file and expand it into cells.
+
+    Args:
+        path: TOML matrix file
+        routes: Optional substrings; only routes containing one of them are kept
+        overrides: Optional dict of top-level settings that replace the file's values
+    """
+    with open(path, "rb") as f:
+        raw = tomllib.load(f)
+    raw.update(overrides or {})
+
+    load = raw.get("load", {})
+    server = raw.get("server", {})
+    variants = raw.get("variants") or {"default": {"env": {}}}
+
+    selected_routes = [
+        route for route in raw["routes"]
+        if not routes or any(pattern in route for pattern in routes)
+    ]
+
+    loads = []
+    for mode in load.get("modes", ["closed"]):
+        if mode == "closed":
+            loads += [("closed", users) for users in load.get("users", [10])]
+        elif mode == "open":
+            loads += [("open", rate) for rate in load.get("rates", [50])]
+        else:
+            raise ValueError(f"Unknown load mode {mode!r}, expected 'closed' or 'open'")
+
+    cells = [
+        Cell(route=route, mode=mode, load=amount, workers=workers, thread_pool_size=pool_size,
+             variant=variant, env={str(k): str(v) for k, v in variants[variant].get("env", {}).items()})
+        for variant, route, (mode, amount), workers, pool_size in itertools.product(
+            variants, selected_routes, loads, server.get("workers", [1]), server.get("thread_pool_sizes", [40])
+        )
+    ]
+
+    return Matrix(
+        duration=raw.get("duration", 10),
+        warmup=raw.get("warmup", 2),
+        sample_interval=raw.get("sample_interval", 0.5),
+        seed=raw.get("seed", 0),
+        host=raw.get("host", "127.0.0.1"),
+        port=raw.get("port", 8010),
+        upstream_port=raw.get("upstream_port", 8110),
+        upstream_latency=raw.get("upstream_latency", 0.2),
+        results_dir=Path(raw.get("results_dir", "docs/bench")),
+        baseline=Path(raw.get("baseline", "docs/bench/baseline.json")),
+        regression_threshold=raw.get("regression_threshold", 0.10),
+        think_time=tuple(load.get("think_time", [0.1, 0.5])),
+        cells=cells,
+        raw=raw,
+    )
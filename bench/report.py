@@ -0,0 +1,105 @@
+"""Summaries, consolidated result files and baseline comparison."""
+import json
+import statistics
+
+# Metrics compared against the baseline: name -> True if higher is better
+COMPARED_METRICS = {
+    "throughput_rps": True,
+    "p95_ms": False,
+    "max_rss_mb": False,
+}
+
+
+def summarize(result, samples, duration):
+    """Reduce one cell's load result and resource samples to headline numbers."""
+    all_latencies = result.latencies
+    latencies = all_latencies.summary(scale=1000)
+    errors = result.error_latencies.summary(scale=1000)
+    cpu = [s["cpu_percent"] for s in samples]
+    rss = [s["memory_rss_mb"] for s in samples]
+    pending = [s["pending_bg_tasks"] for s in samples if s["pending_bg_tasks"] is not None]
+    waiting = [s["thread_pool_waiting"] for s in samples if s["thread_pool_waiting"] is not None]
+    pool_sizes = [s["thread_pool_total"] for s in samples if s.get("thread_pool_total") is not None]
+    return {
+        "requests": result.ok + result.failed,
+        "failures": result.failed,
+        "status_counts": {str(k): v for k, v in result.status_counts.items()},
+        "throughput_rps": result.ok / duration,
+        "mean_ms": latencies["mean"],
+        "p50_ms": latencies["p50"],
+        "p95_ms": latencies["p95"],
+        "p99_ms": latencies["p99"],
+        "p999_ms": latencies["p99.9"],
+        "max_ms": latencies["max"],
+        # Percentiles above are over every request; these are over the failed ones alone
+        "error_p50_ms": errors["p50"],
+        "error_p99_ms": errors["p99"],
+        "latency_histogram": all_latencies.to_dict(),
+        "mean_cpu_percent": statistics.fmean(cpu) if cpu else None,
+        # CPU time of the server process tree per successful request
+        "cpu_ms_per_request": statistics.fmean(cpu) * 10 * duration / result.ok if cpu and result.ok else None,
+        "max_rss_mb": max(rss) if rss else None,
+        "max_thread_pool_waiting": max(waiting) if waiting else None,
+        # Differs from the configured size when the adaptive limiter resized the pool
+        "final_thread_pool_total": pool_sizes[-1] if pool_sizes else None,
+        "pending_bg_tasks_at_end": pending[-1] if pending else None,
+    }
+
+
+def write_results(path, run):
+    """Write the consolidated result file of a run."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(run, f, indent=1)
+
+
+def load_results(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(run, baseline, threshold):
+    """
+    Compare each cell's headline metrics against the baseline run.
+
+    Returns:
+        list of dicts with the cell key, metric, values, relative change and whether it regressed
+    """
+    baseline_cells = {cell["key"]: cell["summary"] for cell in baseline["cells"]}
+    rows = []
+    for cell in run["cells"]:
+        before = baseline_cells.get(cell["key"])
+        if before is None:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            old, new = before.get(metric), cell["summary"].get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            regressed = change < -threshold if higher_is_better else change > threshold
+            rows.append({"key": cell["key"], "metric": metric, "baseline": old, "current": new,
+                         "change": change, "regressed": regressed})
+    return rows
+
+
+def print_summary(run):
+    header = f"{'cell':<95} {'req/s':>8} {'p50ms':>8} {'p95ms':>8} {'p99ms':>8} {'p999ms':>8} {'fail':>6} {'cpu%':>6} {'cpums/r':>7} {'rssMB':>7}"
+    print(header)
+    print("-" * len(header))
+    fmt = lambda value, spec: format(value, spec) if value is not None else "-"
+    for cell in run["cells"]:
+        s = cell["summary"]
+        print(f"{cell['key']:<95} {fmt(s['throughput_rps'], '8.1f')} {fmt(s['p50_ms'], '8.0f')} "
+              f"{fmt(s['p95_ms'], '8.0f')} {fmt(s['p99_ms'], '8.0f')} "
+              f"{fmt(s.get('p999_ms'), '8.0f')} {s['failures']:>6} "
+              f"{fmt(s['mean_cpu_percent'], '6.1f')} {fmt(s.get('cpu_ms_per_request'), '7.2f')} "
+              f"{fmt(s['max_rss_mb'], '7.1f')}")
+
+
+def print_comparison(rows):
+    regressions = [row for row in rows if row["regressed"]]
+    print(f"\nCompared {len(rows)} metrics against the baseline: {len(regressions)} regression(s)")
+    for row in regressions:
+        print(f"  REGRESSION {row['key']} {row['metric']}: "
+              f"{row['baseline']:.1f} -> {row['current']:.1f} ({row['change']:+.1%})")
+    return regressions
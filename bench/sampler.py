@@ -0,0 +1,78 @@
+"""Resource sampling of the app under test, in the benchmark's own process."""
+import asyncio
+import time
+
+import httpx
+import psutil
+
+
+class ResourceSampler:
+    """Samples CPU/RSS of the server's process tree and its /metrics endpoint."""
+
+    def __init__(self, pid, base_url, interval):
+        self.root = psutil.Process(pid)
+        self.base_url = base_url
+        self.interval = interval
+        self.samples = []
+        self._processes = {}
+
+    def _process_tree(self):
+        current = [self.root] + self.root.children(recursive=True)
+        live = {}
+        for proc in current:
+            cached = self._processes.get(proc.pid)
+            if cached is None:
+                proc.cpu_percent(interval=None)  # Prime the measurement
+                cached = proc
+            live[proc.pid] = cached
+        self._processes = live
+        return list(live.values())
+
+    def _sample_process(self):
+        cpu = rss = threads = 0
+        for proc in self._process_tree():
+            try:
+                cpu += proc.cpu_percent(interval=None)
+                rss += proc.memory_info().rss
+                threads += proc.num_threads()
+            except psutil.NoSuchProcess:
+                continue
+        return {"cpu_percent": cpu, "memory_rss_mb": rss / (1024 * 1024), "process_threads": threads}
+
+    async def _sample_internal(self, client):
+        try:
+            response = await client.get("/metrics")
+            internal = response.json()
+        except (httpx.HTTPError, ValueError):
+            return {"thread_pool_total": None, "thread_pool_borrowed": None, "thread_pool_waiting": None,
+                    "pending_bg_tasks": None}
+        cluster = internal.get("cluster")
+        if cluster:
+            totals = cluster["totals"]
+            return {
+                "thread_pool_total": totals["thread_pool_total"],
+                "thread_pool_borrowed": totals["thread_pool_borrowed"],
+                "thread_pool_waiting": totals["thread_pool_waiting"],
+                "pending_bg_tasks": totals["pending_bg_tasks"],
+            }
+        return {
+            "thread_pool_total": internal["thread_pool"]["total_tokens"],
+            "thread_pool_borrowed": internal["thread_pool"]["borrowed_tokens"],
+            "thread_pool_waiting": internal["thread_pool"]["tasks_waiting"],
+            "pending_bg_tasks": internal["background_tasks"]["pending_count"],
+        }
+
+    async def run(self, stop_event):
+        """Sample every interval until stop_event is set."""
+        self._process_tree()
+        start = time.perf_counter()
+        # A dedicated connection so sampling never queues behind load-generator requests
+        async with httpx.AsyncClient(base_url=self.base_url, timeout=self.interval) as client:
+            while not stop_event.is_set():
+                sample = {"t": time.perf_counter() - start, **self._sample_process()}
+                sample.update(await self._sample_internal(client))
+                self.samples.append(sample)
+                try:
+                    await asyncio.wait_for(stop_event.wait(), self.interval)
+                except asyncio.TimeoutError:
+                    pass
@@ -0,0 +1,122 @@
+"""Start and stop the app under test."""
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+
+import httpx
+
+
+class AppServer:
+    """A uvicorn process serving app.main:app with one cell's configuration."""
+
+    def __init__(self, host, port, workers=1, thread_pool_size=40, env=None, log_path=None):
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.thread_pool_size = thread_pool_size
+        self.env = dict(env or {})
+        self.log_path = log_path or os.path.join(tempfile.gettempdir(), "bench-uvicorn.log")
+        self.process = None
+        self._metrics_file = os.path.join(tempfile.gettempdir(), f"bench-metrics-{port}.bin")
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def _environment(self):
+        # Cells stop the server with a backlog of background work; abandon it instead of draining
+        env = {**os.environ, "THREAD_LIMITER_TOKENS": str(self.thread_pool_size), "BG_DRAIN_TIMEOUT": "0",
+               **self.env}
+        if self.workers > 1:
+            env.setdefault("METRICS_SHARED_PATH", self._metrics_file)
+        return env
+
+    async def start(self, timeout=15):
+        """Start uvicorn and wait until it answers."""
+        if os.path.exists(self._metrics_file):
+            os.remove(self._metrics_file)
+        command = [sys.executable, "-m", "uvicorn", "app.main:app",
+                   "--host", self.host, "--port", str(self.port), "--log-level", "warning"]
+        if self.workers > 1:
+            command += ["--workers", str(self.workers)]
+        self._log = open(self.log_path, "w")
+        self.process = subprocess.Popen(command, env=self._environment(), stdout=self._log, stderr=subprocess.STDOUT)
+
+        deadline = asyncio.get_running_loop().time() + timeout
+        async with httpx.AsyncClient(base_url=self.base_url, timeout=1) as client:
+            while asyncio.get_running_loop().time() < deadline:
+                if self.process.poll() is not None:
+                    break
+                try:
+                    await client.get("/")
+                    return
+                except httpx.HTTPError:
+                    await asyncio.sleep(0.2)
+        await self.stop()
+        raise RuntimeError(f"uvicorn failed to start, see {self.log_path}")
+
+    async def stop(self, timeout=10):
+        """Stop uvicorn gracefully, killing it if it does not exit in time."""
+        if self.process is None:
+            return
+        if self.process.poll() is None:
+            self.process.send_signal(signal.SIGINT)
+            try:
+                await asyncio.to_thread(self.process.wait, timeout)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                await asyncio.to_thread(self.process.wait)
+        self._log.close()
+        self.process = None
+
+
+class UpstreamServer:
+    """The bench.upstream stub that the I/O-backed inner functions call, shared by all cells."""
+
+    def __init__(self, host, port, latency=0.2, log_path=None):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.log_path = log_path or os.path.join(tempfile.gettempdir(), "bench-upstream.log")
+        self.process = None
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}/"
+
+    async def start(self, timeout=10):
+        """Start the stub and wait until it answers."""
+        command = [sys.executable, "-m", "bench.upstream",
+                   "--host", self.host, "--port", str(self.port), "--latency", str(self.latency)]
+        self._log = open(self.log_path, "w")
+        self.process = subprocess.Popen(command, stdout=self._log, stderr=subprocess.STDOUT)
+
+        deadline = asyncio.get_running_loop().time() + timeout
+        async with httpx.AsyncClient(timeout=1) as client:
+            while asyncio.get_running_loop().time() < deadline:
+                if self.process.poll() is not None:
+                    break
+                try:
+                    await client.get(self.base_url, params={"delay": 0})
+                    return
+                except httpx.HTTPError:
+                    await asyncio.sleep(0.2)
+        await self.stop()
+        raise RuntimeError(f"upstream stub failed to start, see {self.log_path}")
+
+    async def stop(self, timeout=5):
+        """Stop the stub."""
+        if self.process is None:
+            return
+        if self.process.poll() is None:
+            self.process.send_signal(signal.SIGINT)
+            try:
+                await asyncio.to_thread(self.process.wait, timeout)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                await asyncio.to_thread(self.process.wait)
+        self._log.close()
+        self.process = None
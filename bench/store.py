@@ -0,0 +1,350 @@
+"""
+Run-history store: benchmark results from every run in one SQLite database.
+
+    python -m bench.store ingest                          # docs/*_stats.csv runs + docs/bench/*.json
+    python -m bench.store ingest --label v0.2 --tag LOG_MODE=queue
+    python -m bench.store query --route sync-route-sync-inner-sync-bg-sync-task --users 100
+    python -m bench.store query --metric throughput_rps p95_ms max_rss_mb --since 2025-12-01
+    python -m bench.store sql "SELECT git_commit, avg(throughput_rps) FROM runs GROUP BY 1"
+
+Locust runs (stats, stats_history and resource samples) and `python -m bench`
+result files are ingested as runs. Each run is tagged with its git commit,
+configuration and start time, and carries its headline metrics as columns, so
+a trend across releases is one indexed query. Each artifact is ingested once:
+re-running ingest only adds runs whose files changed.
+"""
+import argparse
+import hashlib
+import json
+import sqlite3
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from bench.artifacts import discover_runs, read_rows, route_name, summarize_run
+
+DEFAULT_DB = "results.sqlite3"
+
+METRICS = (
+    "requests", "failures", "throughput_rps", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "p999_ms",
+    "max_ms", "mean_cpu_percent", "max_rss_mb",
+)
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,              -- "locust" or "bench"
+    name TEXT NOT NULL,                -- run name or bench cell key
+    route TEXT NOT NULL,
+    load_mode TEXT NOT NULL,           -- "closed" or "open"
+    users REAL NOT NULL,               -- closed-loop users, or open-loop requests per second
+    workers INTEGER NOT NULL,
+    thread_pool_size INTEGER,
+    variant TEXT,
+    label TEXT,
+    git_commit TEXT,
+    config TEXT NOT NULL,              -- JSON: environment and tags the run used
+    started_at TEXT NOT NULL,          -- ISO 8601, UTC
+    ingested_at TEXT NOT NULL,
+    artifact TEXT NOT NULL,
+    artifact_sha256 TEXT NOT NULL,
+    {", ".join(f"{metric} REAL" for metric in METRICS)},
+    UNIQUE (source, name, artifact_sha256)
+);
+CREATE INDEX IF NOT EXISTS runs_route_users ON runs (route, users, started_at);
+CREATE INDEX IF NOT EXISTS runs_started_at ON runs (started_at);
+CREATE INDEX IF NOT EXISTS runs_git_commit ON runs (git_commit);
+
+CREATE TABLE IF NOT EXISTS stats_history (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    t REAL NOT NULL,                   -- seconds since the first sample
+    user_count INTEGER,
+    rps REAL,
+    failures_per_s REAL,
+    p50_ms REAL,
+    p95_ms REAL,
+    p99_ms REAL,
+    total_requests INTEGER
+);
+CREATE INDEX IF NOT EXISTS stats_history_run ON stats_history (run_id, t);
+
+CREATE TABLE IF NOT EXISTS resource_samples (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    t REAL NOT NULL,
+    phase TEXT,
+    cpu_percent REAL,
+    memory_rss_mb REAL,
+    process_threads INTEGER,
+    thread_pool_total INTEGER,
+    thread_pool_borrowed INTEGER,
+    thread_pool_waiting INTEGER,
+    pending_bg_tasks INTEGER
+);
+CREATE INDEX IF NOT EXISTS resource_samples_run ON resource_samples (run_id, t);
+"""
+
+
+class ResultsStore:
+    """SQLite database of benchmark runs."""
+
+    def __init__(self, path=DEFAULT_DB):
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def has_artifact(self, source, name, sha256):
+        return self.conn.execute(
+            "SELECT 1 FROM runs WHERE source = ? AND name = ? AND artifact_sha256 = ?", (source, name, sha256)
+        ).fetchone() is not None
+
+    def add_run(self, run, history=(), samples=()):
+        """Insert a run and its time series. Returns the new run id."""
+        columns = list(run)
+        with self.conn:
+            cursor = self.conn.execute(
+                f"INSERT INTO runs ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                [run[column] for column in columns],
+            )
+            run_id = cursor.lastrowid
+            self.conn.executemany(
+                "INSERT INTO stats_history VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(run_id, *row) for row in history],
+            )
+            self.conn.executemany(
+                "INSERT INTO resource_samples VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(run_id, *row) for row in samples],
+            )
+        return run_id
+
+    def query_runs(self, route=None, users=None, workers=None, source=None, label=None,
+                   since=None, until=None, metrics=METRICS):
+        """Return matching runs, oldest first, with the requested metric columns."""
+        conditions, params = [], []
+        for column, value in (("route", route), ("users", users), ("workers", workers),
+                              ("source", source), ("label", label)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if since:
+            conditions.append("started_at >= ?")
+            params.append(since)
+        if until:
+            conditions.append("started_at < ?")
+            params.append(until)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return self.conn.execute(
+            f"SELECT id, started_at, git_commit, label, source, route, load_mode, users, workers, "
+            f"thread_pool_size, variant, {', '.join(metrics)} FROM runs {where} "
+            f"ORDER BY route, load_mode, users, workers, started_at",
+            params,
+        ).fetchall()
+
+
+def file_sha256(*paths):
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(Path(path).read_bytes())
+    return digest.hexdigest()
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _started_at(resource_rows, fallback_path):
+    """The first resource sample's timestamp, else the stats file's mtime."""
+    if resource_rows and resource_rows[0].get("timestamp"):
+        return datetime.fromisoformat(resource_rows[0]["timestamp"]).astimezone(timezone.utc).isoformat()
+    return datetime.fromtimestamp(Path(fallback_path).stat().st_mtime, timezone.utc).isoformat()
+
+
+def _history_rows(rows):
+    rows = [row for row in rows if row["Name"] == "Aggregated"]
+    if not rows:
+        return []
+    start = rows[0]["Timestamp"]
+    return [
+        (row["Timestamp"] - start, row["User Count"], row["Requests/s"], row["Failures/s"],
+         row["50%"], row["95%"], row["99%"], row["Total Request Count"])
+        for row in rows
+    ]
+
+
+def _resource_rows(rows):
+    if not rows:
+        return []
+    start = datetime.fromisoformat(rows[0]["timestamp"])
+    return [
+        ((datetime.fromisoformat(row["timestamp"]) - start).total_seconds(), row.get("phase"),
+         row.get("cpu_percent"), row.get("memory_rss_mb"), row.get("process_threads"),
+         row.get("thread_pool_total"), row.get("thread_pool_borrowed"), row.get("thread_pool_waiting"),
+         row.get("pending_bg_tasks"))
+        for row in rows
+    ]
+
+
+def _run_commit(run):
+    """The git commit recorded with a run by run_load_tests.sh, or None if it was not recorded."""
+    if run.meta is None:
+        return None
+    try:
+        return json.loads(run.meta.read_text(encoding="utf-8")).get("git_commit")
+    except (OSError, ValueError) as exc:
+        print(f"Ignoring {run.meta}: {exc}", file=sys.stderr)
+        return None
+
+
+def ingest_locust_runs(store, results_dir, commit, label, tags):
+    """
+    Ingest every run_load_tests.sh run in results_dir that is not stored yet.
+
+    Runs are tagged with `commit` if given, else with the commit recorded in
+    their metadata file. Runs without one get no commit rather than whatever is
+    checked out at ingest time.
+    """
+    added = 0
+    for run in discover_runs(results_dir):
+        sha256 = file_sha256(run.stats, run.resources)
+        if store.has_artifact("locust", run.name, sha256):
+            continue
+        stats_rows = read_rows(run.stats)
+        resource_rows = read_rows(run.resources)
+        try:
+            summary = summarize_run(stats_rows, resource_rows)
+        except ValueError as exc:
+            print(f"Skipping {run.name}: {exc}", file=sys.stderr)
+            continue
+        store.add_run(
+            {
+                "source": "locust", "name": run.name, "route": run.route, "load_mode": run.load_mode,
+                "users": run.users, "workers": run.workers, "thread_pool_size": None, "variant": None,
+                "label": label, "git_commit": commit or _run_commit(run), "config": json.dumps(tags, sort_keys=True),
+                "started_at": _started_at(resource_rows, run.stats), "ingested_at": _now(),
+                "artifact": str(run.stats), "artifact_sha256": sha256,
+                **{metric: summary[metric] for metric in METRICS},
+            },
+            history=_history_rows(read_rows(run.history)) if run.history else (),
+            samples=_resource_rows(resource_rows),
+        )
+        added += 1
+    return added
+
+
+def ingest_bench_results(store, results_dir, label, tags):
+    """Ingest the cells of every `python -m bench` result file in results_dir."""
+    added = 0
+    for path in sorted(Path(results_dir).glob("*.json")):
+        if path.name == "baseline.json":
+            continue  # A copy of one of the runs
+        sha256 = file_sha256(path)
+        with open(path, encoding="utf-8") as f:
+            result = json.load(f)
+        run_tags = {"json_backend": result["json_backend"]} if "json_backend" in result else {}
+        for cell in result.get("cells", []):
+            if store.has_artifact("bench", cell["key"], sha256):
+                continue
+            summary = cell["summary"]
+            samples = [
+                (s["t"], None, s["cpu_percent"], s["memory_rss_mb"], s["process_threads"],
+                 s.get("thread_pool_total"), s["thread_pool_borrowed"], s["thread_pool_waiting"],
+                 s["pending_bg_tasks"])
+                for s in cell.get("samples", [])
+            ]
+            store.add_run(
+                {
+                    "source": "bench", "name": cell["key"], "route": route_name(cell["route"]),
+                    "load_mode": cell["mode"], "users": cell["load"], "workers": cell["workers"],
+                    "thread_pool_size": cell["thread_pool_size"], "variant": cell["variant"],
+                    "label": label, "git_commit": result.get("git_commit"),
+                    "config": json.dumps({**cell.get("env", {}), **run_tags, **tags}, sort_keys=True),
+                    "started_at": result["started_at"], "ingested_at": _now(),
+                    "artifact": str(path), "artifact_sha256": sha256,
+                    **{metric: summary.get(metric) for metric in METRICS},
+                },
+                samples=samples,
+            )
+            added += 1
+    return added
+
+
+def _format(value):
+    if value is None:
+        return "-"
+    if isinstance(value, float):
+        return f"{value:.1f}"
+    return str(value)
+
+
+def print_rows(rows, columns):
+    """Print rows as an aligned table."""
+    table = [[_format(row[column]) for column in columns] for row in rows]
+    widths = [max([len(column)] + [len(cells[i]) for cells in table]) for i, column in enumerate(columns)]
+    print("  ".join(column.ljust(width) for column, width in zip(columns, widths)))
+    print("  ".join("-" * width for width in widths))
+    for cells in table:
+        print("  ".join(cell.ljust(width) for cell, width in zip(cells, widths)))
+
+
+def _parse_tags(tags):
+    parsed = {}
+    for tag in tags or []:
+        key, _, value = tag.partition("=")
+        parsed[key] = value
+    return parsed
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m bench.store", description="Benchmark run-history store")
+    parser.add_argument("--db", default=DEFAULT_DB, help=f"SQLite database (default: {DEFAULT_DB})")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest = commands.add_parser("ingest", help="Add new runs from result directories")
+    ingest.add_argument("--docs", default="docs", help="run_load_tests.sh output directory")
+    ingest.add_argument("--bench", default="docs/bench", help="python -m bench results directory")
+    ingest.add_argument("--commit", help="Git commit the Locust runs were made with (default: the one in each run's _meta.json)")
+    ingest.add_argument("--label", help="Free-form label, e.g. a release name")
+    ingest.add_argument("--tag", action="append", help="KEY=VALUE configuration tag (repeatable)")
+
+    query = commands.add_parser("query", help="Show metrics across runs, oldest first per configuration")
+    query.add_argument("--route", help="Route name without the leading slash")
+    query.add_argument("--users", type=float, help="Closed-loop users or open-loop rate")
+    query.add_argument("--workers", type=int)
+    query.add_argument("--source", choices=("locust", "bench"))
+    query.add_argument("--label")
+    query.add_argument("--since", help="ISO date/time, inclusive")
+    query.add_argument("--until", help="ISO date/time, exclusive")
+    query.add_argument("--metric", nargs="+", choices=METRICS, default=["throughput_rps", "p95_ms", "max_rss_mb"])
+
+    sql = commands.add_parser("sql", help="Run an SQL query against the store")
+    sql.add_argument("statement")
+
+    args = parser.parse_args()
+    store = ResultsStore(args.db)
+    try:
+        if args.command == "ingest":
+            tags = _parse_tags(args.tag)
+            locust = ingest_locust_runs(store, args.docs, args.commit, args.label, tags)
+            bench = ingest_bench_results(store, args.bench, args.label, tags) if Path(args.bench).is_dir() else 0
+            print(f"Ingested {locust} Locust run(s) and {bench} bench cell(s) into {args.db}")
+        elif args.command == "query":
+            rows = store.query_runs(route=args.route, users=args.users, workers=args.workers, source=args.source,
+                                    label=args.label, since=args.since, until=args.until, metrics=args.metric)
+            columns = ["started_at", "git_commit", "label", "source", "route", "load_mode", "users", "workers",
+                       *args.metric]
+            # Short commit hashes keep the table readable
+            rows = [{**dict(row), "git_commit": row["git_commit"] and row["git_commit"][:10]} for row in rows]
+            print_rows(rows, columns)
+        else:
+            rows = store.conn.execute(args.statement).fetchall()
+            if rows:
+                print_rows(rows, rows[0].keys())
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
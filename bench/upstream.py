@@ -0,0 +1,95 @@
+"""
+Stand-in upstream HTTP service for the I/O-backed inner functions.
+
+    python -m bench.upstream --port 8100 --latency 0.2
+
+Answers every GET after `latency` seconds (override per request with
+`?delay=seconds`) with a JSON body of about `--body-bytes` bytes. Connections
+are kept alive, so clients that pool connections reuse them and clients that
+don't pay for a new connection on every call. It runs on asyncio streams in
+its own process, so thousands of concurrent calls cost it little and the
+latency the app sees is the configured one.
+"""
+import argparse
+import asyncio
+import json
+import signal
+from urllib.parse import parse_qs, urlsplit
+
+
+class UpstreamStub:
+    """Minimal HTTP/1.1 server: one coroutine per connection, keep-alive, fixed latency."""
+
+    def __init__(self, latency, body_bytes):
+        self.latency = latency
+        self.padding = "x" * max(body_bytes - 64, 0)
+        self.connections = 0
+        self.requests = 0
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                keep_alive = True
+                content_length = 0
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    name, value = name.strip().lower(), value.strip().lower()
+                    if name == "connection":
+                        keep_alive = value != "close"
+                    elif name == "content-length":
+                        content_length = int(value)
+                if content_length:
+                    await reader.readexactly(content_length)
+
+                _, target, _ = request_line.decode("latin-1").split(" ", 2)
+                query = parse_qs(urlsplit(target).query)
+                delay = float(query["delay"][0]) if "delay" in query else self.latency
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                self.requests += 1
+                body = json.dumps({"request": self.requests, "delay": delay, "padding": self.padding}).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    b"Content-Length: %d\r\n%s\r\n" % (len(body), b"" if keep_alive else b"Connection: close\r\n")
+                    + body
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+
+async def serve(host, port, latency, body_bytes):
+    stub = UpstreamStub(latency, body_bytes)
+    server = await asyncio.start_server(stub.handle, host, port, backlog=4096)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    print(f"Upstream stub on http://{host}:{port}/ ({latency * 1000:.0f}ms latency)", flush=True)
+    async with server:
+        await stop.wait()
+    print(f"Upstream stub served {stub.requests} requests", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m bench.upstream", description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency", type=float, default=0.2, help="Seconds before each response (default: 0.2)")
+    parser.add_argument("--body-bytes", type=int, default=512, help="Approximate response size (default: 512)")
+    args = parser.parse_args()
+    asyncio.run(serve(args.host, args.port, args.latency, args.body_bytes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,2 @@
+// Generated by embed_data.py
+DASHBOARD_DATA.register("async-route-async-inner-async-bg-async-task-100users", {"stats":{"length":2,"columns":[{"name":"Type","type":"dict","values":["GET"],"codes":[0,-1]},{"name":"Name","type":"dict","values":["/async-route-async-inner-async-bg-async-task","Aggregated"],"codes":[0,1]},{"name":"Request Count","type":"i32","data":"6RQAAOkUAAA="},{"name":"Failure Count","type":"i32","data":"AAAAAAAAAAA="},{"name":"Median Response Time","type":"f64","data":"AIDL91MEaUAAgMv3UwRpQA=="},{"name":"Average Response Time","type":"f64","data":"bp40oHTAaUBunjSgdMBpQA=="},{"name":"Min Response Time","type":"f64","data":"AIDL91MEaUAAgMv3UwRpQA=="},{"name":"Max Response Time","type":"f64","data":"AFh4Ezw/eUAAWHgTPD95QA=="},{"name":"Average Content Size","type":"f64","data":"AAAAAACAaUAAAAAAAIBpQA=="},{"name":"Requests/s","type":"f64","data":"92/k7ioGZ0D3b+TuKgZnQA=="},{"name":"Failures/s","type":"f64","data":"AAAAAAAAAAAAAAAAAAAAAA=="},{"name":"50%","type":"i32","data":"yAAAAMgAAAA="},{"name":"66%","type":"i32","data":"yAAAAMgAAAA="},{"name":"75%","type":"i32","data":"0gAAANIAAAA="},{"name":"80%","type":"i32","data":"0gAAANIAAAA="},{"name":"90%","type":"i32","data":"0gAAANIAAAA="},{"name":"95%","type":"i32","data":"3AAAANwAAAA="},{"name":"98%","type":"i32","data":"5gAAAOYAAAA="},{"name":"99%","type":"i32","data":"BAEAAAQBAAA="},{"name":"99.9%","type":"i32","data":"fAEAAHwBAAA="},{"name":"99.99%","type":"i32","data":"kAEAAJABAAA="},{"name":"100%","type":"i32","data":"kAEAAJABAAA="}]},"resources":{"length":41,"columns":[{"name":"timestamp","type":"dict","values":["2025-12-10T08:22:21.247964","2025-12-10T08:22:22.267453","2025-12-10T08:22:23.276534","2025-12-10T08:22:24.282604","2025-12-10T08:22:25.293116","2025-12-10T08:22:26.361556","2025-12-10T08:22:27.367886","2025-12-10T08:22:28.376211","2025-12-10T08:22:29.383161","2025-12-10T08:22:30.387003","2025-12-10T08:22:31.392588","2025-12-10T08:22:32.397807","2025-12-10T08:22:33.407001","2025-12-10T08:22:34.414845","2025-12-10T08:22:35.423881","2025-12-10T08:22:36.433028","2025-12-10T08:22:37.442794","2025-12-10T08:22:38.450268","2025-12-10T08:22:39.455813","2025-12-10T08:22:40.462893","2025-12-10T08:22:41.472617","2025-12-10T08:22:42.480565","2025-12-10T08:22:43.490173","2025-12-10T08:22:44.499218","2025-12-10T08:22:45.508578","2025-12-10T08:22:46.515064","2025-12-10T08:22:47.522312","2025-12-10T08:22:48.527839","2025-12-10T08:22:49.534558","2025-12-10T08:22:50.542312","2025-12-10T08:22:51.555309","2025-12-10T08:22:52.560334","2025-12-10T08:22:53.565321","2025-12-10T08:22:54.570192","2025-12-10T08:22:55.580880","2025-12-10T08:22:56.588245","2025-12-10T08:22:57.597167","2025-12-10T08:22:58.605415","2025-12-10T08:22:59.617316","2025-12-10T08:23:00.625570","2025-12-10T08:23:01.631078"],"codes":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40]},{"name":"cpu_percent","type":"f64","data":"AAAAAAAAAABmZmZmZmYGQDMzMzMzMyBAAAAAAAAALkDNzMzMzMwuQJqZmZmZGTFAMzMzMzMzK0AzMzMzMzMwQGZmZmZmZjBAZmZmZmZmMkDNzMzMzEw0QGZmZmZmZipAzczMzMzMMUAzMzMzMzM7QAAAAAAAgDpAmpmZmZmZM0DNzMzMzMwtQDMzMzMzMzJAmpmZmZkZNEAzMzMzM7MxQGZmZmZm5jNAMzMzMzMzKkAzMzMzM7MxQM3MzMzMTDJAmpmZmZmZMUCamZmZmZkzQAAAAAAAACtAMzMzMzMzM0CamZmZmZkwQM3MzMzMTDJAmpmZmZmZLUDNzMzMzMwMQDMzMzMzMxdAzczMzMzMGkDNzMzMzMwYQGZmZmZmZhRAAAAAAAAAFkAAAAAAAAAUQJqZmZmZmRdAAAAAAAAAGEAzMzMzMzMTQA=="},{"name":"memory_rss_mb","type":"f64","data":"AAAAAABESEAAAAAAAOZIQAAAAAAAcElAAAAAAABOSkAAAAAAAFJLQAAAAAAAykxAAAAAAAAiTkAAAAAAAIRPQAAAAAAAd1BAAAAAAAAzUUAAAAAAANhRQAAAAAAAZVJAAAAAAADTUkAAAAAAACJTQAAAAAAAZVNAAAAAAABlU0AAAAAAAGVTQAAAAAAAZVNAAAAAAABlU0AAAAAAAGVTQAAAAAAAZVNAAAAAAABlU0AAAAAAAGVTQAAAAAAAZVNAAAAAAABlU0AAAAAAAGpTQAAAAAAAalNAAAAAAABqU0AAAAAAAGpTQAAAAAAAalNAAAAAAABqU0AAAAAAAGpTQAAAAAAAalNAAAAAAABqU0AAAAAAAGpTQAAAAAAAalNAAAAAAABqU0AAAAAAAGpTQAAAAAAAalNAAAAAAABqU0AAAAAAAGpTQA=="},{"name":"memory_vms_mb","type":"f64","data":"AAAAUKfyGUEAAABQq/IZQQAAAFCv8hlBAAAAULPyGUEAAABQu/IZQQAAAFDH8hlBAAAAUM/yGUEAAABQ2/IZQQAAAFDj8hlBAAAAUO/yGUEAAABQ9/IZQQAAAFAD8xlBAAAAUAfzGUEAAABQC/MZQQAAAFAP8xlBAAAAUA/zGUEAAABQD/MZQQAAAFAP8xlBAAAAUA/zGUEAAABQD/MZQQAAAFAP8xlBAAAAUA/zGUEAAABQD/MZQQAAAFAP8xlBAAAAUA/zGUEAAABQD/MZQQAAAFAP8xlBAAAAUA/zGUEAAABQD/MZQQAAAFAP8xlBAAAAUA/zGUEAAABQD/MZQQAAAFAP8xlBAAAAUA/zGUEAAABQD/MZQQAAAFAP8xlBAAAAUA/zGUEAAABQD/MZQQAAAFAP8xlBAAAAUA/zGUEAAABQD/MZQQ=="},{"name":"process_threads","type":"i32","data":"BQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAA="},{"name":"thread_pool_total","type":"i32","data":"KAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAA="},{"name":"thread_pool_borrowed","type":"i32","data":"AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA="},{"name":"thread_pool_available","type":"i32","data":"KAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAA="},{"name":"thread_pool_waiting","type":"i32","data":"AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA="},{"name":"pending_bg_tasks","type":"i32","data":"AAAAACAAAABfAAAA0AAAAG4BAAAiAgAA5QIAALYDAAB2BAAAQAUAAAsGAACvBgAAJAcAAIMHAAC0BwAAuwcAAMAHAAC6BwAAwAcAALcHAACyBwAAvgcAAMUHAADCBwAAxwcAAMkHAADDBwAAyAcAAMgHAADCBwAAswcAAOsGAAAjBgAATgUAAI0EAADHAwAAAAMAADYCAABtAQAArgAAAAAAAAA="},{"name":"active_threads","type":"i32","data":"AQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAA="},{"name":"phase","type":"dict","values":["test","bg_completion"],"codes":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1]}]}});
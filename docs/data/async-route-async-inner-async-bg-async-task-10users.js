@@ -0,0 +1,2 @@
+// Generated by embed_data.py
+DASHBOARD_DATA.register("async-route-async-inner-async-bg-async-task-10users", {"stats":{"length":2,"columns":[{"name":"Type","type":"dict","values":["GET"],"codes":[0,-1]},{"name":"Name","type":"dict","values":["/async-route-async-inner-async-bg-async-task","Aggregated"],"codes":[0,1]},{"name":"Request Count","type":"i32","data":"NwIAADcCAAA="},{"name":"Failure Count","type":"i32","data":"AAAAAAAAAAA="},{"name":"Median Response Time","type":"f64","data":"AAAAAABAakAAAAAAAEBqQA=="},{"name":"Average Response Time","type":"f64","data":"DsA9by64aUAOwD1vLrhpQA=="},{"name":"Min Response Time","type":"f64","data":"ADDrpeIpaUAAMOul4ilpQA=="},{"name":"Max Response Time","type":"f64","data":"AGCBajxkbUAAYIFqPGRtQA=="},{"name":"Average Content Size","type":"f64","data":"AAAAAACAaUAAAAAAAIBpQA=="},{"name":"Requests/s","type":"f64","data":"kGM5FqiGM0CQYzkWqIYzQA=="},{"name":"Failures/s","type":"f64","data":"AAAAAAAAAAAAAAAAAAAAAA=="},{"name":"50%","type":"i32","data":"0gAAANIAAAA="},{"name":"66%","type":"i32","data":"0gAAANIAAAA="},{"name":"75%","type":"i32","data":"0gAAANIAAAA="},{"name":"80%","type":"i32","data":"0gAAANIAAAA="},{"name":"90%","type":"i32","data":"0gAAANIAAAA="},{"name":"95%","type":"i32","data":"0gAAANIAAAA="},{"name":"98%","type":"i32","data":"0gAAANIAAAA="},{"name":"99%","type":"i32","data":"3AAAANwAAAA="},{"name":"99.9%","type":"i32","data":"8AAAAPAAAAA="},{"name":"99.99%","type":"i32","data":"8AAAAPAAAAA="},{"name":"100%","type":"i32","data":"8AAAAPAAAAA="}]},"resources":{"length":41,"columns":[{"name":"timestamp","type":"dict","values":["2025-12-10T08:20:49.661200","2025-12-10T08:20:50.672945","2025-12-10T08:20:51.680959","2025-12-10T08:20:52.691663","2025-12-10T08:20:53.702790","2025-12-10T08:20:54.712889","2025-12-10T08:20:55.721022","2025-12-10T08:20:56.733118","2025-12-10T08:20:57.743240","2025-12-10T08:20:58.750324","2025-12-10T08:20:59.761989","2025-12-10T08:21:00.775431","2025-12-10T08:21:01.786605","2025-12-10T08:21:02.795038","2025-12-10T08:21:03.805819","2025-12-10T08:21:04.815388","2025-12-10T08:21:05.823325","2025-12-10T08:21:06.834898","2025-12-10T08:21:07.843342","2025-12-10T08:21:08.853896","2025-12-10T08:21:09.863883","2025-12-10T08:21:10.873176","2025-12-10T08:21:11.882489","2025-12-10T08:21:12.890868","2025-12-10T08:21:13.900546","2025-12-10T08:21:14.909749","2025-12-10T08:21:15.921363","2025-12-10T08:21:16.928582","2025-12-10T08:21:17.933753","2025-12-10T08:21:18.947731","2025-12-10T08:21:19.958359","2025-12-10T08:21:20.961432","2025-12-10T08:21:21.973363","2025-12-10T08:21:22.982518","2025-12-10T08:21:23.992116","2025-12-10T08:21:25.004852","2025-12-10T08:21:26.014840","2025-12-10T08:21:27.028547","2025-12-10T08:21:28.040904","2025-12-10T08:21:29.051137","2025-12-10T08:21:30.060672"],"codes":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40]},{"name":"cpu_percent","type":"f64","data":"AAAAAAAAAAAAAAAAAADwP5qZmZmZmQ1AMzMzMzMzD0BmZmZmZmYUQJqZmZmZmRFAMzMzMzMzB0AzMzMzMzMRQJqZmZmZmRVAMzMzMzMzF0CamZmZmZkTQJqZmZmZmQlAzczMzMzMEkBmZmZmZmYUQJqZmZmZmRNAAAAAAAAAFEDNzMzMzMwIQGZmZmZmZg5AmpmZmZmZEUBmZmZmZmYWQGZmZmZmZhJAAAAAAAAAEECamZmZmZkRQM3MzMzMzBBAAAAAAAAAEkBmZmZmZmYUQDMzMzMzMw9AAAAAAAAAFEBmZmZmZmYQQAAAAAAAABJAzczMzMzMEEBmZmZmZmbmP83MzMzMzPQ/zczMzMzM7D9mZmZmZmb2P2ZmZmZmZvY/ZmZmZmZm9j9mZmZmZmb2P83MzMzMzOw/AAAAAAAA8D8zMzMzMzPzPw=="},{"name":"memory_rss_mb","type":"f64","data":"AAAAAAA0SEAAAAAAAIRIQAAAAAAApEhAAAAAAADGSEAAAAAAAOJIQAAAAAAABElAAAAAAAAySUAAAAAAAFBJQAAAAAAAdklAAAAAAACUSUAAAAAAALpJQAAAAAAAzklAAAAAAADUSUAAAAAAANhJQAAAAAAA2ElAAAAAAADYSUAAAAAAANpJQAAAAAAA2klAAAAAAADaSUAAAAAAANpJQAAAAAAA2klAAAAAAADaSUAAAAAAANpJQAAAAAAA2klAAAAAAADaSUAAAAAAANpJQAAAAAAA2klAAAAAAADaSUAAAAAAANpJQAAAAAAA2klAAAAAAADaSUAAAAAAANpJQAAAAAAA2klAAAAAAADaSUAAAAAAANpJQAAAAAAA2klAAAAAAADaSUAAAAAAANpJQAAAAAAA2klAAAAAAADaSUAAAAAAANpJQA=="},{"name":"memory_vms_mb","type":"f64","data":"AAAAwKfyGUEAAADAp/IZQQAAAMCr8hlBAAAAwKvyGUEAAADAq/IZQQAAAMCr8hlBAAAAwK/yGUEAAADAr/IZQQAAAMCv8hlBAAAAwK/yGUEAAADAs/IZQQAAAMCz8hlBAAAAwLPyGUEAAADAs/IZQQAAAMCz8hlBAAAAwLPyGUEAAADAs/IZQQAAAMCz8hlBAAAAwLPyGUEAAADAs/IZQQAAAMCz8hlBAAAAwLPyGUEAAADAs/IZQQAAAMCz8hlBAAAAwLPyGUEAAADAs/IZQQAAAMCz8hlBAAAAwLPyGUEAAADAs/IZQQAAAMCz8hlBAAAAwLPyGUEAAADAs/IZQQAAAMCz8hlBAAAAwLPyGUEAAADAs/IZQQAAAMCz8hlBAAAAwLPyGUEAAADAs/IZQQAAAMCz8hlBAAAAwLPyGUEAAADAs/IZQQ=="},{"name":"process_threads","type":"i32","data":"BQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAA="},{"name":"thread_pool_total","type":"i32","data":"KAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAA="},{"name":"thread_pool_borrowed","type":"i32","data":"AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA="},{"name":"thread_pool_available","type":"i32","data":"KAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAA="},{"name":"thread_pool_waiting","type":"i32","data":"AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA="},{"name":"pending_bg_tasks","type":"i32","data":"AAAAAAgAAAAaAAAAKwAAAEEAAABUAAAAaAAAAHwAAACQAAAAowAAALoAAADGAAAAxwAAAM8AAADIAAAAzAAAAMkAAADJAAAAygAAAMcAAADGAAAAyAAAAMIAAADBAAAAwwAAAMQAAADEAAAAwgAAAMQAAADGAAAAwQAAAK0AAACaAAAAiQAAAHQAAABgAAAASgAAADgAAAAkAAAAEAAAAAAAAAA="},{"name":"active_threads","type":"i32","data":"AQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAA="},{"name":"phase","type":"dict","values":["test","bg_completion"],"codes":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1]}]}});
@@ -0,0 +1,2 @@
+// Generated by embed_data.py
+DASHBOARD_DATA.register("async-route-async-inner-async-bg-async-task-40users", {"stats":{"length":2,"columns":[{"name":"Type","type":"dict","values":["GET"],"codes":[0,-1]},{"name":"Name","type":"dict","values":["/async-route-async-inner-async-bg-async-task","Aggregated"],"codes":[0,1]},{"name":"Request Count","type":"i32","data":"hQgAAIUIAAA="},{"name":"Failure Count","type":"i32","data":"AAAAAAAAAAA="},{"name":"Median Response Time","type":"f64","data":"AEDUzncOaUAAQNTOdw5pQA=="},{"name":"Average Response Time","type":"f64","data":"Uxw0trSgaUBTHDS2tKBpQA=="},{"name":"Min Response Time","type":"f64","data":"AEDUzncOaUAAQNTOdw5pQA=="},{"name":"Max Response Time","type":"f64","data":"AKAmXEj1bEAAoCZcSPVsQA=="},{"name":"Average Content Size","type":"f64","data":"AAAAAACAaUAAAAAAAIBpQA=="},{"name":"Requests/s","type":"f64","data":"eWoTJO7FUkB5ahMk7sVSQA=="},{"name":"Failures/s","type":"f64","data":"AAAAAAAAAAAAAAAAAAAAAA=="},{"name":"50%","type":"i32","data":"yAAAAMgAAAA="},{"name":"66%","type":"i32","data":"0gAAANIAAAA="},{"name":"75%","type":"i32","data":"0gAAANIAAAA="},{"name":"80%","type":"i32","data":"0gAAANIAAAA="},{"name":"90%","type":"i32","data":"0gAAANIAAAA="},{"name":"95%","type":"i32","data":"0gAAANIAAAA="},{"name":"98%","type":"i32","data":"0gAAANIAAAA="},{"name":"99%","type":"i32","data":"3AAAANwAAAA="},{"name":"99.9%","type":"i32","data":"3AAAANwAAAA="},{"name":"99.99%","type":"i32","data":"5gAAAOYAAAA="},{"name":"100%","type":"i32","data":"5gAAAOYAAAA="}]},"resources":{"length":41,"columns":[{"name":"timestamp","type":"dict","values":["2025-12-10T08:21:34.968057","2025-12-10T08:21:35.981754","2025-12-10T08:21:36.987860","2025-12-10T08:21:38.001973","2025-12-10T08:21:39.014194","2025-12-10T08:21:40.020238","2025-12-10T08:21:41.026424","2025-12-10T08:21:42.033333","2025-12-10T08:21:43.043629","2025-12-10T08:21:44.053492","2025-12-10T08:21:45.060906","2025-12-10T08:21:46.072606","2025-12-10T08:21:47.093463","2025-12-10T08:21:48.106562","2025-12-10T08:21:49.113040","2025-12-10T08:21:50.121935","2025-12-10T08:21:51.126834","2025-12-10T08:21:52.138077","2025-12-10T08:21:53.147332","2025-12-10T08:21:54.165818","2025-12-10T08:21:55.175041","2025-12-10T08:21:56.181800","2025-12-10T08:21:57.191411","2025-12-10T08:21:58.201590","2025-12-10T08:21:59.209623","2025-12-10T08:22:00.221829","2025-12-10T08:22:01.232728","2025-12-10T08:22:02.242510","2025-12-10T08:22:03.257046","2025-12-10T08:22:04.264078","2025-12-10T08:22:05.272965","2025-12-10T08:22:06.281785","2025-12-10T08:22:07.289441","2025-12-10T08:22:08.299931","2025-12-10T08:22:09.312422","2025-12-10T08:22:10.320619","2025-12-10T08:22:11.332357","2025-12-10T08:22:12.342338","2025-12-10T08:22:13.351191","2025-12-10T08:22:14.363381","2025-12-10T08:22:15.374085"],"codes":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40]},{"name":"cpu_percent","type":"f64","data":"AAAAAAAAAAAAAAAAAAD4PzMzMzMzMxVAMzMzMzMzIEAzMzMzMzMkQAAAAAAAACZAZmZmZmZmIEDNzMzMzMwkQJqZmZmZmSdAzczMzMzMKEBmZmZmZmYqQAAAAAAAAB5AmpmZmZmZLEBmZmZmZmYtQAAAAAAAACtAzczMzMzMJ0BmZmZmZmYsQAAAAAAAACdAZmZmZmZmKEDNzMzMzMwoQAAAAAAAACVAzczMzMzMKEBmZmZmZmYtQGZmZmZmZi1AMzMzMzMzK0AzMzMzMzMsQAAAAAAAACdAMzMzMzMzLEBmZmZmZmYtQM3MzMzMzC5AzczMzMzMJ0AzMzMzMzMDQGZmZmZmZgpAzczMzMzMDEAAAAAAAAAIQGZmZmZmZgpAAAAAAAAADEAAAAAAAAAIQAAAAAAAAAxAZmZmZmZmDkBmZmZmZmYKQA=="},{"name":"memory_rss_mb","type":"f64","data":"AAAAAABGSEAAAAAAAKhIQAAAAAAA9EhAAAAAAABuSUAAAAAAAABKQAAAAAAAhEpAAAAAAAAMS0AAAAAAAJpLQAAAAAAAJExAAAAAAAC6TEAAAAAAAEBNQAAAAAAArk1AAAAAAAAETkAAAAAAACBOQAAAAAAANE5AAAAAAAA0TkAAAAAAADROQAAAAAAANE5AAAAAAAA0TkAAAAAAADROQAAAAAAANE5AAAAAAAA0TkAAAAAAADROQAAAAAAANE5AAAAAAAA0TkAAAAAAADROQAAAAAAANE5AAAAAAAA0TkAAAAAAADROQAAAAAAANE5AAAAAAAA0TkAAAAAAADROQAAAAAAANE5AAAAAAAA0TkAAAAAAACRMQAAAAAAAJExAAAAAAAAkTEAAAAAAACRMQAAAAAAAJExAAAAAAAAkTEAAAAAAACRMQA=="},{"name":"memory_vms_mb","type":"f64","data":"AAAAoKnyGUEAAACgqfIZQQAAAKCt8hlBAAAAoLHyGUEAAACgtfIZQQAAAKC58hlBAAAAoL3yGUEAAACgwfIZQQAAAKDF8hlBAAAAoMnyGUEAAACgzfIZQQAAAKDR8hlBAAAAoNHyGUEAAACg1fIZQQAAAKDV8hlBAAAAoNXyGUEAAACg1fIZQQAAAKDV8hlBAAAAoNXyGUEAAACg1fIZQQAAAKDV8hlBAAAAoNXyGUEAAACg1fIZQQAAAKDV8hlBAAAAoNXyGUEAAACg1fIZQQAAAKDV8hlBAAAAoNXyGUEAAACg1fIZQQAAAKDV8hlBAAAAoNXyGUEAAACg1fIZQQAAAKDV8hlBAAAAoNXyGUEAAACg1fIZQQAAAKDV8hlBAAAAoNXyGUEAAACg1fIZQQAAAKDV8hlBAAAAoNXyGUEAAACg1fIZQQ=="},{"name":"process_threads","type":"i32","data":"BQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAA="},{"name":"thread_pool_total","type":"i32","data":"KAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAA="},{"name":"thread_pool_borrowed","type":"i32","data":"AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA="},{"name":"thread_pool_available","type":"i32","data":"KAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAA="},{"name":"thread_pool_waiting","type":"i32","data":"AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA="},{"name":"pending_bg_tasks","type":"i32","data":"AAAAABEAAAA1AAAAcAAAALkAAAAKAQAAXgEAAKsBAAD8AQAATgIAAJ4CAADcAgAADAMAABwDAAAeAwAAFwMAABsDAAAZAwAAGwMAABUDAAASAwAADQMAAAQDAAAOAwAACQMAAA8DAAATAwAAFAMAABADAAAUAwAAEwMAAMQCAAB6AgAAJwIAANkBAACGAQAANAEAAOMAAACbAAAAQAAAAAAAAAA="},{"name":"active_threads","type":"i32","data":"AQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAA="},{"name":"phase","type":"dict","values":["test","bg_completion"],"codes":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1]}]}});
@@ -0,0 +1,2 @@
+// Generated by embed_data.py
+DASHBOARD_DATA.register("async-route-async-inner-async-bg-sync-task-100users", {"stats":{"length":1,"columns":[{"name":"Type","type":"dict","values":[],"codes":[-1]},{"name":"Name","type":"dict","values":["Aggregated"],"codes":[0]},{"name":"Request Count","type":"i32","data":"AAAAAA=="},{"name":"Failure Count","type":"i32","data":"AAAAAA=="},{"name":"Median Response Time","type":"i32","data":"AAAAAA=="},{"name":"Average Response Time","type":"f64","data":"AAAAAAAAAAA="},{"name":"Min Response Time","type":"i32","data":"AAAAAA=="},{"name":"Max Response Time","type":"i32","data":"AAAAAA=="},{"name":"Average Content Size","type":"i32","data":"AAAAAA=="},{"name":"Requests/s","type":"f64","data":"AAAAAAAAAAA="},{"name":"Failures/s","type":"f64","data":"AAAAAAAAAAA="},{"name":"50%","type":"dict","values":["N/A"],"codes":[0]},{"name":"66%","type":"dict","values":["N/A"],"codes":[0]},{"name":"75%","type":"dict","values":["N/A"],"codes":[0]},{"name":"80%","type":"dict","values":["N/A"],"codes":[0]},{"name":"90%","type":"dict","values":["N/A"],"codes":[0]},{"name":"95%","type":"dict","values":["N/A"],"codes":[0]},{"name":"98%","type":"dict","values":["N/A"],"codes":[0]},{"name":"99%","type":"dict","values":["N/A"],"codes":[0]},{"name":"99.9%","type":"dict","values":["N/A"],"codes":[0]},{"name":"99.99%","type":"dict","values":["N/A"],"codes":[0]},{"name":"100%","type":"dict","values":["N/A"],"codes":[0]}]},"resources":{"length":17,"columns":[{"name":"timestamp","type":"dict","values":["2025-12-10T08:25:48.933898","2025-12-10T08:25:49.948159","2025-12-10T08:25:51.955243","2025-12-10T08:25:53.964449","2025-12-10T08:25:55.974757","2025-12-10T08:25:57.986012","2025-12-10T08:25:59.994894","2025-12-10T08:26:02.005611","2025-12-10T08:26:04.013856","2025-12-10T08:26:06.026081","2025-12-10T08:26:08.033526","2025-12-10T08:26:10.044689","2025-12-10T08:26:12.052181","2025-12-10T08:26:14.062860","2025-12-10T08:26:16.074923","2025-12-10T08:26:18.083530","2025-12-10T08:26:20.094560"],"codes":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16]},{"name":"cpu_percent","type":"f64","data":"AAAAAAAAAABmZmZmZmbmPwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAmpmZmZmZuT8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJqZmZmZmbk/AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACamZmZmZm5Pw=="},{"name":"memory_rss_mb","type":"f64","data":"AAAAAABKSEAAAAAAALhIQAAAAAAAuEhAAAAAAAC4SEAAAAAAALhIQAAAAAAAuEhAAAAAAAC4SEAAAAAAALhIQAAAAAAAuEhAAAAAAAC4SEAAAAAAALhIQAAAAAAAuEhAAAAAAAC4SEAAAAAAALhIQAAAAAAAuEhAAAAAAAC4SEAAAAAAALhIQA=="},{"name":"memory_vms_mb","type":"f64","data":"AAAAoKnyGUEAAACgqfIZQQAAAKCp8hlBAAAAoKnyGUEAAACgqfIZQQAAAKCp8hlBAAAAoKnyGUEAAACgqfIZQQAAAKCp8hlBAAAAoKnyGUEAAACgqfIZQQAAAKCp8hlBAAAAoKnyGUEAAACgqfIZQQAAAKCp8hlBAAAAoKnyGUEAAACgqfIZQQ=="},{"name":"process_threads","type":"i32","data":"BQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAA="},{"name":"thread_pool_total","type":"f64","data":"AAAAAAAAREAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"thread_pool_borrowed","type":"f64","data":"AAAAAAAAAAAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"thread_pool_available","type":"f64","data":"AAAAAAAAREAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"thread_pool_waiting","type":"f64","data":"AAAAAAAAAAAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"pending_bg_tasks","type":"f64","data":"AAAAAAAAAAAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"active_threads","type":"f64","data":"AAAAAAAA8D8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"phase","type":"dict","values":["test","bg_completion"],"codes":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1]}]}});
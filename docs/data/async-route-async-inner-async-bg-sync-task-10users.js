@@ -0,0 +1,2 @@
+// Generated by embed_data.py
+DASHBOARD_DATA.register("async-route-async-inner-async-bg-sync-task-10users", {"stats":{"length":1,"columns":[{"name":"Type","type":"dict","values":[],"codes":[-1]},{"name":"Name","type":"dict","values":["Aggregated"],"codes":[0]},{"name":"Request Count","type":"i32","data":"AAAAAA=="},{"name":"Failure Count","type":"i32","data":"AAAAAA=="},{"name":"Median Response Time","type":"i32","data":"AAAAAA=="},{"name":"Average Response Time","type":"f64","data":"AAAAAAAAAAA="},{"name":"Min Response Time","type":"i32","data":"AAAAAA=="},{"name":"Max Response Time","type":"i32","data":"AAAAAA=="},{"name":"Average Content Size","type":"i32","data":"AAAAAA=="},{"name":"Requests/s","type":"f64","data":"AAAAAAAAAAA="},{"name":"Failures/s","type":"f64","data":"AAAAAAAAAAA="},{"name":"50%","type":"dict","values":["N/A"],"codes":[0]},{"name":"66%","type":"dict","values":["N/A"],"codes":[0]},{"name":"75%","type":"dict","values":["N/A"],"codes":[0]},{"name":"80%","type":"dict","values":["N/A"],"codes":[0]},{"name":"90%","type":"dict","values":["N/A"],"codes":[0]},{"name":"95%","type":"dict","values":["N/A"],"codes":[0]},{"name":"98%","type":"dict","values":["N/A"],"codes":[0]},{"name":"99%","type":"dict","values":["N/A"],"codes":[0]},{"name":"99.9%","type":"dict","values":["N/A"],"codes":[0]},{"name":"99.99%","type":"dict","values":["N/A"],"codes":[0]},{"name":"100%","type":"dict","values":["N/A"],"codes":[0]}]},"resources":{"length":17,"columns":[{"name":"timestamp","type":"dict","values":["2025-12-10T08:23:07.092610","2025-12-10T08:23:08.105722","2025-12-10T08:23:10.112479","2025-12-10T08:23:12.121078","2025-12-10T08:23:14.130415","2025-12-10T08:23:16.135565","2025-12-10T08:23:18.146932","2025-12-10T08:23:20.153513","2025-12-10T08:23:22.160727","2025-12-10T08:23:24.169713","2025-12-10T08:23:26.179176","2025-12-10T08:23:28.189818","2025-12-10T08:23:30.196167","2025-12-10T08:23:32.204334","2025-12-10T08:23:34.215664","2025-12-10T08:23:36.223589","2025-12-10T08:23:38.235987"],"codes":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16]},{"name":"cpu_percent","type":"f64","data":"AAAAAAAAAAAAAAAAAADgPwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4D8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJqZmZmZmbk/AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACamZmZmZm5Pw=="},{"name":"memory_rss_mb","type":"f64","data":"AAAAAAA6SEAAAAAAAJRIQAAAAAAAlEhAAAAAAACUSEAAAAAAAJRIQAAAAAAAlEhAAAAAAAD4NUAAAAAAAPg1QAAAAAAA+DVAAAAAAAD4NUAAAAAAAPg1QAAAAAAACDZAAAAAAAAINkAAAAAAAAg2QAAAAAAACDZAAAAAAAAINkAAAAAAAAw2QA=="},{"name":"memory_vms_mb","type":"f64","data":"AAAAEKfyGUEAAAAQp/IZQQAAABCn8hlBAAAAEKfyGUEAAAAQp/IZQQAAABCn8hlBAAAAEKfyGUEAAAAQp/IZQQAAABCn8hlBAAAAEKfyGUEAAAAQp/IZQQAAABCn8hlBAAAAEKfyGUEAAAAQp/IZQQAAABCn8hlBAAAAEKfyGUEAAAAQp/IZQQ=="},{"name":"process_threads","type":"i32","data":"BQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAA="},{"name":"thread_pool_total","type":"f64","data":"AAAAAAAAREAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"thread_pool_borrowed","type":"f64","data":"AAAAAAAAAAAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"thread_pool_available","type":"f64","data":"AAAAAAAAREAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"thread_pool_waiting","type":"f64","data":"AAAAAAAAAAAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"pending_bg_tasks","type":"f64","data":"AAAAAAAAAAAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"active_threads","type":"f64","data":"AAAAAAAA8D8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"phase","type":"dict","values":["test","bg_completion"],"codes":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1]}]}});
@@ -0,0 +1,2 @@
+// Generated by embed_data.py
+DASHBOARD_DATA.register("async-route-async-inner-async-bg-sync-task-40users", {"stats":{"length":1,"columns":[{"name":"Type","type":"dict","values":[],"codes":[-1]},{"name":"Name","type":"dict","values":["Aggregated"],"codes":[0]},{"name":"Request Count","type":"i32","data":"AAAAAA=="},{"name":"Failure Count","type":"i32","data":"AAAAAA=="},{"name":"Median Response Time","type":"i32","data":"AAAAAA=="},{"name":"Average Response Time","type":"f64","data":"AAAAAAAAAAA="},{"name":"Min Response Time","type":"i32","data":"AAAAAA=="},{"name":"Max Response Time","type":"i32","data":"AAAAAA=="},{"name":"Average Content Size","type":"i32","data":"AAAAAA=="},{"name":"Requests/s","type":"f64","data":"AAAAAAAAAAA="},{"name":"Failures/s","type":"f64","data":"AAAAAAAAAAA="},{"name":"50%","type":"dict","values":["N/A"],"codes":[0]},{"name":"66%","type":"dict","values":["N/A"],"codes":[0]},{"name":"75%","type":"dict","values":["N/A"],"codes":[0]},{"name":"80%","type":"dict","values":["N/A"],"codes":[0]},{"name":"90%","type":"dict","values":["N/A"],"codes":[0]},{"name":"95%","type":"dict","values":["N/A"],"codes":[0]},{"name":"98%","type":"dict","values":["N/A"],"codes":[0]},{"name":"99%","type":"dict","values":["N/A"],"codes":[0]},{"name":"99.9%","type":"dict","values":["N/A"],"codes":[0]},{"name":"99.99%","type":"dict","values":["N/A"],"codes":[0]},{"name":"100%","type":"dict","values":["N/A"],"codes":[0]}]},"resources":{"length":17,"columns":[{"name":"timestamp","type":"dict","values":["2025-12-10T08:24:02.992504","2025-12-10T08:24:04.007298","2025-12-10T08:24:06.015674","2025-12-10T08:24:08.021050","2025-12-10T08:24:10.030333","2025-12-10T08:24:12.040712","2025-12-10T08:24:14.053080","2025-12-10T08:24:16.058992","2025-12-10T08:24:18.068563","2025-12-10T08:24:20.077305","2025-12-10T08:24:22.085794","2025-12-10T08:24:24.094924","2025-12-10T08:24:26.107079","2025-12-10T08:24:28.114886","2025-12-10T08:24:30.122871","2025-12-10T08:24:32.135085","2025-12-10T08:24:34.149227"],"codes":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16]},{"name":"cpu_percent","type":"f64","data":"AAAAAAAAAAAzMzMzMzPjPwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAmpmZmZmZuT8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJqZmZmZmbk/AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACamZmZmZm5Pw=="},{"name":"memory_rss_mb","type":"f64","data":"AAAAAABaSEAAAAAAAKxIQAAAAAAArEhAAAAAAACsSEAAAAAAAKxIQAAAAAAArEhAAAAAAACsSEAAAAAAAKxIQAAAAAAArEhAAAAAAACsSEAAAAAAAKxIQAAAAAAArEhAAAAAAACsSEAAAAAAAKxIQAAAAAAArEhAAAAAAACsSEAAAAAAAKxIQA=="},{"name":"memory_vms_mb","type":"f64","data":"AAAAcKbyGUEAAABwpvIZQQAAAHCm8hlBAAAAcKbyGUEAAABwpvIZQQAAAHCm8hlBAAAAcKbyGUEAAABwpvIZQQAAAHCm8hlBAAAAcKbyGUEAAABwpvIZQQAAAHCm8hlBAAAAcKbyGUEAAABwpvIZQQAAAHCm8hlBAAAAcKbyGUEAAABwpvIZQQ=="},{"name":"process_threads","type":"i32","data":"BQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAA="},{"name":"thread_pool_total","type":"f64","data":"AAAAAAAAREAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"thread_pool_borrowed","type":"f64","data":"AAAAAAAAAAAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"thread_pool_available","type":"f64","data":"AAAAAAAAREAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"thread_pool_waiting","type":"f64","data":"AAAAAAAAAAAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"pending_bg_tasks","type":"f64","data":"AAAAAAAAAAAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"active_threads","type":"f64","data":"AAAAAAAA8D8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"phase","type":"dict","values":["test","bg_completion"],"codes":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1]}]}});
@@ -0,0 +1,2 @@
+// Generated by embed_data.py
+DASHBOARD_DATA.register("async-route-async-inner-sync-bg-sync-task-100users", {"stats":{"length":2,"columns":[{"name":"Type","type":"dict","values":["GET"],"codes":[0,-1]},{"name":"Name","type":"dict","values":["/async-route-async-inner-sync-bg-sync-task","Aggregated"],"codes":[0,1]},{"name":"Request Count","type":"i32","data":"2hQAANoUAAA="},{"name":"Failure Count","type":"i32","data":"AAAAAAAAAAA="},{"name":"Median Response Time","type":"f64","data":"AKDq0j8IaUAAoOrSPwhpQA=="},{"name":"Average Response Time","type":"f64","data":"PCKrDATKaUA8IqsMBMppQA=="},{"name":"Min Response Time","type":"f64","data":"AKDq0j8IaUAAoOrSPwhpQA=="},{"name":"Max Response Time","type":"f64","data":"ANCTQwuvdkAA0JNDC692QA=="},{"name":"Average Content Size","type":"f64","data":"AAAAAAAgZ0AAAAAAACBnQA=="},{"name":"Requests/s","type":"f64","data":"TXPiJfD3ZkBNc+Il8PdmQA=="},{"name":"Failures/s","type":"f64","data":"AAAAAAAAAAAAAAAAAAAAAA=="},{"name":"50%","type":"i32","data":"yAAAAMgAAAA="},{"name":"66%","type":"i32","data":"yAAAAMgAAAA="},{"name":"75%","type":"i32","data":"0gAAANIAAAA="},{"name":"80%","type":"i32","data":"0gAAANIAAAA="},{"name":"90%","type":"i32","data":"0gAAANIAAAA="},{"name":"95%","type":"i32","data":"3AAAANwAAAA="},{"name":"98%","type":"i32","data":"5gAAAOYAAAA="},{"name":"99%","type":"i32","data":"DgEAAA4BAAA="},{"name":"99.9%","type":"i32","data":"SgEAAEoBAAA="},{"name":"99.99%","type":"i32","data":"aAEAAGgBAAA="},{"name":"100%","type":"i32","data":"aAEAAGgBAAA="}]},"resources":{"length":90,"columns":[{"name":"timestamp","type":"dict","values":["2025-12-10T08:38:37.777396","2025-12-10T08:38:38.791306","2025-12-10T08:38:39.799266","2025-12-10T08:38:40.808084","2025-12-10T08:38:41.813123","2025-12-10T08:38:42.823788","2025-12-10T08:38:43.831756","2025-12-10T08:38:44.836057","2025-12-10T08:38:45.843661","2025-12-10T08:38:46.852634","2025-12-10T08:38:47.860914","2025-12-10T08:38:48.867250","2025-12-10T08:38:49.877579","2025-12-10T08:38:50.886695","2025-12-10T08:38:51.891636","2025-12-10T08:38:52.898727","2025-12-10T08:38:53.910751","2025-12-10T08:38:54.917635","2025-12-10T08:38:55.928742","2025-12-10T08:38:56.937994","2025-12-10T08:38:57.941707","2025-12-10T08:38:58.947483","2025-12-10T08:38:59.961369","2025-12-10T08:39:00.968889","2025-12-10T08:39:01.981781","2025-12-10T08:39:02.988200","2025-12-10T08:39:04.008310","2025-12-10T08:39:05.017180","2025-12-10T08:39:06.025664","2025-12-10T08:39:07.033975","2025-12-10T08:39:08.043932","2025-12-10T08:39:09.051593","2025-12-10T08:39:10.074845","2025-12-10T08:39:11.105453","2025-12-10T08:39:12.118269","2025-12-10T08:39:13.131672","2025-12-10T08:39:14.142293","2025-12-10T08:39:15.151404","2025-12-10T08:39:16.162887","2025-12-10T08:39:17.175592","2025-12-10T08:39:18.187412","2025-12-10T08:39:19.199509","2025-12-10T08:39:20.208268","2025-12-10T08:39:21.219463","2025-12-10T08:39:22.227063","2025-12-10T08:39:23.235351","2025-12-10T08:39:24.241872","2025-12-10T08:39:25.256781","2025-12-10T08:39:26.268632","2025-12-10T08:39:27.281624","2025-12-10T08:39:28.294607","2025-12-10T08:39:29.304407","2025-12-10T08:39:30.315162","2025-12-10T08:39:31.323768","2025-12-10T08:39:32.338948","2025-12-10T08:39:33.351705","2025-12-10T08:39:34.356373","2025-12-10T08:39:35.366742","2025-12-10T08:39:36.378690","2025-12-10T08:39:37.393905","2025-12-10T08:39:38.403503","2025-12-10T08:39:39.411519","2025-12-10T08:39:40.420371","2025-12-10T08:39:41.432704","2025-12-10T08:39:42.443094","2025-12-10T08:39:43.451713","2025-12-10T08:39:44.461621","2025-12-10T08:39:45.472943","2025-12-10T08:39:46.479997","2025-12-10T08:39:47.487612","2025-12-10T08:39:48.502424","2025-12-10T08:39:49.514724","2025-12-10T08:39:50.524123","2025-12-10T08:39:51.534326","2025-12-10T08:39:52.547245","2025-12-10T08:39:53.561107","2025-12-10T08:39:54.572111","2025-12-10T08:39:55.583072","2025-12-10T08:39:56.595440","2025-12-10T08:39:57.610048","2025-12-10T08:39:58.620002","2025-12-10T08:39:59.631893","2025-12-10T08:40:00.641727","2025-12-10T08:40:01.650144","2025-12-10T08:40:02.661993","2025-12-10T08:40:03.670755","2025-12-10T08:40:04.682944","2025-12-10T08:40:05.696670","2025-12-10T08:40:06.706735","2025-12-10T08:40:07.718805"],"codes":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89]},{"name":"cpu_percent","type":"f64","data":"AAAAAAAAAAAAAAAAAAAMQGZmZmZmZiJAmpmZmZmZJ0CamZmZmZkrQM3MzMzMzC1AZmZmZmZmJUBmZmZmZmYxQGZmZmZmZjFAzczMzMxMMkAAAAAAAAAuQGZmZmZmZjBAZmZmZmbmNEAzMzMzMzM3QAAAAAAAADdAZmZmZmbmN0AAAAAAAIA+QDMzMzMzMy9AAAAAAAAAOUBmZmZmZmYzQDMzMzMzszlAmpmZmZmZOEAzMzMzM7M6QJqZmZmZGTdAzczMzMxMNkAAAAAAAIA9QDMzMzMzszZAMzMzMzMzOUCamZmZmZk3QM3MzMzMzDdAzczMzMxMMkCamZmZmZkBQDMzMzMzM9M/MzMzMzMz0z+amZmZmZnZPzMzMzMzM9M/MzMzMzMz0z+amZmZmZnZPzMzMzMzM9M/mpmZmZmZ2T+amZmZmZnZP5qZmZmZmQlAMzMzMzMz0z8zMzMzMzPTPzMzMzMzM9M/MzMzMzMz0z8zMzMzMzPTP5qZmZmZmdk/mpmZmZmZ2T+amZmZmZnZP5qZmZmZmfE/ZmZmZmZm9j8zMzMzMzPTPzMzMzMzM9M/AAAAAAAA4D+amZmZmZnZPzMzMzMzM9M/mpmZmZmZ2T+amZmZmZnZP5qZmZmZmdk/mpmZmZmZ8T8AAAAAAAAAQJqZmZmZmdk/MzMzMzMz0z+amZmZmZnZP5qZmZmZmdk/mpmZmZmZ2T+amZmZmZnZPzMzMzMzM9M/MzMzMzMz0z8AAAAAAAD4P2ZmZmZmZv4/MzMzMzMz0z+amZmZmZnZP5qZmZmZmdk/mpmZmZmZ2T+amZmZmZnZP5qZmZmZmdk/MzMzMzMz0z+amZmZmZnZP83MzMzMzPQ/mpmZmZmZ+T8zMzMzMzPTPzMzMzMzM9M/mpmZmZmZ2T+amZmZmZnZP5qZmZmZmdk/MzMzMzMz0z8zMzMzMzPTP5qZmZmZmdk/"},{"name":"memory_rss_mb","type":"f64","data":"AAAAAAA8SEAAAAAAAIZJQAAAAAAAYEpAAAAAAABkS0AAAAAAAKBMQAAAAAAAUE5AAAAAAADeT0AAAAAAALRQQAAAAAAAclFAAAAAAABPUkAAAAAAABtTQAAAAAAAvFNAAAAAAACMVEAAAAAAAEpVQAAAAAAAE1ZAAAAAAADjVkAAAAAAAK5XQAAAAAAAeFhAAAAAAAA8WUAAAAAAAPtZQAAAAAAAyVpAAAAAAABoW0AAAAAAADFcQAAAAAAA7VxAAAAAAAC6XUAAAAAAAHBeQAAAAAAATl9AAAAAAIAKYEAAAAAAgJBgQAAAAACA9WBAAAAAAIBFYUAAAAAAAEZhQAAAAAAARmFAAAAAAABGYUAAAAAAAEZhQAAAAAAARmFAAAAAAABGYUAAAAAAAEZhQAAAAAAARmFAAAAAAABGYUAAAAAAAEZhQAAAAAAARmFAAAAAAABGYUAAAAAAAEZhQAAAAAAARmFAAAAAAABGYUAAAAAAAEZhQAAAAAAARmFAAAAAAABGYUAAAAAAAEZhQAAAAAAARmFAAAAAAABGYUAAAAAAAEZhQAAAAAAARmFAAAAAAABGYUAAAAAAAEZhQAAAAAAARmFAAAAAAABGYUAAAAAAAEZhQAAAAAAARmFAAAAAAABGYUAAAAAAAEZhQAAAAAAARmFAAAAAAABGYUAAAAAAAEZhQAAAAAAARmFAAAAAAABGYUAAAAAAAEZhQAAAAAAARmFAAAAAAABGYUAAAAAAAEZhQAAAAAAARmFAAAAAAABGYUAAAAAAAEZhQAAAAAAARmFAAAAAAABGYUAAAAAAAEZhQAAAAAAARmFAAAAAAABGYUAAAAAAAEZhQAAAAAAARmFAAAAAAABGYUAAAAAAAEZhQAAAAAAARmFAAAAAAABGYUAAAAAAAEZhQAAAAAAARmFAAAAAAABGYUAAAAAAAEZhQAAAAAAARmFA"},{"name":"memory_vms_mb","type":"f64","data":"AAAAAKfyGUEAAAAgs/oZQQAAAEC5/BlBAAAAQMH8GUEAAABAyfwZQQAAAEDV/BlBAAAAQOH8GUEAAABA7fwZQQAAAED5/BlBAAAAQAX9GUEAAABADf0ZQQAAAEAZ/RlBAAAAQCX9GUEAAABAMf0ZQQAAAEA5/RlBAAAAQEX9GUEAAABAUf0ZQQAAAEBd/RlBAAAAQGn9GUEAAABAdf0ZQQAAAECB/RlBAAAAQIn9GUEAAABAlf0ZQQAAAECh/RlBAAAAQKn9GUEAAABAtf0ZQQAAAEDB/RlBAAAAQM39GUEAAABA2f0ZQQAAAEDl/RlBAAAAQO39GUEAAABA7f0ZQQAAAEDt/RlBAAAAQO39GUEAAABA7f0ZQQAAAEDt/RlBAAAAQO39GUEAAABA7f0ZQQAAAEDt/RlBAAAAQO39GUEAAABA7f0ZQQAAAEDt/RlBAAAAQO39GUEAAABA7f0ZQQAAAEDt/RlBAAAAQO39GUEAAABA7f0ZQQAAAEDt/RlBAAAAQO39GUEAAABA7f0ZQQAAAEDt/RlBAAAAQO39GUEAAABA7f0ZQQAAAEDt/RlBAAAAQO39GUEAAABA7f0ZQQAAAEDt/RlBAAAAQO39GUEAAABA7f0ZQQAAAEDt/RlBAAAAQO39GUEAAABA7f0ZQQAAAEDt/RlBAAAAQO39GUEAAABA7f0ZQQAAAEDt/RlBAAAAQO39GUEAAABA7f0ZQQAAAEDt/RlBAAAAQO39GUEAAABA7f0ZQQAAAEDt/RlBAAAAQO39GUEAAABA7f0ZQQAAAEDt/RlBAAAAQO39GUEAAABA7f0ZQQAAAEDt/RlBAAAAQO39GUEAAABA7f0ZQQAAAEDt/RlBAAAAQO39GUEAAABA7f0ZQQAAAEDt/RlBAAAAQO39GUEAAABA7f0ZQQAAAEDt/RlBAAAAQO39GUEAAABA7f0ZQQAAAEDt/RlB"},{"name":"process_threads","type":"i32","data":"BQAAACUAAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAA"},{"name":"thread_pool_total","type":"i32","data":"KAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAA"},{"name":"thread_pool_borrowed","type":"i32","data":"AAAAACAAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAA"},{"name":"thread_pool_available","type":"i32","data":"KAAAAAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA"},{"name":"thread_pool_waiting","type":"i32","data":"AAAAAAAAAABCAAAAswAAAEYBAAAFAgAA0AIAAJYDAABVBAAAHwUAAOYFAACCBgAAUAcAABsIAADgCAAAowkAAG8KAAAyCwAA9QsAALkMAACADQAAFQ4AAOUOAACqDwAAahAAADURAAD5EQAAxxIAAJITAABZFAAAGxUAAPQUAAD0FAAA9BQAAPQUAAD0FAAA9BQAAPQUAAD0FAAA9BQAAPQUAADMFAAAzBQAAMwUAADMFAAAzBQAAMwUAADMFAAAzBQAAMwUAAC4FAAApBQAAKQUAACkFAAApBQAAKQUAACkFAAApBQAAKQUAACkFAAAkBQAAHwUAAB8FAAAfBQAAHwUAAB8FAAAfBQAAHwUAAB8FAAAfBQAAGgUAABUFAAAVBQAAFQUAABUFAAAVBQAAFQUAABUFAAAVBQAAFQUAAA7FAAALBQAACwUAAAsFAAALBQAACwUAAAsFAAALBQAACwUAAAsFAAA"},{"name":"pending_bg_tasks","type":"i32","data":"AAAAACAAAABqAAAA2wAAAG4BAAAtAgAA+AIAAL4DAAB9BAAARwUAAA4GAACqBgAAeAcAAEMIAAAICQAAywkAAJcKAABaCwAAHQwAAOEMAACoDQAAPQ4AAA0PAADSDwAAkhAAAF0RAAAhEgAA7xIAALoTAACBFAAAQxUAABwVAAAcFQAAHBUAABwVAAAcFQAAHBUAABwVAAAcFQAAHBUAABwVAAD0FAAA9BQAAPQUAAD0FAAA9BQAAPQUAAD0FAAA9BQAAPQUAADgFAAAzBQAAMwUAADMFAAAzBQAAMwUAADMFAAAzBQAAMwUAADMFAAAuBQAAKQUAACkFAAApBQAAKQUAACkFAAApBQAAKQUAACkFAAApBQAAJAUAAB8FAAAfBQAAHwUAAB8FAAAfBQAAHwUAAB8FAAAfBQAAHwUAABjFAAAVBQAAFQUAABUFAAAVBQAAFQUAABUFAAAVBQAAFQUAABUFAAA"},{"name":"active_threads","type":"i32","data":"AQAAACEAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAA"},{"name":"phase","type":"dict","values":["test","bg_completion"],"codes":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1]}]}});
@@ -0,0 +1,2 @@
+// Generated by embed_data.py
+DASHBOARD_DATA.register("async-route-async-inner-sync-bg-sync-task-10users", {"stats":{"length":2,"columns":[{"name":"Type","type":"dict","values":["GET"],"codes":[0,-1]},{"name":"Name","type":"dict","values":["/async-route-async-inner-sync-bg-sync-task","Aggregated"],"codes":[0,1]},{"name":"Request Count","type":"i32","data":"OAIAADgCAAA="},{"name":"Failure Count","type":"i32","data":"AAAAAAAAAAA="},{"name":"Median Response Time","type":"f64","data":"AAAAAABAakAAAAAAAEBqQA=="},{"name":"Average Response Time","type":"f64","data":"HZbKupOxaUAdlsq6k7FpQA=="},{"name":"Min Response Time","type":"f64","data":"APDsqeMSaUAA8Oyp4xJpQA=="},{"name":"Max Response Time","type":"f64","data":"AGBbj8KPbEAAYFuPwo9sQA=="},{"name":"Average Content Size","type":"f64","data":"AAAAAAAgZ0AAAAAAACBnQA=="},{"name":"Requests/s","type":"f64","data":"8410DHyLM0DzjXQMfIszQA=="},{"name":"Failures/s","type":"f64","data":"AAAAAAAAAAAAAAAAAAAAAA=="},{"name":"50%","type":"i32","data":"0gAAANIAAAA="},{"name":"66%","type":"i32","data":"0gAAANIAAAA="},{"name":"75%","type":"i32","data":"0gAAANIAAAA="},{"name":"80%","type":"i32","data":"0gAAANIAAAA="},{"name":"90%","type":"i32","data":"0gAAANIAAAA="},{"name":"95%","type":"i32","data":"0gAAANIAAAA="},{"name":"98%","type":"i32","data":"0gAAANIAAAA="},{"name":"99%","type":"i32","data":"0gAAANIAAAA="},{"name":"99.9%","type":"i32","data":"5gAAAOYAAAA="},{"name":"99.99%","type":"i32","data":"5gAAAOYAAAA="},{"name":"100%","type":"i32","data":"5gAAAOYAAAA="}]},"resources":{"length":90,"columns":[{"name":"timestamp","type":"dict","values":["2025-12-10T08:29:14.862018","2025-12-10T08:29:15.874046","2025-12-10T08:29:16.883922","2025-12-10T08:29:17.895846","2025-12-10T08:29:18.906255","2025-12-10T08:29:19.915325","2025-12-10T08:29:20.923800","2025-12-10T08:29:21.946884","2025-12-10T08:29:22.958603","2025-12-10T08:29:23.972319","2025-12-10T08:29:24.988662","2025-12-10T08:29:26.002471","2025-12-10T08:29:27.011090","2025-12-10T08:29:28.023224","2025-12-10T08:29:29.035386","2025-12-10T08:29:30.047128","2025-12-10T08:29:31.056649","2025-12-10T08:29:32.066640","2025-12-10T08:29:33.077780","2025-12-10T08:29:34.089082","2025-12-10T08:29:35.101271","2025-12-10T08:29:36.110629","2025-12-10T08:29:37.121766","2025-12-10T08:29:38.135706","2025-12-10T08:29:39.147161","2025-12-10T08:29:40.159989","2025-12-10T08:29:41.170511","2025-12-10T08:29:42.186176","2025-12-10T08:29:43.193202","2025-12-10T08:29:44.203496","2025-12-10T08:29:45.214082","2025-12-10T08:29:46.224328","2025-12-10T08:29:47.236767","2025-12-10T08:29:48.243040","2025-12-10T08:29:49.253418","2025-12-10T08:29:50.259619","2025-12-10T08:29:51.267401","2025-12-10T08:29:52.277411","2025-12-10T08:29:53.288464","2025-12-10T08:29:54.297964","2025-12-10T08:29:55.307307","2025-12-10T08:29:56.318577","2025-12-10T08:29:57.322563","2025-12-10T08:29:58.331276","2025-12-10T08:29:59.341821","2025-12-10T08:30:00.356130","2025-12-10T08:30:01.365802","2025-12-10T08:30:02.371758","2025-12-10T08:30:03.377548","2025-12-10T08:30:04.383780","2025-12-10T08:30:05.392715","2025-12-10T08:30:06.402470","2025-12-10T08:30:07.409845","2025-12-10T08:30:08.417796","2025-12-10T08:30:09.426980","2025-12-10T08:30:10.439116","2025-12-10T08:30:11.443803","2025-12-10T08:30:12.453209","2025-12-10T08:30:13.466253","2025-12-10T08:30:14.474281","2025-12-10T08:30:15.485277","2025-12-10T08:30:16.494782","2025-12-10T08:30:17.500366","2025-12-10T08:30:18.509050","2025-12-10T08:30:19.518410","2025-12-10T08:30:20.531023","2025-12-10T08:30:21.539607","2025-12-10T08:30:22.551688","2025-12-10T08:30:23.559121","2025-12-10T08:30:24.569162","2025-12-10T08:30:25.579959","2025-12-10T08:30:26.587000","2025-12-10T08:30:27.600890","2025-12-10T08:30:28.610963","2025-12-10T08:30:29.617803","2025-12-10T08:30:30.628791","2025-12-10T08:30:31.640038","2025-12-10T08:30:32.648299","2025-12-10T08:30:33.660475","2025-12-10T08:30:34.670375","2025-12-10T08:30:35.681459","2025-12-10T08:30:36.689509","2025-12-10T08:30:37.697050","2025-12-10T08:30:38.708158","2025-12-10T08:30:39.716104","2025-12-10T08:30:40.725883","2025-12-10T08:30:41.735782","2025-12-10T08:30:42.749486","2025-12-10T08:30:43.757662","2025-12-10T08:30:44.770083"],"codes":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89]},{"name":"cpu_percent","type":"f64","data":"AAAAAAAAAAAzMzMzMzPzP2ZmZmZmZhJAAAAAAAAAFkAzMzMzMzMRQM3MzMzMzBJAzczMzMzMCECamZmZmZkXQDMzMzMzMxFAAAAAAAAAEEBmZmZmZmYUQGZmZmZmZg5AzczMzMzMFEAzMzMzMzMVQGZmZmZmZg5AAAAAAAAAEEDNzMzMzMwEQJqZmZmZmRFAZmZmZmZmEEAAAAAAAAASQAAAAAAAABBAmpmZmZmZCUDNzMzMzMwWQAAAAAAAABRAZmZmZmZmEEAzMzMzMzMRQAAAAAAAAAhAzczMzMzMEkBmZmZmZmYSQDMzMzMzMxNAmpmZmZmZCUDNzMzMzMzsPzMzMzMzMwNAmpmZmZmZ8T+amZmZmZnZPzMzMzMzM9M/mpmZmZmZyT+amZmZmZnZP5qZmZmZmdk/MzMzMzMz0z8zMzMzMzPTP2ZmZmZmZvY/mpmZmZmZ+T9mZmZmZmbmP5qZmZmZmck/mpmZmZmZ2T8zMzMzMzPTPzMzMzMzM9M/MzMzMzMz0z8zMzMzMzPTP5qZmZmZmek/zczMzMzM9D8zMzMzMzP7PzMzMzMzM+M/mpmZmZmZ2T+amZmZmZnZPzMzMzMzM9M/mpmZmZmZ2T+amZmZmZnZPzMzMzMzM9M/ZmZmZmZm5j8AAAAAAAD4P5qZmZmZmQFAZmZmZmZm5j8zMzMzMzPTP5qZmZmZmdk/MzMzMzMz0z8zMzMzMzPTPzMzMzMzM9M/MzMzMzMz0z8zMzMzMzPjP83MzMzMzPQ/zczMzMzMAEAzMzMzMzPTPzMzMzMzM9M/mpmZmZmZ2T+amZmZmZnZP5qZmZmZmdk/AAAAAAAA4D8zMzMzMzPTP5qZmZmZmek/mpmZmZmZ+T/NzMzMzMwAQJqZmZmZmdk/MzMzMzMz0z+amZmZmZnJPzMzMzMzM9M/mpmZmZmZ2T8zMzMzMzPTP5qZmZmZmdk/"},{"name":"memory_rss_mb","type":"f64","data":"AAAAAABOSEAAAAAAAOJIQAAAAAAAbElAAAAAAADYSUAAAAAAAPZJQAAAAAAAJkpAAAAAAABWSkAAAAAAAHhKQAAAAAAAokpAAAAAAADOSkAAAAAAAPBKQAAAAAAACEtAAAAAAAAOS0AAAAAAACJLQAAAAAAASEtAAAAAAAByS0AAAAAAAJpLQAAAAAAAxktAAAAAAADmS0AAAAAAABRMQAAAAAAAPExAAAAAAABMTEAAAAAAAFZMQAAAAAAAYkxAAAAAAACMTEAAAAAAALJMQAAAAAAA2ExAAAAAAAAITUAAAAAAACpNQAAAAAAAWE1AAAAAAAByTUAAAAAAAHJNQAAAAAAAck1AAAAAAAByTUAAAAAAAHJNQAAAAAAAck1AAAAAAAByTUAAAAAAAHJNQAAAAAAAck1AAAAAAAByTUAAAAAAAHJNQAAAAAAAck1AAAAAAAByTUAAAAAAADxNQAAAAAAA9kpAAAAAAAAUQ0AAAAAAABRDQAAAAAAAFkNAAAAAAAAWQ0AAAAAAABZDQAAAAAAAFkNAAAAAAAAYQ0AAAAAAABpDQAAAAAAAHENAAAAAAAAeQ0AAAAAAAB5DQAAAAAAAHkNAAAAAAAAeQ0AAAAAAAB5DQAAAAAAAHkNAAAAAAAAeQ0AAAAAAAB5DQAAAAAAAIENAAAAAAAAgQ0AAAAAAACBDQAAAAAAAIENAAAAAAAAgQ0AAAAAAACBDQAAAAAAAIENAAAAAAAAgQ0AAAAAAACBDQAAAAAAAIENAAAAAAAAgQ0AAAAAAACBDQAAAAAAAIENAAAAAAAAgQ0AAAAAAACBDQAAAAAAAIENAAAAAAAAgQ0AAAAAAACBDQAAAAAAAIENAAAAAAAAgQ0AAAAAAACJDQAAAAAAAIkNAAAAAAAAkQ0AAAAAAACRDQAAAAAAAJENAAAAAAAAkQ0AAAAAAACRDQAAAAAAAJkNA"},{"name":"memory_vms_mb","type":"f64","data":"AAAAEKjyGUEAAAAQqvQZQQAAALAy+RlBAAAAULb8GUEAAABQtvwZQQAAAFC6/BlBAAAAULr8GUEAAABQuvwZQQAAAFC+/BlBAAAAUL78GUEAAABQvvwZQQAAAFC+/BlBAAAAUL78GUEAAABQvvwZQQAAAFDC/BlBAAAAUML8GUEAAABQwvwZQQAAAFDG/BlBAAAAUMb8GUEAAABQxvwZQQAAAFDG/BlBAAAAUMr8GUEAAABQyvwZQQAAAFDK/BlBAAAAUMr8GUEAAABQyvwZQQAAAFDO/BlBAAAAUM78GUEAAABQzvwZQQAAAFDO/BlBAAAAUNL8GUEAAABQ0vwZQQAAAFDS/BlBAAAAUNL8GUEAAABQ0vwZQQAAAFDS/BlBAAAAUNL8GUEAAABQ0vwZQQAAAFDS/BlBAAAAUNL8GUEAAABQ0vwZQQAAAFDS/BlBAAAAUNL8GUEAAABQ0vwZQQAAAFDS/BlBAAAAUNL8GUEAAABQ0vwZQQAAAFDS/BlBAAAAUNL8GUEAAABQ0vwZQQAAAFDS/BlBAAAAUNL8GUEAAABQ0vwZQQAAAFDS/BlBAAAAUNL8GUEAAABQ0vwZQQAAAFDS/BlBAAAAUNL8GUEAAABQ0vwZQQAAAFDS/BlBAAAAUNL8GUEAAABQ0vwZQQAAAFDS/BlBAAAAUNL8GUEAAABQ0vwZQQAAAFDS/BlBAAAAUNL8GUEAAABQ0vwZQQAAAFDS/BlBAAAAUNL8GUEAAABQ0vwZQQAAAFDS/BlBAAAAUNL8GUEAAABQ0vwZQQAAAFDS/BlBAAAAUNL8GUEAAABQ0vwZQQAAAFDS/BlBAAAAUNL8GUEAAABQ0vwZQQAAAFDS/BlBAAAAUNL8GUEAAABQ0vwZQQAAAFDS/BlBAAAAUNL8GUEAAABQ0vwZQQAAAFDS/BlBAAAAUNL8GUEAAABQ0vwZQQAAAFDS/BlB"},{"name":"process_threads","type":"i32","data":"BQAAAA0AAAAfAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAA"},{"name":"thread_pool_total","type":"i32","data":"KAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAA"},{"name":"thread_pool_borrowed","type":"i32","data":"AAAAAAgAAAAaAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAA"},{"name":"thread_pool_available","type":"i32","data":"KAAAACAAAAAOAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA"},{"name":"thread_pool_waiting","type":"i32","data":"AAAAAAAAAAAAAAAABgAAABkAAAAvAAAAQwAAAFYAAABqAAAAfQAAAJMAAACgAAAAoAAAAKgAAAC9AAAAzgAAAOUAAAD5AAAADAEAACABAAAzAQAAPAEAADsBAABGAQAAWgEAAG8BAACEAQAAlgEAAKsBAADAAQAA0QEAAMYBAACwAQAAqQEAAKkBAACpAQAAqQEAAKkBAACpAQAAqQEAAKkBAACdAQAAiAEAAIEBAACBAQAAgQEAAIEBAACBAQAAgQEAAIEBAAB8AQAAbwEAAF0BAABZAQAAWQEAAFkBAABZAQAAWQEAAFkBAABZAQAAVAEAAEYBAAA0AQAAMQEAADEBAAAxAQAAMQEAADEBAAAxAQAAMQEAACwBAAAeAQAACgEAAAkBAAAJAQAACQEAAAkBAAAJAQAACQEAAAkBAAAEAQAA9QAAAOEAAADhAAAA4QAAAOEAAADhAAAA4QAAAOEAAADhAAAA"},{"name":"pending_bg_tasks","type":"i32","data":"AAAAAAgAAAAaAAAALgAAAEEAAABXAAAAawAAAH4AAACSAAAApQAAALsAAADIAAAAyAAAANAAAADlAAAA9gAAAA0BAAAhAQAANAEAAEgBAABbAQAAZAEAAGMBAABuAQAAggEAAJcBAACsAQAAvgEAANMBAADoAQAA+QEAAO4BAADYAQAA0QEAANEBAADRAQAA0QEAANEBAADRAQAA0QEAANEBAADFAQAAsAEAAKkBAACpAQAAqQEAAKkBAACpAQAAqQEAAKkBAACkAQAAlwEAAIUBAACBAQAAgQEAAIEBAACBAQAAgQEAAIEBAACBAQAAfAEAAG4BAABcAQAAWQEAAFkBAABZAQAAWQEAAFkBAABZAQAAWQEAAFQBAABGAQAAMgEAADEBAAAxAQAAMQEAADEBAAAxAQAAMQEAADEBAAAsAQAAHQEAAAkBAAAJAQAACQEAAAkBAAAJAQAACQEAAAkBAAAJAQAA"},{"name":"active_threads","type":"i32","data":"AQAAAAkAAAAbAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAA"},{"name":"phase","type":"dict","values":["test","bg_completion"],"codes":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1]}]}});
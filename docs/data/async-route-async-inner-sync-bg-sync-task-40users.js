@@ -0,0 +1,2 @@
+// Generated by embed_data.py
+DASHBOARD_DATA.register("async-route-async-inner-sync-bg-sync-task-40users", {"stats":{"length":2,"columns":[{"name":"Type","type":"dict","values":["GET"],"codes":[0,-1]},{"name":"Name","type":"dict","values":["/async-route-async-inner-sync-bg-sync-task","Aggregated"],"codes":[0,1]},{"name":"Request Count","type":"i32","data":"gQgAAIEIAAA="},{"name":"Failure Count","type":"i32","data":"AAAAAAAAAAA="},{"name":"Median Response Time","type":"f64","data":"AOB2EhENaUAA4HYSEQ1pQA=="},{"name":"Average Response Time","type":"f64","data":"HjLxPsOvaUAeMvE+w69pQA=="},{"name":"Min Response Time","type":"f64","data":"AOB2EhENaUAA4HYSEQ1pQA=="},{"name":"Max Response Time","type":"f64","data":"AJjR91NJcEAAmNH3U0lwQA=="},{"name":"Average Content Size","type":"f64","data":"AAAAAAAgZ0AAAAAAACBnQA=="},{"name":"Requests/s","type":"f64","data":"+pDAXna8UkD6kMBedrxSQA=="},{"name":"Failures/s","type":"f64","data":"AAAAAAAAAAAAAAAAAAAAAA=="},{"name":"50%","type":"i32","data":"yAAAAMgAAAA="},{"name":"66%","type":"i32","data":"0gAAANIAAAA="},{"name":"75%","type":"i32","data":"0gAAANIAAAA="},{"name":"80%","type":"i32","data":"0gAAANIAAAA="},{"name":"90%","type":"i32","data":"0gAAANIAAAA="},{"name":"95%","type":"i32","data":"0gAAANIAAAA="},{"name":"98%","type":"i32","data":"3AAAANwAAAA="},{"name":"99%","type":"i32","data":"5gAAAOYAAAA="},{"name":"99.9%","type":"i32","data":"+gAAAPoAAAA="},{"name":"99.99%","type":"i32","data":"BAEAAAQBAAA="},{"name":"100%","type":"i32","data":"BAEAAAQBAAA="}]},"resources":{"length":90,"columns":[{"name":"timestamp","type":"dict","values":["2025-12-10T08:31:52.247654","2025-12-10T08:31:53.261793","2025-12-10T08:31:54.267428","2025-12-10T08:31:55.273771","2025-12-10T08:31:56.283747","2025-12-10T08:31:57.299985","2025-12-10T08:31:58.308401","2025-12-10T08:31:59.313790","2025-12-10T08:32:00.320277","2025-12-10T08:32:01.327033","2025-12-10T08:32:02.335093","2025-12-10T08:32:03.348774","2025-12-10T08:32:04.360640","2025-12-10T08:32:05.370822","2025-12-10T08:32:06.394451","2025-12-10T08:32:07.406787","2025-12-10T08:32:08.411930","2025-12-10T08:32:09.418855","2025-12-10T08:32:10.426138","2025-12-10T08:32:11.434740","2025-12-10T08:32:12.443465","2025-12-10T08:32:13.456222","2025-12-10T08:32:14.467562","2025-12-10T08:32:15.477775","2025-12-10T08:32:16.486650","2025-12-10T08:32:17.494897","2025-12-10T08:32:18.502134","2025-12-10T08:32:19.510965","2025-12-10T08:32:20.517556","2025-12-10T08:32:21.527498","2025-12-10T08:32:22.537537","2025-12-10T08:32:23.546614","2025-12-10T08:32:24.557900","2025-12-10T08:32:25.567402","2025-12-10T08:32:26.577435","2025-12-10T08:32:27.587262","2025-12-10T08:32:28.597866","2025-12-10T08:32:29.606647","2025-12-10T08:32:30.617671","2025-12-10T08:32:31.624839","2025-12-10T08:32:32.637519","2025-12-10T08:32:33.650887","2025-12-10T08:32:34.657074","2025-12-10T08:32:35.667965","2025-12-10T08:32:36.677945","2025-12-10T08:32:37.689449","2025-12-10T08:32:38.699229","2025-12-10T08:32:39.709463","2025-12-10T08:32:40.719094","2025-12-10T08:32:41.734980","2025-12-10T08:32:42.744046","2025-12-10T08:32:43.753270","2025-12-10T08:32:44.767058","2025-12-10T08:32:45.773570","2025-12-10T08:32:46.781871","2025-12-10T08:32:47.788333","2025-12-10T08:32:48.797494","2025-12-10T08:32:49.809831","2025-12-10T08:32:50.819896","2025-12-10T08:32:51.833252","2025-12-10T08:32:52.840610","2025-12-10T08:32:53.847859","2025-12-10T08:32:54.855508","2025-12-10T08:32:55.865075","2025-12-10T08:32:56.876018","2025-12-10T08:32:57.885268","2025-12-10T08:32:58.897158","2025-12-10T08:32:59.907149","2025-12-10T08:33:00.917005","2025-12-10T08:33:01.927243","2025-12-10T08:33:02.935699","2025-12-10T08:33:03.944173","2025-12-10T08:33:04.957365","2025-12-10T08:33:05.966047","2025-12-10T08:33:06.977260","2025-12-10T08:33:07.987342","2025-12-10T08:33:09.001853","2025-12-10T08:33:10.016087","2025-12-10T08:33:11.022736","2025-12-10T08:33:12.036096","2025-12-10T08:33:13.047648","2025-12-10T08:33:14.058950","2025-12-10T08:33:15.067838","2025-12-10T08:33:16.077303","2025-12-10T08:33:17.089448","2025-12-10T08:33:18.098336","2025-12-10T08:33:19.110567","2025-12-10T08:33:20.119366","2025-12-10T08:33:21.127114","2025-12-10T08:33:22.140327"],"codes":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89]},{"name":"cpu_percent","type":"f64","data":"AAAAAAAAAACamZmZmZkBQGZmZmZmZhxAAAAAAAAAKEBmZmZmZmYmQM3MzMzMzCpAzczMzMzMIkBmZmZmZmYkQAAAAAAAACdAAAAAAAAAKECamZmZmZkoQDMzMzMzMyNAzczMzMzMKkAzMzMzMzMpQJqZmZmZmSZAzczMzMzMMEDNzMzMzMwjQGZmZmZmZilAMzMzMzMzK0CamZmZmZkpQJqZmZmZmSZAzczMzMzMIEAzMzMzMzMoQDMzMzMzMydAMzMzMzMzJUDNzMzMzMwoQDMzMzMzMydAZmZmZmZmJ0AAAAAAAAAoQGZmZmZmZiRAAAAAAAAAJEBmZmZmZmb2PzMzMzMzM/s/MzMzMzMz0z+amZmZmZnZP5qZmZmZmdk/MzMzMzMz0z8zMzMzMzPTPzMzMzMzM9M/mpmZmZmZ2T8zMzMzMzPTPwAAAAAAAABAAAAAAAAA+D8zMzMzMzPTP5qZmZmZmdk/mpmZmZmZ2T+amZmZmZnZP5qZmZmZmdk/MzMzMzMz0z+amZmZmZnZP5qZmZmZmdk/MzMzMzMzA0CamZmZmZnxPzMzMzMzM9M/MzMzMzMz0z8zMzMzMzPTPzMzMzMzM9M/mpmZmZmZ2T8zMzMzMzPTP5qZmZmZmdk/zczMzMzM7D+amZmZmZkFQGZmZmZmZuY/mpmZmZmZ2T+amZmZmZnZPzMzMzMzM9M/MzMzMzMz0z8zMzMzMzPTPzMzMzMzM9M/MzMzMzMz0z+amZmZmZnpP2ZmZmZmZgZAmpmZmZmZ2T8zMzMzMzPTPzMzMzMzM9M/mpmZmZmZ2T+amZmZmZnZP5qZmZmZmdk/mpmZmZmZ2T8zMzMzMzPTPwAAAAAAAPA/MzMzMzMzB0CamZmZmZnZPzMzMzMzM9M/mpmZmZmZ2T8zMzMzMzPTP5qZmZmZmdk/MzMzMzMz0z8zMzMzMzPTP5qZmZmZmdk/"},{"name":"memory_rss_mb","type":"f64","data":"AAAAAABGSEAAAAAAABBJQAAAAAAA0klAAAAAAABcSkAAAAAAAPZKQAAAAAAAnktAAAAAAABGTEAAAAAAAOBMQAAAAAAAhE1AAAAAAAAeTkAAAAAAALpOQAAAAAAAQE9AAAAAAACoT0AAAAAAACxQQAAAAAAAeFBAAAAAAADJUEAAAAAAABpRQAAAAAAAbFFAAAAAAADPUUAAAAAAAB1SQAAAAAAAaVJAAAAAAACqUkAAAAAAAORSQAAAAAAAOFNAAAAAAACKU0AAAAAAANJTQAAAAAAAJFRAAAAAAAB1VEAAAAAAAMZUQAAAAAAAEVVAAAAAAABXVUAAAAAAAFdVQAAAAAAAV1VAAAAAAABXVUAAAAAAAFdVQAAAAAAAV1VAAAAAAABXVUAAAAAAAFdVQAAAAAAAV1VAAAAAAABXVUAAAAAAAFdVQAAAAAAAV1VAAAAAAABYVUAAAAAAAFhVQAAAAAAAWFVAAAAAAABYVUAAAAAAAFhVQAAAAAAAWFVAAAAAAABYVUAAAAAAAFhVQAAAAAAAWFVAAAAAAABYVUAAAAAAAFhVQAAAAAAAWFVAAAAAAABYVUAAAAAAAFhVQAAAAAAAWFVAAAAAAABYVUAAAAAAAFhVQAAAAAAAWFVAAAAAAABYVUAAAAAAAFhVQAAAAAAAWFVAAAAAAABYVUAAAAAAAFhVQAAAAAAAWFVAAAAAAABYVUAAAAAAAFhVQAAAAAAAWFVAAAAAAABYVUAAAAAAAFhVQAAAAAAAWFVAAAAAAABYVUAAAAAAAFhVQAAAAAAAWFVAAAAAAABYVUAAAAAAAFhVQAAAAAAAWFVAAAAAAABYVUAAAAAAAFhVQAAAAAAAWFVAAAAAAABYVUAAAAAAAFhVQAAAAAAAWFVAAAAAAABYVUAAAAAAAFhVQAAAAAAAWFVAAAAAAABYVUAAAAAAAFhVQAAAAAAAWFVA"},{"name":"memory_vms_mb","type":"f64","data":"AAAAkKbyGUEAAADw7vYZQQAAANC0/BlBAAAA0Lj8GUEAAADQvPwZQQAAANDA/BlBAAAA0Mj8GUEAAADQzPwZQQAAANDQ/BlBAAAA0NT8GUEAAADQ2PwZQQAAANDc/BlBAAAA0OD8GUEAAADQ5PwZQQAAANDo/BlBAAAA0Oz8GUEAAADQ9PwZQQAAAND4/BlBAAAA0Pz8GUEAAADQAP0ZQQAAANAE/RlBAAAA0Aj9GUEAAADQDP0ZQQAAANAQ/RlBAAAA0BT9GUEAAADQGP0ZQQAAANAc/RlBAAAA0CT9GUEAAADQKP0ZQQAAANAs/RlBAAAA0DD9GUEAAADQMP0ZQQAAANAw/RlBAAAA0DD9GUEAAADQMP0ZQQAAANAw/RlBAAAA0DD9GUEAAADQMP0ZQQAAANAw/RlBAAAA0DD9GUEAAADQMP0ZQQAAANAw/RlBAAAA0DD9GUEAAADQMP0ZQQAAANAw/RlBAAAA0DD9GUEAAADQMP0ZQQAAANAw/RlBAAAA0DD9GUEAAADQMP0ZQQAAANAw/RlBAAAA0DD9GUEAAADQMP0ZQQAAANAw/RlBAAAA0DD9GUEAAADQMP0ZQQAAANAw/RlBAAAA0DD9GUEAAADQMP0ZQQAAANAw/RlBAAAA0DD9GUEAAADQMP0ZQQAAANAw/RlBAAAA0DD9GUEAAADQMP0ZQQAAANAw/RlBAAAA0DD9GUEAAADQMP0ZQQAAANAw/RlBAAAA0DD9GUEAAADQMP0ZQQAAANAw/RlBAAAA0DD9GUEAAADQMP0ZQQAAANAw/RlBAAAA0DD9GUEAAADQMP0ZQQAAANAw/RlBAAAA0DD9GUEAAADQMP0ZQQAAANAw/RlBAAAA0DD9GUEAAADQMP0ZQQAAANAw/RlBAAAA0DD9GUEAAADQMP0ZQQAAANAw/RlBAAAA0DD9GUEAAADQMP0ZQQAAANAw/RlB"},{"name":"process_threads","type":"i32","data":"BQAAABYAAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAA"},{"name":"thread_pool_total","type":"i32","data":"KAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAA"},{"name":"thread_pool_borrowed","type":"i32","data":"AAAAABEAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAA"},{"name":"thread_pool_available","type":"i32","data":"KAAAABcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA"},{"name":"thread_pool_waiting","type":"i32","data":"AAAAAAAAAAALAAAAQgAAAI4AAADdAAAAMwEAAH4BAADPAQAAGQIAAGkCAACkAgAA4QIAADIDAACDAwAA1QMAACYEAAB1BAAAwQQAABIFAABhBQAAnAUAANkFAAAnBgAAegYAAMYGAAAVBwAAYwcAALYHAAAFCAAAUwgAAD0IAAArCAAAKwgAACsIAAArCAAAKwgAACsIAAArCAAAKwgAACsIAAAVCAAAAwgAAAMIAAADCAAAAwgAAAMIAAADCAAAAwgAAAMIAAADCAAA6gcAANsHAADbBwAA2wcAANsHAADbBwAA2wcAANsHAADbBwAA0QcAALcHAACzBwAAswcAALMHAACzBwAAswcAALMHAACzBwAAswcAAKkHAACLBwAAiwcAAIsHAACLBwAAiwcAAIsHAACLBwAAiwcAAIsHAACBBwAAYwcAAGMHAABjBwAAYwcAAGMHAABjBwAAYwcAAGMHAABjBwAA"},{"name":"pending_bg_tasks","type":"i32","data":"AAAAABEAAAAzAAAAagAAALYAAAAFAQAAWwEAAKYBAAD3AQAAQQIAAJECAADMAgAACQMAAFoDAACrAwAA/QMAAE4EAACdBAAA6QQAADoFAACJBQAAxAUAAAEGAABPBgAAogYAAO4GAAA9BwAAiwcAAN4HAAAtCAAAewgAAGUIAABTCAAAUwgAAFMIAABTCAAAUwgAAFMIAABTCAAAUwgAAFMIAAA9CAAAKwgAACsIAAArCAAAKwgAACsIAAArCAAAKwgAACsIAAArCAAAEggAAAMIAAADCAAAAwgAAAMIAAADCAAAAwgAAAMIAAADCAAA+QcAAN8HAADbBwAA2wcAANsHAADbBwAA2wcAANsHAADbBwAA2wcAANEHAACzBwAAswcAALMHAACzBwAAswcAALMHAACzBwAAswcAALMHAACpBwAAiwcAAIsHAACLBwAAiwcAAIsHAACLBwAAiwcAAIsHAACLBwAA"},{"name":"active_threads","type":"i32","data":"AQAAABIAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAA"},{"name":"phase","type":"dict","values":["test","bg_completion"],"codes":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1]}]}});
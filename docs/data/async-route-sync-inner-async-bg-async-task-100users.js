@@ -0,0 +1,2 @@
+// Generated by embed_data.py
+DASHBOARD_DATA.register("async-route-sync-inner-async-bg-async-task-100users", {"stats":{"length":2,"columns":[{"name":"Type","type":"dict","values":["GET"],"codes":[0,-1]},{"name":"Name","type":"dict","values":["/async-route-sync-inner-async-bg-async-task","Aggregated"],"codes":[0,1]},{"name":"Request Count","type":"i32","data":"jAAAAIwAAAA="},{"name":"Failure Count","type":"i32","data":"AAAAAAAAAAA="},{"name":"Median Response Time","type":"f64","data":"AAAAAADIqUAAAAAAAMipQA=="},{"name":"Average Response Time","type":"f64","data":"5f9Ef93ur0Dl/0R/3e6vQA=="},{"name":"Min Response Time","type":"f64","data":"AHCmclprakAAcKZyWmtqQA=="},{"name":"Max Response Time","type":"f64","data":"IBCqDT0a20AgEKoNPRrbQA=="},{"name":"Average Content Size","type":"f64","data":"AAAAAAAgaUAAAAAAACBpQA=="},{"name":"Requests/s","type":"f64","data":"YKc275FyE0BgpzbvkXITQA=="},{"name":"Failures/s","type":"f64","data":"AAAAAAAAAAAAAAAAAAAAAA=="},{"name":"50%","type":"i32","data":"5AwAAOQMAAA="},{"name":"66%","type":"i32","data":"2A4AANgOAAA="},{"name":"75%","type":"i32","data":"oA8AAKAPAAA="},{"name":"80%","type":"i32","data":"oA8AAKAPAAA="},{"name":"90%","type":"i32","data":"XBIAAFwSAAA="},{"name":"95%","type":"i32","data":"mDoAAJg6AAA="},{"name":"98%","type":"i32","data":"8FUAAPBVAAA="},{"name":"99%","type":"i32","data":"kGUAAJBlAAA="},{"name":"99.9%","type":"i32","data":"YG0AAGBtAAA="},{"name":"99.99%","type":"i32","data":"YG0AAGBtAAA="},{"name":"100%","type":"i32","data":"YG0AAGBtAAA="}]},"resources":{"length":17,"columns":[{"name":"timestamp","type":"dict","values":["2025-12-10T08:20:00.256909","2025-12-10T08:20:01.272351","2025-12-10T08:20:03.280449","2025-12-10T08:20:05.290903","2025-12-10T08:20:07.299905","2025-12-10T08:20:09.308447","2025-12-10T08:20:11.320628","2025-12-10T08:20:13.330107","2025-12-10T08:20:15.340111","2025-12-10T08:20:17.347201","2025-12-10T08:20:19.357885","2025-12-10T08:20:21.368473","2025-12-10T08:20:23.380810","2025-12-10T08:20:25.391701","2025-12-10T08:20:27.404964","2025-12-10T08:20:29.416445","2025-12-10T08:20:31.424382"],"codes":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16]},{"name":"cpu_percent","type":"f64","data":"AAAAAAAAAACamZmZmZnpP5qZmZmZmek/MzMzMzMz8z8zMzMzMzPjP83MzMzMzOw/mpmZmZmZ6T8AAAAAAADwP2ZmZmZmZuY/mpmZmZmZ6T+amZmZmZnxP5qZmZmZmfE/zczMzMzM7D+amZmZmZnxPzMzMzMzM/M/mpmZmZmZ8T9mZmZmZmbmPw=="},{"name":"memory_rss_mb","type":"f64","data":"AAAAAABYSEAAAAAAAJpIQAAAAAAArEhAAAAAAADASEAAAAAAANBIQAAAAAAA5EhAAAAAAADySEAAAAAAAAJJQAAAAAAABklAAAAAAAAGSUAAAAAAAAhJQAAAAAAACklAAAAAAAAQSUAAAAAAABJJQAAAAAAAFElAAAAAAAAYSUAAAAAAABhJQA=="},{"name":"memory_vms_mb","type":"f64","data":"AAAAYKnyGUEAAABgqfIZQQAAAGCp8hlBAAAAYK3yGUEAAABgrfIZQQAAAGCt8hlBAAAAYK3yGUEAAABgrfIZQQAAAGCt8hlBAAAAYK3yGUEAAABgrfIZQQAAAGCt8hlBAAAAYK3yGUEAAABgrfIZQQAAAGCt8hlBAAAAYK3yGUEAAABgrfIZQQ=="},{"name":"process_threads","type":"i32","data":"BQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAA="},{"name":"thread_pool_total","type":"f64","data":"AAAAAAAAREAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"thread_pool_borrowed","type":"f64","data":"AAAAAAAAAAAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"thread_pool_available","type":"f64","data":"AAAAAAAAREAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"thread_pool_waiting","type":"f64","data":"AAAAAAAAAAAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"pending_bg_tasks","type":"f64","data":"AAAAAAAAAAAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"active_threads","type":"f64","data":"AAAAAAAA8D8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"phase","type":"dict","values":["test","bg_completion"],"codes":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1]}]}});
@@ -0,0 +1,2 @@
+// Generated by embed_data.py
+DASHBOARD_DATA.register("async-route-sync-inner-async-bg-async-task-10users", {"stats":{"length":2,"columns":[{"name":"Type","type":"dict","values":["GET"],"codes":[0,-1]},{"name":"Name","type":"dict","values":["/async-route-sync-inner-async-bg-async-task","Aggregated"],"codes":[0,1]},{"name":"Request Count","type":"i32","data":"iQAAAIkAAAA="},{"name":"Failure Count","type":"i32","data":"AAAAAAAAAAA="},{"name":"Median Response Time","type":"f64","data":"AAAAAACQmkAAAAAAAJCaQA=="},{"name":"Average Response Time","type":"f64","data":"fx4a4ze2mkB/HhrjN7aaQA=="},{"name":"Min Response Time","type":"f64","data":"ACBwvLsEa0AAIHC8uwRrQA=="},{"name":"Max Response Time","type":"f64","data":"gLz/x5XItUCAvP/Hlci1QA=="},{"name":"Average Content Size","type":"f64","data":"AAAAAAAgaUAAAAAAACBpQA=="},{"name":"Requests/s","type":"f64","data":"PpcPbDptE0A+lw9sOm0TQA=="},{"name":"Failures/s","type":"f64","data":"AAAAAAAAAAAAAAAAAAAAAA=="},{"name":"50%","type":"i32","data":"pAYAAKQGAAA="},{"name":"66%","type":"i32","data":"CAcAAAgHAAA="},{"name":"75%","type":"i32","data":"CAcAAAgHAAA="},{"name":"80%","type":"i32","data":"bAcAAGwHAAA="},{"name":"90%","type":"i32","data":"bAcAAGwHAAA="},{"name":"95%","type":"i32","data":"bAcAAGwHAAA="},{"name":"98%","type":"i32","data":"rA0AAKwNAAA="},{"name":"99%","type":"i32","data":"lBEAAJQRAAA="},{"name":"99.9%","type":"i32","data":"4BUAAOAVAAA="},{"name":"99.99%","type":"i32","data":"4BUAAOAVAAA="},{"name":"100%","type":"i32","data":"4BUAAOAVAAA="}]},"resources":{"length":27,"columns":[{"name":"timestamp","type":"dict","values":["2025-12-10T08:18:24.712032","2025-12-10T08:18:25.726781","2025-12-10T08:18:27.735427","2025-12-10T08:18:29.747651","2025-12-10T08:18:31.756856","2025-12-10T08:18:33.766929","2025-12-10T08:18:35.779320","2025-12-10T08:18:37.786410","2025-12-10T08:18:39.797067","2025-12-10T08:18:41.806953","2025-12-10T08:18:43.817977","2025-12-10T08:18:45.825359","2025-12-10T08:18:47.836522","2025-12-10T08:18:49.846657","2025-12-10T08:18:51.859139","2025-12-10T08:18:53.867530","2025-12-10T08:18:55.875815","2025-12-10T08:18:57.294095","2025-12-10T08:18:58.303466","2025-12-10T08:18:59.312671","2025-12-10T08:19:00.324349","2025-12-10T08:19:01.331038","2025-12-10T08:19:02.338601","2025-12-10T08:19:03.351421","2025-12-10T08:19:04.362563","2025-12-10T08:19:05.370400","2025-12-10T08:19:06.381102"],"codes":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26]},{"name":"cpu_percent","type":"f64","data":"AAAAAAAAAADNzMzMzMzsP83MzMzMzOw/mpmZmZmZ8T+amZmZmZnpPwAAAAAAAPA/mpmZmZmZ6T9mZmZmZmb2PwAAAAAAAPA/mpmZmZmZ6T8AAAAAAADwPwAAAAAAAPA/MzMzMzMz8z+amZmZmZnxPzMzMzMzM/M/mpmZmZmZ8T/NzMzMzMzsP83MzMzMzOw/ZmZmZmZm5j8zMzMzMzPjP2ZmZmZmZuY/AAAAAAAA4D8zMzMzMzPjP2ZmZmZmZuY/mpmZmZmZ6T8zMzMzMzPjPzMzMzMzM+M/"},{"name":"memory_rss_mb","type":"f64","data":"AAAAAAAuSEAAAAAAAHxIQAAAAAAAjEhAAAAAAACiSEAAAAAAALRIQAAAAAAAyEhAAAAAAADSSEAAAAAAANhIQAAAAAAA2khAAAAAAADcSEAAAAAAANxIQAAAAAAA3EhAAAAAAADeSEAAAAAAAN5IQAAAAAAA3khAAAAAAADeSEAAAAAAAN5IQAAAAAAA3khAAAAAAADeSEAAAAAAAN5IQAAAAAAA3khAAAAAAADeSEAAAAAAAN5IQAAAAAAA3khAAAAAAADeSEAAAAAAAN5IQAAAAAAA3khA"},{"name":"memory_vms_mb","type":"f64","data":"AAAAYKjyGUEAAABgqPIZQQAAAGCo8hlBAAAAYKzyGUEAAABgrPIZQQAAAGCs8hlBAAAAYKzyGUEAAABgrPIZQQAAAGCs8hlBAAAAYKzyGUEAAABgrPIZQQAAAGCs8hlBAAAAYKzyGUEAAABgrPIZQQAAAGCs8hlBAAAAYKzyGUEAAABgrPIZQQAAAGCs8hlBAAAAYKzyGUEAAABgrPIZQQAAAGCs8hlBAAAAYKzyGUEAAABgrPIZQQAAAGCs8hlBAAAAYKzyGUEAAABgrPIZQQAAAGCs8hlB"},{"name":"process_threads","type":"i32","data":"BQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAA"},{"name":"thread_pool_total","type":"f64","data":"AAAAAAAAREAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAABEQAAAAAAAAERAAAAAAAAAREAAAAAAAABEQAAAAAAAAERAAAAAAAAAREAAAAAAAABEQAAAAAAAAERAAAAAAAAAREAAAAAAAABEQAAAAAAAAERA"},{"name":"thread_pool_borrowed","type":"f64","data":"AAAAAAAAAAAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA"},{"name":"thread_pool_available","type":"f64","data":"AAAAAAAAREAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAABEQAAAAAAAAERAAAAAAAAAREAAAAAAAABEQAAAAAAAAERAAAAAAAAAREAAAAAAAABEQAAAAAAAAERAAAAAAAAAREAAAAAAAABEQAAAAAAAAERA"},{"name":"thread_pool_waiting","type":"f64","data":"AAAAAAAAAAAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA"},{"name":"pending_bg_tasks","type":"f64","data":"AAAAAAAAAAAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAIBIQAAAAAAAAEZAAAAAAACAQ0AAAAAAAABBQAAAAAAAAD1AAAAAAAAAOUAAAAAAAAA0QAAAAAAAAC5AAAAAAAAAJEAAAAAAAAAUQAAAAAAAAAAA"},{"name":"active_threads","type":"f64","data":"AAAAAAAA8D8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAADwPwAAAAAAAPA/AAAAAAAA8D8AAAAAAADwPwAAAAAAAPA/AAAAAAAA8D8AAAAAAADwPwAAAAAAAPA/AAAAAAAA8D8AAAAAAADwPwAAAAAAAPA/"},{"name":"phase","type":"dict","values":["test","bg_completion"],"codes":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1]}]}});
@@ -0,0 +1,2 @@
+// Generated by embed_data.py
+DASHBOARD_DATA.register("async-route-sync-inner-async-bg-async-task-40users", {"stats":{"length":2,"columns":[{"name":"Type","type":"dict","values":["GET"],"codes":[0,-1]},{"name":"Name","type":"dict","values":["/async-route-sync-inner-async-bg-async-task","Aggregated"],"codes":[0,1]},{"name":"Request Count","type":"i32","data":"iAAAAIgAAAA="},{"name":"Failure Count","type":"i32","data":"AAAAAAAAAAA="},{"name":"Median Response Time","type":"f64","data":"AAAAAAA4qEAAAAAAADioQA=="},{"name":"Average Response Time","type":"f64","data":"Amo7T0Mlr0ACajtPQyWvQA=="},{"name":"Min Response Time","type":"f64","data":"AMBKtoHPakAAwEq2gc9qQA=="},{"name":"Max Response Time","type":"f64","data":"QM/O9xpQ2UBAz873GlDZQA=="},{"name":"Average Content Size","type":"f64","data":"AAAAAAAgaUAAAAAAACBpQA=="},{"name":"Requests/s","type":"f64","data":"jnLwbbF4E0COcvBtsXgTQA=="},{"name":"Failures/s","type":"f64","data":"AAAAAAAAAAAAAAAAAAAAAA=="},{"name":"50%","type":"i32","data":"HAwAABwMAAA="},{"name":"66%","type":"i32","data":"dA4AAHQOAAA="},{"name":"75%","type":"i32","data":"oA8AAKAPAAA="},{"name":"80%","type":"i32","data":"BBAAAAQQAAA="},{"name":"90%","type":"i32","data":"JBMAACQTAAA="},{"name":"95%","type":"i32","data":"mDoAAJg6AAA="},{"name":"98%","type":"i32","data":"8FUAAPBVAAA="},{"name":"99%","type":"i32","data":"wF0AAMBdAAA="},{"name":"99.9%","type":"i32","data":"kGUAAJBlAAA="},{"name":"99.99%","type":"i32","data":"kGUAAJBlAAA="},{"name":"100%","type":"i32","data":"kGUAAJBlAAA="}]},"resources":{"length":17,"columns":[{"name":"timestamp","type":"dict","values":["2025-12-10T08:19:11.334860","2025-12-10T08:19:12.350192","2025-12-10T08:19:14.356731","2025-12-10T08:19:16.367739","2025-12-10T08:19:18.377780","2025-12-10T08:19:20.386474","2025-12-10T08:19:22.394686","2025-12-10T08:19:24.402888","2025-12-10T08:19:26.407418","2025-12-10T08:19:28.412401","2025-12-10T08:19:30.422280","2025-12-10T08:19:32.433893","2025-12-10T08:19:34.441594","2025-12-10T08:19:36.450577","2025-12-10T08:19:38.458758","2025-12-10T08:19:40.467552","2025-12-10T08:19:42.478694"],"codes":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16]},{"name":"cpu_percent","type":"f64","data":"AAAAAAAAAADNzMzMzMzsPwAAAAAAAPA/mpmZmZmZ8T+amZmZmZnpP5qZmZmZmfE/AAAAAAAA8D8AAAAAAADwP2ZmZmZmZuY/mpmZmZmZ6T/NzMzMzMzsP83MzMzMzOw/mpmZmZmZ6T+amZmZmZnpP83MzMzMzOw/AAAAAAAA8D+amZmZmZnpPw=="},{"name":"memory_rss_mb","type":"f64","data":"AAAAAABMSEAAAAAAAI5IQAAAAAAAnkhAAAAAAAC0SEAAAAAAAMRIQAAAAAAA2EhAAAAAAADkSEAAAAAAAPZIQAAAAAAA/EhAAAAAAAD8SEAAAAAAAP5IQAAAAAAA/khAAAAAAAAASUAAAAAAAAZJQAAAAAAACElAAAAAAAAOSUAAAAAAAA5JQA=="},{"name":"memory_vms_mb","type":"f64","data":"AAAAoKbyGUEAAACgpvIZQQAAAKCm8hlBAAAAoKryGUEAAACgqvIZQQAAAKCq8hlBAAAAoKryGUEAAACgqvIZQQAAAKCq8hlBAAAAoKryGUEAAACgqvIZQQAAAKCq8hlBAAAAoKryGUEAAACgqvIZQQAAAKCq8hlBAAAAoKryGUEAAACgqvIZQQ=="},{"name":"process_threads","type":"i32","data":"BQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAAFAAAABQAAAAUAAAA="},{"name":"thread_pool_total","type":"f64","data":"AAAAAAAAREAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"thread_pool_borrowed","type":"f64","data":"AAAAAAAAAAAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"thread_pool_available","type":"f64","data":"AAAAAAAAREAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"thread_pool_waiting","type":"f64","data":"AAAAAAAAAAAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"pending_bg_tasks","type":"f64","data":"AAAAAAAAAAAAAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"active_threads","type":"f64","data":"AAAAAAAA8D8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fwAAAAAAAPh/AAAAAAAA+H8AAAAAAAD4fw=="},{"name":"phase","type":"dict","values":["test","bg_completion"],"codes":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1]}]}});
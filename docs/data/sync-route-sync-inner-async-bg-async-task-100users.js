@@ -0,0 +1,2 @@
+// Generated by embed_data.py
+DASHBOARD_DATA.register("sync-route-sync-inner-async-bg-async-task-100users", {"stats":{"length":2,"columns":[{"name":"Type","type":"dict","values":["GET"],"codes":[0,-1]},{"name":"Name","type":"dict","values":["/sync-route-sync-inner-async-bg-async-task","Aggregated"],"codes":[0,1]},{"name":"Request Count","type":"i32","data":"MRQAADEUAAA="},{"name":"Failure Count","type":"i32","data":"AAAAAAAAAAA="},{"name":"Median Response Time","type":"f64","data":"AAAAAACAa0AAAAAAAIBrQA=="},{"name":"Average Response Time","type":"f64","data":"QVfyXdaqa0BBV/Jd1qprQA=="},{"name":"Min Response Time","type":"f64","data":"AEBJ4fomaUAAQEnh+iZpQA=="},{"name":"Max Response Time","type":"f64","data":"AEgrXNbRdEAASCtc1tF0QA=="},{"name":"Average Content Size","type":"f64","data":"L+J50/LpaEAv4nnT8uloQA=="},{"name":"Requests/s","type":"f64","data":"R/QlPtQ9ZkBH9CU+1D1mQA=="},{"name":"Failures/s","type":"f64","data":"AAAAAAAAAAAAAAAAAAAAAA=="},{"name":"50%","type":"i32","data":"3AAAANwAAAA="},{"name":"66%","type":"i32","data":"3AAAANwAAAA="},{"name":"75%","type":"i32","data":"5gAAAOYAAAA="},{"name":"80%","type":"i32","data":"8AAAAPAAAAA="},{"name":"90%","type":"i32","data":"8AAAAPAAAAA="},{"name":"95%","type":"i32","data":"+gAAAPoAAAA="},{"name":"98%","type":"i32","data":"BAEAAAQBAAA="},{"name":"99%","type":"i32","data":"DgEAAA4BAAA="},{"name":"99.9%","type":"i32","data":"SgEAAEoBAAA="},{"name":"99.99%","type":"i32","data":"SgEAAEoBAAA="},{"name":"100%","type":"i32","data":"SgEAAEoBAAA="}]},"resources":{"length":41,"columns":[{"name":"timestamp","type":"dict","values":["2025-12-10T08:14:27.228746","2025-12-10T08:14:28.243482","2025-12-10T08:14:29.251546","2025-12-10T08:14:30.263386","2025-12-10T08:14:31.272128","2025-12-10T08:14:32.279968","2025-12-10T08:14:33.295497","2025-12-10T08:14:34.304110","2025-12-10T08:14:35.312454","2025-12-10T08:14:36.322935","2025-12-10T08:14:37.332456","2025-12-10T08:14:38.348498","2025-12-10T08:14:39.352853","2025-12-10T08:14:40.360344","2025-12-10T08:14:41.372235","2025-12-10T08:14:42.390948","2025-12-10T08:14:43.398815","2025-12-10T08:14:44.406718","2025-12-10T08:14:45.415125","2025-12-10T08:14:46.425243","2025-12-10T08:14:47.433934","2025-12-10T08:14:48.443136","2025-12-10T08:14:49.451955","2025-12-10T08:14:50.456119","2025-12-10T08:14:51.462178","2025-12-10T08:14:52.470579","2025-12-10T08:14:53.478755","2025-12-10T08:14:54.491743","2025-12-10T08:14:55.501054","2025-12-10T08:14:56.510463","2025-12-10T08:14:57.520762","2025-12-10T08:14:58.529439","2025-12-10T08:14:59.539440","2025-12-10T08:15:00.549680","2025-12-10T08:15:01.560859","2025-12-10T08:15:02.571686","2025-12-10T08:15:03.582025","2025-12-10T08:15:04.595063","2025-12-10T08:15:05.608226","2025-12-10T08:15:06.616885","2025-12-10T08:15:07.622771"],"codes":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40]},{"name":"cpu_percent","type":"f64","data":"AAAAAAAAAABmZmZmZmYKQAAAAAAAACRAAAAAAACAN0CamZmZmRk3QJqZmZmZmTtAAAAAAACANUBmZmZmZuY9QM3MzMzMzD5AZmZmZmZmPEBmZmZmZuY9QAAAAAAAADZAzczMzMxMNEDNzMzMzEw2QDMzMzMzMzhAmpmZmZkZNUAzMzMzMzMxQGZmZmZm5jVAzczMzMzMNUDNzMzMzEw3QDMzMzMzszdAzczMzMzML0DNzMzMzMw2QDMzMzMzMzdAZmZmZmZmOUBmZmZmZuY3QDMzMzMzszRAAAAAAAAAPUCamZmZmRlBQDMzMzMzM0BAzczMzMzMOkDNzMzMzMwMQDMzMzMzMxdAZmZmZmZmGkAzMzMzMzMTQM3MzMzMzBhAAAAAAAAAFECamZmZmZkXQAAAAAAAABpAAAAAAAAAGkAAAAAAAAAWQA=="},{"name":"memory_rss_mb","type":"f64","data":"AAAAAAA8SEAAAAAAAFJJQAAAAAAAJkpAAAAAAAAwS0AAAAAAAE5MQAAAAAAApE1AAAAAAAAYT0AAAAAAAC5QQAAAAAAA2FBAAAAAAACOUUAAAAAAADtSQAAAAAAAwlJAAAAAAAAyU0AAAAAAAGpTQAAAAAAAmFNAAAAAAAClU0AAAAAAAKZTQAAAAAAAtVNAAAAAAAC1U0AAAAAAALVTQAAAAAAAtVNAAAAAAAC2U0AAAAAAALZTQAAAAAAAtlNAAAAAAAC2U0AAAAAAALZTQAAAAAAAtlNAAAAAAAC2U0AAAAAAALZTQAAAAAAAtlNAAAAAAAC3U0AAAAAAALdTQAAAAAAAt1NAAAAAAAC3U0AAAAAAALdTQAAAAAAAt1NAAAAAAAC3U0AAAAAAALdTQAAAAAAAt1NAAAAAAAC3U0AAAAAAALdTQA=="},{"name":"memory_vms_mb","type":"f64","data":"AAAAMKfyGUEAAABQsPcZQQAAABB3+hlBAAAAcMH8GUEAAABwyfwZQQAAALAR/RlBAAAAsB39GUEAAACwJf0ZQQAAALAx/RlBAAAAsDn9GUEAAACwQf0ZQQAAALBN/RlBAAAAsFH9GUEAAACwVf0ZQQAAALBZ/RlBAAAAsFn9GUEAAACwWf0ZQQAAALBZ/RlBAAAAsFn9GUEAAACwWf0ZQQAAALBZ/RlBAAAAsFn9GUEAAACwWf0ZQQAAALBZ/RlBAAAAsFn9GUEAAACwWf0ZQQAAALBZ/RlBAAAAsFn9GUEAAACwWf0ZQQAAALBZ/RlBAAAAsFn9GUEAAACwWf0ZQQAAALBZ/RlBAAAAsFn9GUEAAACwWf0ZQQAAALBZ/RlBAAAAsFn9GUEAAACwWf0ZQQAAALBZ/RlBAAAAsFn9GUEAAACwWf0ZQQ=="},{"name":"process_threads","type":"i32","data":"BQAAABkAAAAkAAAALQAAAC0AAAAuAAAALgAAAC4AAAAuAAAALgAAAC4AAAAuAAAALgAAAC4AAAAuAAAALgAAAC4AAAAuAAAALgAAAC4AAAAuAAAALgAAAC4AAAAuAAAALgAAAC4AAAAuAAAALgAAAC4AAAAuAAAALgAAAC4AAAAuAAAALgAAAC4AAAAuAAAALgAAAC4AAAAuAAAALgAAAC4AAAA="},{"name":"thread_pool_total","type":"i32","data":"KAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAA="},{"name":"thread_pool_borrowed","type":"i32","data":"AAAAAAsAAAATAAAAGAAAAB0AAAAlAAAAKAAAACcAAAAoAAAAIwAAACkAAAAnAAAAKAAAACgAAAAmAAAAKAAAACgAAAAnAAAAKAAAACgAAAAoAAAAKAAAACgAAAAnAAAAKAAAACUAAAAnAAAAKAAAACgAAAAoAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA="},{"name":"thread_pool_available","type":"i32","data":"KAAAAB0AAAAVAAAAEAAAAAsAAAADAAAAAAAAAAEAAAAAAAAABQAAAP////8BAAAAAAAAAAAAAAACAAAAAAAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAAAAAAAAAMAAAABAAAAAAAAAAAAAAAAAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAA="},{"name":"thread_pool_waiting","type":"i32","data":"AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABwAAAAIAAAADAAAAAAAAAAAAAAAAAAAAAgAAAAAAAAAGAAAACAAAAAAAAAAAAAAAAwAAAAEAAAAAAAAAAQAAAAEAAAAAAAAABQAAAAAAAAAKAAAABAAAAAYAAAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA="},{"name":"pending_bg_tasks","type":"i32","data":"AAAAAB0AAABjAAAA1QAAAGcBAAAcAgAA2wIAAJ0DAABeBAAAIwUAAOUFAAB+BgAA+AYAAEIHAAB2BwAAegcAAHoHAAB+BwAAfgcAAHYHAAB0BwAAcQcAAHEHAABzBwAAcgcAAHgHAAB0BwAAbQcAAG4HAABwBwAAcgcAALEGAADyBQAALQUAAGcEAACmAwAA5wIAACkCAABrAQAAqwAAAAAAAAA="},{"name":"active_threads","type":"i32","data":"AQAAABUAAAAgAAAAKQAAACkAAAAqAAAAKgAAACoAAAAqAAAAKgAAACoAAAAqAAAAKgAAACoAAAAqAAAAKgAAACoAAAAqAAAAKgAAACoAAAAqAAAAKgAAACoAAAAqAAAAKgAAACoAAAAqAAAAKgAAACoAAAAqAAAAKgAAACoAAAAqAAAAKgAAACoAAAAqAAAAKgAAACoAAAAqAAAAKgAAACoAAAA="},{"name":"phase","type":"dict","values":["test","bg_completion"],"codes":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1]}]}});
@@ -0,0 +1,2 @@
+// Generated by embed_data.py
+DASHBOARD_DATA.register("sync-route-sync-inner-async-bg-async-task-10users", {"stats":{"length":2,"columns":[{"name":"Type","type":"dict","values":["GET"],"codes":[0,-1]},{"name":"Name","type":"dict","values":["/sync-route-sync-inner-async-bg-async-task","Aggregated"],"codes":[0,1]},{"name":"Request Count","type":"i32","data":"KgIAACoCAAA="},{"name":"Failure Count","type":"i32","data":"AAAAAAAAAAA="},{"name":"Median Response Time","type":"f64","data":"AAAAAABAakAAAAAAAEBqQA=="},{"name":"Average Response Time","type":"f64","data":"+PQrYc0VakD49CthzRVqQA=="},{"name":"Min Response Time","type":"f64","data":"AJBsvLs/aUAAkGy8uz9pQA=="},{"name":"Max Response Time","type":"f64","data":"AIAsCOXBbEAAgCwI5cFsQA=="},{"name":"Average Content Size","type":"f64","data":"AAAAAADAaEAAAAAAAMBoQA=="},{"name":"Requests/s","type":"f64","data":"MKe6HlYbM0Awp7oeVhszQA=="},{"name":"Failures/s","type":"f64","data":"AAAAAAAAAAAAAAAAAAAAAA=="},{"name":"50%","type":"i32","data":"0gAAANIAAAA="},{"name":"66%","type":"i32","data":"0gAAANIAAAA="},{"name":"75%","type":"i32","data":"0gAAANIAAAA="},{"name":"80%","type":"i32","data":"0gAAANIAAAA="},{"name":"90%","type":"i32","data":"0gAAANIAAAA="},{"name":"95%","type":"i32","data":"0gAAANIAAAA="},{"name":"98%","type":"i32","data":"3AAAANwAAAA="},{"name":"99%","type":"i32","data":"3AAAANwAAAA="},{"name":"99.9%","type":"i32","data":"5gAAAOYAAAA="},{"name":"99.99%","type":"i32","data":"5gAAAOYAAAA="},{"name":"100%","type":"i32","data":"5gAAAOYAAAA="}]},"resources":{"length":41,"columns":[{"name":"timestamp","type":"dict","values":["2025-12-10T08:12:55.347289","2025-12-10T08:12:56.362398","2025-12-10T08:12:57.376372","2025-12-10T08:12:58.385685","2025-12-10T08:12:59.392905","2025-12-10T08:13:00.404768","2025-12-10T08:13:01.414606","2025-12-10T08:13:02.423158","2025-12-10T08:13:03.431966","2025-12-10T08:13:04.443030","2025-12-10T08:13:05.453201","2025-12-10T08:13:06.465847","2025-12-10T08:13:07.477821","2025-12-10T08:13:08.486528","2025-12-10T08:13:09.500994","2025-12-10T08:13:10.513320","2025-12-10T08:13:11.525398","2025-12-10T08:13:12.533095","2025-12-10T08:13:13.539512","2025-12-10T08:13:14.549453","2025-12-10T08:13:15.560507","2025-12-10T08:13:16.569512","2025-12-10T08:13:17.583394","2025-12-10T08:13:18.595408","2025-12-10T08:13:19.614130","2025-12-10T08:13:20.624505","2025-12-10T08:13:21.631139","2025-12-10T08:13:22.639669","2025-12-10T08:13:23.648526","2025-12-10T08:13:24.656067","2025-12-10T08:13:25.660944","2025-12-10T08:13:26.665101","2025-12-10T08:13:27.676368","2025-12-10T08:13:28.690374","2025-12-10T08:13:29.700429","2025-12-10T08:13:30.710024","2025-12-10T08:13:31.717714","2025-12-10T08:13:32.727991","2025-12-10T08:13:33.738627","2025-12-10T08:13:34.752938","2025-12-10T08:13:35.765680"],"codes":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40]},{"name":"cpu_percent","type":"f64","data":"AAAAAAAAAAAzMzMzMzPzP5qZmZmZmRFAzczMzMzMFEAzMzMzMzMRQJqZmZmZmRNAMzMzMzMzB0BmZmZmZmYQQM3MzMzMzBZAAAAAAAAAFEDNzMzMzMwUQDMzMzMzMw9AMzMzMzMzE0BmZmZmZmYaQAAAAAAAABhAmpmZmZmZE0BmZmZmZmYQQJqZmZmZmRNAMzMzMzMzFUDNzMzMzMwUQGZmZmZmZhhAzczMzMzMEkCamZmZmZkXQJqZmZmZmRNAmpmZmZmZGUCamZmZmZkVQAAAAAAAABpAMzMzMzMzE0BmZmZmZmYSQDMzMzMzMxVAMzMzMzMzC0CamZmZmZnpP5qZmZmZmfE/mpmZmZmZ6T9mZmZmZmb2PzMzMzMzM/M/mpmZmZmZ+T/NzMzMzMz0P83MzMzMzPQ/mpmZmZmZ+T8AAAAAAAD4Pw=="},{"name":"memory_rss_mb","type":"f64","data":"AAAAAACGSEAAAAAAAPJIQAAAAAAAJElAAAAAAABGSUAAAAAAAGxJQAAAAAAAjElAAAAAAAC2SUAAAAAAANJJQAAAAAAA7klAAAAAAAAUSkAAAAAAADpKQAAAAAAAUEpAAAAAAABWSkAAAAAAAFZKQAAAAAAAVkpAAAAAAABWSkAAAAAAAFZKQAAAAAAAVkpAAAAAAABWSkAAAAAAAFZKQAAAAAAAVkpAAAAAAABWSkAAAAAAAFZKQAAAAAAAVkpAAAAAAABYSkAAAAAAAFRKQAAAAAAAVEpAAAAAAABUSkAAAAAAAFRKQAAAAAAAVEpAAAAAAABUSkAAAAAAAFRKQAAAAAAAVEpAAAAAAABUSkAAAAAAAFRKQAAAAAAAVEpAAAAAAABUSkAAAAAAAFRKQAAAAAAAVEpAAAAAAABUSkAAAAAAAFRKQA=="},{"name":"memory_vms_mb","type":"f64","data":"AAAAMLjyGUEAAABw+fMZQQAAADC+9BlBAAAAML70GUEAAAAwvvQZQQAAADC+9BlBAAAAMML0GUEAAAAwwvQZQQAAADDC9BlBAAAAMML0GUEAAABwBvUZQQAAAHAG9RlBAAAAcAb1GUEAAABwBvUZQQAAAHAG9RlBAAAAcAb1GUEAAABwBvUZQQAAAHAG9RlBAAAAcAb1GUEAAABwBvUZQQAAAHAG9RlBAAAAcAb1GUEAAABwBvUZQQAAAHAG9RlBAAAAcAb1GUEAAAAwxvQZQQAAADDG9BlBAAAAMMb0GUEAAAAwxvQZQQAAADDG9BlBAAAAMMb0GUEAAAAwxvQZQQAAADDG9BlBAAAAMMb0GUEAAAAwxvQZQQAAADDG9BlBAAAAMMb0GUEAAAAwxvQZQQAAADDG9BlBAAAAMMb0GUEAAAAwxvQZQQ=="},{"name":"process_threads","type":"i32","data":"BQAAAAoAAAANAAAADQAAAA0AAAANAAAADQAAAA0AAAANAAAADQAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAADgAAAA0AAAANAAAADQAAAA0AAAANAAAADQAAAA0AAAANAAAADQAAAA0AAAANAAAADQAAAA0AAAANAAAADQAAAA0AAAA="},{"name":"thread_pool_total","type":"i32","data":"KAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAA="},{"name":"thread_pool_borrowed","type":"i32","data":"AAAAAAIAAAAFAAAAAQAAAAYAAAAGAAAABgAAAAUAAAACAAAAAwAAAAEAAAAEAAAABgAAAAUAAAAHAAAAAwAAAAYAAAAHAAAAAwAAAAQAAAAEAAAABgAAAAMAAAADAAAAAgAAAAIAAAADAAAAAgAAAAMAAAACAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA="},{"name":"thread_pool_available","type":"i32","data":"KAAAACYAAAAjAAAAJwAAACIAAAAiAAAAIgAAACMAAAAmAAAAJQAAACcAAAAkAAAAIgAAACMAAAAhAAAAJQAAACIAAAAhAAAAJQAAACQAAAAkAAAAIgAAACUAAAAlAAAAJgAAACYAAAAlAAAAJgAAACUAAAAmAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAA="},{"name":"thread_pool_waiting","type":"i32","data":"AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA="},{"name":"pending_bg_tasks","type":"i32","data":"AAAAAAgAAAAbAAAAMgAAAEEAAABWAAAAagAAAH0AAACSAAAApQAAALoAAADEAAAAwAAAAL8AAAC+AAAAwQAAAL4AAAC9AAAAvwAAAL4AAAC+AAAAvgAAAMIAAADCAAAAxQAAAMQAAADEAAAAwgAAAMIAAADBAAAAvwAAAK4AAACXAAAAhAAAAHEAAABdAAAASQAAADcAAAAlAAAAEQAAAAAAAAA="},{"name":"active_threads","type":"i32","data":"AQAAAAYAAAAJAAAACQAAAAkAAAAJAAAACQAAAAkAAAAJAAAACQAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAkAAAAJAAAACQAAAAkAAAAJAAAACQAAAAkAAAAJAAAACQAAAAkAAAAJAAAACQAAAAkAAAAJAAAACQAAAAkAAAA="},{"name":"phase","type":"dict","values":["test","bg_completion"],"codes":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1]}]}});
@@ -0,0 +1,2 @@
+// Generated by embed_data.py
+DASHBOARD_DATA.register("sync-route-sync-inner-async-bg-async-task-40users", {"stats":{"length":2,"columns":[{"name":"Type","type":"dict","values":["GET"],"codes":[0,-1]},{"name":"Name","type":"dict","values":["/sync-route-sync-inner-async-bg-async-task","Aggregated"],"codes":[0,1]},{"name":"Request Count","type":"i32","data":"aQgAAGkIAAA="},{"name":"Failure Count","type":"i32","data":"AAAAAAAAAAA="},{"name":"Median Response Time","type":"f64","data":"AAAAAABAakAAAAAAAEBqQA=="},{"name":"Average Response Time","type":"f64","data":"VymfGGY1akBXKZ8YZjVqQA=="},{"name":"Min Response Time","type":"f64","data":"AMAZhSRAaUAAwBmFJEBpQA=="},{"name":"Max Response Time","type":"f64","data":"AHBpkTQAb0AAcGmRNABvQA=="},{"name":"Average Content Size","type":"f64","data":"gg6WQlDVaECCDpZCUNVoQA=="},{"name":"Requests/s","type":"f64","data":"KujONHuGUkAq6M40e4ZSQA=="},{"name":"Failures/s","type":"f64","data":"AAAAAAAAAAAAAAAAAAAAAA=="},{"name":"50%","type":"i32","data":"0gAAANIAAAA="},{"name":"66%","type":"i32","data":"0gAAANIAAAA="},{"name":"75%","type":"i32","data":"0gAAANIAAAA="},{"name":"80%","type":"i32","data":"0gAAANIAAAA="},{"name":"90%","type":"i32","data":"0gAAANIAAAA="},{"name":"95%","type":"i32","data":"3AAAANwAAAA="},{"name":"98%","type":"i32","data":"3AAAANwAAAA="},{"name":"99%","type":"i32","data":"5gAAAOYAAAA="},{"name":"99.9%","type":"i32","data":"+gAAAPoAAAA="},{"name":"99.99%","type":"i32","data":"+gAAAPoAAAA="},{"name":"100%","type":"i32","data":"+gAAAPoAAAA="}]},"resources":{"length":41,"columns":[{"name":"timestamp","type":"dict","values":["2025-12-10T08:13:41.251578","2025-12-10T08:13:42.264766","2025-12-10T08:13:43.270947","2025-12-10T08:13:44.283370","2025-12-10T08:13:45.294022","2025-12-10T08:13:46.308362","2025-12-10T08:13:47.316837","2025-12-10T08:13:48.322614","2025-12-10T08:13:49.334806","2025-12-10T08:13:50.343073","2025-12-10T08:13:51.352146","2025-12-10T08:13:52.360420","2025-12-10T08:13:53.371538","2025-12-10T08:13:54.383829","2025-12-10T08:13:55.396654","2025-12-10T08:13:56.403186","2025-12-10T08:13:57.415760","2025-12-10T08:13:58.426678","2025-12-10T08:13:59.431623","2025-12-10T08:14:00.441950","2025-12-10T08:14:01.453753","2025-12-10T08:14:02.462993","2025-12-10T08:14:03.473694","2025-12-10T08:14:04.483259","2025-12-10T08:14:05.489316","2025-12-10T08:14:06.501322","2025-12-10T08:14:07.508991","2025-12-10T08:14:08.520264","2025-12-10T08:14:09.533428","2025-12-10T08:14:10.545439","2025-12-10T08:14:11.556325","2025-12-10T08:14:12.562760","2025-12-10T08:14:13.571337","2025-12-10T08:14:14.584647","2025-12-10T08:14:15.597848","2025-12-10T08:14:16.609682","2025-12-10T08:14:17.623005","2025-12-10T08:14:18.634672","2025-12-10T08:14:19.645145","2025-12-10T08:14:20.658789","2025-12-10T08:14:21.671985"],"codes":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40]},{"name":"cpu_percent","type":"f64","data":"AAAAAAAAAACamZmZmZkBQGZmZmZmZiFAmpmZmZmZKEAAAAAAAAAxQAAAAAAAADJAZmZmZmZmJkAzMzMzMzMxQGZmZmZm5jBAzczMzMxMMkAAAAAAAAAxQDMzMzMzszJAmpmZmZmZMkDNzMzMzMwxQM3MzMzMTDBAzczMzMzML0DNzMzMzEwzQJqZmZmZGTBAMzMzMzMzL0CamZmZmZkyQGZmZmZmZi5AzczMzMxMMUAzMzMzM7MyQM3MzMzMzDJAZmZmZmbmMEDNzMzMzMwqQDMzMzMzszFAMzMzMzOzNUDNzMzMzMwxQAAAAAAAADRAmpmZmZmZK0DNzMzMzMwAQGZmZmZmZg5AmpmZmZmZDUAzMzMzMzMLQDMzMzMzMwtAmpmZmZmZDUBmZmZmZmYOQGZmZmZmZgpAMzMzMzMzC0DNzMzMzMwMQA=="},{"name":"memory_rss_mb","type":"f64","data":"AAAAAABKSEAAAAAAAN5IQAAAAAAAQklAAAAAAADOSUAAAAAAAJRKQAAAAAAAGktAAAAAAACsS0AAAAAAADJMQAAAAAAArkxAAAAAAAA+TUAAAAAAAMZNQAAAAAAAOE5AAAAAAACCTkAAAAAAAK5OQAAAAAAAsk5AAAAAAACyTkAAAAAAALJOQAAAAAAAsk5AAAAAAACyTkAAAAAAALxOQAAAAAAAvE5AAAAAAAC4TkAAAAAAALhOQAAAAAAAuE5AAAAAAAC4TkAAAAAAALhOQAAAAAAAuE5AAAAAAADKTkAAAAAAAMpOQAAAAAAAyk5AAAAAAADKTkAAAAAAAMpOQAAAAAAAyk5AAAAAAADKTkAAAAAAAMpOQAAAAAAAyk5AAAAAAADKTkAAAAAAAMpOQAAAAAAAyk5AAAAAAADKTkAAAAAAAMpOQA=="},{"name":"memory_vms_mb","type":"f64","data":"AAAAoKnyGUEAAAAgMPUZQQAAAGBx9hlBAAAAgHb3GUEAAACAfPkZQQAAAICA+RlBAAAAgIT5GUEAAACAiPkZQQAAAICM+RlBAAAAgJD5GUEAAACAlPkZQQAAAICY+RlBAAAAgJj5GUEAAACAnPkZQQAAAAAc+RlBAAAAABz5GUEAAAAAHPkZQQAAAAAc+RlBAAAAABz5GUEAAAAAHPkZQQAAAAAc+RlBAAAAwNv4GUEAAADA2/gZQQAAAMDb+BlBAAAAwNv4GUEAAADA2/gZQQAAAMDb+BlBAAAAwNz5GUEAAADA3PkZQQAAAMDc+RlBAAAAwNz5GUEAAADA3PkZQQAAAMDc+RlBAAAAwNz5GUEAAADA3PkZQQAAAMDc+RlBAAAAwNz5GUEAAADA3PkZQQAAAMDc+RlBAAAAwNz5GUEAAADA3PkZQQ=="},{"name":"process_threads","type":"i32","data":"BQAAAA8AAAAUAAAAGAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAgAAAAIAAAACAAAAAeAAAAHgAAAB4AAAAeAAAAHgAAAB4AAAAeAAAAHQAAAB0AAAAdAAAAHQAAAB0AAAAdAAAAIQAAACEAAAAhAAAAIQAAACEAAAAhAAAAIQAAACEAAAAhAAAAIQAAACEAAAAhAAAAIQAAACEAAAA="},{"name":"thread_pool_total","type":"i32","data":"KAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAA="},{"name":"thread_pool_borrowed","type":"i32","data":"AAAAAAMAAAAIAAAADQAAABUAAAAPAAAAEQAAABAAAAAOAAAAEAAAABMAAAARAAAADwAAAAwAAAAPAAAAEAAAABAAAAAPAAAADwAAAA8AAAAOAAAADQAAABYAAAANAAAAEAAAABIAAAANAAAADgAAABYAAAAMAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA="},{"name":"thread_pool_available","type":"i32","data":"KAAAACUAAAAgAAAAGwAAABMAAAAZAAAAFwAAABgAAAAaAAAAGAAAABUAAAAXAAAAGQAAABwAAAAZAAAAGAAAABgAAAAZAAAAGQAAABkAAAAaAAAAGwAAABIAAAAbAAAAGAAAABYAAAAbAAAAGgAAABIAAAAcAAAAJwAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAA="},{"name":"thread_pool_waiting","type":"i32","data":"AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA="},{"name":"pending_bg_tasks","type":"i32","data":"AAAAABIAAAA1AAAAawAAALYAAAAIAQAAVQEAAKQBAADuAQAAPQIAAIkCAADKAgAA9AIAAAoDAAAJAwAABQMAAAcDAAAIAwAADAMAAA0DAAARAwAADAMAAAADAAAHAwAABwMAAAUDAAAMAwAACQMAAAUDAAAMAwAAAwMAALoCAABtAgAAHgIAANIBAACCAQAAMwEAAN0AAACQAAAAQQAAAAAAAAA="},{"name":"active_threads","type":"i32","data":"AQAAAAsAAAAQAAAAFAAAABwAAAAcAAAAHAAAABwAAAAcAAAAHAAAABwAAAAcAAAAHAAAABwAAAAaAAAAGgAAABoAAAAaAAAAGgAAABoAAAAaAAAAGQAAABkAAAAZAAAAGQAAABkAAAAZAAAAHQAAAB0AAAAdAAAAHQAAAB0AAAAdAAAAHQAAAB0AAAAdAAAAHQAAAB0AAAAdAAAAHQAAAB0AAAA="},{"name":"phase","type":"dict","values":["test","bg_completion"],"codes":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1]}]}});
@@ -0,0 +1,2 @@
+// Generated by embed_data.py
+DASHBOARD_DATA.register("sync-route-sync-inner-async-bg-sync-task-100users", {"stats":{"length":2,"columns":[{"name":"Type","type":"dict","values":["GET"],"codes":[0,-1]},{"name":"Name","type":"dict","values":["/sync-route-sync-inner-async-bg-sync-task","Aggregated"],"codes":[0,1]},{"name":"Request Count","type":"i32","data":"vQAAAL0AAAA="},{"name":"Failure Count","type":"i32","data":"AAAAAAAAAAA="},{"name":"Median Response Time","type":"f64","data":"AAAAAAAwwUAAAAAAADDBQA=="},{"name":"Average Response Time","type":"f64","data":"7iLjqbFMukDuIuOpsUy6QA=="},{"name":"Min Response Time","type":"f64","data":"AMDuUX91aUAAwO5Rf3VpQA=="},{"name":"Max Response Time","type":"f64","data":"wDxe1tbcxUDAPF7W1tzFQA=="},{"name":"Average Content Size","type":"f64","data":"GIZhGIbBZkAYhmEYhsFmQA=="},{"name":"Requests/s","type":"f64","data":"vAZsiPD6IEC8BmyI8PogQA=="},{"name":"Failures/s","type":"f64","data":"AAAAAAAAAAAAAAAAAAAAAA=="},{"name":"50%","type":"i32","data":"YCIAAGAiAAA="},{"name":"66%","type":"i32","data":"uCQAALgkAAA="},{"name":"75%","type":"i32","data":"HCUAABwlAAA="},{"name":"80%","type":"i32","data":"rCYAAKwmAAA="},{"name":"90%","type":"i32","data":"+CoAAPgqAAA="},{"name":"95%","type":"i32","data":"+CoAAPgqAAA="},{"name":"98%","type":"i32","data":"+CoAAPgqAAA="},{"name":"99%","type":"i32","data":"+CoAAPgqAAA="},{"name":"99.9%","type":"i32","data":"+CoAAPgqAAA="},{"name":"99.99%","type":"i32","data":"+CoAAPgqAAA="},{"name":"100%","type":"i32","data":"+CoAAPgqAAA="}]},"resources":{"length":82,"columns":[{"name":"timestamp","type":"dict","values":["2025-12-10T08:11:27.707010","2025-12-10T08:11:28.721925","2025-12-10T08:11:29.730947","2025-12-10T08:11:30.741915","2025-12-10T08:11:31.770699","2025-12-10T08:11:32.780829","2025-12-10T08:11:33.792697","2025-12-10T08:11:34.799896","2025-12-10T08:11:35.811369","2025-12-10T08:11:36.825709","2025-12-10T08:11:37.836214","2025-12-10T08:11:38.850655","2025-12-10T08:11:39.859559","2025-12-10T08:11:40.872609","2025-12-10T08:11:41.886890","2025-12-10T08:11:42.896082","2025-12-10T08:11:43.906491","2025-12-10T08:11:44.915051","2025-12-10T08:11:45.922417","2025-12-10T08:11:46.934874","2025-12-10T08:11:47.945449","2025-12-10T08:11:48.958452","2025-12-10T08:11:49.969214","2025-12-10T08:11:50.977869","2025-12-10T08:11:51.986314","2025-12-10T08:11:52.995098","2025-12-10T08:11:54.008790","2025-12-10T08:11:55.017067","2025-12-10T08:11:56.025585","2025-12-10T08:11:57.038851","2025-12-10T08:11:58.048794","2025-12-10T08:11:59.054951","2025-12-10T08:12:00.065820","2025-12-10T08:12:01.075403","2025-12-10T08:12:02.085609","2025-12-10T08:12:03.094888","2025-12-10T08:12:04.102911","2025-12-10T08:12:05.114668","2025-12-10T08:12:06.127105","2025-12-10T08:12:07.134229","2025-12-10T08:12:08.143257","2025-12-10T08:12:09.153317","2025-12-10T08:12:10.163579","2025-12-10T08:12:11.171813","2025-12-10T08:12:12.185280","2025-12-10T08:12:13.194508","2025-12-10T08:12:14.204074","2025-12-10T08:12:15.218100","2025-12-10T08:12:16.228066","2025-12-10T08:12:17.239162","2025-12-10T08:12:18.252844","2025-12-10T08:12:19.266880","2025-12-10T08:12:20.277977","2025-12-10T08:12:21.286401","2025-12-10T08:12:22.297229","2025-12-10T08:12:23.306727","2025-12-10T08:12:24.314849","2025-12-10T08:12:25.324635","2025-12-10T08:12:26.330951","2025-12-10T08:12:27.338423","2025-12-10T08:12:28.346427","2025-12-10T08:12:29.352537","2025-12-10T08:12:30.361737","2025-12-10T08:12:31.374126","2025-12-10T08:12:32.384013","2025-12-10T08:12:33.392504","2025-12-10T08:12:34.399870","2025-12-10T08:12:35.416560","2025-12-10T08:12:36.427263","2025-12-10T08:12:37.436838","2025-12-10T08:12:38.445650","2025-12-10T08:12:39.457820","2025-12-10T08:12:40.469102","2025-12-10T08:12:41.479156","2025-12-10T08:12:42.492915","2025-12-10T08:12:43.505530","2025-12-10T08:12:44.519340","2025-12-10T08:12:45.526937","2025-12-10T08:12:46.539344","2025-12-10T08:12:47.552399","2025-12-10T08:12:48.560580","2025-12-10T08:12:49.574227"],"codes":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81]},{"name":"cpu_percent","type":"f64","data":"AAAAAAAAAADNzMzMzMwSQJqZmZmZmQ1AZmZmZmZm9j8zMzMzMzMHQDMzMzMzM+M/MzMzMzMz0z8zMzMzMzPTP5qZmZmZmdk/mpmZmZmZ2T+amZmZmZnZP83MzMzMzBZAZmZmZmZmI0AAAAAAAADgPwAAAAAAAOA/MzMzMzMz0z8zMzMzMzPTPzMzMzMzM9M/MzMzMzMz0z+amZmZmZnZPzMzMzMzM9M/mpmZmZmZBUAAAAAAAAAeQAAAAAAAAPg/MzMzMzMz0z+amZmZmZnJP5qZmZmZmdk/MzMzMzMz0z8zMzMzMzPTP5qZmZmZmdk/ZmZmZmZm5j9mZmZmZmbmPwAAAAAAABZAZmZmZmZmDkBmZmZmZmbmP5qZmZmZmdk/MzMzMzMz0z+amZmZmZnZPzMzMzMzM9M/MzMzMzMz0z8zMzMzMzPTP83MzMzMzABAzczMzMzMEEBmZmZmZmYCQJqZmZmZmdk/MzMzMzMz0z8zMzMzMzPTP5qZmZmZmdk/MzMzMzMz0z+amZmZmZnZPwAAAAAAAOA/mpmZmZmZ8T8AAAAAAAD4PwAAAAAAAPg/mpmZmZmZ2T8zMzMzMzPTPzMzMzMzM9M/mpmZmZmZyT8zMzMzMzPTPzMzMzMzM9M/MzMzMzMz0z/NzMzMzMz0PwAAAAAAAPA/AAAAAAAA+D+amZmZmZnZP5qZmZmZmdk/MzMzMzMz0z+amZmZmZnZPzMzMzMzM9M/mpmZmZmZyT8zMzMzMzPTP5qZmZmZmfk/mpmZmZmZ8T8AAAAAAADwPzMzMzMzM9M/mpmZmZmZ2T+amZmZmZnZP5qZmZmZmdk/mpmZmZmZ2T+amZmZmZnZP5qZmZmZmdk/mpmZmZmZ6T8="},{"name":"memory_rss_mb","type":"f64","data":"AAAAAABGSEAAAAAAAMZJQAAAAAAAMkpAAAAAAABwSkAAAAAAAKpKQAAAAAAA4kpAAAAAAADmSkAAAAAAAOZKQAAAAAAA5kpAAAAAAADmSkAAAAAAAOZKQAAAAAAA6kpAAAAAAABuS0AAAAAAAHJLQAAAAAAAcktAAAAAAAByS0AAAAAAAHJLQAAAAAAAdEtAAAAAAAB0S0AAAAAAAHRLQAAAAAAAdEtAAAAAAAB0S0AAAAAAAHRLQAAAAAAAdEtAAAAAAAB0S0AAAAAAAHRLQAAAAAAAdEtAAAAAAAB0S0AAAAAAABRJQAAAAAAAFElAAAAAAAAiSUAAAAAAACJJQAAAAAAAQElAAAAAAABMSUAAAAAAAExJQAAAAAAATElAAAAAAABMSUAAAAAAAExJQAAAAAAATElAAAAAAABMSUAAAAAAAExJQAAAAAAATElAAAAAAABMSUAAAAAAAExJQAAAAAAATElAAAAAAABMSUAAAAAAAExJQAAAAAAATElAAAAAAABMSUAAAAAAAExJQAAAAAAATElAAAAAAABMSUAAAAAAAExJQAAAAAAATElAAAAAAABMSUAAAAAAAExJQAAAAAAATElAAAAAAABMSUAAAAAAAExJQAAAAAAATElAAAAAAABMSUAAAAAAAExJQAAAAAAATElAAAAAAABMSUAAAAAAAExJQAAAAAAATElAAAAAAABMSUAAAAAAAExJQAAAAAAATElAAAAAAABMSUAAAAAAAExJQAAAAAAATElAAAAAAABMSUAAAAAAAExJQAAAAAAATElAAAAAAABMSUAAAAAAAExJQAAAAAAATElAAAAAAABMSUAAAAAAAExJQAAAAAAATElAAAAAAABMSUA="},{"name":"memory_vms_mb","type":"f64","data":"AAAA8KjyGUEAAAAwt/wZQQAAADC7/BlBAAAAMLv8GUEAAAAwu/wZQQAAADC//BlBAAAAML/8GUEAAAAwv/wZQQAAADC//BlBAAAAML/8GUEAAAAwv/wZQQAAADC//BlBAAAAMMP8GUEAAAAww/wZQQAAADDD/BlBAAAAMMP8GUEAAAAww/wZQQAAADDD/BlBAAAAMMP8GUEAAAAww/wZQQAAADDD/BlBAAAAMMP8GUEAAAAww/wZQQAAADDD/BlBAAAAMMP8GUEAAAAww/wZQQAAADDD/BlBAAAAMMP8GUEAAAAww/wZQQAAADDD/BlBAAAAMMP8GUEAAAAww/wZQQAAADDD/BlBAAAAMMP8GUEAAAAww/wZQQAAADDD/BlBAAAAMMP8GUEAAAAww/wZQQAAADDD/BlBAAAAMMP8GUEAAAAww/wZQQAAADDD/BlBAAAAMMP8GUEAAAAww/wZQQAAADDD/BlBAAAAMMP8GUEAAAAww/wZQQAAADDD/BlBAAAAMMP8GUEAAAAww/wZQQAAADDD/BlBAAAAMMP8GUEAAAAww/wZQQAAADDD/BlBAAAAMMP8GUEAAAAww/wZQQAAADDD/BlBAAAAMMP8GUEAAAAww/wZQQAAADDD/BlBAAAAMMP8GUEAAAAww/wZQQAAADDD/BlBAAAAMMP8GUEAAAAww/wZQQAAADDD/BlBAAAAMMP8GUEAAAAww/wZQQAAADDD/BlBAAAAMMP8GUEAAAAww/wZQQAAADDD/BlBAAAAMMP8GUEAAAAww/wZQQAAADDD/BlBAAAAMMP8GUEAAAAww/wZQQAAADDD/BlBAAAAMMP8GUEAAAAww/wZQQAAADDD/BlBAAAAMMP8GUE="},{"name":"process_threads","type":"i32","data":"BQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAA=="},{"name":"thread_pool_total","type":"i32","data":"KAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAAA=="},{"name":"thread_pool_borrowed","type":"i32","data":"AAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACcAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAfAAAAFAAAAAkAAAAJAAAACQAAAAkAAAAJAAAACQAAAAkAAAAIAAAAAAAAAA=="},{"name":"thread_pool_available","type":"i32","data":"KAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJAAAAFAAAAB8AAAAfAAAAHwAAAB8AAAAfAAAAHwAAAB8AAAAgAAAAKAAAAA=="},{"name":"thread_pool_waiting","type":"i32","data":"AAAAAAAAAAAtAAAARAAAAFgAAABsAAAAbAAAAGwAAABsAAAAbAAAAGwAAABcAAAArAAAAKsAAACrAAAAqwAAAKsAAACrAAAAqwAAAKsAAACrAAAApAAAAJ8AAACpAAAAqQAAAKkAAACpAAAAqQAAAKkAAACpAAAAqQAAAJ0AAACCAAAAgQAAAIEAAACBAAAAgQAAAIEAAACBAAAAgQAAAIEAAAByAAAAYgAAAFoAAABZAAAAWQAAAFkAAABZAAAAWQAAAFkAAABYAAAASwAAAD0AAAAyAAAAMQAAADEAAAAxAAAAMQAAADEAAAAxAAAAMAAAAB8AAAAVAAAACgAAAAkAAAAJAAAACQAAAAkAAAAJAAAACQAAAAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=="},{"name":"pending_bg_tasks","type":"i32","data":"AAAAACEAAAAuAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAABDAAAAcAAAAG8AAABvAAAAbwAAAG8AAABvAAAAbwAAAG8AAABvAAAAbwAAAGsAAABtAAAAbQAAAG0AAABtAAAAbQAAAG0AAABtAAAAbQAAAGAAAABmAAAAhAAAAIYAAACGAAAAhgAAAIYAAACGAAAAhgAAAIYAAAB8AAAAgAAAAIIAAACBAAAAgQAAAIEAAACBAAAAgQAAAIEAAACAAAAAcwAAAGUAAABaAAAAWQAAAFkAAABZAAAAWQAAAFkAAABZAAAAWAAAAEcAAAA9AAAAMgAAADEAAAAxAAAAMQAAADEAAAAxAAAAMQAAADAAAAAfAAAAFAAAAAkAAAAJAAAACQAAAAkAAAAJAAAACQAAAAkAAAAIAAAAAAAAAA=="},{"name":"active_threads","type":"i32","data":"AQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAAA=="},{"name":"phase","type":"dict","values":["test","bg_completion"],"codes":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1]}]}});
@@ -0,0 +1,2 @@
+// Generated by embed_data.py
+DASHBOARD_DATA.register("sync-route-sync-inner-async-bg-sync-task-10users", {"stats":{"length":2,"columns":[{"name":"Type","type":"dict","values":["GET"],"codes":[0,-1]},{"name":"Name","type":"dict","values":["/sync-route-sync-inner-async-bg-sync-task","Aggregated"],"codes":[0,1]},{"name":"Request Count","type":"i32","data":"fwAAAH8AAAA="},{"name":"Failure Count","type":"i32","data":"AAAAAAAAAAA="},{"name":"Median Response Time","type":"f64","data":"AAAAAAAgd0AAAAAAACB3QA=="},{"name":"Average Response Time","type":"f64","data":"ed6WpmcAmEB53pamZwCYQA=="},{"name":"Min Response Time","type":"f64","data":"AFB/lcOpaUAAUH+Vw6lpQA=="},{"name":"Max Response Time","type":"f64","data":"gG+df+egv0CAb51/56C/QA=="},{"name":"Average Content Size","type":"f64","data":"mUwmk8nEZkCZTCaTycRmQA=="},{"name":"Requests/s","type":"f64","data":"jndCuFVzFUCOd0K4VXMVQA=="},{"name":"Failures/s","type":"f64","data":"AAAAAAAAAAAAAAAAAAAAAA=="},{"name":"50%","type":"i32","data":"cgEAAHIBAAA="},{"name":"66%","type":"i32","data":"1gEAANYBAAA="},{"name":"75%","type":"i32","data":"TgIAAE4CAAA="},{"name":"80%","type":"i32","data":"igIAAIoCAAA="},{"name":"90%","type":"i32","data":"3B4AANweAAA="},{"name":"95%","type":"i32","data":"QB8AAEAfAAA="},{"name":"98%","type":"i32","data":"QB8AAEAfAAA="},{"name":"99%","type":"i32","data":"QB8AAEAfAAA="},{"name":"99.9%","type":"i32","data":"pB8AAKQfAAA="},{"name":"99.99%","type":"i32","data":"pB8AAKQfAAA="},{"name":"100%","type":"i32","data":"pB8AAKQfAAA="}]},"resources":{"length":43,"columns":[{"name":"timestamp","type":"dict","values":["2025-12-10T08:09:41.099031","2025-12-10T08:09:42.116279","2025-12-10T08:09:43.125680","2025-12-10T08:09:44.134441","2025-12-10T08:09:45.143260","2025-12-10T08:09:46.151029","2025-12-10T08:09:47.159955","2025-12-10T08:09:48.169408","2025-12-10T08:09:49.176455","2025-12-10T08:09:50.187761","2025-12-10T08:09:51.197543","2025-12-10T08:09:52.210491","2025-12-10T08:09:53.222095","2025-12-10T08:09:54.229115","2025-12-10T08:09:55.237453","2025-12-10T08:09:56.246153","2025-12-10T08:09:57.253506","2025-12-10T08:09:58.261797","2025-12-10T08:09:59.268041","2025-12-10T08:10:00.276202","2025-12-10T08:10:01.285474","2025-12-10T08:10:02.294314","2025-12-10T08:10:03.305057","2025-12-10T08:10:04.313519","2025-12-10T08:10:05.324687","2025-12-10T08:10:06.334534","2025-12-10T08:10:07.342310","2025-12-10T08:10:08.349556","2025-12-10T08:10:09.361232","2025-12-10T08:10:10.370100","2025-12-10T08:10:11.385158","2025-12-10T08:10:12.388965","2025-12-10T08:10:13.395315","2025-12-10T08:10:14.405167","2025-12-10T08:10:15.417251","2025-12-10T08:10:16.424231","2025-12-10T08:10:17.433489","2025-12-10T08:10:18.446222","2025-12-10T08:10:19.457961","2025-12-10T08:10:20.464099","2025-12-10T08:10:21.473576","2025-12-10T08:10:22.483925","2025-12-10T08:10:23.495290"],"codes":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42]},{"name":"cpu_percent","type":"f64","data":"AAAAAAAAAACamZmZmZkBQDMzMzMzMxFAMzMzMzMzE0CamZmZmZnpP5qZmZmZmdk/mpmZmZmZyT+amZmZmZnZPzMzMzMzM9M/mpmZmZmZ2T8zMzMzMzPTPzMzMzMzMwNAMzMzMzMzEUAzMzMzMzMVQM3MzMzMzPQ/mpmZmZmZyT+amZmZmZnJP5qZmZmZmck/mpmZmZmZyT8zMzMzMzPTPzMzMzMzM9M/zczMzMzMAEAzMzMzMzMRQGZmZmZmZhJAmpmZmZmZAUAzMzMzMzPTP5qZmZmZmdk/mpmZmZmZ2T+amZmZmZnZPzMzMzMzM9M/mpmZmZmZ2T8AAAAAAADgPwAAAAAAAARAMzMzMzMz8z9mZmZmZmbmPzMzMzMzM9M/mpmZmZmZ2T+amZmZmZnZP5qZmZmZmdk/MzMzMzMz0z8zMzMzMzPTP2ZmZmZmZuY/MzMzMzMz8z8="},{"name":"memory_rss_mb","type":"f64","data":"AAAAAABMSEAAAAAAANhIQAAAAAAAaklAAAAAAADCSUAAAAAAAMxJQAAAAAAAzklAAAAAAADOSUAAAAAAAM5JQAAAAAAAzklAAAAAAADOSUAAAAAAAM5JQAAAAAAAzklAAAAAAADOSUAAAAAAAM5JQAAAAAAA0ElAAAAAAADQSUAAAAAAANBJQAAAAAAASkVAAAAAAABKRUAAAAAAAEpFQAAAAAAASkVAAAAAAABMRUAAAAAAAExFQAAAAAAAUEVAAAAAAABQRUAAAAAAAFRFQAAAAAAAVEVAAAAAAABURUAAAAAAAFRFQAAAAAAAVEVAAAAAAABURUAAAAAAAFRFQAAAAAAAVEVAAAAAAABURUAAAAAAAFRFQAAAAAAAVEVAAAAAAABURUAAAAAAAFRFQAAAAAAAVEVAAAAAAABURUAAAAAAAFRFQAAAAAAAVEVAAAAAAABURUA="},{"name":"memory_vms_mb","type":"f64","data":"AAAAgKnyGUEAAAAALPUZQQAAACA1+hlBAAAAwLf8GUEAAADAt/wZQQAAAMC3/BlBAAAAwLf8GUEAAADAt/wZQQAAAMC3/BlBAAAAwLf8GUEAAADAt/wZQQAAAMC3/BlBAAAAwLf8GUEAAADAt/wZQQAAAMC3/BlBAAAAwLf8GUEAAADAt/wZQQAAAMC3/BlBAAAAwLf8GUEAAADAt/wZQQAAAMC3/BlBAAAAwLf8GUEAAADAt/wZQQAAAAD4/BlBAAAAAPj8GUEAAAAA+PwZQQAAAAD4/BlBAAAAAPj8GUEAAAAA+PwZQQAAAAD4/BlBAAAAAPj8GUEAAAAA+PwZQQAAAAD4/BlBAAAAAPj8GUEAAAAA+PwZQQAAAAD4/BlBAAAAAPj8GUEAAAAA+PwZQQAAAAD4/BlBAAAAAPj8GUEAAAAA+PwZQQAAAAD4/BlBAAAAAPj8GUE="},{"name":"process_threads","type":"i32","data":"BQAAAA8AAAAjAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAuAAAALgAAAC4AAAAuAAAALgAAAC4AAAAuAAAALgAAAC4AAAAuAAAALgAAAC4AAAAuAAAALgAAAC4AAAAuAAAALgAAAC4AAAAuAAAALgAAAA=="},{"name":"thread_pool_total","type":"i32","data":"KAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAAA=="},{"name":"thread_pool_borrowed","type":"i32","data":"AAAAAAoAAAAeAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAjAAAAFQAAABEAAAARAAAAEQAAABEAAAARAAAAEQAAABEAAAAMAAAAAAAAAA=="},{"name":"thread_pool_available","type":"i32","data":"KAAAAB4AAAAKAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFAAAAEwAAABcAAAAXAAAAFwAAABcAAAAXAAAAFwAAABcAAAAcAAAAKAAAAA=="},{"name":"thread_pool_waiting","type":"i32","data":"AAAAAAAAAAAAAAAACgAAAA0AAAANAAAADQAAAA0AAAANAAAADQAAAA0AAAAHAAAABgAAAAkAAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAACAAAAAQAAAAJAAAAEAAAABEAAAARAAAAEQAAABEAAAARAAAAEQAAAA0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=="},{"name":"pending_bg_tasks","type":"i32","data":"AAAAAAkAAAAWAAAAKgAAACsAAAArAAAAKwAAACsAAAArAAAAKwAAACsAAAApAAAAKQAAACoAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAAKAAAACYAAAAoAAAALwAAAC8AAAAvAAAALwAAAC8AAAAvAAAALwAAACwAAAAjAAAAFQAAABEAAAARAAAAEQAAABEAAAARAAAAEQAAABEAAAAMAAAAAAAAAA=="},{"name":"active_threads","type":"i32","data":"AQAAAAsAAAAfAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAAqAAAAKgAAACoAAAAqAAAAKgAAACoAAAAqAAAAKgAAACoAAAAqAAAAKgAAACoAAAAqAAAAKgAAACoAAAAqAAAAKgAAACoAAAAqAAAAKgAAAA=="},{"name":"phase","type":"dict","values":["test","bg_completion"],"codes":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1]}]}});
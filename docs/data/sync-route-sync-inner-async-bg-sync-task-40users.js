@@ -0,0 +1,2 @@
+// Generated by embed_data.py
+DASHBOARD_DATA.register("sync-route-sync-inner-async-bg-sync-task-40users", {"stats":{"length":2,"columns":[{"name":"Type","type":"dict","values":["GET"],"codes":[0,-1]},{"name":"Name","type":"dict","values":["/sync-route-sync-inner-async-bg-sync-task","Aggregated"],"codes":[0,1]},{"name":"Request Count","type":"i32","data":"lAAAAJQAAAA="},{"name":"Failure Count","type":"i32","data":"AAAAAAAAAAA="},{"name":"Median Response Time","type":"f64","data":"AAAAAABAv0AAAAAAAEC/QA=="},{"name":"Average Response Time","type":"f64","data":"8NV20dhCtEDw1XbR2EK0QA=="},{"name":"Min Response Time","type":"f64","data":"AMDiUapgaUAAwOJRqmBpQA=="},{"name":"Max Response Time","type":"f64","data":"wGOT4PGjw0DAY5Pg8aPDQA=="},{"name":"Average Content Size","type":"f64","data":"MEU+6wbDZkAwRT7rBsNmQA=="},{"name":"Requests/s","type":"f64","data":"QvMIvFOkGkBC8wi8U6QaQA=="},{"name":"Failures/s","type":"f64","data":"AAAAAAAAAAAAAAAAAAAAAA=="},{"name":"50%","type":"i32","data":"pB8AAKQfAAA="},{"name":"66%","type":"i32","data":"xCIAAMQiAAA="},{"name":"75%","type":"i32","data":"HCUAABwlAAA="},{"name":"80%","type":"i32","data":"5CUAAOQlAAA="},{"name":"90%","type":"i32","data":"rCYAAKwmAAA="},{"name":"95%","type":"i32","data":"ECcAABAnAAA="},{"name":"98%","type":"i32","data":"ECcAABAnAAA="},{"name":"99%","type":"i32","data":"ECcAABAnAAA="},{"name":"99.9%","type":"i32","data":"ECcAABAnAAA="},{"name":"99.99%","type":"i32","data":"ECcAABAnAAA="},{"name":"100%","type":"i32","data":"ECcAABAnAAA="}]},"resources":{"length":53,"columns":[{"name":"timestamp","type":"dict","values":["2025-12-10T08:10:29.633992","2025-12-10T08:10:30.649892","2025-12-10T08:10:31.658619","2025-12-10T08:10:32.669908","2025-12-10T08:10:33.675531","2025-12-10T08:10:34.686021","2025-12-10T08:10:35.696503","2025-12-10T08:10:36.700390","2025-12-10T08:10:37.715856","2025-12-10T08:10:38.725485","2025-12-10T08:10:39.735912","2025-12-10T08:10:40.746033","2025-12-10T08:10:41.756854","2025-12-10T08:10:42.770386","2025-12-10T08:10:43.778332","2025-12-10T08:10:44.785480","2025-12-10T08:10:45.793547","2025-12-10T08:10:46.801938","2025-12-10T08:10:47.813446","2025-12-10T08:10:48.823048","2025-12-10T08:10:49.834073","2025-12-10T08:10:50.847980","2025-12-10T08:10:51.856799","2025-12-10T08:10:52.867887","2025-12-10T08:10:53.875754","2025-12-10T08:10:54.883714","2025-12-10T08:10:55.896072","2025-12-10T08:10:56.904997","2025-12-10T08:10:57.920358","2025-12-10T08:10:58.931115","2025-12-10T08:10:59.940305","2025-12-10T08:11:00.947786","2025-12-10T08:11:01.956909","2025-12-10T08:11:02.964841","2025-12-10T08:11:03.975694","2025-12-10T08:11:04.985556","2025-12-10T08:11:05.991450","2025-12-10T08:11:07.001208","2025-12-10T08:11:08.013798","2025-12-10T08:11:09.022980","2025-12-10T08:11:10.033482","2025-12-10T08:11:11.043018","2025-12-10T08:11:12.054282","2025-12-10T08:11:13.065026","2025-12-10T08:11:14.078906","2025-12-10T08:11:15.089611","2025-12-10T08:11:16.098104","2025-12-10T08:11:17.106368","2025-12-10T08:11:18.116119","2025-12-10T08:11:19.127524","2025-12-10T08:11:20.140983","2025-12-10T08:11:21.150158","2025-12-10T08:11:22.158758"],"codes":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52]},{"name":"cpu_percent","type":"f64","data":"AAAAAAAAAAAzMzMzMzMDQAAAAAAAAB5AzczMzMzM9D8zMzMzMzPjP5qZmZmZmdk/MzMzMzMz0z+amZmZmZnJP5qZmZmZmdk/MzMzMzMz0z8zMzMzMzPTP5qZmZmZmQVAAAAAAAAAHEBmZmZmZmYUQJqZmZmZmck/MzMzMzMz0z+amZmZmZnJPzMzMzMzM9M/mpmZmZmZ2T8zMzMzMzPTP5qZmZmZmdk/AAAAAAAA8D9mZmZmZmYhQGZmZmZmZgJAMzMzMzMz0z8zMzMzMzPTP5qZmZmZmdk/mpmZmZmZ2T8zMzMzMzPTPzMzMzMzM9M/AAAAAAAA4D8zMzMzMzPjP2ZmZmZmZhJAAAAAAAAABECamZmZmZnZP5qZmZmZmck/MzMzMzMz0z8zMzMzMzPTP5qZmZmZmdk/mpmZmZmZ2T8zMzMzMzPTP5qZmZmZmek/AAAAAAAABEAAAAAAAADwP5qZmZmZmdk/MzMzMzMz0z8zMzMzMzPTP5qZmZmZmdk/MzMzMzMz0z+amZmZmZnZPzMzMzMzM9M/MzMzMzMz4z8zMzMzMzP7Pw=="},{"name":"memory_rss_mb","type":"f64","data":"AAAAAABuSEAAAAAAADpJQAAAAAAAAEpAAAAAAAAoSkAAAAAAAEZKQAAAAAAASEpAAAAAAABISkAAAAAAAEhKQAAAAAAASEpAAAAAAABISkAAAAAAAEhKQAAAAAAASEpAAAAAAAAOSUAAAAAAAB5KQAAAAAAAIEpAAAAAAAAgSkAAAAAAACBKQAAAAAAAIEpAAAAAAAAgSkAAAAAAACBKQAAAAAAAIEpAAAAAAAAgSkAAAAAAACBKQAAAAAAAgkdAAAAAAACER0AAAAAAAIRHQAAAAAAAhEdAAAAAAACER0AAAAAAAIRHQAAAAAAAhEdAAAAAAACER0AAAAAAAIRHQAAAAAAAhEdAAAAAAACER0AAAAAAAIRHQAAAAAAAhEdAAAAAAACER0AAAAAAAIRHQAAAAAAAhEdAAAAAAACER0AAAAAAAIRHQAAAAAAAhEdAAAAAAACER0AAAAAAAIRHQAAAAAAAhEdAAAAAAACER0AAAAAAAIRHQAAAAAAAhEdAAAAAAACER0AAAAAAAIRHQAAAAAAAhEdAAAAAAACGR0AAAAAAAIZHQA=="},{"name":"memory_vms_mb","type":"f64","data":"AAAAkLjyGUEAAACwwfcZQQAAANDG/BlBAAAA0Mr8GUEAAADQyvwZQQAAANDK/BlBAAAA0Mr8GUEAAADQyvwZQQAAANDK/BlBAAAA0Mr8GUEAAADQyvwZQQAAANDK/BlBAAAA0Mr8GUEAAADQyvwZQQAAANDK/BlBAAAA0Mr8GUEAAADQyvwZQQAAANDK/BlBAAAA0Mr8GUEAAADQyvwZQQAAANDK/BlBAAAA0Mr8GUEAAADQyvwZQQAAANDK/BlBAAAA0Mr8GUEAAADQyvwZQQAAANDK/BlBAAAA0Mr8GUEAAADQyvwZQQAAANDK/BlBAAAA0Mr8GUEAAADQyvwZQQAAANDK/BlBAAAA0Mr8GUEAAADQyvwZQQAAANDK/BlBAAAA0Mr8GUEAAADQyvwZQQAAANDK/BlBAAAA0Mr8GUEAAADQyvwZQQAAANDK/BlBAAAA0Mr8GUEAAADQyvwZQQAAANDK/BlBAAAA0Mr8GUEAAADQyvwZQQAAANDK/BlBAAAA0Mr8GUEAAADQyvwZQQAAANDK/BlBAAAA0Mr8GUEAAADQyvwZQQ=="},{"name":"process_threads","type":"i32","data":"BQAAABkAAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAA="},{"name":"thread_pool_total","type":"i32","data":"KAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAA="},{"name":"thread_pool_borrowed","type":"i32","data":"AAAAABQAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAABwAAAAcAAAAHAAAABwAAAAcAAAAHAAAABwAAAAcAAAAEwAAAAAAAAA="},{"name":"thread_pool_available","type":"i32","data":"KAAAABQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAMAAAAFQAAACgAAAA="},{"name":"thread_pool_waiting","type":"i32","data":"AAAAAAAAAAASAAAAIwAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAmAAAANQAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAPQAAADMAAABEAAAARAAAAEQAAABEAAAARAAAAEQAAABEAAAARAAAAD4AAAAfAAAAHAAAABwAAAAcAAAAHAAAABwAAAAcAAAAHAAAABwAAAAXAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA="},{"name":"pending_bg_tasks","type":"i32","data":"AAAAAA4AAAArAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAA1AAAAPAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAPgAAAEMAAABEAAAARAAAAEQAAABEAAAARAAAAEQAAABEAAAARAAAAD8AAAA0AAAARAAAAEQAAABEAAAARAAAAEQAAABEAAAARAAAAEQAAAA/AAAAKAAAABwAAAAcAAAAHAAAABwAAAAcAAAAHAAAABwAAAAcAAAAEwAAAAAAAAA="},{"name":"active_threads","type":"i32","data":"AQAAABUAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAA="},{"name":"phase","type":"dict","values":["test","bg_completion"],"codes":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1]}]}});
@@ -0,0 +1,2 @@
+// Generated by embed_data.py
+DASHBOARD_DATA.register("sync-route-sync-inner-sync-bg-sync-task-100users", {"stats":{"length":2,"columns":[{"name":"Type","type":"dict","values":["GET"],"codes":[0,-1]},{"name":"Name","type":"dict","values":["/sync-route-sync-inner-sync-bg-sync-task","Aggregated"],"codes":[0,1]},{"name":"Request Count","type":"i32","data":"ugAAALoAAAA="},{"name":"Failure Count","type":"i32","data":"AAAAAAAAAAA="},{"name":"Median Response Time","type":"f64","data":"AAAAAAAwwUAAAAAAADDBQA=="},{"name":"Average Response Time","type":"f64","data":"gAM8G47RuUCAAzwbjtG5QA=="},{"name":"Min Response Time","type":"f64","data":"AKB864p2aUAAoHzrinZpQA=="},{"name":"Max Response Time","type":"f64","data":"gD628+uVxUCAPrbz65XFQA=="},{"name":"Average Content Size","type":"f64","data":"aaKJJpqIZkBpookmmohmQA=="},{"name":"Requests/s","type":"f64","data":"MAeqajrQIEAwB6pqOtAgQA=="},{"name":"Failures/s","type":"f64","data":"AAAAAAAAAAAAAAAAAAAAAA=="},{"name":"50%","type":"i32","data":"YCIAAGAiAAA="},{"name":"66%","type":"i32","data":"uCQAALgkAAA="},{"name":"75%","type":"i32","data":"HCUAABwlAAA="},{"name":"80%","type":"i32","data":"gCUAAIAlAAA="},{"name":"90%","type":"i32","data":"+CoAAPgqAAA="},{"name":"95%","type":"i32","data":"+CoAAPgqAAA="},{"name":"98%","type":"i32","data":"+CoAAPgqAAA="},{"name":"99%","type":"i32","data":"+CoAAPgqAAA="},{"name":"99.9%","type":"i32","data":"+CoAAPgqAAA="},{"name":"99.99%","type":"i32","data":"+CoAAPgqAAA="},{"name":"100%","type":"i32","data":"+CoAAPgqAAA="}]},"resources":{"length":82,"columns":[{"name":"timestamp","type":"dict","values":["2025-12-10T08:16:57.908202","2025-12-10T08:16:58.924106","2025-12-10T08:16:59.928310","2025-12-10T08:17:00.934495","2025-12-10T08:17:01.943378","2025-12-10T08:17:02.953727","2025-12-10T08:17:03.965586","2025-12-10T08:17:04.976373","2025-12-10T08:17:05.984612","2025-12-10T08:17:06.991295","2025-12-10T08:17:08.001809","2025-12-10T08:17:09.011572","2025-12-10T08:17:10.020315","2025-12-10T08:17:11.027661","2025-12-10T08:17:12.039127","2025-12-10T08:17:13.050879","2025-12-10T08:17:14.061452","2025-12-10T08:17:15.075252","2025-12-10T08:17:16.084648","2025-12-10T08:17:17.099863","2025-12-10T08:17:18.112741","2025-12-10T08:17:19.122838","2025-12-10T08:17:20.136037","2025-12-10T08:17:21.146483","2025-12-10T08:17:22.154024","2025-12-10T08:17:23.164498","2025-12-10T08:17:24.172062","2025-12-10T08:17:25.188725","2025-12-10T08:17:26.198153","2025-12-10T08:17:27.208999","2025-12-10T08:17:28.224180","2025-12-10T08:17:29.229597","2025-12-10T08:17:30.242289","2025-12-10T08:17:31.250032","2025-12-10T08:17:32.261376","2025-12-10T08:17:33.275634","2025-12-10T08:17:34.287093","2025-12-10T08:17:35.299729","2025-12-10T08:17:36.310152","2025-12-10T08:17:37.320804","2025-12-10T08:17:38.329724","2025-12-10T08:17:39.342404","2025-12-10T08:17:40.356114","2025-12-10T08:17:41.364288","2025-12-10T08:17:42.376632","2025-12-10T08:17:43.384563","2025-12-10T08:17:44.394611","2025-12-10T08:17:45.406678","2025-12-10T08:17:46.416471","2025-12-10T08:17:47.423687","2025-12-10T08:17:48.437785","2025-12-10T08:17:49.448260","2025-12-10T08:17:50.457443","2025-12-10T08:17:51.468888","2025-12-10T08:17:52.480523","2025-12-10T08:17:53.492672","2025-12-10T08:17:54.504489","2025-12-10T08:17:55.511699","2025-12-10T08:17:56.525298","2025-12-10T08:17:57.534823","2025-12-10T08:17:58.545294","2025-12-10T08:17:59.554532","2025-12-10T08:18:00.565125","2025-12-10T08:18:01.573913","2025-12-10T08:18:02.586845","2025-12-10T08:18:03.597149","2025-12-10T08:18:04.604891","2025-12-10T08:18:05.616689","2025-12-10T08:18:06.626589","2025-12-10T08:18:07.632987","2025-12-10T08:18:08.646902","2025-12-10T08:18:09.661742","2025-12-10T08:18:10.674269","2025-12-10T08:18:11.684710","2025-12-10T08:18:12.696783","2025-12-10T08:18:13.710240","2025-12-10T08:18:14.719039","2025-12-10T08:18:15.727503","2025-12-10T08:18:16.736620","2025-12-10T08:18:17.745960","2025-12-10T08:18:18.760809","2025-12-10T08:18:19.770727"],"codes":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81]},{"name":"cpu_percent","type":"f64","data":"AAAAAAAAAABmZmZmZmYOQJqZmZmZmQ1AAAAAAAAA8D/NzMzMzMwAQJqZmZmZmek/MzMzMzMz0z8zMzMzMzPTPzMzMzMzM9M/MzMzMzMz0z8zMzMzMzPTP83MzMzMzBBAzczMzMzMKkBmZmZmZmbmP5qZmZmZmdk/mpmZmZmZ2T8zMzMzMzPTP5qZmZmZmdk/mpmZmZmZ2T8AAAAAAADgP5qZmZmZmdk/AAAAAAAAAEBmZmZmZmYeQDMzMzMzM/M/MzMzMzMz0z+amZmZmZnZPzMzMzMzM9M/AAAAAAAA4D+amZmZmZnZP5qZmZmZmdk/ZmZmZmZm5j+amZmZmZnZP83MzMzMzBhAAAAAAAAAEkCamZmZmZnZP5qZmZmZmdk/mpmZmZmZ2T+amZmZmZnZPzMzMzMzM9M/mpmZmZmZ2T+amZmZmZnZPzMzMzMzM/s/ZmZmZmZmCkAAAAAAAAAEQAAAAAAAAOA/MzMzMzMz0z+amZmZmZnZP5qZmZmZmdk/MzMzMzMz0z+amZmZmZnZP5qZmZmZmdk/zczMzMzM/D8AAAAAAAD4P2ZmZmZmZv4/mpmZmZmZ2T+amZmZmZnZP5qZmZmZmdk/mpmZmZmZ2T+amZmZmZnZPzMzMzMzM9M/MzMzMzMz0z8zMzMzMzP7P5qZmZmZmfE/mpmZmZmZ8T+amZmZmZnZP5qZmZmZmdk/mpmZmZmZ2T+amZmZmZnZPwAAAAAAAOA/MzMzMzMz0z+amZmZmZnZP83MzMzMzPw/mpmZmZmZ6T/NzMzMzMz0P5qZmZmZmdk/mpmZmZmZ2T8zMzMzMzPTP5qZmZmZmdk/MzMzMzMz0z8zMzMzMzPTPwAAAAAAAOA/ZmZmZmZm5j8="},{"name":"memory_rss_mb","type":"f64","data":"AAAAAAB2SEAAAAAAANhJQAAAAAAARkpAAAAAAAB6SkAAAAAAALxKQAAAAAAA7kpAAAAAAADwSkAAAAAAAPBKQAAAAAAA8EpAAAAAAADwSkAAAAAAAPJKQAAAAAAA8EpAAAAAAABwS0AAAAAAAH5LQAAAAAAAgEtAAAAAAACAS0AAAAAAAIJLQAAAAAAAgktAAAAAAACCS0AAAAAAAIJLQAAAAAAAgktAAAAAAACCS0AAAAAAAIJLQAAAAAAAgktAAAAAAACCS0AAAAAAAIJLQAAAAAAAgktAAAAAAACCS0AAAAAAAIJLQAAAAAAAgktAAAAAAACCS0AAAAAAAIJLQAAAAAAAgktAAAAAAACCS0AAAAAAAIJLQAAAAAAAgktAAAAAAACCS0AAAAAAAIJLQAAAAAAAgktAAAAAAACCS0AAAAAAAIJLQAAAAAAAgktAAAAAAACCS0AAAAAAAIJLQAAAAAAAgktAAAAAAACCS0AAAAAAAIJLQAAAAAAAgktAAAAAAACCS0AAAAAAAIJLQAAAAAAAgktAAAAAAACCS0AAAAAAAIJLQAAAAAAAgktAAAAAAACCS0AAAAAAAIJLQAAAAAAAgktAAAAAAACCS0AAAAAAAIJLQAAAAAAAgktAAAAAAACCS0AAAAAAAIJLQAAAAAAAgktAAAAAAACCS0AAAAAAAIJLQAAAAAAAgktAAAAAAACCS0AAAAAAAIJLQAAAAAAAgktAAAAAAACCS0AAAAAAAIJLQAAAAAAAgktAAAAAAACCS0AAAAAAAIJLQAAAAAAAgktAAAAAAACCS0AAAAAAAIJLQAAAAAAAgktAAAAAAACCS0AAAAAAAIJLQAAAAAAAgktAAAAAAACES0A="},{"name":"memory_vms_mb","type":"f64","data":"AAAAIKnyGUEAAABgt/wZQQAAAKD7/BlBAAAAoPv8GUEAAACg+/wZQQAAAKD//BlBAAAAoP/8GUEAAACg//wZQQAAAKD//BlBAAAAoP/8GUEAAACg//wZQQAAAGC//BlBAAAAYMP8GUEAAABgw/wZQQAAAGDD/BlBAAAAYMP8GUEAAABgw/wZQQAAAGDD/BlBAAAAYMP8GUEAAABgw/wZQQAAAGDD/BlBAAAAYMP8GUEAAABgw/wZQQAAAGDD/BlBAAAAYMP8GUEAAABgw/wZQQAAAGDD/BlBAAAAYMP8GUEAAABgw/wZQQAAAGDD/BlBAAAAYMP8GUEAAABgw/wZQQAAAGDD/BlBAAAAYMP8GUEAAABgw/wZQQAAAGDD/BlBAAAAYMP8GUEAAABgw/wZQQAAAGDD/BlBAAAAYMP8GUEAAABgw/wZQQAAAGDD/BlBAAAAYMP8GUEAAABgw/wZQQAAAGDD/BlBAAAAYMP8GUEAAABgw/wZQQAAAGDD/BlBAAAAYMP8GUEAAABgw/wZQQAAAGDD/BlBAAAAYMP8GUEAAABgw/wZQQAAAGDD/BlBAAAAYMP8GUEAAABgw/wZQQAAAGDD/BlBAAAAYMP8GUEAAABgw/wZQQAAAGDD/BlBAAAAYMP8GUEAAABgw/wZQQAAAGDD/BlBAAAAYMP8GUEAAABgw/wZQQAAAGDD/BlBAAAAYMP8GUEAAABgw/wZQQAAAGDD/BlBAAAAYMP8GUEAAABgw/wZQQAAAGDD/BlBAAAAYMP8GUEAAABgw/wZQQAAAGDD/BlBAAAAYMP8GUEAAABgw/wZQQAAAGDD/BlBAAAAYMP8GUEAAABgw/wZQQAAAGDD/BlBAAAAYMP8GUE="},{"name":"process_threads","type":"i32","data":"BQAAAC0AAAAuAAAALgAAAC4AAAAuAAAALgAAAC4AAAAuAAAALgAAAC4AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAA=="},{"name":"thread_pool_total","type":"i32","data":"KAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAAA=="},{"name":"thread_pool_borrowed","type":"i32","data":"AAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAbAAAAFQAAAAYAAAAGAAAABgAAAAYAAAAGAAAABgAAAAYAAAAFAAAAAAAAAA=="},{"name":"thread_pool_available","type":"i32","data":"KAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAANAAAAEwAAACIAAAAiAAAAIgAAACIAAAAiAAAAIgAAACIAAAAjAAAAKAAAAA=="},{"name":"thread_pool_waiting","type":"i32","data":"AAAAAAEAAAAsAAAAQAAAAFQAAABoAAAAaAAAAGgAAABoAAAAaAAAAGgAAABWAAAAqQAAAKwAAACsAAAArAAAAKwAAACsAAAArAAAAKwAAACsAAAAqgAAAJ4AAACmAAAApgAAAKYAAACmAAAApgAAAKYAAACmAAAApgAAAKIAAAB/AAAAfgAAAH4AAAB+AAAAfgAAAH4AAAB+AAAAfgAAAH4AAABvAAAAYQAAAFcAAABWAAAAVgAAAFYAAABWAAAAVgAAAFYAAABWAAAASQAAAD0AAAAuAAAALgAAAC4AAAAuAAAALgAAAC4AAAAuAAAALgAAABwAAAAVAAAABgAAAAYAAAAGAAAABgAAAAYAAAAGAAAABgAAAAYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=="},{"name":"pending_bg_tasks","type":"i32","data":"AAAAAB0AAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAxAAAAbwAAAHAAAABwAAAAcAAAAHAAAABwAAAAcAAAAHAAAABwAAAAcgAAAGkAAABqAAAAagAAAGoAAABqAAAAagAAAGoAAABqAAAAagAAAGYAAABjAAAAiAAAAIkAAACJAAAAiQAAAIkAAACJAAAAiQAAAIkAAAB7AAAAfAAAAH8AAAB+AAAAfgAAAH4AAAB+AAAAfgAAAH4AAAB+AAAAcQAAAGUAAABWAAAAVgAAAFYAAABWAAAAVgAAAFYAAABWAAAAVgAAAEQAAAA9AAAALgAAAC4AAAAuAAAALgAAAC4AAAAuAAAALgAAAC4AAAAbAAAAFQAAAAYAAAAGAAAABgAAAAYAAAAGAAAABgAAAAYAAAAFAAAAAAAAAA=="},{"name":"active_threads","type":"i32","data":"AQAAACkAAAAqAAAAKgAAACoAAAAqAAAAKgAAACoAAAAqAAAAKgAAACoAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAAA=="},{"name":"phase","type":"dict","values":["test","bg_completion"],"codes":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1]}]}});
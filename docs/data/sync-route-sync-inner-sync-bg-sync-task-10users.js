@@ -0,0 +1,2 @@
+// Generated by embed_data.py
+DASHBOARD_DATA.register("sync-route-sync-inner-sync-bg-sync-task-10users", {"stats":{"length":2,"columns":[{"name":"Type","type":"dict","values":["GET"],"codes":[0,-1]},{"name":"Name","type":"dict","values":["/sync-route-sync-inner-sync-bg-sync-task","Aggregated"],"codes":[0,1]},{"name":"Request Count","type":"i32","data":"fgAAAH4AAAA="},{"name":"Failure Count","type":"i32","data":"AAAAAAAAAAA="},{"name":"Median Response Time","type":"f64","data":"AAAAAABAcEAAAAAAAEBwQA=="},{"name":"Average Response Time","type":"f64","data":"jnzQ0c2hl0COfNDRzaGXQA=="},{"name":"Min Response Time","type":"f64","data":"ACBA4WyIaUAAIEDhbIhpQA=="},{"name":"Max Response Time","type":"f64","data":"ADMt6t+hv0AAMy3q36G/QA=="},{"name":"Average Content Size","type":"f64","data":"OY7jOI6DZkA5juM4joNmQA=="},{"name":"Requests/s","type":"f64","data":"R4q7ZjpyFUBHirtmOnIVQA=="},{"name":"Failures/s","type":"f64","data":"AAAAAAAAAAAAAAAAAAAAAA=="},{"name":"50%","type":"i32","data":"BAEAAAQBAAA="},{"name":"66%","type":"i32","data":"pAEAAKQBAAA="},{"name":"75%","type":"i32","data":"CAIAAAgCAAA="},{"name":"80%","type":"i32","data":"OgIAADoCAAA="},{"name":"90%","type":"i32","data":"3B4AANweAAA="},{"name":"95%","type":"i32","data":"QB8AAEAfAAA="},{"name":"98%","type":"i32","data":"pB8AAKQfAAA="},{"name":"99%","type":"i32","data":"pB8AAKQfAAA="},{"name":"99.9%","type":"i32","data":"pB8AAKQfAAA="},{"name":"99.99%","type":"i32","data":"pB8AAKQfAAA="},{"name":"100%","type":"i32","data":"pB8AAKQfAAA="}]},"resources":{"length":43,"columns":[{"name":"timestamp","type":"dict","values":["2025-12-10T08:15:12.550125","2025-12-10T08:15:13.561112","2025-12-10T08:15:14.569302","2025-12-10T08:15:15.579580","2025-12-10T08:15:16.587614","2025-12-10T08:15:17.603909","2025-12-10T08:15:18.615451","2025-12-10T08:15:19.620953","2025-12-10T08:15:20.633855","2025-12-10T08:15:21.645307","2025-12-10T08:15:22.659125","2025-12-10T08:15:23.670212","2025-12-10T08:15:24.678769","2025-12-10T08:15:25.687631","2025-12-10T08:15:26.698774","2025-12-10T08:15:27.710722","2025-12-10T08:15:28.721514","2025-12-10T08:15:29.733163","2025-12-10T08:15:30.744566","2025-12-10T08:15:31.757312","2025-12-10T08:15:32.769970","2025-12-10T08:15:33.783597","2025-12-10T08:15:34.794884","2025-12-10T08:15:35.807744","2025-12-10T08:15:36.818820","2025-12-10T08:15:37.827840","2025-12-10T08:15:38.837977","2025-12-10T08:15:39.851819","2025-12-10T08:15:40.863060","2025-12-10T08:15:41.875935","2025-12-10T08:15:42.881427","2025-12-10T08:15:43.887252","2025-12-10T08:15:44.899782","2025-12-10T08:15:45.910810","2025-12-10T08:15:46.920669","2025-12-10T08:15:47.934020","2025-12-10T08:15:48.945044","2025-12-10T08:15:49.957186","2025-12-10T08:15:50.969547","2025-12-10T08:15:51.983593","2025-12-10T08:15:52.994081","2025-12-10T08:15:54.004677","2025-12-10T08:15:55.010097"],"codes":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42]},{"name":"cpu_percent","type":"f64","data":"AAAAAAAAAAAAAAAAAAAAQDMzMzMzMxVAzczMzMzMFEAAAAAAAADgPwAAAAAAAOA/mpmZmZmZ2T+amZmZmZnJP5qZmZmZmdk/mpmZmZmZ2T+amZmZmZnZP83MzMzMzPw/ZmZmZmZmEkCamZmZmZkVQAAAAAAAAPA/MzMzMzMz0z8zMzMzMzPTP5qZmZmZmdk/AAAAAAAA4D+amZmZmZnZPwAAAAAAAOA/ZmZmZmZm9j8AAAAAAAAUQAAAAAAAABRAmpmZmZmZAUCamZmZmZnZP5qZmZmZmdk/mpmZmZmZ2T+amZmZmZnZPwAAAAAAAOA/MzMzMzMz0z+amZmZmZnxP83MzMzMzARAmpmZmZmZ8T9mZmZmZmbmPwAAAAAAAOA/mpmZmZmZ2T+amZmZmZnZP5qZmZmZmdk/mpmZmZmZ2T+amZmZmZnZP83MzMzMzOw/mpmZmZmZ6T8="},{"name":"memory_rss_mb","type":"f64","data":"AAAAAAB+SEAAAAAAAA5JQAAAAAAAoElAAAAAAADwSUAAAAAAAPRJQAAAAAAA+klAAAAAAAD6SUAAAAAAAPpJQAAAAAAA+klAAAAAAAD6SUAAAAAAAPpJQAAAAAAA+klAAAAAAAD6SUAAAAAAAPpJQAAAAAAA/klAAAAAAAD+SUAAAAAAAP5JQAAAAAAA/klAAAAAAAD+SUAAAAAAAP5JQAAAAAAA/klAAAAAAAD+SUAAAAAAAP5JQAAAAAAA/klAAAAAAAD+SUAAAAAAAABKQAAAAAAAAEpAAAAAAAAASkAAAAAAAABKQAAAAAAAAEpAAAAAAAAASkAAAAAAAABKQAAAAAAAAEpAAAAAAAAASkAAAAAAAABKQAAAAAAAAEpAAAAAAAAASkAAAAAAAABKQAAAAAAAAEpAAAAAAAAASkAAAAAAAABKQAAAAAAAAEpAAAAAAAAASkA="},{"name":"memory_vms_mb","type":"f64","data":"AAAAwLnyGUEAAACAfPUZQQAAAKCF+hlBAAAAAMj8GUEAAAAAyPwZQQAAAADI/BlBAAAAAMj8GUEAAAAAyPwZQQAAAADI/BlBAAAAAMj8GUEAAAAAyPwZQQAAAADI/BlBAAAAAMj8GUEAAAAAyPwZQQAAAADI/BlBAAAAAMj8GUEAAAAAyPwZQQAAAADI/BlBAAAAAMj8GUEAAAAAyPwZQQAAAADI/BlBAAAAAMj8GUEAAAAAyPwZQQAAAADI/BlBAAAAAMj8GUEAAAAAyPwZQQAAAADI/BlBAAAAAMj8GUEAAAAAyPwZQQAAAADI/BlBAAAAAMj8GUEAAAAAyPwZQQAAAADI/BlBAAAAAMj8GUEAAAAAyPwZQQAAAADI/BlBAAAAAMj8GUEAAAAAyPwZQQAAAADI/BlBAAAAAMj8GUEAAAAAyPwZQQAAAADI/BlBAAAAAMj8GUE="},{"name":"process_threads","type":"i32","data":"BQAAABAAAAAkAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAA=="},{"name":"thread_pool_total","type":"i32","data":"KAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAAA=="},{"name":"thread_pool_borrowed","type":"i32","data":"AAAAAAsAAAAfAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAJwAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACcAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAeAAAAEwAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAKAAAAAAAAAA=="},{"name":"thread_pool_available","type":"i32","data":"KAAAAB0AAAAJAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKAAAAFQAAABgAAAAYAAAAGAAAABgAAAAYAAAAGAAAABgAAAAeAAAAKAAAAA=="},{"name":"thread_pool_waiting","type":"i32","data":"AAAAAAAAAAAAAAAACgAAAAwAAAAMAAAADAAAAAwAAAAMAAAADAAAAAwAAAAEAAAAAAAAAAgAAAAOAAAADgAAAA4AAAAOAAAADgAAAA4AAAAOAAAABAAAAAAAAAAHAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAAAYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=="},{"name":"pending_bg_tasks","type":"i32","data":"AAAAAAkAAAAcAAAAKgAAACoAAAAqAAAAKgAAACoAAAAqAAAAKgAAACoAAAAqAAAAIwAAACoAAAAsAAAALAAAACwAAAAsAAAALAAAACwAAAAsAAAAJwAAACcAAAAqAAAALgAAAC4AAAAuAAAALgAAAC4AAAAuAAAALgAAACcAAAAeAAAAEwAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAKAAAAAAAAAA=="},{"name":"active_threads","type":"i32","data":"AQAAAAwAAAAgAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAAA=="},{"name":"phase","type":"dict","values":["test","bg_completion"],"codes":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1]}]}});
@@ -0,0 +1,2 @@
+// Generated by embed_data.py
+DASHBOARD_DATA.register("sync-route-sync-inner-sync-bg-sync-task-40users", {"stats":{"length":2,"columns":[{"name":"Type","type":"dict","values":["GET"],"codes":[0,-1]},{"name":"Name","type":"dict","values":["/sync-route-sync-inner-sync-bg-sync-task","Aggregated"],"codes":[0,1]},{"name":"Request Count","type":"i32","data":"lgAAAJYAAAA="},{"name":"Failure Count","type":"i32","data":"AAAAAAAAAAA="},{"name":"Median Response Time","type":"f64","data":"AAAAAABAv0AAAAAAAEC/QA=="},{"name":"Average Response Time","type":"f64","data":"QDfWQS8jtEBAN9ZBLyO0QA=="},{"name":"Min Response Time","type":"f64","data":"APCnxks3aUAA8KfGSzdpQA=="},{"name":"Max Response Time","type":"f64","data":"wF+Ns6mHw0DAX42zqYfDQA=="},{"name":"Average Content Size","type":"f64","data":"GEt+seR3ZkAYS36x5HdmQA=="},{"name":"Requests/s","type":"f64","data":"ref6zlc2GkCt5/rOVzYaQA=="},{"name":"Failures/s","type":"f64","data":"AAAAAAAAAAAAAAAAAAAAAA=="},{"name":"50%","type":"i32","data":"QB8AAEAfAAA="},{"name":"66%","type":"i32","data":"xCIAAMQiAAA="},{"name":"75%","type":"i32","data":"5CUAAOQlAAA="},{"name":"80%","type":"i32","data":"SCYAAEgmAAA="},{"name":"90%","type":"i32","data":"rCYAAKwmAAA="},{"name":"95%","type":"i32","data":"ECcAABAnAAA="},{"name":"98%","type":"i32","data":"ECcAABAnAAA="},{"name":"99%","type":"i32","data":"ECcAABAnAAA="},{"name":"99.9%","type":"i32","data":"ECcAABAnAAA="},{"name":"99.99%","type":"i32","data":"ECcAABAnAAA="},{"name":"100%","type":"i32","data":"ECcAABAnAAA="}]},"resources":{"length":53,"columns":[{"name":"timestamp","type":"dict","values":["2025-12-10T08:15:59.852817","2025-12-10T08:16:00.867840","2025-12-10T08:16:01.874033","2025-12-10T08:16:02.882638","2025-12-10T08:16:03.891136","2025-12-10T08:16:04.902534","2025-12-10T08:16:05.913070","2025-12-10T08:16:06.920026","2025-12-10T08:16:07.928795","2025-12-10T08:16:08.939086","2025-12-10T08:16:09.952908","2025-12-10T08:16:10.963583","2025-12-10T08:16:11.968883","2025-12-10T08:16:12.982013","2025-12-10T08:16:13.992050","2025-12-10T08:16:15.007349","2025-12-10T08:16:16.020308","2025-12-10T08:16:17.026767","2025-12-10T08:16:18.039634","2025-12-10T08:16:19.052335","2025-12-10T08:16:20.064050","2025-12-10T08:16:21.070840","2025-12-10T08:16:22.080746","2025-12-10T08:16:23.088277","2025-12-10T08:16:24.095049","2025-12-10T08:16:25.109061","2025-12-10T08:16:26.119241","2025-12-10T08:16:27.128971","2025-12-10T08:16:28.143266","2025-12-10T08:16:29.152391","2025-12-10T08:16:30.165152","2025-12-10T08:16:31.173701","2025-12-10T08:16:32.182458","2025-12-10T08:16:33.187591","2025-12-10T08:16:34.199027","2025-12-10T08:16:35.213124","2025-12-10T08:16:36.225441","2025-12-10T08:16:37.242026","2025-12-10T08:16:38.253382","2025-12-10T08:16:39.265568","2025-12-10T08:16:40.278714","2025-12-10T08:16:41.290342","2025-12-10T08:16:42.300199","2025-12-10T08:16:43.315728","2025-12-10T08:16:44.328633","2025-12-10T08:16:45.334117","2025-12-10T08:16:46.342334","2025-12-10T08:16:47.353316","2025-12-10T08:16:48.364340","2025-12-10T08:16:49.374518","2025-12-10T08:16:50.383997","2025-12-10T08:16:51.392143","2025-12-10T08:16:52.398979"],"codes":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52]},{"name":"cpu_percent","type":"f64","data":"AAAAAAAAAAAAAAAAAAAEQGZmZmZmZhRAzczMzMzM7D8zMzMzMzPjP5qZmZmZmdk/MzMzMzMz0z+amZmZmZnJP5qZmZmZmdk/mpmZmZmZ2T+amZmZmZnZPwAAAAAAABBAmpmZmZmZHUBmZmZmZmb2PzMzMzMzM9M/AAAAAAAA4D+amZmZmZnZP5qZmZmZmck/mpmZmZmZ2T+amZmZmZnZPwAAAAAAAOA/zczMzMzM9D8zMzMzMzMrQAAAAAAAAARAMzMzMzMz0z+amZmZmZnZP5qZmZmZmdk/MzMzMzMz0z+amZmZmZnZP5qZmZmZmdk/AAAAAAAA4D/NzMzMzMzsP83MzMzMzBZAmpmZmZmZ8T+amZmZmZnZP5qZmZmZmdk/mpmZmZmZ2T8AAAAAAADgP5qZmZmZmdk/mpmZmZmZ2T+amZmZmZnZP83MzMzMzPQ/AAAAAAAAAECamZmZmZnpP5qZmZmZmdk/MzMzMzMz0z+amZmZmZnZPzMzMzMzM9M/mpmZmZmZ2T+amZmZmZnZP5qZmZmZmdk/mpmZmZmZ6T8AAAAAAADwPw=="},{"name":"memory_rss_mb","type":"f64","data":"AAAAAACWSEAAAAAAAGpJQAAAAAAAIkpAAAAAAABESkAAAAAAAGRKQAAAAAAAakpAAAAAAABqSkAAAAAAAGpKQAAAAAAAakpAAAAAAABqSkAAAAAAAGpKQAAAAAAAakpAAAAAAAB6SkAAAAAAAIxKQAAAAAAAjkpAAAAAAACOSkAAAAAAAI5KQAAAAAAAjkpAAAAAAACOSkAAAAAAAI5KQAAAAAAAjkpAAAAAAACOSkAAAAAAAI5KQAAAAAAAlEpAAAAAAACWSkAAAAAAAJhKQAAAAAAAmEpAAAAAAACaSkAAAAAAAJpKQAAAAAAAmkpAAAAAAACaSkAAAAAAAJpKQAAAAAAAmkpAAAAAAACaSkAAAAAAAJpKQAAAAAAAmkpAAAAAAACaSkAAAAAAAJpKQAAAAAAAmkpAAAAAAACaSkAAAAAAAJpKQAAAAAAAmkpAAAAAAACaSkAAAAAAAJpKQAAAAAAAmkpAAAAAAACaSkAAAAAAAJpKQAAAAAAAmkpAAAAAAACaSkAAAAAAAJpKQAAAAAAAmkpAAAAAAACaSkAAAAAAAJpKQA=="},{"name":"memory_vms_mb","type":"f64","data":"AAAAQLnyGUEAAACgAvgZQQAAAIDH/BlBAAAAgMf8GUEAAACAy/wZQQAAAIDL/BlBAAAAgMv8GUEAAACAy/wZQQAAAIDL/BlBAAAAgMv8GUEAAACAy/wZQQAAAIDL/BlBAAAAgMv8GUEAAACAy/wZQQAAAIDL/BlBAAAAgMv8GUEAAACAy/wZQQAAAIDL/BlBAAAAgMv8GUEAAACAy/wZQQAAAIDL/BlBAAAAgMv8GUEAAACAy/wZQQAAAIDL/BlBAAAAgMv8GUEAAACAy/wZQQAAAIDL/BlBAAAAgMv8GUEAAACAy/wZQQAAAIDL/BlBAAAAgMv8GUEAAACAy/wZQQAAAIDL/BlBAAAAgMv8GUEAAACAy/wZQQAAAIDL/BlBAAAAgMv8GUEAAACAy/wZQQAAAIDL/BlBAAAAgMv8GUEAAACAy/wZQQAAAIDL/BlBAAAAgMv8GUEAAACAy/wZQQAAAIDL/BlBAAAAgMv8GUEAAACAy/wZQQAAAIDL/BlBAAAAgMv8GUEAAACAy/wZQQAAAIDL/BlBAAAAgMv8GUEAAACAy/wZQQ=="},{"name":"process_threads","type":"i32","data":"BQAAABoAAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAAtAAAALQAAAC0AAAA="},{"name":"thread_pool_total","type":"i32","data":"KAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAA="},{"name":"thread_pool_borrowed","type":"i32","data":"AAAAABUAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAAJgAAAB4AAAAeAAAAHgAAAB4AAAAeAAAAHgAAAB4AAAAdAAAAFQAAAAAAAAA="},{"name":"thread_pool_available","type":"i32","data":"KAAAABMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAgAAAAoAAAAKAAAACgAAAAoAAAAKAAAACgAAAAoAAAALAAAAEwAAACgAAAA="},{"name":"thread_pool_waiting","type":"i32","data":"AAAAAAAAAAAVAAAAIQAAACsAAAArAAAAKwAAACsAAAArAAAAKwAAACsAAAAnAAAANQAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAANgAAADgAAABFAAAARgAAAEYAAABGAAAARgAAAEYAAABGAAAARgAAAD8AAAAfAAAAHgAAAB4AAAAeAAAAHgAAAB4AAAAeAAAAHgAAAB4AAAAWAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA="},{"name":"pending_bg_tasks","type":"i32","data":"AAAAAA4AAAArAAAAKwAAACsAAAArAAAAKwAAACsAAAArAAAAKwAAACsAAAA0AAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAANgAAAEAAAABGAAAARgAAAEYAAABGAAAARgAAAEYAAABGAAAARgAAAEAAAAA+AAAARgAAAEYAAABGAAAARgAAAEYAAABGAAAARgAAAEYAAAA+AAAAJgAAAB4AAAAeAAAAHgAAAB4AAAAeAAAAHgAAAB4AAAAdAAAAFQAAAAAAAAA="},{"name":"active_threads","type":"i32","data":"AQAAABYAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAApAAAAKQAAACkAAAA="},{"name":"phase","type":"dict","values":["test","bg_completion"],"codes":[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1]}]}});
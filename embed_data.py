@@ -1,106 +1,247 @@
 #!/usr/bin/env python3
 """
-Script to embed CSV data directly into the HTML dashboard file.
+Script to embed CSV data into the HTML dashboard file.
 This eliminates the need for a web server to serve CSV files.
+
+Every `docs/<config>_stats.csv` + `docs/<config>_resources.csv` pair is one
+configuration. Each is converted to a compact columnar payload: numeric columns
+become base64 typed arrays, and string columns are dictionary-encoded. By default
+every payload is written to a sidecar script, `docs/data/<config>.js`. The
+dashboard loads a sidecar only when it needs that configuration, and
+index.html itself only embeds the list of configurations.
+
+Builds are incremental: `docs/data/.manifest.json` records the mtime, size and
+hash of each CSV, so only new or changed runs are parsed and rewritten.
+
+    python embed_data.py              # sidecar files (default)
+    python embed_data.py --inline     # single self-contained index.html
+    python embed_data.py --gzip       # gzip+base64 the payloads
+    python embed_data.py --force      # ignore the cache
 """
 
+import argparse
+import array
+import base64
 import csv
+import gzip
+import hashlib
 import json
 import sys
 from pathlib import Path
 
-
-def read_csv_to_dict(file_path):
-    """Read a CSV file and return it as a list of dictionaries."""
-    data = []
-    with open(file_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+DOCS_DIR = Path('docs')
+DATA_DIR = DOCS_DIR / 'data'
+MANIFEST_PATH = DATA_DIR / '.manifest.json'
+
+# Bump when the payload layout changes, so cached payloads are rebuilt
+PAYLOAD_FORMAT = 2
+
+INT32_MIN, INT32_MAX = -2 ** 31, 2 ** 31 - 1
+
+EMBED_START = '  <script id="embedded-data">'
+EMBED_END = '</script>'
+
+
+def _parse_number(value):
+    """Return an int or float for a numeric CSV cell, or None if it is not numeric."""
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def encode_column(name, values):
+    """
+    Encode one CSV column with a single type chosen for the whole column.
+
+    Returns a dict with the column name, a type and its data:
+        i32:  all cells are integers (no empty cells) -> base64 little-endian Int32Array
+        f64:  all non-empty cells are numbers -> base64 little-endian Float64Array, NaN for empty
+        dict: anything else -> distinct values plus one index per cell (-1 for empty)
+    """
+    numbers = [None if value == '' else _parse_number(value) for value in values]
+    non_empty = [(value, number) for value, number in zip(values, numbers) if value != '']
+
+    if non_empty and all(number is not None for _, number in non_empty):
+        if (len(non_empty) == len(values)
+                and all(isinstance(n, int) and INT32_MIN <= n <= INT32_MAX for n in numbers)):
+            typed = array.array('i', numbers)
+            kind = 'i32'
+        else:
+            typed = array.array('d', (float('nan') if n is None else n for n in numbers))
+            kind = 'f64'
+        if sys.byteorder != 'little':
+            typed.byteswap()
+        return {'name': name, 'type': kind, 'data': base64.b64encode(typed.tobytes()).decode('ascii')}
+
+    distinct = {}
+    codes = [-1 if value == '' else distinct.setdefault(value, len(distinct)) for value in values]
+    return {'name': name, 'type': 'dict', 'values': list(distinct), 'codes': codes}
+
+
+def read_csv_columnar(file_path):
+    """Stream a CSV file into columns and encode it as a columnar table."""
+    with open(file_path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        columns = [[] for _ in header]
+        length = 0
         for row in reader:
-            # Convert numeric values
-            converted_row = {}
-            for key, value in row.items():
-                if value == '':
-                    converted_row[key] = None
-                else:
-                    try:
-                        # Try to convert to float first
-                        if '.' in value:
-                            converted_row[key] = float(value)
-                        else:
-                            # Try integer
-                            converted_row[key] = int(value)
-                    except (ValueError, AttributeError):
-                        # Keep as string
-                        converted_row[key] = value
-            data.append(converted_row)
-    return data
-
-
-def collect_all_data():
-    """Collect all CSV data from the docs directory."""
-    results_dir = Path('docs')
-
-    if not results_dir.exists():
-        print(f"Error: {results_dir} directory not found!")
-        sys.exit(1)
-
-    route_configs = [
-        'async-route-async-inner-async-bg-async-task',
-        'async-route-async-inner-async-bg-sync-task',
-        'async-route-async-inner-sync-bg-sync-task',
-        'async-route-sync-inner-async-bg-async-task',
-        'sync-route-sync-inner-async-bg-async-task',
-        'sync-route-sync-inner-async-bg-sync-task',
-        'sync-route-sync-inner-sync-bg-sync-task'
-    ]
-
-    user_counts = [10, 40, 100]
-
-    all_data = {}
-
-    for route in route_configs:
-        for users in user_counts:
-            stats_file = results_dir / f"{route}-{users}users_stats.csv"
-            resources_file = results_dir / f"{route}-{users}users_resources.csv"
-
-            key = f"{route}-{users}users"
-
-            if not stats_file.exists() or not resources_file.exists():
-                print(f"Warning: Missing files for {key}")
-                continue
-
-            all_data[key] = {
-                'stats': read_csv_to_dict(stats_file),
-                'resources': read_csv_to_dict(resources_file)
-            }
-            print(f"✓ Loaded {key}")
-
-    return all_data
+            for column, value in zip(columns, row):
+                column.append(value)
+            # Short rows are padded so every column has one cell per row
+            for column in columns[len(row):]:
+                column.append('')
+            length += 1
+    return {
+        'length': length,
+        'columns': [encode_column(name, values) for name, values in zip(header, columns)],
+    }
+
+
+def file_fingerprint(path, cached=None):
+    """
+    Return {mtime_ns, size, sha256} for a file.
+
+    The hash is only recomputed when the mtime or size differs from the cached
+    fingerprint, so untouched files cost one stat() call.
+    """
+    stat = path.stat()
+    if cached and cached.get('mtime_ns') == stat.st_mtime_ns and cached.get('size') == stat.st_size:
+        return cached
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': digest}
+
+
+def discover_configs(results_dir):
+    """Return {config key: (stats csv, resources csv)} for every complete run in results_dir."""
+    configs = {}
+    for stats_file in sorted(results_dir.glob('*_stats.csv')):
+        key = stats_file.name[:-len('_stats.csv')]
+        resources_file = results_dir / f"{key}_resources.csv"
+        if not resources_file.exists():
+            print(f"Warning: Missing resources file for {key}")
+            continue
+        configs[key] = (stats_file, resources_file)
+    return configs
+
+
+def load_manifest(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {'format': PAYLOAD_FORMAT, 'configs': {}}
+    if manifest.get('format') != PAYLOAD_FORMAT:
+        return {'format': PAYLOAD_FORMAT, 'configs': {}}
+    return manifest
+
+
+def encode_payload(payload, compress):
+    """Serialize a config payload as compact JSON, or as a gzip+base64 JSON string."""
+    text = json.dumps(payload, separators=(',', ':'))
+    if not compress:
+        return text
+    # mtime=0 keeps the output byte-identical across rebuilds of unchanged data
+    packed = base64.b64encode(gzip.compress(text.encode('utf-8'), mtime=0)).decode('ascii')
+    return json.dumps(packed)
+
+
+def write_if_changed(path, content):
+    """Write a text file unless it already has this content. Returns True if written."""
+    if path.exists() and path.read_text(encoding='utf-8') == content:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding='utf-8')
+    return True
+
+
+def build_payloads(configs, manifest, force=False):
+    """
+    Parse new or changed configurations and return their encoded-payload cache entries.
+
+    Returns:
+        (entries, rebuilt): manifest entries keyed by config, and the keys that were re-parsed
+    """
+    entries = {}
+    rebuilt = []
+    for key, (stats_file, resources_file) in configs.items():
+        cached = {} if force else manifest['configs'].get(key, {})
+        stats_fp = file_fingerprint(stats_file, cached.get('stats'))
+        resources_fp = file_fingerprint(resources_file, cached.get('resources'))
+
+        unchanged = (
+            cached.get('payload') is not None
+            and cached['stats'].get('sha256') == stats_fp['sha256']
+            and cached['resources'].get('sha256') == resources_fp['sha256']
+        )
+        if unchanged:
+            entries[key] = {**cached, 'stats': stats_fp, 'resources': resources_fp}
+            continue
+
+        payload = {
+            'stats': read_csv_columnar(stats_file),
+            'resources': read_csv_columnar(resources_file),
+        }
+        entries[key] = {'stats': stats_fp, 'resources': resources_fp, 'payload': payload}
+        rebuilt.append(key)
+        print(f"✓ Parsed {key}")
+    return entries, rebuilt
+
+
+def write_sidecars(entries, compress):
+    """Write docs/data/<config>.js for every configuration and remove stale ones."""
+    written = 0
+    for key, entry in entries.items():
+        script = (
+            "// Generated by embed_data.py\n"
+            f"DASHBOARD_DATA.register({json.dumps(key)}, {encode_payload(entry['payload'], compress)});\n"
+        )
+        written += write_if_changed(DATA_DIR / f"{key}.js", script)
+    for stale in DATA_DIR.glob('*.js'):
+        if stale.stem not in entries:
+            stale.unlink()
+            print(f"✓ Removed stale {stale}")
+    return written
+
+
+def embedded_index(entries, inline, compress):
+    """Build the object embedded in index.html: per config, a sidecar path or the payload itself."""
+    configs = {}
+    for key, entry in entries.items():
+        if inline:
+            configs[key] = {'payload': json.loads(encode_payload(entry['payload'], compress))}
+        else:
+            configs[key] = {'src': f"data/{key}.js"}
+    return {'format': PAYLOAD_FORMAT, 'configs': configs}
 
 
 def embed_data_in_html(html_path, output_path, data):
-    """Embed the CSV data into the HTML file."""
+    """Embed the data index into the HTML file. Returns True if the file changed."""
     with open(html_path, 'r', encoding='utf-8') as f:
         html_content = f.read()
 
-    # Convert data to JSON string
-    data_json = json.dumps(data, indent=2)
+    data_json = json.dumps(data, separators=(',', ':'))
 
     # Create the embedded data script
     embedded_data_script = f"""
-  <script id="embedded-data">
-    // Embedded CSV data - generated by embed_data.py
+{EMBED_START}
+    // Embedded data index - generated by embed_data.py
     const EMBEDDED_DATA = {data_json};
-  </script>"""
-
-    # Remove any existing embedded-data script blocks to avoid duplicates
-    import re
-    html_content = re.sub(
-        r'  <script id="embedded-data">.*?</script>',
-        '',
-        html_content,
-        flags=re.DOTALL
-    )
+  {EMBED_END}"""
+
+    # Replace the existing embedded-data block (located with plain searches, not a regex over the file)
+    start = html_content.find(EMBED_START)
+    if start != -1:
+        end = html_content.index(EMBED_END, start) + len(EMBED_END)
+        # Include the newline the block was inserted after
+        if html_content[start - 1:start] == '\n':
+            start -= 1
+        html_content = html_content[:start] + html_content[end:]
 
     # Find the position right after <body> tag and insert the data
     body_pos = html_content.find('<body>')
@@ -118,28 +259,49 @@ def embed_data_in_html(html_path, output_path, data):
         '<!-- PapaParse not needed with embedded data -->\n  <!-- <script src="https://cdn.jsdelivr.net/npm/papaparse@5"></script> -->'
     )
 
-    # Write the updated HTML
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    return write_if_changed(Path(output_path), html_content)
+
 
-    print(f"\n✓ Embedded data written to {output_path}")
+def save_manifest(entries):
+    manifest = {'format': PAYLOAD_FORMAT, 'configs': entries}
+    write_if_changed(MANIFEST_PATH, json.dumps(manifest, separators=(',', ':')))
 
 
 def main():
     """Main function."""
-    html_path = Path('docs/index.html')
+    parser = argparse.ArgumentParser(description="Embed load test results into docs/index.html")
+    parser.add_argument('--inline', action='store_true',
+                        help="Embed all payloads in index.html instead of writing sidecar files")
+    parser.add_argument('--gzip', action='store_true', help="Store payloads gzip-compressed and base64-encoded")
+    parser.add_argument('--force', action='store_true', help="Re-parse every CSV, ignoring the cache manifest")
+    args = parser.parse_args()
+
+    html_path = DOCS_DIR / 'index.html'
 
     if not html_path.exists():
         print(f"Error: {html_path} not found!")
         sys.exit(1)
 
     print("Collecting CSV data...")
-    data = collect_all_data()
-
-    print(f"\nCollected data for {len(data)} configurations")
+    configs = discover_configs(DOCS_DIR)
+    manifest = load_manifest(MANIFEST_PATH)
+    entries, rebuilt = build_payloads(configs, manifest, force=args.force)
+    print(f"\nCollected data for {len(entries)} configurations ({len(rebuilt)} parsed, "
+          f"{len(entries) - len(rebuilt)} cached)")
+
+    if args.inline:
+        for stale in DATA_DIR.glob('*.js'):
+            stale.unlink()
+    else:
+        written = write_sidecars(entries, args.gzip)
+        print(f"✓ {written} sidecar file(s) written to {DATA_DIR}")
 
     print("\nEmbedding data into HTML...")
-    embed_data_in_html(html_path, html_path, data)
+    if embed_data_in_html(html_path, html_path, embedded_index(entries, args.inline, args.gzip)):
+        print(f"✓ Embedded data written to {html_path}")
+    else:
+        print(f"✓ {html_path} already up to date")
+    save_manifest(entries)
 
     print("\n✅ Done! The dashboard now has embedded data and can be opened directly in a browser.")
     print(f"   Just open {html_path} in your browser - no server needed!")
@@ -3,14 +3,29 @@
 Resource monitor for FastAPI load tests.
 
 Monitors CPU, memory, thread pool stats, and background task queue.
+With `uvicorn --workers N`, process metrics are summed over the uvicorn
+process and its workers, and internal metrics use the counters of every worker.
 Runs continuously until:
 1. The specified test duration has passed
 2. All background tasks have completed (pending_count == 0)
 
+Internal metrics come from one of two sources:
+- `--shared-metrics PATH`: the shared-memory file that the app's workers publish
+  to from a side thread (start the app with METRICS_SHARED_PATH=PATH). Reading it
+  costs no request and keeps working while an event loop is blocked, so it
+  supports sampling at 10-100 Hz.
+- Otherwise, `GET /metrics` over one keep-alive connection. When the loop is
+  blocked, those samples have no internal metrics.
+
+Every sample also records the busiest thread's CPU, the number of busy threads,
+and the context-switch rates of the process tree. `--threads-output` writes
+per-thread CPU to a second CSV.
+
 Outputs time-series data to CSV.
 """
 import argparse
 import csv
+import os
 import sys
 import time
 from datetime import datetime
@@ -19,6 +34,16 @@ from typing import Optional
 import psutil
 import requests
 
+from app.shared_metrics import SharedMetricsFile, sum_counters
+
+# A thread counts as busy when it used more than this share of a core during a sample
+BUSY_THREAD_CPU_PERCENT = 5.0
+
+INTERNAL_FIELDS = (
+    'thread_pool_total', 'thread_pool_borrowed', 'thread_pool_available', 'thread_pool_waiting',
+    'pending_bg_tasks', 'active_threads', 'loop_stalls', 'loop_lag_ms',
+)
+
 
 def find_uvicorn_pid() -> Optional[int]:
     """Find the uvicorn process serving on port 8000."""
@@ -33,74 +58,224 @@ def find_uvicorn_pid() -> Optional[int]:
     return None
 
 
-def collect_metrics(pid: int, metrics_url: str, process: psutil.Process) -> Optional[dict]:
+class ProcessTree:
+    """The monitored uvicorn process plus any worker processes it spawned."""
+
+    def __init__(self, pid: int, refresh_interval: float = 1.0):
+        self.root = psutil.Process(pid)
+        self._processes = {}
+        # Listing children scans /proc, so at high sample rates it is only redone periodically
+        self._refresh_interval = refresh_interval
+        self._refreshed_at = 0.0
+        self._thread_times = {}
+        self._ctx_switches = {}
+        self._sampled_at = None
+
+    def processes(self) -> list:
+        """Return psutil.Process objects for the root and its live children."""
+        now = time.monotonic()
+        if now - self._refreshed_at < self._refresh_interval:
+            return list(self._processes.values())
+        self._refreshed_at = now
+
+        current = [self.root] + self.root.children(recursive=True)
+        live = {}
+        for proc in current:
+            cached = self._processes.get(proc.pid)
+            if cached is None:
+                # First call to cpu_percent() initializes the measurement
+                # It will return 0.0, but subsequent calls will return actual values
+                try:
+                    proc.cpu_percent(interval=None)
+                except psutil.NoSuchProcess:
+                    continue
+                cached = proc
+            live[proc.pid] = cached
+        self._processes = live
+        return list(live.values())
+
+    def sample_threads(self, processes: list) -> tuple:
+        """
+        Measure per-thread CPU and context switches since the previous call.
+
+        Returns:
+            (summary dict, list of (pid, tid, cpu_percent) for threads that used CPU)
+        """
+        now = time.monotonic()
+        elapsed = now - self._sampled_at if self._sampled_at is not None else None
+        self._sampled_at = now
+
+        thread_times = {}
+        ctx_switches = {}
+        per_thread = []
+        voluntary = involuntary = 0
+        for proc in processes:
+            try:
+                threads = proc.threads()
+                switches = proc.num_ctx_switches()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            ctx_switches[proc.pid] = switches
+            previous = self._ctx_switches.get(proc.pid)
+            if previous is not None:
+                voluntary += switches.voluntary - previous.voluntary
+                involuntary += switches.involuntary - previous.involuntary
+            for thread in threads:
+                key = (proc.pid, thread.id)
+                thread_times[key] = thread.user_time + thread.system_time
+                if elapsed and key in self._thread_times:
+                    cpu = (thread_times[key] - self._thread_times[key]) / elapsed * 100
+                    if cpu > 0:
+                        per_thread.append((proc.pid, thread.id, cpu))
+        self._thread_times = thread_times
+        self._ctx_switches = ctx_switches
+
+        if not elapsed:
+            return {
+                'ctx_switches_voluntary_per_s': None, 'ctx_switches_involuntary_per_s': None,
+                'max_thread_cpu_percent': None, 'busy_threads': None,
+            }, []
+        return {
+            'ctx_switches_voluntary_per_s': voluntary / elapsed,
+            'ctx_switches_involuntary_per_s': involuntary / elapsed,
+            'max_thread_cpu_percent': max((cpu for _, _, cpu in per_thread), default=0.0),
+            'busy_threads': sum(1 for _, _, cpu in per_thread if cpu > BUSY_THREAD_CPU_PERCENT),
+        }, per_thread
+
+
+class SharedMemorySource:
+    """Reads the counters that the app's workers publish to the shared metrics file."""
+
+    name = 'shared'
+
+    def __init__(self, path: str, wait: float = 10.0):
+        deadline = time.monotonic() + wait
+        while True:
+            try:
+                self.shared = SharedMetricsFile.attach(path)
+                return
+            except (OSError, ValueError):
+                # The app creates the file during startup
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.1)
+
+    def read(self) -> Optional[dict]:
+        workers = [worker for worker in self.shared.read_all() if not worker['stale']]
+        if not workers:
+            return None
+        totals = sum_counters(workers)
+        return {
+            'thread_pool_total': totals['thread_pool_total'],
+            'thread_pool_borrowed': totals['thread_pool_borrowed'],
+            'thread_pool_available': totals['thread_pool_total'] - totals['thread_pool_borrowed'],
+            'thread_pool_waiting': totals['thread_pool_waiting'],
+            'pending_bg_tasks': totals['pending_bg_tasks'],
+            'active_threads': totals['active_threads'],
+            'loop_stalls': totals['loop_stalls'],
+            'loop_lag_ms': totals['loop_lag_us'] / 1000,
+        }
+
+
+class HttpSource:
+    """Polls GET /metrics over a persistent keep-alive connection."""
+
+    name = 'http'
+
+    def __init__(self, url: str, timeout: float):
+        self.url = url
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    def read(self) -> Optional[dict]:
+        try:
+            response = self.session.get(self.url, timeout=self.timeout)
+            if response.status_code != 200:
+                return None
+            internal = response.json()
+        except (requests.RequestException, ValueError):
+            # Endpoint unavailable
+            return None
+        loop_stats = internal.get('event_loop') or {}
+        cluster = internal.get('cluster')
+        if cluster:
+            # Multi-worker mode: use the counters summed over every worker
+            totals = cluster['totals']
+            return {
+                'thread_pool_total': totals['thread_pool_total'],
+                'thread_pool_borrowed': totals['thread_pool_borrowed'],
+                'thread_pool_available': totals['thread_pool_total'] - totals['thread_pool_borrowed'],
+                'thread_pool_waiting': totals['thread_pool_waiting'],
+                'pending_bg_tasks': totals['pending_bg_tasks'],
+                'active_threads': totals['active_threads'],
+                'loop_stalls': totals['loop_stalls'],
+                'loop_lag_ms': totals['loop_lag_us'] / 1000,
+            }
+        return {
+            'thread_pool_total': internal['thread_pool']['total_tokens'],
+            'thread_pool_borrowed': internal['thread_pool']['borrowed_tokens'],
+            'thread_pool_available': internal['thread_pool']['available_tokens'],
+            'thread_pool_waiting': internal['thread_pool']['tasks_waiting'],
+            'pending_bg_tasks': internal['background_tasks']['pending_count'],
+            'active_threads': internal['threading']['active_thread_count'],
+            'loop_stalls': loop_stats.get('stalls'),
+            'loop_lag_ms': None,
+        }
+
+
+def collect_metrics(source, tree: ProcessTree) -> Optional[tuple]:
     """
-    Collect all metrics from process and internal endpoint.
+    Collect all metrics from the process tree and the internal metrics source.
 
     Args:
-        pid: Process ID
-        metrics_url: URL of the metrics endpoint
-        process: Pre-initialized psutil.Process object
+        source: SharedMemorySource or HttpSource
+        tree: Pre-initialized ProcessTree for the uvicorn process
 
     Returns:
-        dict with all metrics, or None if process not found
+        (metrics dict, per-thread CPU list), or None if process not found
     """
     try:
-        # Process-level metrics
+        # Process-level metrics, summed over the uvicorn process and its workers
         # cpu_percent() returns the CPU usage since the last call
         # Using interval=None makes it non-blocking but requires previous call to initialize
-        cpu_percent = process.cpu_percent(interval=None)
-        memory_info = process.memory_info()
-        num_threads = process.num_threads()
+        if not tree.root.is_running():
+            return None
+        cpu_percent = 0.0
+        rss = vms = num_threads = 0
+        processes = tree.processes()
+        for proc in processes:
+            try:
+                cpu_percent += proc.cpu_percent(interval=None)
+                memory_info = proc.memory_info()
+                rss += memory_info.rss
+                vms += memory_info.vms
+                num_threads += proc.num_threads()
+            except psutil.NoSuchProcess:
+                continue
+        thread_summary, per_thread = tree.sample_threads(processes)
 
         metrics = {
             'timestamp': datetime.now().isoformat(),
             'cpu_percent': cpu_percent,
-            'memory_rss_mb': memory_info.rss / (1024 * 1024),
-            'memory_vms_mb': memory_info.vms / (1024 * 1024),
+            'memory_rss_mb': rss / (1024 * 1024),
+            'memory_vms_mb': vms / (1024 * 1024),
             'process_threads': num_threads,
+            'monitored_processes': len(processes),
+            **thread_summary,
+            'metrics_source': source.name,
         }
 
-        # Internal metrics from endpoint
-        try:
-            response = requests.get(metrics_url, timeout=1)
-            if response.status_code == 200:
-                internal = response.json()
-                metrics.update({
-                    'thread_pool_total': internal['thread_pool']['total_tokens'],
-                    'thread_pool_borrowed': internal['thread_pool']['borrowed_tokens'],
-                    'thread_pool_available': internal['thread_pool']['available_tokens'],
-                    'thread_pool_waiting': internal['thread_pool']['tasks_waiting'],
-                    'pending_bg_tasks': internal['background_tasks']['pending_count'],
-                    'active_threads': internal['threading']['active_thread_count'],
-                })
-            else:
-                metrics.update({
-                    'thread_pool_total': None,
-                    'thread_pool_borrowed': None,
-                    'thread_pool_available': None,
-                    'thread_pool_waiting': None,
-                    'pending_bg_tasks': None,
-                    'active_threads': None,
-                })
-        except requests.RequestException:
-            # Endpoint unavailable
-            metrics.update({
-                'thread_pool_total': None,
-                'thread_pool_borrowed': None,
-                'thread_pool_available': None,
-                'thread_pool_waiting': None,
-                'pending_bg_tasks': None,
-                'active_threads': None,
-            })
+        # Internal metrics (None values when the source could not be read)
+        metrics.update(source.read() or dict.fromkeys(INTERNAL_FIELDS))
 
-        return metrics
+        return metrics, per_thread
     except psutil.NoSuchProcess:
         return None
 
 
 def monitor(output_file: str, test_duration: int, interval: float = 1.0,
-            max_wait_for_bg_tasks: int = 60, pid: Optional[int] = None):
+            max_wait_for_bg_tasks: int = 60, pid: Optional[int] = None,
+            shared_metrics: Optional[str] = None, threads_output: Optional[str] = None):
     """
     Main monitoring loop.
 
@@ -110,6 +285,8 @@ def monitor(output_file: str, test_duration: int, interval: float = 1.0,
         interval: Sample interval in seconds
         max_wait_for_bg_tasks: Maximum time to wait for background tasks after test ends
         pid: Process ID to monitor (if None, will search for uvicorn process)
+        shared_metrics: Shared metrics file published by the app (if None, poll /metrics)
+        threads_output: Optional CSV path for per-thread CPU samples
     """
     # Find uvicorn process if PID not provided
     if pid is None:
@@ -118,80 +295,117 @@ def monitor(output_file: str, test_duration: int, interval: float = 1.0,
             print("ERROR: Could not find uvicorn process", file=sys.stderr)
             sys.exit(1)
 
+    if shared_metrics:
+        source = SharedMemorySource(shared_metrics)
+    else:
+        source = HttpSource('http://localhost:8000/metrics', timeout=max(interval, 0.5))
+
     print(f"Monitoring uvicorn process PID {pid}")
-    print(f"Test duration: {test_duration}s, Sample interval: {interval}s")
+    print(f"Test duration: {test_duration}s, Sample interval: {interval}s, Internal metrics: {source.name}")
 
-    # Initialize process object and CPU monitoring
-    process = psutil.Process(pid)
-    # First call to cpu_percent() initializes the measurement
-    # It will return 0.0, but subsequent calls will return actual values
-    process.cpu_percent(interval=None)
+    # Initialize process objects and CPU monitoring for uvicorn and its workers
+    tree = ProcessTree(pid)
+    tree.processes()
+    tree.sample_threads(tree.processes())
 
     fieldnames = [
         'timestamp', 'cpu_percent', 'memory_rss_mb', 'memory_vms_mb',
-        'process_threads', 'thread_pool_total', 'thread_pool_borrowed',
+        'process_threads', 'monitored_processes', 'thread_pool_total', 'thread_pool_borrowed',
         'thread_pool_available', 'thread_pool_waiting', 'pending_bg_tasks',
-        'active_threads', 'phase'
+        'active_threads', 'loop_stalls', 'loop_lag_ms', 'ctx_switches_voluntary_per_s',
+        'ctx_switches_involuntary_per_s', 'max_thread_cpu_percent', 'busy_threads',
+        'metrics_source', 'phase'
     ]
 
-    metrics_url = 'http://localhost:8000/metrics'
     start_time = time.time()
     test_end_time = start_time + test_duration
 
+    threads_file = open(threads_output, 'w', newline='') if threads_output else None
+    threads_writer = None
+    if threads_file:
+        threads_writer = csv.writer(threads_file)
+        threads_writer.writerow(['timestamp', 'pid', 'tid', 'cpu_percent', 'phase'])
+
+    # Console output and file flushes happen at most once per second, whatever the sample rate
+    last_report = 0.0
+
+    def sample(phase):
+        """Take one sample, write it, and return the metrics (None if the process is gone)."""
+        collected = collect_metrics(source, tree)
+        if collected is None:
+            return None
+        metrics, per_thread = collected
+        metrics['phase'] = phase
+        writer.writerow(metrics)
+        if threads_writer:
+            threads_writer.writerows(
+                (metrics['timestamp'], thread_pid, tid, f"{cpu:.1f}", phase) for thread_pid, tid, cpu in per_thread
+            )
+        return metrics
+
+    def report_due():
+        """Flush output files and return True at most once per second."""
+        nonlocal last_report
+        now = time.time()
+        if now - last_report < 1.0:
+            return False
+        last_report = now
+        f.flush()
+        if threads_file:
+            threads_file.flush()
+        return True
+
+    def format_status(metrics):
+        cpu = metrics.get('cpu_percent')
+        cpu = f"{cpu:.1f}" if cpu is not None else '?'
+        lag = metrics.get('loop_lag_ms')
+        lag = f"{lag:.0f}ms" if lag is not None else '?'
+        return (f"CPU: {cpu}%, Threads: {metrics.get('thread_pool_borrowed', '?')}/"
+                f"{metrics.get('thread_pool_total', '?')}, Pending BG: {metrics.get('pending_bg_tasks', '?')}, "
+                f"Loop lag: {lag}")
+
+    def sleep_until(deadline):
+        delay = deadline - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
     with open(output_file, 'w', newline='') as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
 
         print("\n=== Monitoring Phase 1: During Load Test ===")
 
-        # Phase 1: Monitor during the test
+        # Phase 1: Monitor during the test (samples are scheduled on a fixed grid)
+        next_sample = time.time()
         while time.time() < test_end_time:
-            metrics = collect_metrics(pid, metrics_url, process)
-            if metrics:
-                metrics['phase'] = 'test'
-                writer.writerow(metrics)
-                f.flush()
-
-                # Print status
-                elapsed = time.time() - start_time
-                pending = metrics.get('pending_bg_tasks', '?')
-                cpu = metrics.get('cpu_percent', '?')
-                if cpu != '?':
-                    cpu = f"{cpu:.1f}"
-                borrowed = metrics.get('thread_pool_borrowed', '?')
-                print(f"[{elapsed:.0f}s] CPU: {cpu}%, Threads: {borrowed}/40, Pending BG: {pending}")
-
-            time.sleep(interval)
+            metrics = sample('test')
+            if metrics and report_due():
+                print(f"[{time.time() - start_time:.0f}s] {format_status(metrics)}")
+            next_sample += interval
+            sleep_until(next_sample)
 
         print("\n=== Monitoring Phase 2: Waiting for Background Tasks ===")
 
         # Phase 2: Wait for background tasks to complete
         bg_wait_start = time.time()
         all_tasks_complete = False
+        next_sample = bg_wait_start
 
         while time.time() - bg_wait_start < max_wait_for_bg_tasks:
-            metrics = collect_metrics(pid, metrics_url, process)
+            metrics = sample('bg_completion')
             if not metrics:
                 print("Process no longer exists")
                 break
 
-            metrics['phase'] = 'bg_completion'
-            writer.writerow(metrics)
-            f.flush()
-
             pending = metrics.get('pending_bg_tasks')
-            if pending is None:
-                print("Metrics endpoint not available")
+            if pending is None and source.name == 'shared':
+                print("No worker is publishing metrics")
                 break
 
-            elapsed_total = time.time() - start_time
-            elapsed_bg = time.time() - bg_wait_start
-            cpu = metrics.get('cpu_percent', '?')
-            if cpu != '?':
-                cpu = f"{cpu:.1f}"
-            borrowed = metrics.get('thread_pool_borrowed', '?')
-            print(f"[{elapsed_total:.0f}s / +{elapsed_bg:.0f}s bg] "
-                  f"CPU: {cpu}%, Threads: {borrowed}/40, Pending BG: {pending}")
+            if report_due():
+                elapsed_total = time.time() - start_time
+                elapsed_bg = time.time() - bg_wait_start
+                print(f"[{elapsed_total:.0f}s / +{elapsed_bg:.0f}s bg] {format_status(metrics)}")
 
             if pending == 0:
                 all_tasks_complete = True
@@ -203,14 +417,17 @@ def monitor(output_file: str, test_duration: int, interval: float = 1.0,
                 print(f"  Total monitoring time: {total_duration:.1f}s")
                 break
 
-            time.sleep(interval)
+            next_sample += interval
+            sleep_until(next_sample)
 
         if not all_tasks_complete:
             print(f"\n⚠ WARNING: Background tasks did not complete within {max_wait_for_bg_tasks}s")
-            final_metrics = collect_metrics(pid, metrics_url, process)
-            if final_metrics:
-                print(f"  Final pending count: {final_metrics.get('pending_bg_tasks', '?')}")
+            final = collect_metrics(source, tree)
+            if final:
+                print(f"  Final pending count: {final[0].get('pending_bg_tasks', '?')}")
 
+    if threads_file:
+        threads_file.close()
     print(f"\nMonitoring complete. Results written to {output_file}")
 
     # Return exit code based on whether all tasks completed
@@ -226,11 +443,16 @@ if __name__ == '__main__':
     parser.add_argument('--test-duration', '-d', type=int, default=30,
                         help='Expected test duration in seconds (default: 30)')
     parser.add_argument('--interval', '-i', type=float, default=1.0,
-                        help='Sample interval in seconds (default: 1.0)')
+                        help='Sample interval in seconds, e.g. 0.01-0.1 for 10-100 Hz (default: 1.0)')
     parser.add_argument('--max-bg-wait', type=int, default=60,
                         help='Maximum time to wait for background tasks (default: 60)')
     parser.add_argument('--pid', '-p', type=int, default=None,
                         help='Process ID to monitor (if not provided, will search for uvicorn)')
+    parser.add_argument('--shared-metrics', default=os.environ.get('METRICS_SHARED_PATH') or None,
+                        help='Shared metrics file the app publishes to (default: $METRICS_SHARED_PATH; '
+                             'without it /metrics is polled over HTTP)')
+    parser.add_argument('--threads-output', default=None,
+                        help='Optional CSV file for per-thread CPU samples')
 
     args = parser.parse_args()
 
@@ -239,5 +461,7 @@ if __name__ == '__main__':
         test_duration=args.test_duration,
         interval=args.interval,
         max_wait_for_bg_tasks=args.max_bg_wait,
-        pid=args.pid
+        pid=args.pid,
+        shared_metrics=args.shared_metrics,
+        threads_output=args.threads_output
     )
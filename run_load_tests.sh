@@ -16,12 +16,62 @@ declare -a routes=(
     "async-route-async-inner-async-bg-async-task|AsyncRouteAsyncInnerAsyncBgAsyncTask"
     "async-route-async-inner-async-bg-sync-task|AsyncRouteAsyncInnerAsyncBgSyncTask"
     "async-route-async-inner-sync-bg-sync-task|AsyncRouteAsyncInnerSyncBgSyncTask"
+    "sync-route-cpu-inner-inline|SyncRouteCpuInnerInline"
+    "sync-route-cpu-inner-thread|SyncRouteCpuInnerThread"
+    "sync-route-cpu-inner-process|SyncRouteCpuInnerProcess"
+    "async-route-cpu-inner-inline|AsyncRouteCpuInnerInline"
+    "async-route-cpu-inner-thread|AsyncRouteCpuInnerThread"
+    "async-route-cpu-inner-process|AsyncRouteCpuInnerProcess"
+    "sync-route-http-inner|SyncRouteHttpInner"
+    "async-route-http-inner|AsyncRouteHttpInner"
+    "sync-route-db-inner|SyncRouteDbInner"
+    "async-route-db-inner|AsyncRouteDbInner"
 )
 
+# Concurrency levels: "users|spawn_rate"
+declare -a user_levels=(
+    "10|5"
+    "40|10"
+    "100|20"
+)
+
+# uvicorn worker counts to benchmark (override with e.g. WORKERS="1 2")
+read -r -a worker_counts <<< "${WORKERS:-1 2 4 8}"
+
+# "closed" (users wait for responses and think) or "open" (constant arrival rate,
+# OPEN_LOOP_RATE req/s per user, default 2 - about the nominal closed-loop load)
+LOAD_MODE="${LOAD_MODE:-closed}"
+
+# Resource sampling interval in seconds (0.05 = 20 Hz)
+MONITOR_INTERVAL="${MONITOR_INTERVAL:-0.05}"
+
+# Seconds of sampling profile to capture per run, starting 5s into the test (0 = off).
+# Written to docs/{run}_profile.txt in collapsed-stack format (one worker's view in multi-worker runs)
+PROFILE_SECONDS="${PROFILE_SECONDS:-0}"
+
+# Latency of the upstream stub that the http-inner routes call, in seconds
+UPSTREAM_LATENCY="${UPSTREAM_LATENCY:-0.2}"
+
+# Shared file that workers publish their metrics to
+METRICS_SHARED_FILE="/tmp/fastapi-sync-vs-async-metrics.bin"
+
+# Commit the runs are made with, recorded next to each run's artifacts (null outside a git checkout)
+GIT_COMMIT=$(git rev-parse HEAD 2>/dev/null)
+GIT_COMMIT_JSON=$([ -n "$GIT_COMMIT" ] && echo "\"$GIT_COMMIT\"" || echo null)
+GIT_DIRTY_JSON=$([ -n "$(git status --porcelain --untracked-files=no 2>/dev/null)" ] && echo true || echo false)
+
 # Function to start uvicorn and wait for it to be ready
 start_uvicorn() {
-    echo "Starting uvicorn..."
-    poetry run uvicorn app.main:app --host 0.0.0.0 --port 8000 > /tmp/uvicorn.log 2>&1 &
+    local workers=$1
+    local cpu_pool_prestart=$2
+    echo "Starting uvicorn with ${workers} worker(s)..."
+    rm -f "$METRICS_SHARED_FILE"
+    # Workers publish their counters to shared memory at 100 Hz; resource_monitor.py reads them
+    # from there, so sampling keeps working while an event loop is blocked.
+    # The leftover background backlog is abandoned at shutdown instead of drained
+    PROFILER_ENABLED=$([ "$PROFILE_SECONDS" != "0" ] && echo 1 || echo 0) CPU_POOL_PRESTART="$cpu_pool_prestart" \
+    METRICS_SHARED_PATH="$METRICS_SHARED_FILE" METRICS_PUBLISH_INTERVAL=0.01 BG_DRAIN_TIMEOUT=0 \
+        poetry run uvicorn app.main:app --host 0.0.0.0 --port 8000 --workers "$workers" > /tmp/uvicorn.log 2>&1 &
     UVICORN_PID=$!
 
     # Wait for uvicorn to be ready (max 10 seconds)
@@ -47,127 +97,104 @@ stop_uvicorn() {
     fi
 }
 
-# Run tests for each route at different concurrency levels
-for route_config in "${routes[@]}"
-do
-    IFS='|' read -r route_name class_name <<< "$route_config"
+# Function to run one route at one concurrency level and worker count
+run_test() {
+    local route_name=$1
+    local class_name=$2
+    local users=$3
+    local spawn_rate=$4
+    local workers=$5
+
+    # Single-worker results keep their original names so existing dashboards still load them
+    local name="${route_name}-${users}users"
+    if [ "$workers" -gt 1 ]; then
+        name="${name}-${workers}workers"
+    fi
+    if [ "$LOAD_MODE" = "open" ]; then
+        name="${name}-open"
+        class_name="OpenLoop${class_name}"
+    fi
 
-    # Test with 10 users
     echo ""
     echo "=========================================="
-    echo "Testing ${route_name} with 10 users"
+    echo "Testing ${route_name} with ${users} users, ${workers} worker(s), ${LOAD_MODE} loop"
     echo "=========================================="
 
-    start_uvicorn
-    if [ $? -ne 0 ]; then
-        echo "Skipping test due to uvicorn startup failure"
-        continue
+    # Routes that use the process pool get it started and warmed up before the test
+    local cpu_pool_prestart=0
+    if [[ "$route_name" == *-cpu-inner-process ]]; then
+        cpu_pool_prestart=1
     fi
 
-    # Start resource monitor in background with the correct PID
-    poetry run python resource_monitor.py \
-        --output "docs/${route_name}-10users_resources.csv" \
-        --test-duration 30 \
-        --interval 1 \
-        --pid $UVICORN_PID &
-    MONITOR_PID=$!
-
-    # Run locust test
-    poetry run locust \
-        -f tests/locustfile.py \
-        --headless \
-        -u 10 \
-        -r 5 \
-        -t 30s \
-        --only-summary \
-        --html "docs/${route_name}-10users.html" \
-        --csv "docs/${route_name}-10users" \
-        ${class_name}
-
-    # Wait for resource monitor to finish (it waits for bg tasks)
-    echo "Waiting for resource monitor to complete..."
-    wait $MONITOR_PID
-
-    stop_uvicorn
-    sleep 2
-
-    # Test with 40 users
-    echo ""
-    echo "=========================================="
-    echo "Testing ${route_name} with 40 users"
-    echo "=========================================="
-
-    start_uvicorn
+    start_uvicorn "$workers" "$cpu_pool_prestart"
     if [ $? -ne 0 ]; then
         echo "Skipping test due to uvicorn startup failure"
-        continue
+        stop_uvicorn
+        return
     fi
 
+    # What the run was made with, read by `python -m bench.store ingest`
+    printf '{"git_commit": %s, "git_dirty": %s, "load_mode": "%s", "users": %s, "workers": %s}\n' \
+        "$GIT_COMMIT_JSON" "$GIT_DIRTY_JSON" "$LOAD_MODE" "$users" "$workers" > "docs/${name}_meta.json"
+
     # Start resource monitor in background with the correct PID
     poetry run python resource_monitor.py \
-        --output "docs/${route_name}-40users_resources.csv" \
+        --output "docs/${name}_resources.csv" \
         --test-duration 30 \
-        --interval 1 \
+        --interval "$MONITOR_INTERVAL" \
+        --shared-metrics "$METRICS_SHARED_FILE" \
+        --threads-output "docs/${name}_threads.csv" \
         --pid $UVICORN_PID &
     MONITOR_PID=$!
 
+    PROFILE_PID=""
+    if [ "$PROFILE_SECONDS" != "0" ]; then
+        (sleep 5 && curl -s "http://localhost:8000/debug/profile?seconds=${PROFILE_SECONDS}" \
+            -o "docs/${name}_profile.txt") &
+        PROFILE_PID=$!
+    fi
+
     # Run locust test
     poetry run locust \
         -f tests/locustfile.py \
         --headless \
-        -u 40 \
-        -r 10 \
+        -u "$users" \
+        -r "$spawn_rate" \
         -t 30s \
         --only-summary \
-        --html "docs/${route_name}-40users.html" \
-        --csv "docs/${route_name}-40users" \
+        --html "docs/${name}.html" \
+        --csv "docs/${name}" \
         ${class_name}
 
     # Wait for resource monitor to finish (it waits for bg tasks)
     echo "Waiting for resource monitor to complete..."
     wait $MONITOR_PID
+    if [ -n "$PROFILE_PID" ]; then
+        wait $PROFILE_PID
+    fi
 
     stop_uvicorn
     sleep 2
+}
 
-    # Test with 100 users
-    echo ""
-    echo "=========================================="
-    echo "Testing ${route_name} with 100 users"
-    echo "=========================================="
-
-    start_uvicorn
-    if [ $? -ne 0 ]; then
-        echo "Skipping test due to uvicorn startup failure"
-        continue
-    fi
-
-    # Start resource monitor in background with the correct PID
-    poetry run python resource_monitor.py \
-        --output "docs/${route_name}-100users_resources.csv" \
-        --test-duration 30 \
-        --interval 1 \
-        --pid $UVICORN_PID &
-    MONITOR_PID=$!
-
-    # Run locust test
-    poetry run locust \
-        -f tests/locustfile.py \
-        --headless \
-        -u 100 \
-        -r 20 \
-        -t 30s \
-        --only-summary \
-        --html "docs/${route_name}-100users.html" \
-        --csv "docs/${route_name}-100users" \
-        ${class_name}
+# Start the upstream stub once for all runs; the http-inner routes call it at UPSTREAM_URL
+poetry run python -m bench.upstream --port 8100 --latency "$UPSTREAM_LATENCY" > /tmp/upstream.log 2>&1 &
+UPSTREAM_PID=$!
+trap 'kill -INT $UPSTREAM_PID 2>/dev/null' EXIT
 
-    # Wait for resource monitor to finish (it waits for bg tasks)
-    echo "Waiting for resource monitor to complete..."
-    wait $MONITOR_PID
+# Run tests for each route at different worker counts and concurrency levels
+for route_config in "${routes[@]}"
+do
+    IFS='|' read -r route_name class_name <<< "$route_config"
 
-    stop_uvicorn
-    sleep 2
+    for workers in "${worker_counts[@]}"
+    do
+        for user_level in "${user_levels[@]}"
+        do
+            IFS='|' read -r users spawn_rate <<< "$user_level"
+            run_test "$route_name" "$class_name" "$users" "$spawn_rate" "$workers"
+        done
+    done
 done
 
 echo ""
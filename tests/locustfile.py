@@ -1,5 +1,129 @@
-"""Locust load testing scenarios for all routes."""
-from locust import HttpUser, task, between
+"""
+Locust load testing scenarios for all routes.
+
+The route classes are closed-loop: each user waits for its response before
+thinking and sending the next request. The OpenLoop* classes fire at a fixed
+rate (OPEN_LOOP_RATE requests/s per user) whatever the server does, and report
+latency from each request's intended send time. Every request, failed or not,
+is also recorded in an HDR histogram per route, written to <csv prefix>_hdr.csv
+at the end of a run with --csv, next to a histogram of the failed ones alone.
+"""
+import csv
+import os
+import sys
+import time
+from pathlib import Path
+
+import gevent
+import gevent.pool
+import requests
+from requests.adapters import HTTPAdapter
+from locust import HttpUser, task, between, constant, events
+
+# Locust only puts this file's directory on sys.path; bench/ lives at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from bench.hdr import HdrHistogram  # noqa: E402
+
+# Requests per second fired by each open-loop user
+OPEN_LOOP_RATE = float(os.environ.get("OPEN_LOOP_RATE", "2"))
+
+# Seconds an open-loop request waits before giving up; sent as X-Request-Timeout so an app
+# running with REQUEST_CANCELLATION=1 drops the work too
+CLIENT_TIMEOUT = float(os.environ.get("CLIENT_TIMEOUT", "120"))
+
+# Per-route latency histograms in microseconds: every request, and failed requests alone.
+# Timeouts, 5xx and the 504/499 of a cancelling server are the slow tail, so they are not left out
+latency_histograms = {}
+error_histograms = {}
+
+
+class RequestCutOff(Exception):
+    """An open-loop request still outstanding when the test stopped."""
+
+
+@events.request.add_listener
+def record_latency(name, response_time, exception, **kwargs):
+    latency_histograms.setdefault(name, HdrHistogram()).record(response_time * 1000)
+    if exception is not None:
+        error_histograms.setdefault(name, HdrHistogram()).record(response_time * 1000)
+
+
+@events.test_stop.add_listener
+def write_latency_histograms(environment, **kwargs):
+    csv_prefix = getattr(environment.parsed_options, "csv_prefix", None)
+    if not csv_prefix or not latency_histograms:
+        return
+    aggregated = HdrHistogram()
+    for histogram in latency_histograms.values():
+        aggregated.merge(histogram)
+    rows = [(name, "all", histogram) for name, histogram in sorted(latency_histograms.items())]
+    rows += [(name, "failed", histogram) for name, histogram in sorted(error_histograms.items())]
+    rows.append(("Aggregated", "all", aggregated))
+    fields = list(aggregated.summary())
+    with open(f"{csv_prefix}_hdr.csv", "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Name", "Requests"] + [field if field == "count" else f"{field}_ms" for field in fields])
+        for name, requests_recorded, histogram in rows:
+            summary = histogram.summary(scale=1000)
+            writer.writerow([name, requests_recorded] + [summary[field] for field in fields])
+
+
+class OpenLoopUser(HttpUser):
+    """Fires requests at a constant arrival rate, independent of response times."""
+    abstract = True
+    wait_time = constant(0)
+    host = "http://localhost:8000"
+    path = None
+
+    def on_start(self):
+        # A separate session so Locust's client does not report service time on its own;
+        # sized so outstanding requests never queue for a connection in the client
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1000))
+
+    def send(self, intended):
+        exception = None
+        response_length = 0
+        try:
+            response = self.session.get(self.host + self.path, timeout=CLIENT_TIMEOUT,
+                                        headers={"X-Request-Timeout": str(CLIENT_TIMEOUT)})
+            response.raise_for_status()
+            response_length = len(response.content)
+        except requests.RequestException as exc:
+            exception = exc
+        self.report(intended, response_length, exception)
+
+    def report(self, intended, response_length, exception):
+        # Measured from when the request should have gone out, so time spent
+        # behind a stalled server is not omitted (coordinated omission)
+        self.environment.events.request.fire(
+            request_type="GET",
+            name=self.path,
+            response_time=(time.perf_counter() - intended) * 1000,
+            response_length=response_length,
+            exception=exception,
+            context={"open_loop": True},
+        )
+
+    @task
+    def fire_at_constant_rate(self):
+        interval = 1.0 / OPEN_LOOP_RATE
+        in_flight = gevent.pool.Group()
+        next_send = time.perf_counter()
+        try:
+            while True:
+                delay = next_send - time.perf_counter()
+                if delay > 0:
+                    gevent.sleep(delay)
+                in_flight.spawn(self.send, next_send).intended = next_send
+                next_send += interval
+        finally:
+            # The requests still outstanding are the slowest ones. Report them as failures with
+            # the time they have waited so far, so the cut-off does not trim the tail
+            for greenlet in list(in_flight):
+                if not greenlet.dead:
+                    self.report(greenlet.intended, 0, RequestCutOff("Still waiting for a response at test stop"))
+            in_flight.kill(block=False)
 
 
 class SyncRouteSyncInnerAsyncBgSyncTask(HttpUser):
@@ -70,3 +194,188 @@ class AsyncRouteAsyncInnerSyncBgSyncTask(HttpUser):
     @task
     def test_async_route_async_inner_sync_bg_sync_task(self):
         self.client.get("/async-route-async-inner-sync-bg-sync-task")
+
+
+class SyncRouteCpuInnerInline(HttpUser):
+    """Load test: def/cpu-inline"""
+    wait_time = between(0.1, 0.5)
+    host = "http://localhost:8000"
+
+    @task
+    def test_sync_route_cpu_inner_inline(self):
+        self.client.get("/sync-route-cpu-inner?mode=inline")
+
+
+class SyncRouteCpuInnerThread(HttpUser):
+    """Load test: def/cpu-thread"""
+    wait_time = between(0.1, 0.5)
+    host = "http://localhost:8000"
+
+    @task
+    def test_sync_route_cpu_inner_thread(self):
+        self.client.get("/sync-route-cpu-inner?mode=thread")
+
+
+class SyncRouteCpuInnerProcess(HttpUser):
+    """Load test: def/cpu-process"""
+    wait_time = between(0.1, 0.5)
+    host = "http://localhost:8000"
+
+    @task
+    def test_sync_route_cpu_inner_process(self):
+        self.client.get("/sync-route-cpu-inner?mode=process")
+
+
+class AsyncRouteCpuInnerInline(HttpUser):
+    """Load test: async/cpu-inline"""
+    wait_time = between(0.1, 0.5)
+    host = "http://localhost:8000"
+
+    @task
+    def test_async_route_cpu_inner_inline(self):
+        self.client.get("/async-route-cpu-inner?mode=inline")
+
+
+class AsyncRouteCpuInnerThread(HttpUser):
+    """Load test: async/cpu-thread"""
+    wait_time = between(0.1, 0.5)
+    host = "http://localhost:8000"
+
+    @task
+    def test_async_route_cpu_inner_thread(self):
+        self.client.get("/async-route-cpu-inner?mode=thread")
+
+
+class AsyncRouteCpuInnerProcess(HttpUser):
+    """Load test: async/cpu-process"""
+    wait_time = between(0.1, 0.5)
+    host = "http://localhost:8000"
+
+    @task
+    def test_async_route_cpu_inner_process(self):
+        self.client.get("/async-route-cpu-inner?mode=process")
+
+
+class SyncRouteHttpInner(HttpUser):
+    """Load test: def/http-pool"""
+    wait_time = between(0.1, 0.5)
+    host = "http://localhost:8000"
+
+    @task
+    def test_sync_route_http_inner(self):
+        self.client.get("/sync-route-http-inner")
+
+
+class AsyncRouteHttpInner(HttpUser):
+    """Load test: async/http-pool"""
+    wait_time = between(0.1, 0.5)
+    host = "http://localhost:8000"
+
+    @task
+    def test_async_route_http_inner(self):
+        self.client.get("/async-route-http-inner")
+
+
+class SyncRouteDbInner(HttpUser):
+    """Load test: def/db-pool"""
+    wait_time = between(0.1, 0.5)
+    host = "http://localhost:8000"
+
+    @task
+    def test_sync_route_db_inner(self):
+        self.client.get("/sync-route-db-inner")
+
+
+class AsyncRouteDbInner(HttpUser):
+    """Load test: async/db-pool"""
+    wait_time = between(0.1, 0.5)
+    host = "http://localhost:8000"
+
+    @task
+    def test_async_route_db_inner(self):
+        self.client.get("/async-route-db-inner")
+
+
+class OpenLoopSyncRouteSyncInnerAsyncBgSyncTask(OpenLoopUser):
+    """Open-loop load test: def/sync/async-bg-reg/sync-bg-task"""
+    path = "/sync-route-sync-inner-async-bg-sync-task"
+
+
+class OpenLoopSyncRouteSyncInnerAsyncBgAsyncTask(OpenLoopUser):
+    """Open-loop load test: def/sync/async-bg-reg/async-bg-task"""
+    path = "/sync-route-sync-inner-async-bg-async-task"
+
+
+class OpenLoopSyncRouteSyncInnerSyncBgSyncTask(OpenLoopUser):
+    """Open-loop load test: def/sync/sync-bg-reg/sync-bg-task"""
+    path = "/sync-route-sync-inner-sync-bg-sync-task"
+
+
+class OpenLoopAsyncRouteSyncInnerAsyncBgAsyncTask(OpenLoopUser):
+    """Open-loop load test: async/sync/async-bg-reg/async-bg-task"""
+    path = "/async-route-sync-inner-async-bg-async-task"
+
+
+class OpenLoopAsyncRouteAsyncInnerAsyncBgAsyncTask(OpenLoopUser):
+    """Open-loop load test: async/async/async-bg-reg/async-bg-task"""
+    path = "/async-route-async-inner-async-bg-async-task"
+
+
+class OpenLoopAsyncRouteAsyncInnerAsyncBgSyncTask(OpenLoopUser):
+    """Open-loop load test: async/async/async-bg-reg/sync-bg-task"""
+    path = "/async-route-async-inner-async-bg-sync-task"
+
+
+class OpenLoopAsyncRouteAsyncInnerSyncBgSyncTask(OpenLoopUser):
+    """Open-loop load test: async/async/sync-bg-reg/sync-bg-task"""
+    path = "/async-route-async-inner-sync-bg-sync-task"
+
+
+class OpenLoopSyncRouteCpuInnerInline(OpenLoopUser):
+    """Open-loop load test: def/cpu-inline"""
+    path = "/sync-route-cpu-inner?mode=inline"
+
+
+class OpenLoopSyncRouteCpuInnerThread(OpenLoopUser):
+    """Open-loop load test: def/cpu-thread"""
+    path = "/sync-route-cpu-inner?mode=thread"
+
+
+class OpenLoopSyncRouteCpuInnerProcess(OpenLoopUser):
+    """Open-loop load test: def/cpu-process"""
+    path = "/sync-route-cpu-inner?mode=process"
+
+
+class OpenLoopAsyncRouteCpuInnerInline(OpenLoopUser):
+    """Open-loop load test: async/cpu-inline"""
+    path = "/async-route-cpu-inner?mode=inline"
+
+
+class OpenLoopAsyncRouteCpuInnerThread(OpenLoopUser):
+    """Open-loop load test: async/cpu-thread"""
+    path = "/async-route-cpu-inner?mode=thread"
+
+
+class OpenLoopAsyncRouteCpuInnerProcess(OpenLoopUser):
+    """Open-loop load test: async/cpu-process"""
+    path = "/async-route-cpu-inner?mode=process"
+
+
+class OpenLoopSyncRouteHttpInner(OpenLoopUser):
+    """Open-loop load test: def/http-pool"""
+    path = "/sync-route-http-inner"
+
+
+class OpenLoopAsyncRouteHttpInner(OpenLoopUser):
+    """Open-loop load test: async/http-pool"""
+    path = "/async-route-http-inner"
+
+
+class OpenLoopSyncRouteDbInner(OpenLoopUser):
+    """Open-loop load test: def/db-pool"""
+    path = "/sync-route-db-inner"
+
+
+class OpenLoopAsyncRouteDbInner(OpenLoopUser):
+    """Open-loop load test: async/db-pool"""
+    path = "/async-route-db-inner"
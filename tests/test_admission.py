@@ -0,0 +1,21 @@
+"""Configuration checks of app.admission."""
+import pytest
+
+from app import admission, config
+
+
+def test_unknown_overflow_policy_fails_validation(monkeypatch):
+    monkeypatch.setattr(config, "BG_OVERFLOW_POLICIES", {"sync_background_task": "rejct"})
+    with pytest.raises(ValueError, match=r"BG_OVERFLOW_POLICIES\[sync_background_task\]"):
+        admission.validate_policies()
+
+
+def test_unknown_default_policy_fails_validation(monkeypatch):
+    monkeypatch.setattr(config, "BG_OVERFLOW_DEFAULT", "queue")
+    with pytest.raises(ValueError, match="BG_OVERFLOW_DEFAULT"):
+        admission.validate_policies()
+
+
+def test_known_policies_pass_validation(monkeypatch):
+    monkeypatch.setattr(config, "BG_OVERFLOW_POLICIES", {"sync_background_task": "coalesce"})
+    admission.validate_policies()
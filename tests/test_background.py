@@ -0,0 +1,51 @@
+"""Scheduling bookkeeping of app.background."""
+import asyncio
+
+import pytest
+from fastapi import BackgroundTasks
+
+from app import background, config
+from app.coalescing import coalescer
+from app.metrics import get_pending_bg_tasks
+
+
+@pytest.fixture
+def coalesced(monkeypatch):
+    monkeypatch.setattr(config, "BG_BACKEND", "pool")
+    monkeypatch.setattr(config, "BG_SCHEDULING", "response")
+    monkeypatch.setattr(config, "BG_COALESCE_TASKS", {"sync_background_task"})
+    dispatched = []
+    monkeypatch.setattr(background, "_dispatch", lambda task, call: dispatched.append(call))
+    return dispatched
+
+
+def test_dropped_response_leaves_no_coalescing_key_claimed(coalesced):
+    pending = get_pending_bg_tasks("sync_background_task")
+
+    # The response is never sent, so its background tasks never run
+    background.schedule_background_task(BackgroundTasks(), background.sync_background_task)
+    assert coalescer.queued() == 0
+    assert get_pending_bg_tasks("sync_background_task") == pending
+
+    # A later request with the same key is scheduled, not absorbed
+    tasks = BackgroundTasks()
+    background.schedule_background_task(tasks, background.sync_background_task)
+    asyncio.run(tasks())
+    assert len(coalesced) == 1
+    assert get_pending_bg_tasks("sync_background_task") == pending + 1
+
+    key = coalesced[0].coalesce_key
+    background._on_task_done("sync_background_task", coalesced[0].key)
+    coalescer.release(key)
+
+
+def test_call_scheduled_while_one_is_queued_is_absorbed(coalesced):
+    first, second = BackgroundTasks(), BackgroundTasks()
+    background.schedule_background_task(first, background.sync_background_task)
+    background.schedule_background_task(second, background.sync_background_task)
+    asyncio.run(first())
+    asyncio.run(second())
+    assert len(coalesced) == 1
+
+    background._on_task_done("sync_background_task", coalesced[0].key)
+    coalescer.release(coalesced[0].coalesce_key)
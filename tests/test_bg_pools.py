@@ -0,0 +1,106 @@
+"""Dedicated background task pools of app.bg_pools."""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app import bg_pools, config
+from app.bg_pools import LoopWorkerPool, ThreadWorkerPool
+
+
+def _wait_for(condition, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+def test_thread_pool_runs_at_most_size_tasks_and_queues_the_rest():
+    pool = ThreadWorkerPool("test", size=2)
+    release = threading.Event()
+    try:
+        futures = [pool.submit(release.wait) for _ in range(5)]
+        _wait_for(lambda: pool.statistics()["active"] == 2)
+        stats = pool.statistics()
+        assert (stats["kind"], stats["active"], stats["queued"]) == ("thread", 2, 3)
+        release.set()
+        for future in futures:
+            future.result(timeout=2)
+        stats = pool.statistics()
+        assert (stats["active"], stats["queued"], stats["completed"], stats["failed"]) == (0, 0, 5, 0)
+    finally:
+        release.set()
+        pool.shutdown()
+
+
+def test_thread_pool_counts_failed_tasks():
+    def fail():
+        raise ValueError("boom")
+
+    pool = ThreadWorkerPool("test", size=1)
+    try:
+        with pytest.raises(ValueError):
+            pool.submit(fail).result(timeout=2)
+        assert pool.statistics()["failed"] == 1
+    finally:
+        pool.shutdown()
+
+
+def test_loop_pool_task_that_blocks_stalls_only_its_own_loop():
+    async def blocks_its_loop():
+        time.sleep(0.3)
+
+    async def main():
+        pool = LoopWorkerPool("test", size=2)
+        try:
+            future = pool.submit(blocks_its_loop)
+            started = time.perf_counter()
+            # The request loop keeps running while the pool's loop is blocked
+            await asyncio.sleep(0.05)
+            request_loop_delay = time.perf_counter() - started
+            await asyncio.wrap_future(future)
+            return request_loop_delay, pool.statistics()
+        finally:
+            pool.shutdown()
+
+    delay, stats = asyncio.run(main())
+    assert delay < 0.2
+    assert (stats["kind"], stats["completed"]) == ("loop", 1)
+
+
+def test_loop_pool_bounds_concurrency():
+    running = []
+    peak = []
+
+    async def task():
+        running.append(1)
+        peak.append(len(running))
+        await asyncio.sleep(0.05)
+        running.pop()
+
+    pool = LoopWorkerPool("test", size=2)
+    try:
+        futures = [pool.submit(task) for _ in range(6)]
+        for future in futures:
+            future.result(timeout=2)
+    finally:
+        pool.shutdown()
+    assert max(peak) == 2
+
+
+def test_pools_are_created_per_task_type_with_configured_sizes(monkeypatch):
+    monkeypatch.setattr(config, "BG_POOL_SIZES", {"report": 3})
+    monkeypatch.setattr(config, "BG_POOL_DEFAULT_SIZE", 1)
+    monkeypatch.setattr(bg_pools, "_pools", {})
+    try:
+        report = bg_pools.get_pool("report", is_async=False)
+        email = bg_pools.get_pool("email", is_async=True)
+        assert bg_pools.get_pool("report", is_async=False) is report
+        stats = bg_pools.get_pool_stats()
+        assert (stats["report"]["kind"], stats["report"]["size"]) == ("thread", 3)
+        assert (stats["email"]["kind"], stats["email"]["size"]) == ("loop", 1)
+        assert bg_pools.find_pool("email") is email
+    finally:
+        bg_pools.shutdown_pools()
+    assert bg_pools.find_pool("report") is None
@@ -0,0 +1,58 @@
+"""Graceful drain of app.bg_runner."""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.bg_pools import ThreadWorkerPool
+from app.bg_runner import BackgroundRunner
+
+
+@pytest.fixture
+def pool():
+    pool = ThreadWorkerPool("test", size=4)
+    yield pool
+    pool.shutdown()
+
+
+def _drain(pool, calls, timeout):
+    """Submit `calls` (seconds each) through a runner, drain it and return (drain seconds, runner)."""
+    async def main():
+        runner = BackgroundRunner(asyncio.get_running_loop())
+        for seconds in calls:
+            runner.submit(pool, time.sleep, seconds)
+        started = time.perf_counter()
+        await runner.drain(timeout)
+        return time.perf_counter() - started, runner
+
+    return asyncio.run(main())
+
+
+def test_drain_waits_for_calls_that_finish_before_the_timeout(pool):
+    elapsed, runner = _drain(pool, [0.05, 0.1], timeout=2)
+    assert elapsed < 1
+    assert runner.statistics() == {"draining": True, "in_flight": 0, "submitted": 2, "refused": 0, "abandoned": 0}
+
+
+def test_drain_abandons_calls_still_running_at_the_timeout(pool):
+    elapsed, runner = _drain(pool, [0.05, 0.6, 0.6], timeout=0.2)
+    assert 0.2 <= elapsed < 0.5
+    assert runner.statistics()["abandoned"] == 2
+
+
+def test_drain_with_no_timeout_abandons_everything_in_flight(pool):
+    elapsed, runner = _drain(pool, [0.3, 0.3], timeout=0)
+    assert elapsed < 0.1
+    assert runner.statistics()["abandoned"] == 2
+
+
+def test_runner_refuses_work_once_draining(pool):
+    async def main():
+        runner = BackgroundRunner(asyncio.get_running_loop())
+        await runner.drain(1)
+        return runner.submit(pool, threading.get_ident), runner.statistics()
+
+    future, stats = asyncio.run(main())
+    assert future is None
+    assert (stats["submitted"], stats["refused"]) == (0, 1)
@@ -0,0 +1,61 @@
+"""The @blocking guard of app.functions."""
+import asyncio
+import threading
+
+import pytest
+
+from app import config
+from app.cache import cached
+from app.functions import BlockingCallError, blocking
+
+
+@blocking
+def current_thread():
+    return threading.get_ident()
+
+
+def test_plain_call_on_the_loop_runs_inline_and_returns_the_result():
+    async def main():
+        return current_thread(), threading.get_ident()
+
+    result, loop_thread = asyncio.run(main())
+    assert result == loop_thread
+
+
+def test_plain_call_on_the_loop_raises_in_debug_mode(monkeypatch):
+    monkeypatch.setattr(config, "DEBUG", True)
+
+    async def main():
+        current_thread()
+
+    with pytest.raises(BlockingCallError):
+        asyncio.run(main())
+    assert current_thread() == threading.get_ident()  # off the loop it still runs
+
+
+def test_offload_runs_in_another_thread():
+    async def main():
+        return await current_thread.offload(), threading.get_ident()
+
+    result, loop_thread = asyncio.run(main())
+    assert result != loop_thread
+
+
+def test_cached_blocking_function_offloads_only_misses():
+    calls = []
+
+    @cached(ttl=30, name="test.blocking")
+    @blocking
+    def compute(x):
+        calls.append(threading.get_ident())
+        return x * 2
+
+    async def main():
+        return [await compute.offload(21) for _ in range(3)], compute(21), threading.get_ident()
+
+    results, plain, loop_thread = asyncio.run(main())
+    assert results == [42, 42, 42]
+    assert plain == 42
+    assert calls[0] != loop_thread
+    # One offloaded miss; the plain call on the loop bypasses the cache's flights and runs inline
+    assert len(calls) == 2
@@ -0,0 +1,121 @@
+"""Priority lanes and bulkheads of app.bulkheads."""
+import asyncio
+import threading
+
+import anyio
+import httpx
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+
+from app import bulkheads, config
+from app.bulkheads import Bulkhead, LaneRoute, admit_request
+
+
+@pytest.fixture
+def lanes_app(monkeypatch):
+    """App with one critical and one bulk `def` route behind admit_request."""
+    monkeypatch.setattr(config, "CRITICAL_ROUTES", {"/critical"})
+    monkeypatch.setattr(config, "THREAD_RESERVED_TOKENS", 2)
+    monkeypatch.setattr(config, "BULK_QUEUE", 1)
+    monkeypatch.setattr(bulkheads, "_lanes", None)
+    monkeypatch.setattr(bulkheads, "_bulkheads", {})
+
+    router = APIRouter(route_class=LaneRoute, dependencies=[Depends(admit_request)])
+
+    @router.get("/critical")
+    def critical():
+        return {"thread": threading.get_ident()}
+
+    @router.get("/bulk")
+    def bulk():
+        return {"thread": threading.get_ident()}
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+async def _fill_default_limiter(release, extra_waiters=0):
+    """Borrow every default limiter token with blocked offloads, plus `extra_waiters` queued ones."""
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = 2
+    offloads = [asyncio.ensure_future(anyio.to_thread.run_sync(release.wait)) for _ in range(2 + extra_waiters)]
+    while limiter.statistics().borrowed_tokens < 2 or limiter.statistics().tasks_waiting < extra_waiters:
+        await asyncio.sleep(0.01)
+    return offloads
+
+
+def test_critical_routes_keep_their_threads_while_offloads_hold_the_default_limiter(lanes_app):
+    async def main():
+        release = threading.Event()
+        offloads = await _fill_default_limiter(release)
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=lanes_app), base_url="http://test") as client:
+            critical = await asyncio.wait_for(client.get("/critical"), 2)
+            bulk = asyncio.ensure_future(client.get("/bulk"))
+            await asyncio.sleep(0.2)
+            bulk_waited = not bulk.done()
+            release.set()
+            await asyncio.gather(*offloads)
+            return critical, bulk_waited, await bulk, bulkheads.get_lanes().statistics()
+
+    critical, bulk_waited, bulk, stats = asyncio.run(main())
+    assert critical.status_code == 200
+    assert bulk_waited
+    assert bulk.status_code == 200
+    assert stats["lanes"]["critical"]["dedicated"]
+    assert stats["lanes"]["critical"]["capacity"] == 2
+    assert stats["lanes"]["critical"]["admitted"] == 1
+
+
+def test_bulk_requests_are_shed_when_other_offloads_queue_for_the_default_limiter(lanes_app):
+    async def main():
+        release = threading.Event()
+        offloads = await _fill_default_limiter(release, extra_waiters=1)
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=lanes_app), base_url="http://test") as client:
+            bulk = await client.get("/bulk")
+            critical = await asyncio.wait_for(client.get("/critical"), 2)
+        release.set()
+        await asyncio.gather(*offloads)
+        return bulk, critical, bulkheads.get_lanes().statistics()
+
+    bulk, critical, stats = asyncio.run(main())
+    assert bulk.status_code == 503
+    assert bulk.headers["Retry-After"] == "1"
+    assert critical.status_code == 200
+    assert stats["shed"] == 1
+
+
+def test_bulkhead_hands_a_slot_on_when_its_waiter_is_cancelled():
+    async def main():
+        bulkhead = Bulkhead("/route", limit=1, queue_size=10)
+        await bulkhead.acquire()
+        first = asyncio.ensure_future(bulkhead.acquire())
+        second = asyncio.ensure_future(bulkhead.acquire())
+        await asyncio.sleep(0)
+        # The slot is handed to `first`, which is cancelled before it resumes
+        bulkhead.release()
+        first.cancel()
+        await asyncio.wait_for(second, 1)
+        assert first.cancelled()
+        return bulkhead.statistics()
+
+    stats = asyncio.run(main())
+    assert stats["in_flight"] == 1
+    assert stats["waiting"] == 0
+
+
+def test_full_bulkhead_queue_sheds():
+    async def main():
+        bulkhead = Bulkhead("/route", limit=1, queue_size=1)
+        await bulkhead.acquire()
+        waiter = asyncio.ensure_future(bulkhead.acquire())
+        await asyncio.sleep(0)
+        with pytest.raises(Exception) as shed:
+            await bulkhead.acquire()
+        bulkhead.release()
+        await waiter
+        return shed.value, bulkhead.statistics()
+
+    shed, stats = asyncio.run(main())
+    assert shed.status_code == 503
+    assert (stats["shed"], stats["in_flight"]) == (1, 1)
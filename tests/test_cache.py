@@ -0,0 +1,109 @@
+"""Single-flight behavior of app.cache."""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.cache import cached
+
+
+def test_concurrent_async_misses_collapse_into_one_call():
+    calls = []
+
+    @cached(ttl=30, name="test.collapse_async")
+    async def compute(x):
+        calls.append(x)
+        await asyncio.sleep(0.05)
+        return x * 2
+
+    async def main():
+        return await asyncio.gather(*[compute(21) for _ in range(50)])
+
+    assert asyncio.run(main()) == [42] * 50
+    assert calls == [21]
+    stats = compute.cache_statistics()
+    assert (stats["miss"], stats["collapsed"], stats["in_flight"]) == (1, 49, 0)
+
+
+def test_concurrent_sync_misses_collapse_into_one_call():
+    calls = []
+
+    @cached(ttl=30, name="test.collapse_sync")
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return "value"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(compute())) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["value"] * 20
+    assert len(calls) == 1
+
+
+def test_error_reaches_every_waiter_and_is_not_cached():
+    calls = []
+
+    @cached(ttl=30, name="test.error")
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        if len(calls) == 1:
+            raise ValueError("upstream failed")
+        return "recovered"
+
+    async def main():
+        return await asyncio.gather(*[compute() for _ in range(5)], return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert compute.cache_statistics()["error"] == 1
+    assert asyncio.run(compute()) == "recovered"
+    assert len(calls) == 2
+
+
+def test_cancelled_leader_hands_the_flight_to_a_waiter():
+    calls = []
+
+    @cached(ttl=30, name="test.cancelled_leader")
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "value"
+
+    async def main():
+        leader = asyncio.create_task(compute())
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(compute()) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await asyncio.gather(*waiters)
+
+    assert asyncio.run(main()) == ["value"] * 5
+    # The cancelled leader's call, then one call by the waiter that took over
+    assert len(calls) == 2
+
+
+def test_cancelled_waiter_does_not_cancel_the_flight():
+    @cached(ttl=30, name="test.cancelled_waiter")
+    async def compute():
+        await asyncio.sleep(0.05)
+        return "value"
+
+    async def main():
+        leader = asyncio.create_task(compute())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(compute())
+        other = asyncio.create_task(compute())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        return await leader, await other
+
+    assert asyncio.run(main()) == ("value", "value")
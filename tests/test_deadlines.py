@@ -0,0 +1,110 @@
+"""Request deadlines and disconnect cancellation of app.deadlines."""
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.deadlines import DeadlineMiddleware, deadline_headers, request_abandoned
+from app.metrics_registry import REQUESTS_ABANDONED
+
+
+@pytest.fixture
+def deadline_app():
+    events = {}
+    app = FastAPI()
+
+    @app.get("/deadline-async")
+    async def async_route():
+        events["async_started"] = True
+        await asyncio.sleep(1)
+        events["async_finished"] = True
+        return {}
+
+    @app.get("/deadline-sync")
+    def sync_route():
+        time.sleep(0.3)
+        # A running thread cannot be interrupted, but it can see that nobody waits for it
+        events["sync_abandoned"] = request_abandoned()
+        return {}
+
+    @app.get("/deadline-fast")
+    async def fast_route():
+        return {"headers": deadline_headers(), "abandoned": request_abandoned()}
+
+    app.add_middleware(DeadlineMiddleware)
+    return app, events
+
+
+def _get(app, path, timeout):
+    async def main():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            started = time.perf_counter()
+            response = await client.get(path, headers={"X-Request-Timeout": str(timeout)})
+            return response, time.perf_counter() - started
+
+    return asyncio.run(main())
+
+
+def test_missed_deadline_cancels_the_handler_and_returns_504(deadline_app):
+    app, events = deadline_app
+    abandoned = REQUESTS_ABANDONED.value(route="/deadline-async", reason="deadline")
+    response, elapsed = _get(app, "/deadline-async", timeout=0.1)
+
+    assert response.status_code == 504
+    assert elapsed < 0.5
+    assert events == {"async_started": True}
+    assert REQUESTS_ABANDONED.value(route="/deadline-async", reason="deadline") == abandoned + 1
+
+
+def test_sync_handler_past_its_deadline_finishes_but_sees_it_is_abandoned(deadline_app):
+    app, events = deadline_app
+    response, _ = _get(app, "/deadline-sync", timeout=0.1)
+    assert response.status_code == 504
+    assert events == {"sync_abandoned": True}
+
+
+def test_request_within_its_deadline_passes_the_time_left_on(deadline_app):
+    app, _ = deadline_app
+    response, _ = _get(app, "/deadline-fast", timeout=5)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["abandoned"] is False
+    assert 4 < float(body["headers"]["x-request-timeout"]) <= 5
+
+
+def test_client_disconnect_cancels_the_handler_and_records_499(deadline_app):
+    app, events = deadline_app
+    abandoned = REQUESTS_ABANDONED.value(route="/deadline-async", reason="disconnect")
+
+    async def main():
+        gone = asyncio.Event()
+        requests = [{"type": "http.request", "body": b"", "more_body": False}]
+        sent = []
+
+        async def receive():
+            if requests:
+                return requests.pop()
+            await gone.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+            "scheme": "http", "path": "/deadline-async", "raw_path": b"/deadline-async", "root_path": "",
+            "query_string": b"", "headers": [(b"host", b"test")], "client": ("127.0.0.1", 1), "server": ("test", 80),
+        }
+        asyncio.get_running_loop().call_later(0.1, gone.set)
+        started = time.perf_counter()
+        await app(scope, receive, send)
+        return sent, time.perf_counter() - started
+
+    sent, elapsed = asyncio.run(main())
+    assert sent[0]["type"] == "http.response.start"
+    assert sent[0]["status"] == 499
+    assert elapsed < 0.5
+    assert events == {"async_started": True}
+    assert REQUESTS_ABANDONED.value(route="/deadline-async", reason="disconnect") == abandoned + 1
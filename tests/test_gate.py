@@ -0,0 +1,122 @@
+"""Bootstrap intervals and verdicts of bench.gate."""
+import csv
+import random
+import statistics
+
+import pytest
+
+from bench.artifacts import discover_runs
+from bench.gate import (
+    IMPROVED, INCONCLUSIVE, PASS, PERCENTILE_COLUMNS, REGRESSION, RunData, block_bootstrap_means, compare_metric,
+)
+
+SETTINGS = {"confidence": 0.95, "resamples": 500, "block_seconds": 5}
+LOWER_IS_BETTER = {"higher_is_better": False, "threshold": 0.15}
+HIGHER_IS_BETTER = {"higher_is_better": True, "threshold": 0.10}
+
+
+def _write_csv(path, rows):
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _write_run(directory, requests_per_second, latency_ms, seed=0):
+    """
+    Write the stats, stats-history and resource CSVs of a 30s run to `directory`.
+
+    Each second completes about `requests_per_second` requests with a median of
+    about `latency_ms`; both wander from second to second.
+    """
+    rng = random.Random(seed)
+    directory.mkdir(exist_ok=True)
+    name = "route-10users"
+    history, total = [], 0
+    for second in range(30):
+        total += round(requests_per_second * rng.uniform(0.9, 1.1))
+        median = latency_ms * rng.uniform(0.95, 1.05)
+        history.append({
+            "Timestamp": 1000 + second, "User Count": 10, "Name": "Aggregated", "Total Request Count": total,
+            **{column: round(median * (1 + q)) for column, q in PERCENTILE_COLUMNS.items()},
+        })
+    _write_csv(directory / f"{name}_stats_history.csv", history)
+    _write_csv(directory / f"{name}_stats.csv", [{
+        "Name": "Aggregated", "Request Count": total, "Requests/s": total / 29, "Min Response Time": latency_ms / 2,
+        **{column: latency_ms * (1 + q) for column, q in PERCENTILE_COLUMNS.items()},
+    }])
+    _write_csv(directory / f"{name}_resources.csv", [
+        {"phase": "test", "memory_rss_mb": 70 + rng.uniform(-1, 1)} for _ in range(30)
+    ])
+    return RunData(discover_runs(directory)[0])
+
+
+def _compare(baseline, current, metric, rule):
+    return compare_metric(baseline, current, metric, rule, SETTINGS, random.Random(0))
+
+
+def test_block_bootstrap_of_a_constant_series_has_no_spread():
+    means = block_bootstrap_means([5.0] * 20, 100, 4, random.Random(0))
+    assert means == [5.0] * 100
+
+
+def test_block_bootstrap_keeps_the_spread_of_autocorrelated_series():
+    # Two regimes of 30 seconds each: i.i.d. resampling would average them out
+    series = [100.0] * 30 + [200.0] * 30
+    iid = block_bootstrap_means(series, 500, 1, random.Random(0))
+    blocks = block_bootstrap_means(series, 500, 30, random.Random(0))
+    assert statistics.fmean(iid) == pytest.approx(150, rel=0.05)
+    assert statistics.stdev(blocks) > 2 * statistics.stdev(iid)
+
+
+def test_block_bootstrap_caps_the_block_at_the_series_length():
+    assert block_bootstrap_means([1.0, 2.0, 3.0], 10, 50, random.Random(0)) == [2.0] * 10
+
+
+def test_identical_runs_pass(tmp_path):
+    baseline = _write_run(tmp_path / "baseline", 100, 200)
+    current = _write_run(tmp_path / "current", 100, 200, seed=1)
+    for metric, rule in (("throughput_rps", HIGHER_IS_BETTER), ("p50_ms", LOWER_IS_BETTER),
+                         ("p99_ms", LOWER_IS_BETTER), ("rss_mb", LOWER_IS_BETTER)):
+        row = _compare(baseline, current, metric, rule)
+        assert row["verdict"] == PASS, row
+        assert row["ci"][0] < 0 < row["ci"][1]
+
+
+def test_slower_run_is_a_regression(tmp_path):
+    baseline = _write_run(tmp_path / "baseline", 100, 200)
+    current = _write_run(tmp_path / "current", 50, 400, seed=1)
+    assert _compare(baseline, current, "p50_ms", LOWER_IS_BETTER)["verdict"] == REGRESSION
+    row = _compare(baseline, current, "throughput_rps", HIGHER_IS_BETTER)
+    assert row["verdict"] == REGRESSION
+    assert row["change"] == pytest.approx(-0.5, abs=0.05)
+
+
+def test_faster_run_is_an_improvement(tmp_path):
+    baseline = _write_run(tmp_path / "baseline", 100, 400)
+    current = _write_run(tmp_path / "current", 200, 200, seed=1)
+    assert _compare(baseline, current, "p50_ms", LOWER_IS_BETTER)["verdict"] == IMPROVED
+    assert _compare(baseline, current, "throughput_rps", HIGHER_IS_BETTER)["verdict"] == IMPROVED
+
+
+def test_change_within_the_noise_is_inconclusive(tmp_path):
+    baseline = _write_run(tmp_path / "baseline", 100, 200)
+    current = _write_run(tmp_path / "current", 100, 200, seed=1)
+    # Only the last seconds slow down: the point estimate is past the threshold, the interval is not
+    for row in current.latency_per_second.values():
+        row[-10:] = [value * 3 for value in row[-10:]]
+    current.latency.points = [(q, value * 1.2) for q, value in current.latency.points]
+    row = _compare(baseline, current, "p50_ms", LOWER_IS_BETTER)
+    assert row["change"] == pytest.approx(0.2)
+    assert row["verdict"] == INCONCLUSIVE, row
+
+
+def test_latency_interval_widens_with_autocorrelated_percentiles(tmp_path):
+    baseline = _write_run(tmp_path / "baseline", 100, 200)
+    steady = _write_run(tmp_path / "steady", 100, 200, seed=1)
+    drifting = _write_run(tmp_path / "drifting", 100, 200, seed=1)
+    for row in drifting.latency_per_second.values():
+        row[15:] = [value * 1.5 for value in row[15:]]
+    width = lambda row: row["ci"][1] - row["ci"][0]
+    assert width(_compare(baseline, drifting, "p95_ms", LOWER_IS_BETTER)) > \
+        2 * width(_compare(baseline, steady, "p95_ms", LOWER_IS_BETTER))
@@ -0,0 +1,96 @@
+"""Job queue backends of app.job_queue and the app.worker job runner."""
+import threading
+import time
+
+import pytest
+
+from app.background import JOB_TASKS
+from app.job_queue import DONE, FAILED, QUEUED, RUNNING, InMemoryJobQueue, SQLiteJobQueue
+from app.worker import JobWorker
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def queue(request, tmp_path):
+    if request.param == "memory":
+        queue = InMemoryJobQueue()
+    else:
+        queue = SQLiteJobQueue(str(tmp_path / "jobs.sqlite3"), poll_interval=0.01)
+    yield queue
+    queue.close()
+
+
+def test_claim_takes_the_oldest_queued_job(queue):
+    first = queue.enqueue("task", args=[1])
+    second = queue.enqueue("task", kwargs={"n": 2})
+
+    job = queue.claim("worker-a", timeout=0)
+    assert (job.id, job.status, job.worker, job.attempts, job.args) == (first, RUNNING, "worker-a", 1, [1])
+    job = queue.claim("worker-b", timeout=0)
+    assert (job.id, job.kwargs) == (second, {"n": 2})
+    assert queue.counts() == {RUNNING: 2}
+
+
+def test_claim_on_an_empty_queue_waits_for_the_timeout(queue):
+    started = time.monotonic()
+    assert queue.claim("worker", timeout=0.1) is None
+    assert time.monotonic() - started >= 0.09
+
+
+def test_concurrent_claims_never_share_a_job(queue):
+    job_ids = {queue.enqueue("task") for _ in range(50)}
+    claimed = []
+
+    def drain(worker_id):
+        while (job := queue.claim(worker_id, timeout=0)) is not None:
+            claimed.append(job.id)
+
+    threads = [threading.Thread(target=drain, args=(f"worker-{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(claimed) == sorted(job_ids)
+
+
+def test_requeue_stale_returns_only_old_running_jobs_to_the_queue(queue):
+    stale = queue.enqueue("task")
+    queue.claim("crashed-worker", timeout=0)
+    time.sleep(0.05)
+    fresh = queue.enqueue("task")
+    queue.claim("live-worker", timeout=0)
+    finished = queue.enqueue("task")
+    queue.claim("live-worker", timeout=0)
+    queue.complete(finished)
+
+    assert queue.requeue_stale(older_than=60) == 0
+    assert queue.requeue_stale(older_than=0.04) == 1
+    assert (queue.get(stale).status, queue.get(stale).worker) == (QUEUED, None)
+    assert queue.get(fresh).status == RUNNING
+    assert queue.get(finished).status == DONE
+    assert queue.pending_count() == 2
+
+    job = queue.claim("other-worker", timeout=0)
+    assert (job.id, job.attempts) == (stale, 2)
+
+
+def test_worker_records_each_job_outcome(queue, monkeypatch):
+    calls = []
+
+    def fail():
+        raise ValueError("boom")
+
+    monkeypatch.setitem(JOB_TASKS, "test-ok", lambda n: calls.append(n))
+    monkeypatch.setitem(JOB_TASKS, "test-fail", fail)
+    ok = queue.enqueue("test-ok", args=[7])
+    failed = queue.enqueue("test-fail")
+    unknown = queue.enqueue("test-unknown")
+
+    worker = JobWorker(queue, "worker", threading.Event(), poll_interval=0.01)
+    for _ in range(3):
+        worker.execute(queue.claim("worker", timeout=0))
+
+    assert calls == [7]
+    assert queue.get(ok).status == DONE
+    assert (queue.get(failed).status, queue.get(failed).error) == (FAILED, "ValueError('boom')")
+    assert queue.get(unknown).status == FAILED
+    assert "test-unknown" in queue.get(unknown).error
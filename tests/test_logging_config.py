@@ -0,0 +1,53 @@
+"""Shutdown of the queue-mode log writer in app.logging_config."""
+import io
+import logging
+import queue
+import threading
+import time
+
+from app import logging_config
+from app.logging_config import BatchingLogWriter
+
+
+def _record(message):
+    return logging.makeLogRecord({"msg": message, "levelno": logging.INFO, "levelname": "INFO"})
+
+
+def test_stop_writes_out_queued_records():
+    log_queue = queue.Queue(maxsize=100)
+    stream = io.StringIO()
+    writer = BatchingLogWriter(log_queue, stream, logging.Formatter("%(message)s"), batch_size=10)
+    writer.start()
+    for i in range(25):
+        log_queue.put(_record(f"line {i}"))
+    writer.stop()
+    assert stream.getvalue().splitlines() == [f"line {i}" for i in range(25)]
+
+
+class _BlockedStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def write(self, text):
+        self.release.wait()
+        return super().write(text)
+
+
+def test_stop_does_not_hang_on_a_full_queue_and_a_stuck_writer():
+    log_queue = queue.Queue(maxsize=2)
+    stream = _BlockedStream()
+    writer = BatchingLogWriter(log_queue, stream, logging.Formatter("%(message)s"), batch_size=1)
+    writer.start()
+    log_queue.put(_record("stuck"))
+    while not log_queue.empty():  # the writer holds the first record in a blocked write
+        time.sleep(0.01)
+    log_queue.put(_record("queued 1"))
+    log_queue.put(_record("queued 2"))
+    dropped = logging_config._dropped
+
+    started = time.monotonic()
+    writer.stop(timeout=0.2)
+    assert time.monotonic() - started < 1
+    assert logging_config._dropped - dropped == 2
+    stream.release.set()
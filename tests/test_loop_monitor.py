@@ -0,0 +1,61 @@
+"""Stall detection of app.loop_monitor."""
+import asyncio
+import time
+
+from app.loop_monitor import LoopLagMonitor
+
+INTERVAL = 0.01
+THRESHOLD = 0.1
+
+
+def _hold_the_loop(seconds):
+    time.sleep(seconds)
+
+
+async def _monitored(body):
+    monitor = LoopLagMonitor(asyncio.get_running_loop(), INTERVAL, THRESHOLD)
+    monitor.start()
+    try:
+        await asyncio.sleep(INTERVAL * 5)
+        result = await body(monitor)
+        # Let the sentinel record the probe that was outstanding during the stall
+        await asyncio.sleep(INTERVAL * 5)
+        return result, monitor.statistics()
+    finally:
+        monitor.stop()
+
+
+def test_blocking_past_the_threshold_is_a_stall_with_its_offender():
+    async def body(monitor):
+        _hold_the_loop(THRESHOLD * 3)
+
+    _, stats = asyncio.run(_monitored(body))
+    assert stats["stalls"] == 1
+    assert stats["max_lag_ms"] >= THRESHOLD * 1000
+    offender, = stats["worst_offenders"]
+    assert offender["function"] == f"{__name__}:_hold_the_loop"
+    assert offender["max_blocked_ms"] >= THRESHOLD * 1000
+    assert any("_hold_the_loop" in line for line in offender["last_stack"])
+
+
+def test_blocking_under_the_threshold_is_lag_but_not_a_stall():
+    async def body(monitor):
+        for _ in range(3):
+            _hold_the_loop(THRESHOLD / 3)
+            await asyncio.sleep(INTERVAL * 3)
+
+    _, stats = asyncio.run(_monitored(body))
+    assert stats["probes"] > 0
+    assert stats["stalls"] == 0
+    assert stats["worst_offenders"] == []
+    assert stats["max_lag_ms"] < THRESHOLD * 1000
+
+
+def test_current_lag_grows_while_the_loop_is_stalled():
+    async def body(monitor):
+        _hold_the_loop(THRESHOLD * 2)
+        # Still on the stalled iteration: the outstanding probe is as old as the stall
+        return monitor.current_lag()
+
+    lag, _ = asyncio.run(_monitored(body))
+    assert lag >= THRESHOLD
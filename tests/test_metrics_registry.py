@@ -0,0 +1,36 @@
+"""Per-thread shards of app.metrics_registry."""
+import threading
+
+from app.metrics_registry import Registry
+
+
+def _run_threads(count, target):
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_shards_of_exited_threads_are_retired_with_their_values():
+    registry = Registry()
+    counter = registry.counter("test_total", "test", labels=("kind",))
+    histogram = registry.histogram("test_seconds", "test", buckets=(0.1, 1.0))
+
+    def record():
+        counter.inc(kind="a")
+        counter.inc(2, kind="b")
+        histogram.observe(0.5)
+
+    _run_threads(50, record)
+    counter.inc(kind="a")
+
+    assert registry.shard_count() == 1  # only this thread's shard is live
+    assert counter.values() == {("a",): 51, ("b",): 100}
+    assert histogram.values()[()] == [0, 50, 0, 25.0, 50]
+
+    # New threads keep adding to the retired totals
+    _run_threads(10, record)
+    assert counter.value(kind="b") == 120
+    assert histogram.values()[()][-1] == 60
+    assert registry.shard_count() == 1
@@ -0,0 +1,81 @@
+"""Seqlock-guarded slots of app.shared_metrics."""
+import os
+import struct
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from app.shared_metrics import FIELDS, SharedMetricsFile
+
+
+@pytest.fixture
+def shared(tmp_path):
+    shared = SharedMetricsFile(str(tmp_path / "metrics.bin"), slots=2)
+    yield shared
+    shared.close()
+
+
+def _dead_pid():
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def _tear(shared, slot):
+    """Leave a slot as a writer killed between its two sequence writes would."""
+    offset = shared._offset(slot)
+    seq = struct.unpack_from("<Q", shared._mm, offset)[0]
+    struct.pack_into("<Q", shared._mm, offset, seq + 1)
+
+
+def test_reads_racing_a_writer_only_see_whole_writes(shared):
+    slot = shared.claim_slot(os.getpid())
+    stop = threading.Event()
+
+    def write():
+        i = 0
+        while not stop.is_set():
+            i += 1
+            shared.write(slot, {name: i for name in FIELDS})
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    try:
+        reads = 0
+        deadline = time.monotonic() + 0.5
+        while time.monotonic() < deadline:
+            (worker,) = shared.read_all()
+            if not worker["torn"]:
+                assert len({worker[name] for name in FIELDS}) == 1
+                reads += 1
+    finally:
+        stop.set()
+        writer.join()
+    assert reads > 0
+
+
+def test_slot_torn_by_a_dead_writer_does_not_hang_readers_and_is_reclaimed(shared):
+    shared.claim_slot(_dead_pid())
+    _tear(shared, 0)
+
+    started = time.monotonic()
+    assert shared.read_all() == []
+    assert shared.claim_slot(os.getpid()) == 0
+    assert time.monotonic() - started < 1
+
+    shared.write(0, {"active_threads": 3})
+    (worker,) = shared.read_all()
+    assert (worker["torn"], worker["stale"], worker["active_threads"]) == (False, False, 3)
+
+
+def test_torn_slot_of_a_live_worker_is_reported_stale(shared):
+    shared.claim_slot(os.getpid())
+    shared.write(0, {"active_threads": 3})
+    _tear(shared, 0)
+
+    (worker,) = shared.read_all()
+    assert worker["torn"] and worker["stale"]
+    assert worker["active_threads"] == 0
@@ -0,0 +1,76 @@
+"""Sizing decisions of the adaptive controller in app.thread_limiter."""
+import asyncio
+
+from app.thread_limiter import AdaptiveLimiterController, get_limiter
+
+
+def _controller(cpu_percent=10.0, **kwargs):
+    settings = {"min_tokens": 2, "max_tokens": 20, "interval": 1, "cpu_high": 80, "shrink_after": 3, **kwargs}
+    controller = AdaptiveLimiterController(**settings)
+    controller._sample_cpu = lambda: cpu_percent
+    return controller
+
+
+async def _load_limiter(total, borrowed, waiting):
+    """Size the loop's default limiter and hold `borrowed` tokens with `waiting` more tasks queued."""
+    limiter = get_limiter()
+    limiter.total_tokens = total
+    holders = [object() for _ in range(borrowed)]
+    for holder in holders:
+        await limiter.acquire_on_behalf_of(holder)
+    waiters = [asyncio.ensure_future(limiter.acquire_on_behalf_of(object())) for _ in range(waiting)]
+    await asyncio.sleep(0)
+    return limiter, waiters
+
+
+def _ticks(controller, total, borrowed, waiting, ticks=1):
+    async def main():
+        limiter, waiters = await _load_limiter(total, borrowed, waiting)
+        decisions = [controller.tick() for _ in range(ticks)]
+        for waiter in waiters:
+            waiter.cancel()
+        return decisions, limiter.total_tokens
+
+    return asyncio.run(main())
+
+
+def test_grows_while_tasks_wait_and_cpu_is_free():
+    controller = _controller()
+    assert _ticks(controller, total=8, borrowed=8, waiting=3) == (["grow"], 10)
+    assert controller.statistics()["grown"] == 1
+
+
+def test_grows_by_at_least_one_token():
+    assert _ticks(_controller(), total=2, borrowed=2, waiting=1) == (["grow"], 3)
+
+
+def test_holds_while_tasks_wait_but_cpu_is_saturated():
+    controller = _controller(cpu_percent=95.0)
+    assert _ticks(controller, total=8, borrowed=8, waiting=3) == (["hold_cpu"], 8)
+    assert controller.statistics()["held_for_cpu"] == 1
+
+
+def test_holds_at_max_tokens():
+    assert _ticks(_controller(max_tokens=8), total=8, borrowed=8, waiting=3) == (["hold_max"], 8)
+
+
+def test_shrinks_only_after_consecutive_idle_ticks():
+    controller = _controller()
+    assert _ticks(controller, total=20, borrowed=2, waiting=0, ticks=3) == (["idle", "idle", "shrink"], 18)
+    assert controller.statistics()["shrunk"] == 1
+
+
+def test_busy_tick_resets_the_idle_count():
+    controller = _controller()
+    assert _ticks(controller, total=20, borrowed=2, waiting=0, ticks=2) == (["idle", "idle"], 20)
+    assert _ticks(controller, total=20, borrowed=15, waiting=0) == (["steady"], 20)
+    assert _ticks(controller, total=20, borrowed=2, waiting=0, ticks=2) == (["idle", "idle"], 20)
+
+
+def test_never_shrinks_below_min_tokens_or_the_borrowed_count():
+    assert _ticks(_controller(min_tokens=4), total=4, borrowed=0, waiting=0, ticks=3)[0][-1] == "hold_min"
+    # 10% of 40 would leave 36, but 19 of them are in use: keep one spare above the borrowed count
+    assert _ticks(_controller(min_tokens=2), total=40, borrowed=19, waiting=0, ticks=3) == (
+        ["idle", "idle", "shrink"], 36)
+    assert _ticks(_controller(min_tokens=2, shrink_factor=0.9), total=40, borrowed=19, waiting=0, ticks=3) == (
+        ["idle", "idle", "shrink"], 20)
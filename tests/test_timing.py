@@ -0,0 +1,91 @@
+"""Per-request phase timing of app.timing and its Server-Timing header."""
+import asyncio
+import threading
+import time
+
+import anyio
+import httpx
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+
+from app.metrics_registry import REQUEST_PHASE_DURATION
+from app.middleware import RequestTimingMiddleware
+from app.timing import mark_handler_start, mark_routed, server_timing_header, timed_phase
+
+INNER = 0.05
+
+
+@pytest.fixture
+def timing_app():
+    router = APIRouter(dependencies=[Depends(mark_routed)])
+
+    @router.get("/timing-sync")
+    def sync_route():
+        mark_handler_start()
+        with timed_phase("inner"):
+            time.sleep(INNER)
+        return {"thread": threading.get_ident()}
+
+    @router.get("/timing-async")
+    async def async_route():
+        mark_handler_start()
+        with timed_phase("inner"):
+            await asyncio.sleep(INNER)
+        return {}
+
+    app = FastAPI()
+    app.include_router(router)
+    app.add_middleware(RequestTimingMiddleware)
+    return app
+
+
+def _server_timing(response):
+    """Parse a Server-Timing header into phase -> milliseconds."""
+    phases = {}
+    for entry in response.headers["server-timing"].split(", "):
+        phase, _, duration = entry.partition(";dur=")
+        phases[phase] = float(duration)
+    return phases
+
+
+def _get(app, path):
+    async def main():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return await client.get(path)
+
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize("path", ["/timing-sync", "/timing-async"])
+def test_server_timing_header_breaks_latency_into_phases(timing_app, path):
+    response = _get(timing_app, path)
+    phases = _server_timing(response)
+
+    assert list(phases) == ["accept", "wait", "handler", "inner", "total"]
+    assert phases["inner"] >= INNER * 1000
+    assert phases["handler"] >= phases["inner"]
+    assert phases["total"] >= phases["accept"] + phases["wait"] + phases["handler"] - 0.1
+    assert REQUEST_PHASE_DURATION.values()[(path, "inner")][-1] >= 1
+
+
+def test_wait_phase_includes_the_wait_for_a_thread_token(timing_app):
+    release = threading.Event()
+
+    async def main():
+        limiter = anyio.to_thread.current_default_thread_limiter()
+        limiter.total_tokens = 1
+        blocker = asyncio.ensure_future(anyio.to_thread.run_sync(release.wait))
+        while limiter.statistics().borrowed_tokens < 1:
+            await asyncio.sleep(0.01)
+        asyncio.get_running_loop().call_later(0.2, release.set)
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=timing_app), base_url="http://test") as client:
+            response = await client.get("/timing-sync")
+        await blocker
+        return response
+
+    phases = _server_timing(asyncio.run(main()))
+    assert phases["wait"] >= 150
+
+
+def test_server_timing_header_format():
+    assert server_timing_header({"accept": 0.0012, "total": 0.25}) == "accept;dur=1.20, total;dur=250.00"